@@ -0,0 +1,257 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 00:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import re
+import copy
+import collections
+sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_param/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_discrete/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "cart_coord_dmp/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "quat_dmp/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../utilities/"))
+from TauSystem import *
+from CanonicalSystemDiscrete import *
+from CartesianCoordDMP import *
+from QuaternionDMP import *
+from definitions_base import *
+import DMPParamsIO as dmp_params_io
+
+# The name of the prims params directories to be indexed (see
+# DMPParamsIO for the layout of each):
+PRIMS_PARAMS_DIR_NAME = "learned_prims_params"
+PRIM_DIR_NAME_REGEX = r"prim(\d+)$"
+RL_ITER_DIR_NAME_REGEX = r"iter(\d+)$"
+
+DEFAULT_MAX_NUM_CACHED_DMPS = 16
+
+
+class PrimitiveLibrary(object):
+  """Class for an indexed library of (learned) primitives' params, e.g. of
+
+       many tasks, primitive IDs, DMP types ("CartCoord" or "Quaternion") and
+       RL iterations. A primitive is identified by the key
+       (task, prim_id, dmp_type, iteration), where iteration=None means
+       NOT an RL iteration (e.g. the nominal primitive).
+       Indexing only lists the directories; the params of a primitive are
+       loaded on first access (and kept, they are small), and the DMPs
+       (instantiated from the params, ready to unroll) are kept in a bounded
+       LRU cache, i.e. after warm-up, switching primitives costs NO disk I/O.
+  """
+
+  def __init__(self,
+               dt,
+               max_num_cached_dmps=DEFAULT_MAX_NUM_CACHED_DMPS,
+               root_dir_path=None):
+    assert (dt > 0.0)
+    assert (max_num_cached_dmps >= 1)
+    self.dt = dt
+    self.max_num_cached_dmps = max_num_cached_dmps
+    self.prims_params_sources = {}  # (key -> where its params are stored)
+    self.prims_params = {}  # (key -> its loaded params)
+    self.binary_files_params = {}  # (file path -> its (memory-mapped) params)
+    self.cached_dmps = collections.OrderedDict()  # (LRU order: oldest first)
+    self.params_loader_dmps = None
+    if (root_dir_path is not None):
+      self.indexDirectory(root_dir_path)
+
+  def indexDirectory(self, root_dir_path):
+    """Indexes all prims params directories (named PRIMS_PARAMS_DIR_NAME)
+
+       (recursively) under root_dir_path; the task of each is its parent
+       directory path relative to root_dir_path, except for the RL iteration
+       directory names (iter#), which define its iteration.
+       Returns the number of indexed primitives.
+    """
+    assert (os.path.isdir(root_dir_path)
+           ), "Directory " + root_dir_path + " does NOT exist!"
+    num_indexed_prims = 0
+    for [dir_path, dir_names, _] in os.walk(root_dir_path):
+      if (PRIMS_PARAMS_DIR_NAME not in dir_names):
+        continue
+      task_dir_names = []
+      iteration = None
+      relative_dir_path = os.path.relpath(dir_path, root_dir_path)
+      for dir_name in relative_dir_path.split(os.sep):
+        rl_iter_match = re.match(RL_ITER_DIR_NAME_REGEX, dir_name)
+        if (rl_iter_match is not None):
+          iteration = int(rl_iter_match.group(1))
+        elif (dir_name != "."):
+          task_dir_names.append(dir_name)
+      num_indexed_prims += self.indexPrimsParamsDirectory(
+          os.path.join(dir_path, PRIMS_PARAMS_DIR_NAME),
+          "/".join(task_dir_names), iteration)
+    return num_indexed_prims
+
+  def indexPrimsParamsDirectory(self, prims_params_dirpath, task,
+                                iteration=None):
+    """Indexes the primitives in prims_params_dirpath (as saved by
+
+       savePrimsParamsFromDictAtDirPath()), preferring its binary file
+       (which is only memory-mapped here) over its text files, unless it is
+       stale (see dmp_params_io.isPrimsParamsBinaryFileUpToDate()).
+       Returns the number of indexed primitives.
+    """
+    assert (os.path.isdir(prims_params_dirpath)
+           ), "Directory " + prims_params_dirpath + " does NOT exist!"
+    num_indexed_prims = 0
+    binary_file_path = os.path.join(prims_params_dirpath,
+                                    dmp_params_io.DMP_PARAMS_BINARY_FILE_NAME)
+    if (dmp_params_io.isPrimsParamsBinaryFileUpToDate(prims_params_dirpath)):
+      self.binary_files_params[binary_file_path] = (
+          dmp_params_io.loadParamsBinary(binary_file_path))
+      for dmp_type in dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES.keys(
+      ):
+        for n_prim in range(
+            len(self.binary_files_params[binary_file_path].get(dmp_type, []))):
+          self.addPrimParamsSource((task, n_prim + 1, dmp_type, iteration),
+                                   ("binary", binary_file_path, n_prim))
+          num_indexed_prims += 1
+      return num_indexed_prims
+    for [dmp_type, dmp_type_subdir_name
+        ] in dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES.items():
+      dmp_type_dirpath = os.path.join(prims_params_dirpath,
+                                      dmp_type_subdir_name)
+      if (not os.path.isdir(dmp_type_dirpath)):
+        continue
+      for prim_dir_name in os.listdir(dmp_type_dirpath):
+        prim_match = re.match(PRIM_DIR_NAME_REGEX, prim_dir_name)
+        if (prim_match is None):
+          continue
+        self.addPrimParamsSource(
+            (task, int(prim_match.group(1)), dmp_type, iteration),
+            ("text", os.path.join(dmp_type_dirpath, prim_dir_name)))
+        num_indexed_prims += 1
+    return num_indexed_prims
+
+  def addPrimParamsSource(self, key, source):
+    assert (key[2] in dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES.keys()
+           ), "DMP type " + str(key[2]) + " is NOT supported!"
+    self.prims_params_sources[key] = source
+    # (invalidating the previously-loaded params and DMP, if any)
+    self.prims_params.pop(key, None)
+    self.cached_dmps.pop(key, None)
+    return None
+
+  def addPrimParams(self, task, prim_id, dmp_type, params, iteration=None):
+    # adds the (in-memory) params of a primitive, e.g. of a new RL iteration:
+    key = (task, prim_id, dmp_type, iteration)
+    self.addPrimParamsSource(key, ("memory",))
+    self.prims_params[key] = copy.deepcopy(params)
+    return None
+
+  def findPrims(self, task=None, prim_id=None, dmp_type=None, iteration=None):
+    # returns the (sorted) keys matching all of the given (NOT None) metadata:
+    return sorted(
+        [
+            key for key in self.prims_params_sources.keys()
+            if (((task is None) or (key[0] == task)) and
+                ((prim_id is None) or (key[1] == prim_id)) and
+                ((dmp_type is None) or (key[2] == dmp_type)) and
+                ((iteration is None) or (key[3] == iteration)))
+        ],
+        key=lambda key: (key[0], key[1], key[2], -1
+                         if key[3] is None else key[3]))
+
+  def getTasks(self):
+    return sorted(set([key[0] for key in self.prims_params_sources.keys()]))
+
+  def getIterations(self, task, prim_id, dmp_type):
+    # returns the (sorted) RL iterations of a primitive (None is NOT included):
+    return sorted([
+        key[3]
+        for key in self.findPrims(task, prim_id, dmp_type)
+        if key[3] is not None
+    ])
+
+  def getParamsLoaderDMP(self, dmp_type):
+    # (only for loading params from text files, hence its model size does NOT
+    #  matter)
+    if (self.params_loader_dmps is None):
+      canonical_sys_discr = CanonicalSystemDiscrete(
+          TauSystem(self.dt, MIN_TAU), 2)
+      self.params_loader_dmps = {
+          "CartCoord":
+              CartesianCoordDMP(25, canonical_sys_discr,
+                                SCHAAL_LOCAL_COORD_FRAME),
+          "Quaternion":
+              QuaternionDMP(25, canonical_sys_discr)
+      }
+    return self.params_loader_dmps[dmp_type]
+
+  def getPrimParams(self, task, prim_id, dmp_type, iteration=None):
+    """Returns the params (dictionary) of a primitive, loading them
+
+       on first access; do NOT modify them in-place (copy.deepcopy() them).
+    """
+    key = (task, prim_id, dmp_type, iteration)
+    assert (key in self.prims_params_sources
+           ), "Primitive " + str(key) + " is NOT in the library!"
+    if (key not in self.prims_params):
+      source = self.prims_params_sources[key]
+      if (source[0] == "binary"):
+        self.prims_params[key] = self.binary_files_params[source[1]][dmp_type][
+            source[2]]
+      else:  # (source[0] == "text")
+        self.prims_params[key] = self.getParamsLoaderDMP(
+            dmp_type).loadParamsAsDict(
+                source[1], **dmp_params_io.PRIMS_PARAMS_FILE_NAMES[dmp_type])
+    return self.prims_params[key]
+
+  def createDMP(self, dmp_type, params):
+    model_size = params["W"].shape[1]
+    canonical_sys_discr = CanonicalSystemDiscrete(
+        TauSystem(self.dt, MIN_TAU), params.get("canonical_order", 2))
+    if (dmp_type == "CartCoord"):
+      dmp = CartesianCoordDMP(model_size, canonical_sys_discr,
+                              params["ctraj_local_coordinate_frame_selection"])
+    else:  # (dmp_type == "Quaternion")
+      dmp = QuaternionDMP(model_size, canonical_sys_discr)
+    dmp_params = copy.deepcopy(params)
+    # (the params loaded from text files are 1-D arrays, instead of the column
+    #  vectors of getParamsAsDict())
+    for param_name in ["A_learn", "mean_start_position", "mean_goal_position"]:
+      dmp_params[param_name] = np.array(dmp_params[param_name]).reshape(-1, 1)
+    dmp_params["mean_tau"] = float(dmp_params["mean_tau"])
+    dmp.setParamsFromDict(dmp_params)
+    return dmp
+
+  def getDMP(self, task, prim_id, dmp_type, iteration=None):
+    """Returns the DMP of a primitive, with its params set (ready to unroll),
+
+       from the LRU cache of the max_num_cached_dmps most-recently-used DMPs
+       (or instantiated, if it is NOT in the cache).
+    """
+    key = (task, prim_id, dmp_type, iteration)
+    if (key in self.cached_dmps):
+      dmp = self.cached_dmps.pop(key)
+    else:
+      dmp = self.createDMP(
+          dmp_type, self.getPrimParams(task, prim_id, dmp_type, iteration))
+      while (len(self.cached_dmps) >= self.max_num_cached_dmps):
+        self.cached_dmps.popitem(last=False)
+    self.cached_dmps[key] = dmp  # (as the most-recently-used)
+    return dmp
+
+  def getPrimsParamsAsDict(self, task, N_primitives, iteration=None):
+    # returns the params of primitives 1..N_primitives of a task, in the format
+    # of loadPrimsParamsAsDictFromDirPath() (see rl_tactile_fb_utils):
+    cdmp_params = {}
+    for dmp_type in dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES.keys():
+      cdmp_params[dmp_type] = [
+          self.getPrimParams(task, n_prim + 1, dmp_type, iteration)
+          for n_prim in range(N_primitives)
+      ]
+    return cdmp_params
+
+  def __len__(self):
+    return len(self.prims_params_sources)
+
+  def __contains__(self, key):
+    return (key in self.prims_params_sources)
@@ -111,16 +111,50 @@ class CartesianCoordDMP(DMPDiscrete, object):
 
     return list_ctraj_local
 
+  def getPreprocessingStats(self):
+    # (the local coordinate system of the last preprocessed demo)
+    return {
+        "T_local_to_global_H":
+            copy.copy(self.ctraj_hmg_transform_local_to_global_matrix),
+        "T_global_to_local_H":
+            copy.copy(self.ctraj_hmg_transform_global_to_local_matrix)
+    }
+
+  def setPreprocessingStats(self, preprocessing_stats):
+    self.ctraj_hmg_transform_local_to_global_matrix = copy.copy(
+        preprocessing_stats["T_local_to_global_H"])
+    self.ctraj_hmg_transform_global_to_local_matrix = copy.copy(
+        preprocessing_stats["T_global_to_local_H"])
+    return None
+
+  def setMeanStartAndGoalPositions(self, start_positions, goal_positions):
+    # (from the global start and goal positions of the demos, column-wise
+    #  stacked; the local ones are w.r.t. the current local coordinate system,
+    #  i.e. the one of the last (remaining) demo, see setPreprocessingStats())
+    super(CartesianCoordDMP,
+          self).setMeanStartAndGoalPositions(start_positions, goal_positions)
+    self.mean_start_global_position = self.getMeanStartPosition()
+    self.mean_goal_global_position = self.getMeanGoalPosition()
+    self.mean_start_local_position = self.cart_coord_transformer.computeCPosAtNewCoordSys(
+        self.mean_start_global_position,
+        self.ctraj_hmg_transform_global_to_local_matrix)
+    self.mean_goal_local_position = self.cart_coord_transformer.computeCPosAtNewCoordSys(
+        self.mean_goal_global_position,
+        self.ctraj_hmg_transform_global_to_local_matrix)
+    return None
+
   def start(self, critical_states, tau_init):
-    assert (
-        self.isValid()
-    ), "Pre-condition(s) checking is failed: this CartesianCoordDMP is invalid!"
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this CartesianCoordDMP is "
+          "invalid!")
 
     critical_states_length = critical_states.getLength()
     assert (critical_states_length >= 2)
     assert (((self.ctraj_local_coord_selection == KROEMER_LOCAL_COORD_FRAME) and
              (critical_states_length < 3)) == False)
-    assert (critical_states.isValid())
+    if (isValidationRequired(self.validation_level, False)):
+      assert (critical_states.isValid())
     assert (critical_states.dmp_num_dimensions == self.dmp_num_dimensions)
     start_state_global_init = critical_states.getDMPStateAtIndex(0)
     approaching_ss_goal_state_global_init = critical_states.getDMPStateAtIndex(
@@ -170,9 +204,10 @@ class CartesianCoordDMP(DMPDiscrete, object):
 
     self.is_started = True
 
-    assert (self.isValid()), (
-        "Post-condition(s) checking is failed: this CartesianCoordDMP became "
-        "invalid!")
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this CartesianCoordDMP became "
+          "invalid!")
     return None
 
   def getNextState(self,
@@ -180,9 +215,10 @@ class CartesianCoordDMP(DMPDiscrete, object):
                    update_canonical_state,
                    is_also_returning_local_next_state=False):
     assert (self.is_started == True)
-    assert (
-        self.isValid()
-    ), "Pre-condition(s) checking is failed: this CartesianCoordDMP is invalid!"
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this CartesianCoordDMP is "
+          "invalid!")
 
     [
         result_dmp_state_local, transform_sys_forcing_term,
@@ -198,7 +234,9 @@ class CartesianCoordDMP(DMPDiscrete, object):
     self.ctraj_critical_states_local_coord.setDMPStateAtIndex(
         1, result_dmp_state_local)
     self.ctraj_critical_states_local_coord.setDMPStateAtIndex(
-        2, self.transform_sys_discrete_cart_coord.getCurrentGoalState())
+        2,
+        self.transform_sys_discrete_cart_coord.getCurrentGoalState(
+            is_snapshot=False))
 
     self.ctraj_critical_states_global_coord = self.cart_coord_transformer.convertCTrajAtOldToNewCoordSys(
         self.ctraj_critical_states_local_coord,
@@ -207,14 +245,44 @@ class CartesianCoordDMP(DMPDiscrete, object):
     result_dmp_state_global = self.ctraj_critical_states_global_coord.getDMPStateAtIndex(
         1)
 
-    assert (self.isValid()), (
-        "Post-condition(s) checking is failed: this CartesianCoordDMP became "
-        "invalid!")
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this CartesianCoordDMP became "
+          "invalid!")
     if (is_also_returning_local_next_state):
       return result_dmp_state_global, result_dmp_state_local, transform_sys_forcing_term, transform_sys_coupling_term_acc, transform_sys_coupling_term_vel, func_approx_basis_function_vector
     else:
       return result_dmp_state_global, transform_sys_forcing_term, transform_sys_coupling_term_acc, transform_sys_coupling_term_vel, func_approx_basis_function_vector
 
+  def getNextStateAtTimeIndex(self, dt, time_index):
+    next_state_local = self.transform_sys_discrete_cart_coord.getNextStateAtTimeIndex(
+        dt, time_index)
+    return self.cart_coord_transformer.convertCTrajAtOldToNewCoordSys(
+        next_state_local, self.ctraj_hmg_transform_local_to_global_matrix)
+
+  def getNextStateTraj(self, dt, traj_length):
+    [next_state_traj_local, forcing_term_traj,
+     basis_function_traj] = super(CartesianCoordDMP,
+                                  self).getNextStateTraj(dt, traj_length)
+
+    # update critical states in local coordinate frame (only current state and current goal state changes)
+    self.ctraj_critical_states_local_coord.setDMPStateAtIndex(
+        1, self.transform_sys_discrete_cart_coord.getCurrentState())
+    self.ctraj_critical_states_local_coord.setDMPStateAtIndex(
+        2, self.transform_sys_discrete_cart_coord.getCurrentGoalState())
+
+    self.ctraj_critical_states_global_coord = self.cart_coord_transformer.convertCTrajAtOldToNewCoordSys(
+        self.ctraj_critical_states_local_coord,
+        self.ctraj_hmg_transform_local_to_global_matrix)
+
+    next_state_traj_global = self.cart_coord_transformer.convertCTrajAtOldToNewCoordSys(
+        next_state_traj_local, self.ctraj_hmg_transform_local_to_global_matrix)
+
+    assert (self.isValid()), (
+        "Post-condition(s) checking is failed: this CartesianCoordDMP became "
+        "invalid!")
+    return next_state_traj_global, forcing_term_traj, basis_function_traj
+
   def getCurrentState(self):
     # update critical states in local coordinate frame (only current state and current goal state changes)
     self.ctraj_critical_states_local_coord.setDMPStateAtIndex(
@@ -318,6 +386,20 @@ class CartesianCoordDMP(DMPDiscrete, object):
     return self.cart_coord_transformer.convertCTrajAtOldToNewCoordSys(
         dmp_state_global, self.ctraj_hmg_transform_global_to_local_matrix)
 
+  def getLocalToGlobalTransform(self):
+    return copy.copy(self.ctraj_hmg_transform_local_to_global_matrix)
+
+  def convertLocalTrajBatchToGlobalTrajBatch(self, X_local, Xd_local,
+                                             Xdd_local,
+                                             list_local_to_global_transform):
+    T_local_to_global_H = np.stack(list_local_to_global_transform)
+    R_local_to_global = T_local_to_global_H[:, 0:3, 0:3]
+    p_local_to_global = T_local_to_global_H[:, 0:3, [3]]
+    X_global = np.matmul(R_local_to_global, X_local) + p_local_to_global
+    Xd_global = np.matmul(R_local_to_global, Xd_local)
+    Xdd_global = np.matmul(R_local_to_global, Xdd_local)
+    return X_global, Xd_global, Xdd_global
+
   def convertGlobalTrajToLocalTraj(self, global_traj, dmp_params_dict=None):
     assert (dmp_params_dict is not None
            ), "For CartesianCoordDMP, dmp_params_dict must be specified!"
@@ -484,6 +566,25 @@ class CartesianCoordDMP(DMPDiscrete, object):
         "invalid!")
     return None
 
+  def getExportedParamsFromDict(self, cart_coord_dmp_params):
+    exported_cart_coord_dmp_params = super(
+        CartesianCoordDMP, self).getExportedParamsFromDict(cart_coord_dmp_params)
+    for key in [
+        "mean_start_global_position", "mean_goal_global_position",
+        "mean_start_local_position", "mean_goal_local_position"
+    ]:
+      exported_cart_coord_dmp_params[key] = np.array(
+          cart_coord_dmp_params[key], dtype=float).reshape(3, 1)
+    exported_cart_coord_dmp_params[
+        "ctraj_local_coordinate_frame_selection"] = int(
+            round(
+                float(cart_coord_dmp_params[
+                    "ctraj_local_coordinate_frame_selection"])))
+    for key in ["T_local_to_global_H", "T_global_to_local_H"]:
+      exported_cart_coord_dmp_params[key] = np.array(
+          cart_coord_dmp_params[key], dtype=float)
+    return exported_cart_coord_dmp_params
+
   def loadParams(
       self,
       dir_path,
@@ -18,6 +18,7 @@ sys.path.append(
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
 from DMPTrajectory import *
 from DMPState import *
+from TrajectoryBuilder import *
 from TauSystem import *
 from DMPUnrollInitParams import *
 from CanonicalSystemDiscrete import *
@@ -69,8 +70,10 @@ def learnCartPrimitiveMultiOnLocalCoord(
   cart_coord_dmp_params['unroll_dt'] = unroll_dt
   cart_coord_dmp_params['unroll_tau'] = unroll_tau
 
-  list_cart_coord_dmpstate_unroll_fit_global = [None] * unroll_traj_length
-  list_cart_coord_dmpstate_unroll_fit_local = [None] * unroll_traj_length
+  cart_coord_dmp_unroll_fit_global_traj_builder = TrajectoryBuilder(
+      DMPTrajectory, unroll_traj_length)
+  cart_coord_dmp_unroll_fit_local_traj_builder = TrajectoryBuilder(
+      DMPTrajectory, unroll_traj_length)
   list_forcing_term = [None] * unroll_traj_length
 
   for i in range(unroll_traj_length):
@@ -83,14 +86,14 @@ def learnCartPrimitiveMultiOnLocalCoord(
     ] = cart_coord_dmp.getNextState(
         unroll_dt, True, is_also_returning_local_next_state=True)
 
-    list_cart_coord_dmpstate_unroll_fit_global[i] = current_state_global
-    list_cart_coord_dmpstate_unroll_fit_local[i] = current_state_local
+    cart_coord_dmp_unroll_fit_global_traj_builder.append(current_state_global)
+    cart_coord_dmp_unroll_fit_local_traj_builder.append(current_state_local)
     list_forcing_term[i] = transform_sys_forcing_term
 
-  cart_coord_dmp_unroll_fit_global_traj = convertDMPStatesListIntoDMPTrajectory(
-      list_cart_coord_dmpstate_unroll_fit_global)
-  cart_coord_dmp_unroll_fit_local_traj = convertDMPStatesListIntoDMPTrajectory(
-      list_cart_coord_dmpstate_unroll_fit_local)
+  cart_coord_dmp_unroll_fit_global_traj = cart_coord_dmp_unroll_fit_global_traj_builder.finalize(
+  )
+  cart_coord_dmp_unroll_fit_local_traj = cart_coord_dmp_unroll_fit_local_traj_builder.finalize(
+  )
   Ffit = np.hstack(list_forcing_term)
 
   return cart_coord_dmp_params, cart_coord_dmp_unroll_fit_global_traj, cart_coord_dmp_unroll_fit_local_traj, Ffit, cart_coord_dmp
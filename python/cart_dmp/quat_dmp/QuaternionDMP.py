@@ -76,19 +76,31 @@ class QuaternionDMP(DMPDiscrete, object):
         "invalid!")
     return preprocessed_list_quat_dmp_trajectory
 
+  def setMeanStartAndGoalPositions(self, start_positions, goal_positions):
+    # (as in preprocess(), from the start and goal Quaternions of the demos,
+    #  column-wise stacked)
+    self.mean_start_position = util_quat.computeAverageQuaternions(
+        start_positions.T)
+    self.mean_goal_position = util_quat.computeAverageQuaternions(
+        goal_positions.T)
+    return None
+
   def start(self, critical_states, tau_init):
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this QuaternionDMP is invalid!"
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid(
+      )), "Pre-condition(s) checking is failed: this QuaternionDMP is invalid!"
 
     critical_states_length = critical_states.getLength()
     assert (critical_states_length >= 2)
-    assert (critical_states.isValid())
+    if (isValidationRequired(self.validation_level, False)):
+      assert (critical_states.isValid())
     assert (critical_states.dmp_num_dimensions == self.dmp_num_dimensions)
     start_state_init = critical_states.getQuaternionDMPStateAtIndex(0)
     goal_state_init = critical_states.getQuaternionDMPStateAtIndex(
         critical_states_length - 1)
-    assert (start_state_init.isValid())
-    assert (goal_state_init.isValid())
+    if (isValidationRequired(self.validation_level, False)):
+      assert (start_state_init.isValid())
+      assert (goal_state_init.isValid())
     assert (start_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
     assert (goal_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
     assert (tau_init >= MIN_TAU)
@@ -97,9 +109,10 @@ class QuaternionDMP(DMPDiscrete, object):
     self.transform_sys_discrete_quat.start(start_state_init, goal_state_init)
     self.is_started = True
 
-    assert (self.isValid()), (
-        "Post-condition(s) checking is failed: this QuaternionDMP became "
-        "invalid!")
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this QuaternionDMP became "
+          "invalid!")
     return None
 
   def extractSetTrajectories(self,
@@ -128,15 +141,12 @@ class QuaternionDMP(DMPDiscrete, object):
         dt=dt,
         fc=smoothing_cutoff_frequency)
 
-  def learnGetDefaultUnrollParams(self, set_traj_input, robot_task_servo_rate):
-    W, mean_A_learn, mean_tau, Ft, Fp, QgT, cX, cV, PSI = self.learn(
-        set_traj_input, robot_task_servo_rate)
+  def getDefaultUnrollCriticalStates(self):
     critical_states_list_learn = [None] * 2
     critical_states_list_learn[0] = QuaternionDMPState(self.mean_start_position)
     critical_states_list_learn[-1] = QuaternionDMPState(self.mean_goal_position)
-    critical_states_learn = convertQuaternionDMPStatesListIntoQuaternionDMPTrajectory(
+    return convertQuaternionDMPStatesListIntoQuaternionDMPTrajectory(
         critical_states_list_learn)
-    return critical_states_learn, W, mean_A_learn, self.mean_tau, Ft, Fp, QgT, cX, cV, PSI
 
   def getDMPUnrollInitParams(self, critical_states_learn, tau):
     return QuaternionDMPUnrollInitParams(critical_states_learn, tau)
@@ -145,6 +155,80 @@ class QuaternionDMP(DMPDiscrete, object):
     return convertQuaternionDMPStatesListIntoQuaternionDMPTrajectory(
         dmpstates_list)
 
+  def createTrajectoryBuilder(self, traj_length=None):
+    return TrajectoryBuilder(QuaternionDMPTrajectory, traj_length)
+
+  def unrollBatch(self, list_critical_states_unroll, list_tau_unroll,
+                  time_unroll_max, dt, list_weights, list_A_learn):
+    """Unrolls K parameter sets (weights, A_learn, tau, and critical states)
+
+       in one pass, and returns the unrolled trajectories as tensors:
+       Q, Qd, and Qdd (each of size K X 4 X T), omega and omegad
+       (each of size K X 3 X T), and time (of size K X 1 X T).
+       The parameters of this QuaternionDMP are restored afterwards.
+    """
+    K = len(list_weights)
+    assert (K >= 1)
+    assert (len(list_A_learn) == K)
+    assert (len(list_tau_unroll) == K)
+    assert (len(list_critical_states_unroll) == K)
+    traj_length = int(np.round(time_unroll_max / dt) + 1)
+
+    [weights_orig, A_learn_orig] = self.getParams()
+    tau = np.zeros((K, 1))
+    Q_init = np.zeros((K, 4))
+    omega_init = np.zeros((K, 3))
+    omegad_init = np.zeros((K, 3))
+    Qg_init = np.zeros((K, 4))
+    QG = np.zeros((K, 4))
+    scaled_forcing_term_trajectory = np.zeros((K, 3, traj_length))
+    time_init = np.zeros((K, 1, 1))
+    for k in range(K):
+      self.setParams(list_weights[k], list_A_learn[k])
+      self.startWithUnrollParams(
+          self.getDMPUnrollInitParams(list_critical_states_unroll[k],
+                                      list_tau_unroll[k]))
+      tau[k, 0] = self.tau_sys.getTauRelative()
+      Q_init[k, :] = self.transform_sys_discrete_quat.current_state.getQ()[:, 0]
+      omega_init[k, :] = self.transform_sys_discrete_quat.current_state.getOmega(
+      )[:, 0]
+      omegad_init[
+          k, :] = self.transform_sys_discrete_quat.current_state.getOmegad()[:, 0]
+      Qg_init[k, :] = self.transform_sys_discrete_quat.goal_sys.getCurrentGoalState(
+      ).getQ()[:, 0]
+      QG[k, :] = self.transform_sys_discrete_quat.goal_sys.getSteadyStateGoalPosition(
+      )[:, 0]
+      time_init[k, :, :] = self.transform_sys_discrete_quat.current_state.time
+      [forcing_term_trajectory,
+       _] = self.transform_sys_discrete_quat.getForcingTermTrajForUnroll(
+           dt, traj_length)
+      scaled_forcing_term_trajectory[k, :, :] = (
+          forcing_term_trajectory *
+          self.transform_sys_discrete_quat.getScalingAmplitude())
+    self.is_started = False
+    self.setParams(weights_orig, A_learn_orig)
+
+    [QT, omegaT, omegadT, _, _, _,
+     _] = self.transform_sys_discrete_quat.integrateNextQuatStateTrajBatch(
+         dt, tau, Q_init, omega_init, omegad_init, Qg_init, QG,
+         scaled_forcing_term_trajectory)
+    time = time_init + (
+        dt * np.arange(1, traj_length + 1).reshape(1, 1, traj_length))
+    [QdT, QddT] = util_quat.computeQDotAndQDoubleDotTrajectory(
+        np.moveaxis(QT, 1, 2).reshape(K * traj_length, 4),
+        np.moveaxis(omegaT, 1, 2).reshape(K * traj_length, 3),
+        np.moveaxis(omegadT, 1, 2).reshape(K * traj_length, 3))
+    QdT = np.moveaxis(QdT.reshape(K, traj_length, 4), 2, 1)
+    QddT = np.moveaxis(QddT.reshape(K, traj_length, 4), 2, 1)
+    return QT, QdT, QddT, omegaT, omegadT, time
+
+  def convertBatchUnrollIntoDMPTrajectoryList(self, batch_unroll):
+    [QT, QdT, QddT, omegaT, omegadT, time] = batch_unroll
+    return [
+        QuaternionDMPTrajectory(QT[k], QdT[k], QddT[k], omegaT[k], omegadT[k],
+                                time[k]) for k in range(QT.shape[0])
+    ]
+
   def plotDemosVsUnroll(self,
                         set_demo_Qtrajs,
                         unroll_Qtraj,
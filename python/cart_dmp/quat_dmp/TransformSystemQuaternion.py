@@ -60,11 +60,12 @@ class TransformSystemQuaternion(TransformSystemDiscrete, object):
     return True
 
   def start(self, start_quat_state_init, goal_quat_state_init):
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this TransformSystemQuaternion is"
-        " invalid!")
-    assert (start_quat_state_init.isValid())
-    assert (goal_quat_state_init.isValid())
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this "
+          "TransformSystemQuaternion is invalid!")
+      assert (start_quat_state_init.isValid())
+      assert (goal_quat_state_init.isValid())
     assert (start_quat_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
     assert (goal_quat_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
 
@@ -103,16 +104,18 @@ class TransformSystemQuaternion(TransformSystemDiscrete, object):
     self.resetCouplingTerm()
     self.is_started = True
 
-    assert (self.isValid()), (
-        "Post-condition(s) checking is failed: this TransformSystemQuaternion "
-        "became invalid!")
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this "
+          "TransformSystemQuaternion became invalid!")
     return None
 
   def getNextState(self, dt):
     assert (self.is_started)
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this TransformSystemQuaternion is"
-        " invalid!")
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this "
+          "TransformSystemQuaternion is invalid!")
     assert (dt > 0.0)
 
     tau = self.tau_sys.getTauRelative()
@@ -156,28 +159,181 @@ class TransformSystemQuaternion(TransformSystemDiscrete, object):
     ethad = ((self.alpha *
               ((self.beta * log_quat_diff_Qg_and_Q) - etha)) +
              (forcing_term * A) + ct_acc) * 1.0 / tau
-    assert (np.isnan(ethad).any() == False), "ethad contains NaN!"
+    if (isValidationRequired(self.validation_level)):
+      assert (np.isnan(ethad).any() == False), "ethad contains NaN!"
 
     omegad = ethad * 1.0 / tau
 
     time = time + dt
 
-    self.current_state = QuaternionDMPState(
-        Q_init=Q,
+    # (updated in-place, i.e. in the current states' buffers)
+    self.current_state.X = Q
+    self.current_state.omega = omega
+    self.current_state.omegad = omegad
+    self.current_state.time = time
+    self.current_state.computeQdAndQdd()
+    self.current_velocity_state.X = etha
+    self.current_velocity_state.Xd = ethad
+    self.current_velocity_state.time = time
+    next_state = self.current_state
+
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this "
+          "TransformSystemQuaternion became invalid!")
+    return next_state, forcing_term, ct_acc, ct_vel, basis_function_vector
+
+  def getNextStateTraj(self, dt, traj_length):
+    """Vectorized equivalent of traj_length consecutive calls of getNextState(dt),
+
+       each followed by the canonical state and goal state updates.
+       Coupling terms are NOT supported here.
+    """
+    assert (self.is_started)
+    assert (self.isValid()), (
+        "Pre-condition(s) checking is failed: this TransformSystemQuaternion is"
+        " invalid!")
+
+    tau = self.tau_sys.getTauRelative()
+    forcing_term_trajectory, basis_function_trajectory = self.getForcingTermTrajForUnroll(
+        dt, traj_length)
+    A = self.getScalingAmplitude()
+
+    [QT, omegaT, omegadT, ethaT, ethadT, QgT,
+     omegagT] = self.integrateNextQuatStateTrajBatch(
+         dt, tau * np.ones((1, 1)),
+         self.current_state.getQ().T,
+         self.current_state.getOmega().T,
+         self.current_state.getOmegad().T,
+         self.goal_sys.getCurrentGoalState().getQ().T,
+         self.goal_sys.getSteadyStateGoalPosition().T,
+         (forcing_term_trajectory * A).reshape(
+             (1, self.dmp_num_dimensions, traj_length)))
+    time = self.current_state.time + (
+        dt * np.arange(1, traj_length + 1).reshape(1, traj_length))
+
+    next_state_trajectory = QuaternionDMPTrajectory(
+        Q_init=QT[0],
         Qd_init=None,
         Qdd_init=None,
-        omega_init=omega,
-        omegad_init=omegad,
+        omega_init=omegaT[0],
+        omegad_init=omegadT[0],
         time_init=time)
-    self.current_state.computeQdAndQdd()
+    next_state_trajectory.computeQdAndQdd()
+
+    self.current_state = next_state_trajectory.getQuaternionDMPStateAtIndex(
+        traj_length - 1)
     self.current_velocity_state = DMPState(
-        X_init=etha, Xd_init=ethad, Xdd_init=None, time_init=time)
-    next_state = copy.copy(self.current_state)
+        X_init=ethaT[0][:, [-1]],
+        Xd_init=ethadT[0][:, [-1]],
+        Xdd_init=None,
+        time_init=time[:, [-1]])
+    if (traj_length > 1):
+      prev_omegag = omegagT[0][:, [-2]]
+    else:
+      prev_omegag = self.goal_sys.current_goal_state.getOmega()
+    self.goal_sys.current_goal_state.setQ(QgT[0][:, [-1]])
+    self.goal_sys.current_goal_state.setOmega(omegagT[0][:, [-1]])
+    self.goal_sys.current_goal_state.setOmegad(
+        (omegagT[0][:, [-1]] - prev_omegag) / dt)
+    self.goal_sys.current_goal_state.computeQdAndQdd()
+    self.goal_sys.current_goal_state.setTime(
+        self.goal_sys.current_goal_state.getTime() + (traj_length * dt))
 
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this TransformSystemQuaternion "
         "became invalid!")
-    return next_state, forcing_term, ct_acc, ct_vel, basis_function_vector
+    return next_state_trajectory, forcing_term_trajectory, basis_function_trajectory
+
+  def getScalingAmplitude(self):
+    A = util_quat.computeLogQuatDifference(
+        self.goal_sys.getSteadyStateGoalPosition().T,
+        self.start_state.getQ().T).reshape(1, self.dmp_num_dimensions).T
+
+    for d in range(self.dmp_num_dimensions):
+      if (self.is_using_scaling[d]):
+        if (np.fabs(self.A_learn[d, 0]) < MIN_FABS_AMPLITUDE):
+          A[d, 0] = 1.0
+        else:
+          A[d, 0] = A[d, 0] * 1.0 / self.A_learn[d, 0]
+      else:
+        A[d, 0] = 1.0
+    return A
+
+  def integrateNextQuatStateTrajBatch(self, dt, tau, Q_init, omega_init,
+                                      omegad_init, Qg_init, QG,
+                                      scaled_forcing_term_trajectory):
+    """Integrates a batch of K (un-coupled) Quaternion transformation systems,
+
+       together with their goal evolution systems,
+       over traj_length time steps, all at once.
+       tau is of size K X 1; Q_init, Qg_init, and QG are of size K X 4;
+       omega_init and omegad_init are of size K X 3;
+       scaled_forcing_term_trajectory is of size K X 3 X traj_length.
+       Returns the trajectories of Q, omega, omegad, etha, ethad,
+       Qg, and omegag (the last two are recorded AFTER each goal update),
+       each of size K X (4 or 3) X traj_length.
+    """
+    assert (self.unroll_integrator == EULER_INTEGRATOR), (
+        "Only EULER_INTEGRATOR is supported for Quaternion DMP unrolling!")
+    assert (dt > 0.0)
+    assert (len(scaled_forcing_term_trajectory.shape) == 3)
+    [K, D, traj_length] = scaled_forcing_term_trajectory.shape
+    assert (D == self.dmp_num_dimensions)
+    assert (tau.shape == (K, 1))
+    assert (Q_init.shape == (K, 4))
+    assert (Qg_init.shape == (K, 4))
+    assert (QG.shape == (K, 4))
+    assert (omega_init.shape == (K, D))
+    assert (omegad_init.shape == (K, D))
+
+    forcing_traj = np.ascontiguousarray(
+        np.moveaxis(scaled_forcing_term_trajectory, 2, 0))
+    QT = np.zeros((traj_length, K, 4))
+    omegaT = np.zeros((traj_length, K, D))
+    omegadT = np.zeros((traj_length, K, D))
+    ethaT = np.zeros((traj_length, K, D))
+    ethadT = np.zeros((traj_length, K, D))
+    QgT = np.zeros((traj_length, K, 4))
+    omegagT = np.zeros((traj_length, K, D))
+    Q = Q_init
+    omega = omega_init
+    omegad = omegad_init
+    Qg = Qg_init
+    for i in range(traj_length):
+      Q = util_quat.integrateQuat(Q, omega, dt).reshape(K, 4)
+      omega = omega + (omegad * dt)
+      etha = tau * omega
+      log_quat_diff_Qg_and_Q = util_quat.computeLogQuatDifference(
+          Qg, Q).reshape(K, D)
+      ethad = ((self.alpha * ((self.beta * log_quat_diff_Qg_and_Q) - etha)) +
+               forcing_traj[i]) * 1.0 / tau
+      omegad = ethad * 1.0 / tau
+
+      # goal evolution:
+      log_quat_diff_g = util_quat.computeLogQuatDifference(QG,
+                                                           Qg).reshape(K, D)
+      omegag = (self.goal_sys.alpha * 1.0 / tau) * log_quat_diff_g
+      Qg = util_quat.integrateQuat(Qg, omegag, dt).reshape(K, 4)
+
+      QT[i] = Q
+      omegaT[i] = omega
+      omegadT[i] = omegad
+      ethaT[i] = etha
+      ethadT[i] = ethad
+      QgT[i] = Qg
+      omegagT[i] = omegag
+    assert (np.isnan(ethadT).any() == False), "ethad contains NaN!"
+
+    return [
+        np.moveaxis(QT, 0, 2),
+        np.moveaxis(omegaT, 0, 2),
+        np.moveaxis(omegadT, 0, 2),
+        np.moveaxis(ethaT, 0, 2),
+        np.moveaxis(ethadT, 0, 2),
+        np.moveaxis(QgT, 0, 2),
+        np.moveaxis(omegagT, 0, 2)
+    ]
 
   def getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemo(
       self,
@@ -219,21 +375,27 @@ class TransformSystemQuaternion(TransformSystemDiscrete, object):
     self.start(start_quatdmpstate_demo_local,
                goal_steady_quatdmpstate_demo_local)
     tau_relative = self.tau_sys.getTauRelative()
+    # without canonical coupling, the canonical trajectory is taken from
+    # the (cached) closed-form phase table:
+    is_canonical_traj_closed_form = all(
+        canonical_coupler is None
+        for canonical_coupler in self.canonical_sys.canonical_couplers_list)
+    if (is_canonical_traj_closed_form):
+      [X, V] = self.canonical_sys.unrollCanonicalState(dt, traj_length)
     X_list = [None] * traj_length
     V_list = [None] * traj_length
     Qg_list = [None] * traj_length
     for i in range(traj_length):
-      x = self.canonical_sys.getCanonicalPosition()
-      v = self.canonical_sys.getCanonicalVelocity()
-      Qg = self.goal_sys.getCurrentGoalState().getQ()
-      X_list[i] = x
-      V_list[i] = v
-      Qg_list[i] = Qg
-
-      self.canonical_sys.updateCanonicalState(dt)
+      if (not is_canonical_traj_closed_form):
+        X_list[i] = self.canonical_sys.getCanonicalPosition()
+        V_list[i] = self.canonical_sys.getCanonicalVelocity()
+        self.canonical_sys.updateCanonicalState(dt)
+      Qg_list[i] = self.goal_sys.getCurrentGoalState().getQ()
+
       self.updateCurrentGoalState(dt)
-    X = np.hstack(X_list).reshape((1, traj_length))
-    V = np.hstack(V_list).reshape((1, traj_length))
+    if (not is_canonical_traj_closed_form):
+      X = np.hstack(X_list).reshape((1, traj_length))
+      V = np.hstack(V_list).reshape((1, traj_length))
     QgT = np.hstack(Qg_list)
     self.is_started = False
     self.canonical_sys.is_started = False
@@ -247,6 +409,54 @@ class TransformSystemQuaternion(TransformSystemDiscrete, object):
         "became invalid!")
     return quat_goal_position_trajectory, canonical_position_trajectory, canonical_velocity_trajectory, tau, tau_relative, A_learn
 
+  def getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemoBatch(
+      self,
+      list_quatdmptrajectory_demo_local,
+      robot_task_servo_rate,
+      steady_state_quat_goal_position_local=None):
+    # (the Quaternion goal evolution is NOT linear in Q, hence per demo)
+    list_outputs = [
+        self.getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemo(
+            quatdmptrajectory_demo_local, robot_task_servo_rate,
+            steady_state_quat_goal_position_local)
+        for quatdmptrajectory_demo_local in list_quatdmptrajectory_demo_local
+    ]
+    return [list(outputs) for outputs in zip(*list_outputs)]
+
+  def getTargetForcingTermTrajBatch(self, list_quatdmptrajectory_demo_local,
+                                    robot_task_servo_rate):
+    list_outputs = [
+        self.getTargetForcingTermTraj(quatdmptrajectory_demo_local,
+                                      robot_task_servo_rate)
+        for quatdmptrajectory_demo_local in list_quatdmptrajectory_demo_local
+    ]
+    [
+        list_F_target, list_cX, list_cV, list_tau, list_tau_relative,
+        list_A_learn, list_QgT
+    ] = [list(outputs) for outputs in zip(*list_outputs)]
+    return np.hstack(list_F_target), np.hstack(list_cX), np.hstack(
+        list_cV), list_tau, list_tau_relative, list_A_learn, np.hstack(list_QgT)
+
+  def getTargetCouplingTermTrajBatch(self, list_quatdmptrajectory_demo_local,
+                                     robot_task_servo_rate,
+                                     steady_state_quat_goal_position_local):
+    list_outputs = [
+        self.getTargetCouplingTermTraj(quatdmptrajectory_demo_local,
+                                       robot_task_servo_rate,
+                                       steady_state_quat_goal_position_local)
+        for quatdmptrajectory_demo_local in list_quatdmptrajectory_demo_local
+    ]
+    [
+        list_C_target, _, _, list_cX, list_cV, list_tau, list_tau_relative,
+        list_QgT
+    ] = [list(outputs) for outputs in zip(*list_outputs)]
+    cX = np.hstack(list_cX)
+    cV = np.hstack(list_cV)
+    F, PSI = self.func_approx.getForcingTermTraj(cX, cV)
+    return np.hstack(
+        list_C_target
+    ), F, PSI, cX, cV, list_tau, list_tau_relative, np.hstack(list_QgT)
+
   def getTargetForcingTermTraj(self,
                                quatdmptrajectory_demo_local,
                                robot_task_servo_rate,
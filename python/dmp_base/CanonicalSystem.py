@@ -24,12 +24,18 @@ class CanonicalSystem:
     self.tau_sys = tau_system
     self.canonical_couplers_list = canonical_couplers_list
     self.is_started = False
+    self.validation_level = None
 
   def isValid(self):
     assert (self.tau_sys != None), 'TauSystem tau_sys does NOT exist!'
     assert (self.tau_sys.isValid()), 'TauSystem tau_sys is invalid!'
     return True
 
+  def setValidationLevel(self, new_validation_level):
+    assertValidValidationLevel(new_validation_level)
+    self.validation_level = new_validation_level
+    return None
+
   def resetCouplingTerm(self):
     for canonical_coupler_idx in range(len(self.canonical_couplers_list)):
       if (self.canonical_couplers_list[canonical_coupler_idx] is not None):
@@ -19,6 +19,7 @@ from FunctionApproximator import *
 from TransformationSystem import *
 from DMPState import *
 from DMPTrajectory import *
+from TrajectoryBuilder import *
 from DataIO import *
 from utility_states_trajectories import smoothStartEndNDTrajectoryBasedOnPosition
 import utilities as py_util
@@ -46,6 +47,7 @@ class DMP:
     self.mean_start_position = np.zeros((self.dmp_num_dimensions, 1))
     self.mean_goal_position = np.zeros((self.dmp_num_dimensions, 1))
     self.mean_tau = 0.0
+    self.validation_level = None
 
   def isValid(self):
     assert (self.dmp_num_dimensions > 0), "self.dmp_num_dimensions=" + str(
@@ -100,12 +102,31 @@ class DMP:
             0.0), "self.mean_tau=" + str(self.mean_tau) + " < 0.0 (invalid!)"
     return True
 
+  def setValidationLevel(self, new_validation_level):
+    """Sets the validation level of this DMP and of all of its components
+
+       (tau system, canonical system, function approximator, and
+       transformation system, including its goal system).
+       new_validation_level=None means following the global validation level
+       (see setGlobalValidationLevel()).
+    """
+    assertValidValidationLevel(new_validation_level)
+    self.validation_level = new_validation_level
+    self.tau_sys.setValidationLevel(new_validation_level)
+    self.canonical_sys.setValidationLevel(new_validation_level)
+    self.func_approx.setValidationLevel(new_validation_level)
+    self.transform_sys.setValidationLevel(new_validation_level)
+    return None
+
   def getMeanTau(self):
     return copy.copy(self.mean_tau)
 
   def convertDMPStatesListIntoDMPTrajectory(self, dmpstates_list):
     return convertDMPStatesListIntoDMPTrajectory(dmpstates_list)
 
+  def createTrajectoryBuilder(self, traj_length=None):
+    return TrajectoryBuilder(DMPTrajectory, traj_length)
+
   def setTransformSystemCouplingTermUsagePerDimensions(
       self, is_using_transform_sys_coupling_term_at_dimension_init):
     return self.transform_sys.setCouplingTermUsagePerDimensions(
@@ -25,6 +25,7 @@ class FunctionApproximator:
     self.model_size = model_size_init
     self.canonical_sys = canonical_system
     self.weights = np.zeros((self.dmp_num_dimensions, self.model_size))
+    self.validation_level = None
 
   def isValid(self):
     assert (self.dmp_num_dimensions > 0), "self.dmp_num_dimensions=" + str(
@@ -45,6 +46,11 @@ class FunctionApproximator:
                     self.model_size)
     return True
 
+  def setValidationLevel(self, new_validation_level):
+    assertValidValidationLevel(new_validation_level)
+    self.validation_level = new_validation_level
+    return None
+
   def getWeights(self):
     assert (self.isValid())
     return copy.copy(self.weights)
@@ -62,6 +62,7 @@ class TransformationSystem:
       self.goal_sys = goal_system
     else:
       self.goal_sys = GoalSystem(self.dmp_num_dimensions, self.tau_sys)
+    self.validation_level = None
 
   def isValid(self):
     assert (self.dmp_num_dimensions > 0), "self.dmp_num_dimensions=" + str(
@@ -116,6 +117,12 @@ class TransformationSystem:
                self.dmp_num_dimensions) + "!"
     return True
 
+  def setValidationLevel(self, new_validation_level):
+    assertValidValidationLevel(new_validation_level)
+    self.validation_level = new_validation_level
+    self.goal_sys.setValidationLevel(new_validation_level)
+    return None
+
   def resetCouplingTerm(self):
     for transform_coupler_idx in range(len(self.transform_couplers_list)):
       if (self.transform_couplers_list[transform_coupler_idx] is not None):
@@ -161,8 +168,12 @@ class TransformationSystem:
         " invalid!")
     return None
 
-  def getCurrentState(self):
-    return copy.copy(self.current_state)
+  def getCurrentState(self, is_snapshot=True):
+    # is_snapshot=False returns the current state itself (NO copy),
+    # which is updated in-place by the next time step(s):
+    if (is_snapshot):
+      return copy.copy(self.current_state)
+    return self.current_state
 
   def setCurrentState(self, new_current_state):
     assert (self.isValid()), (
@@ -175,7 +186,10 @@ class TransformationSystem:
             self.current_state.dmp_num_dimensions
         ) + " is mis-matched with new_current_state.dmp_num_dimensions=" + str(
             new_current_state.dmp_num_dimensions) + "!"
-    self.current_state = copy.copy(new_current_state)
+    if (type(self.current_state) == type(new_current_state)):
+      self.current_state.copyFieldValuesFrom(new_current_state)
+    else:
+      self.current_state = copy.copy(new_current_state)
     self.updateCurrentVelocityStateFromCurrentState()
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this TransformationSystem became"
@@ -200,8 +214,8 @@ class TransformationSystem:
         " invalid!")
     return None
 
-  def getCurrentGoalState(self):
-    return self.goal_sys.getCurrentGoalState()
+  def getCurrentGoalState(self, is_snapshot=True):
+    return self.goal_sys.getCurrentGoalState(is_snapshot)
 
   def setCurrentGoalState(self, new_current_goal_state):
     return self.goal_sys.setCurrentGoalState(new_current_goal_state)
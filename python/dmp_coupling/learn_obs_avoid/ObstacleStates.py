@@ -16,6 +16,8 @@ from DMPState import *
 class ObstacleStates(DMPState, object):
     'Class for a group/bundle of states of obstacles.'
     
+    __slots__ = ()
+    
     def isValid(self):
         assert (super(ObstacleStates, self).isValid())
         assert (self.time.shape[1] == 1)
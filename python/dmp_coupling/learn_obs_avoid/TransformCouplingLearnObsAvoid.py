@@ -185,16 +185,17 @@ class TransformCouplingLearnObsAvoid(TransformCoupling, object):
         
         self.tau_sys.setTauBase(tau)
         
-        for i in range(traj_length):
-            self.endeff_ccstate_local.X = Y_obs_local_shifted[:,i].reshape(3,1)
-            self.endeff_ccstate_local.Xd = Yd_obs_local_shifted[:,i].reshape(3,1)
-            self.endeff_ccstate_local.Xdd = Ydd_obs_local_shifted[:,i].reshape(3,1)
-            self.endeff_ccstate_local.time = demo_obs_avoid_traj_local.time[:,i].reshape(1,1)
-            
-            self.point_obstacles_ccstate_local.time = demo_obs_avoid_traj_local.time[:,i].reshape(1,1)
+        demo_obs_avoid_traj_local_shifted = DMPTrajectory(Y_obs_local_shifted,
+                                                          Yd_obs_local_shifted,
+                                                          Ydd_obs_local_shifted,
+                                                          demo_obs_avoid_traj_local.getTime())
+        
+        # (zero-copy) views of the end-effector states, one per time step:
+        for i, endeff_ccstate_local in enumerate(demo_obs_avoid_traj_local_shifted):
+            self.point_obstacles_ccstate_local.time = endeff_ccstate_local.time
             
             sub_X_vector = self.computeObsAvoidCtFeat(self.point_obstacles_ccstate_local,
-                                                      self.endeff_ccstate_local)
+                                                      endeff_ccstate_local)
             
             list_sub_X_vectors[i] = sub_X_vector
         
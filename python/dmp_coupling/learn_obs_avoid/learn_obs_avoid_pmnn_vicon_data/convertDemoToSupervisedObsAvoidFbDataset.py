@@ -35,6 +35,7 @@ def convertDemoToSupervisedObsAvoidFbDataset():
     data_global_coord = prepareDemoDatasetLOAVicon()
     
     saveObj(data_global_coord, 'data_multi_demo_vicon_static_global_coord.pkl')
+    saveDemoDatasetLOAViconStore(data_global_coord, 'data_multi_demo_vicon_static_global_coord_store/')
     
     # end of Demo Dataset Preparation
     
@@ -21,6 +21,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../dmp_coupling/l
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../utilities/'))
 from DMPState import *
 from DMPTrajectory import *
+from TrajectoryBuilder import *
 from TauSystem import *
 from DMPUnrollInitParams import *
 from CartesianCoordDMP import *
@@ -60,7 +61,7 @@ def unrollLearnedObsAvoidViconTraj(demo_obs_avoid_traj_global,
     
     cart_coord_dmp.startWithUnrollParams(dmp_unroll_init_params)
     
-    list_ccdmpstate_loa_unroll_global = [None] * unroll_traj_length
+    ccdmp_loa_unroll_global_traj_builder = TrajectoryBuilder(DMPTrajectory, unroll_traj_length)
     list_ctacc = [None] * unroll_traj_length
     list_pmnn_input_vector = [None] * unroll_traj_length
     
@@ -82,7 +83,7 @@ def unrollLearnedObsAvoidViconTraj(demo_obs_avoid_traj_global,
          _, 
          _] = cart_coord_dmp.getNextState(unroll_dt, True)
         
-        list_ccdmpstate_loa_unroll_global[i] = current_state_global
+        ccdmp_loa_unroll_global_traj_builder.append(current_state_global)
         list_ctacc[i] = transform_sys_coupling_term_acc
         if (is_using_coupling_term):
             list_pmnn_input_vector[i] = tcloa.pmnn_input_vector.T
@@ -93,6 +94,6 @@ def unrollLearnedObsAvoidViconTraj(demo_obs_avoid_traj_global,
         sub_X_unroll = []
         cart_coord_dmp.transform_sys_discrete_cart_coord.transform_couplers_list[0] = tcloa # restore the learned obstacle avoidance coupling term attachment to the transformation system
     sub_Ct_unroll = np.hstack(list_ctacc)
-    ccdmp_loa_unroll_global_traj = convertDMPStatesListIntoDMPTrajectory(list_ccdmpstate_loa_unroll_global)
+    ccdmp_loa_unroll_global_traj = ccdmp_loa_unroll_global_traj_builder.finalize()
     
     return sub_X_unroll, sub_Ct_unroll, ccdmp_loa_unroll_global_traj
\ No newline at end of file
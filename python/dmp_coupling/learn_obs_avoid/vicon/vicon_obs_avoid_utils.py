@@ -11,16 +11,22 @@ import os
 import sys
 import copy
 import glob
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../dmp_state/'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../utilities/'))
 from DataIO import *
+from DemoDatasetStore import *
 from utilities import *
 
-def prepareDemoDatasetLOAVicon(freq=300.0, dmp_home_dir_path='../../../../'):
+def prepareDemoDatasetLOAVicon(freq=300.0, dmp_home_dir_path='../../../../', num_threads=1, is_printing_parse_time=False):
+    # num_threads > 1 loads the files concurrently (by a pool of num_threads threads), in the same order
+    # (see extractTrajectoriesFromFiles()):
     trajs_extraction_version = 2
     dir_path = dmp_home_dir_path + 'data/dmp_coupling/learn_obs_avoid/static_obs/data_multi_demo_vicon_static/'
     
     data_global_coord = {}
-    data_global_coord["baseline"] = extractSetCartCoordTrajectories(dir_path + '/baseline/endeff_trajs/')
+    data_global_coord["baseline"] = extractSetCartCoordTrajectories(dir_path + '/baseline/endeff_trajs/', 
+                                                                    num_threads=num_threads, 
+                                                                    is_printing_parse_time=is_printing_parse_time)
     obs_avoid_dominant_axis_annotation = np.loadtxt(dir_path + '/data_annotation_obs_avoid_dominant_axis.txt', dtype=int)
     obs_avoid_demo_consistency_annotation = np.loadtxt(dir_path + '/data_annotation_obs_avoid_consistency.txt')
     
@@ -33,11 +39,67 @@ def prepareDemoDatasetLOAVicon(freq=300.0, dmp_home_dir_path='../../../../'):
     N_settings = countNumericSubdirs(dir_path)
     data_global_coord["obs_avoid"] = [[None] * N_settings for j in range(4)]
     
+    # all files (of all settings) are extracted by a single (order-preserving) pool, 
+    # i.e. [obs_markers_global_coord file, endeff_trajs files] of setting 1, then of setting 2, etc.:
+    list_setting_files = [None] * N_settings
     for i in range(N_settings):
         setting_dir_path = dir_path + "/" + str(i + 1) + "/"
-        data_global_coord["obs_avoid"][0][i] = np.loadtxt(setting_dir_path + data_global_coord["obs_avoid_var_descriptor"][0] + '.txt')
-        data_global_coord["obs_avoid"][1][i] = extractSetCartCoordTrajectories(setting_dir_path + data_global_coord["obs_avoid_var_descriptor"][1] + '/')
+        list_setting_files[i] = ([setting_dir_path + data_global_coord["obs_avoid_var_descriptor"][0] + '.txt'] + 
+                                 getTrajectoryFilesList(setting_dir_path + data_global_coord["obs_avoid_var_descriptor"][1] + '/'))
+    
+    def extractSettingFile(setting_file_path):
+        if (setting_file_path.endswith(data_global_coord["obs_avoid_var_descriptor"][0] + '.txt')):
+            return np.array(loadTextFileCached(setting_file_path))
+        else:
+            return extractNDTrajectory(setting_file_path, 3)
+    
+    list_extracted_setting_files = extractTrajectoriesFromFiles([setting_file for setting_files in list_setting_files for setting_file in setting_files], 
+                                                                extractSettingFile, num_threads, is_printing_parse_time)
+    setting_file_idx = 0
+    for i in range(N_settings):
+        N_setting_files = len(list_setting_files[i])
+        data_global_coord["obs_avoid"][0][i] = list_extracted_setting_files[setting_file_idx]
+        data_global_coord["obs_avoid"][1][i] = list_extracted_setting_files[setting_file_idx+1:setting_file_idx+N_setting_files]
+        setting_file_idx += N_setting_files
         data_global_coord["obs_avoid"][2][i] = obs_avoid_dominant_axis_annotation[i]
         data_global_coord["obs_avoid"][3][i] = (obs_avoid_demo_consistency_annotation==(i+1)).any()
     
-    return data_global_coord
\ No newline at end of file
+    return data_global_coord
+
+def saveDemoDatasetLOAViconStore(data_global_coord, store_dir_path):
+    # saves the output of prepareDemoDatasetLOAVicon() as (consolidated) demo dataset stores
+    # (see DemoDatasetStore), instead of one huge pickle file:
+    var_descriptor = data_global_coord["obs_avoid_var_descriptor"]
+    metadata = {"dt": data_global_coord["dt"], 
+                "obs_avoid_var_descriptor": var_descriptor}
+    saveDemoDatasetStore(store_dir_path + '/baseline/', [data_global_coord["baseline"]], 
+                         metadata=metadata)
+    saveDemoDatasetStore(store_dir_path + '/obs_avoid/', data_global_coord["obs_avoid"][1], 
+                         setting_arrays={var_descriptor[0]: data_global_coord["obs_avoid"][0], 
+                                         var_descriptor[2]: data_global_coord["obs_avoid"][2], 
+                                         var_descriptor[3]: data_global_coord["obs_avoid"][3]}, 
+                         metadata=metadata)
+    return None
+
+def loadDemoDatasetLOAViconStore(store_dir_path, mmap_mode='c'):
+    # same structure as the output of prepareDemoDatasetLOAVicon(), but with the demo trajectories 
+    # memory-mapped from the demo dataset stores saved by saveDemoDatasetLOAViconStore(), 
+    # i.e. data_global_coord["obs_avoid"][1][i][j] is loaded (zero-copy) on access only;
+    # by default (mmap_mode='c') the trajectories are copy-on-write, i.e. writable like the ones of 
+    # prepareDemoDatasetLOAVicon(), without ever modifying the stores (mmap_mode='r' makes them read-only):
+    baseline_store = DemoDatasetStore(store_dir_path + '/baseline/', mmap_mode)
+    obs_avoid_store = DemoDatasetStore(store_dir_path + '/obs_avoid/', mmap_mode)
+    var_descriptor = obs_avoid_store.metadata["obs_avoid_var_descriptor"]
+    N_settings = obs_avoid_store.getNumSettings()
+    
+    data_global_coord = {}
+    data_global_coord["baseline"] = baseline_store.getSettingDemos(0)
+    data_global_coord["dt"] = obs_avoid_store.metadata["dt"]
+    data_global_coord["obs_avoid_var_descriptor"] = var_descriptor
+    data_global_coord["obs_avoid"] = [None] * 4
+    data_global_coord["obs_avoid"][0] = [obs_avoid_store.getSettingArray(var_descriptor[0], i) for i in range(N_settings)]
+    data_global_coord["obs_avoid"][1] = obs_avoid_store
+    data_global_coord["obs_avoid"][2] = [obs_avoid_store.getSettingArray(var_descriptor[2], i)[0] for i in range(N_settings)]
+    data_global_coord["obs_avoid"][3] = [obs_avoid_store.getSettingArray(var_descriptor[3], i)[0] for i in range(N_settings)]
+    
+    return data_global_coord
@@ -10,6 +10,7 @@ import os
 import sys
 import time
 import copy
+import threading
 import numpy as np
 import matplotlib.pyplot as plt
 import rospy
@@ -21,12 +22,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../reinforcement_
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../utilities/'))
 from pi2 import Pi2
 import utilities as py_util
+from CLMCDataFileWatcher import CLMCDataFileWatcher
 import rl_tactile_fb_utils as rl_util
 import rl_tactile_fb_pmnn_supervised_training as rl_pmnn_tr
 
 class RLTactileFeedback:
     def updateRobotReadyStatusCallback(self, robot_ready_notification_msg):
-        self.is_robot_ready = robot_ready_notification_msg.data
+        with self.robot_ready_status_condition:
+            self.is_robot_ready = robot_ready_notification_msg.data
+            self.robot_ready_status_condition.notify_all()
     
     def executeBehaviorOnRobotNTimes(self, N_unroll, 
                                      exec_behavior_until_prim_no, 
@@ -40,17 +44,23 @@ class RLTactileFeedback:
                                      ):
         # start by removing all SL data files inside sl_data_dirpath
         py_util.deleteAllCLMCDataFilesInDirectory(self.sl_data_dirpath)
+        # (blocks efficiently until new SL data files are fully written, instead of busy-waiting)
+        clmc_dfile_watcher = CLMCDataFileWatcher(self.sl_data_dirpath)
         prev_clmc_dfilepaths_list = []
         n_unroll = 0
         
         while (n_unroll < N_unroll):
             is_waiting_robot_ready_msg_printed_out = False
-            while (not self.is_robot_ready):
-                if (not is_waiting_robot_ready_msg_printed_out):
-                    print ("Waiting for the robot to be ready to accept command...")
-                is_waiting_robot_ready_msg_printed_out = True
-                if (periodic_wait_time_until_robot_is_ready_secs > 0.0):
-                    time.sleep(periodic_wait_time_until_robot_is_ready_secs)
+            with self.robot_ready_status_condition:
+                while (not self.is_robot_ready):
+                    if (not is_waiting_robot_ready_msg_printed_out):
+                        print ("Waiting for the robot to be ready to accept command...")
+                    is_waiting_robot_ready_msg_printed_out = True
+                    # (woken up by updateRobotReadyStatusCallback(); periodic_wait_time_until_robot_is_ready_secs <= 0.0 means no time-out)
+                    if (periodic_wait_time_until_robot_is_ready_secs > 0.0):
+                        self.robot_ready_status_condition.wait(periodic_wait_time_until_robot_is_ready_secs)
+                    else:
+                        self.robot_ready_status_condition.wait()
             
             if (exec_mode == "EXEC_OPENLOOPEQUIV_DMP_ONLY"):
                 assert (behavior_params is not None)
@@ -84,17 +94,26 @@ class RLTactileFeedback:
             
             print (self.dmp_rl_tactile_fb_robot_exec_mode_msg.description)
             
-            while (self.is_robot_ready):
-                self.dmp_rl_tactile_fb_robot_exec_mode_msg.header.stamp = rospy.Time.now()
-                self.dmp_rl_tactile_fb_robot_exec_mode_msg_pub.publish(self.dmp_rl_tactile_fb_robot_exec_mode_msg)
-                print ("Waiting for the robot to finish processing transmitted command...")
-                if (periodic_wait_time_until_robot_is_finished_processing_transmitted_cmd_secs > 0.0):
-                    time.sleep(periodic_wait_time_until_robot_is_finished_processing_transmitted_cmd_secs)
+            with self.robot_ready_status_condition:
+                while (self.is_robot_ready):
+                    self.dmp_rl_tactile_fb_robot_exec_mode_msg.header.stamp = rospy.Time.now()
+                    self.dmp_rl_tactile_fb_robot_exec_mode_msg_pub.publish(self.dmp_rl_tactile_fb_robot_exec_mode_msg)
+                    print ("Waiting for the robot to finish processing transmitted command...")
+                    # (re-publishing periodically, unless woken up earlier by updateRobotReadyStatusCallback(); 
+                    #  periodic_wait_time_until_robot_is_finished_processing_transmitted_cmd_secs <= 0.0 means 
+                    #  publishing once and waiting without time-out; wait() always releases the lock, 
+                    #  so that the callback can update is_robot_ready)
+                    if (periodic_wait_time_until_robot_is_finished_processing_transmitted_cmd_secs > 0.0):
+                        self.robot_ready_status_condition.wait(periodic_wait_time_until_robot_is_finished_processing_transmitted_cmd_secs)
+                    else:
+                        self.robot_ready_status_condition.wait()
             
-            curr_clmc_dfilepaths_list = py_util.waitUntilTotalCLMCDataFilesReaches(self.sl_data_dirpath, n_unroll+1)
-            new_clmc_dfilepath = list(set(curr_clmc_dfilepaths_list) - set(prev_clmc_dfilepaths_list))
+            # (returns once the new SL data file is fully written, i.e. its size matches its header, 
+            #  so wait_time_until_robot_is_finished_logging_into_datafile_secs is only an additional safety margin)
+            new_clmc_dfilepath = clmc_dfile_watcher.waitForNewFiles(1)
             assert (len(new_clmc_dfilepath) == 1)
             new_clmc_dfilepath = new_clmc_dfilepath[0]
+            curr_clmc_dfilepaths_list = prev_clmc_dfilepaths_list + [new_clmc_dfilepath]
             
             time.sleep(wait_time_until_robot_is_finished_logging_into_datafile_secs)
             
@@ -104,7 +123,9 @@ class RLTactileFeedback:
             else:
                 print ("The latest-obtained unroll result CLMC datafile %s is invalid!!! Deleting it and repeating the unroll..." % new_clmc_dfilepath)
                 os.remove(new_clmc_dfilepath)
+                clmc_dfile_watcher.forgetFile(new_clmc_dfilepath)
         
+        clmc_dfile_watcher.close()
         assert (len(prev_clmc_dfilepaths_list) == N_unroll)
         
         return None
@@ -115,6 +136,7 @@ class RLTactileFeedback:
                  starting_prim_tbi=-1, 
                  starting_rl_iter=-1):
         self.is_robot_ready = False
+        self.robot_ready_status_condition = threading.Condition()
         
         rospy.init_node(node_name)
         self.ros_rate = rospy.Rate(loop_rate)
@@ -27,11 +27,13 @@ from QuaternionDMPUnrollInitParams import *
 from CanonicalSystemDiscrete import *
 from CartesianCoordDMP import *
 from QuaternionDMP import *
+from learnDMPsInParallel import *
 import DMPTrajectory as dmp_traj
 import QuaternionDMPTrajectory as qdmp_traj
 import utilities as py_util
 import pyplot_util as pypl_util
 import clmcplot_utils as clmcplot_util
+import DMPParamsIO as dmp_params_io
 
 percentage_padding_default = 1.5
 percentage_smoothing_points_default = 3.0
@@ -401,7 +403,8 @@ def learnCartDMPUnrollParams(unroll_results, prims_to_be_learned="All",
                              is_smoothing_training_traj_before_learning=True, 
                              is_plotting=False, 
                              threshold_var_ground_truth_Q= 5.0e-4, 
-                             default_cdmp_params=None):
+                             default_cdmp_params=None, 
+                             num_processes=1):
     cdmp_trajs = extractCartDMPTrajectoriesFromUnrollResults(unroll_results)
     N_primitives = len(cdmp_trajs["Quaternion"])
     all_prims = range(N_primitives)
@@ -437,6 +440,9 @@ def learnCartDMPUnrollParams(unroll_results, prims_to_be_learned="All",
         cdmp_params["CartCoord"][n_prim_ntbl] = copy.deepcopy(default_cdmp_params["CartCoord"][n_prim_ntbl])
         cdmp_params["Quaternion"][n_prim_ntbl] = copy.deepcopy(default_cdmp_params["Quaternion"][n_prim_ntbl])
     
+    # learn all (to-be-learned) primitives of both types in parallel
+    # (if num_processes > 1), i.e. one learning job per primitive per type:
+    list_learning_kwargs = list()
     for n_prim in prims_to_be_learned:
         print("Learning (Modified) Open-Loop Primitive # %d/%d" % (n_prim+1, N_primitives))
         if (is_smoothing_training_traj_before_learning):
@@ -448,40 +454,37 @@ def learnCartDMPUnrollParams(unroll_results, prims_to_be_learned="All",
                 smoothing_mode = 0 # do not smooth
         else:
             smoothing_mode = None
-        
-        [
-         [ccdmp_critical_states_learn, 
-          _, _, _, 
-          _, _, _, _, _, 
-          _], 
-         cdmp_smoothened_trajs["CartCoord"][n_prim]
-         ] = ccdmp.learnFromSetTrajectories(cdmp_trajs["CartCoord"][n_prim], task_servo_rate, 
-                                            is_smoothing_training_traj_before_learning=is_smoothing_training_traj_before_learning, 
-                                            percentage_padding=percentage_padding, 
-                                            percentage_smoothing_points=percentage_smoothing_points, 
-                                            smoothing_mode=smoothing_mode, 
-                                            smoothing_cutoff_frequency=smoothing_cutoff_frequency, 
-                                            is_returning_smoothened_training_traj=True
-                                            )
-        cdmp_params["CartCoord"][n_prim] = ccdmp.getParamsAsDict()
-        cdmp_params["CartCoord"][n_prim]["critical_states_learn"] = ccdmp_critical_states_learn
-        
-        [
-         [qdmp_critical_states_learn, 
-          _, _, _, 
-          _, _, _, _, _, 
-          _], 
-         cdmp_smoothened_trajs["Quaternion"][n_prim]
-         ] = qdmp.learnFromSetTrajectories(cdmp_trajs["Quaternion"][n_prim], task_servo_rate, 
-                                           is_smoothing_training_traj_before_learning=is_smoothing_training_traj_before_learning, 
-                                           percentage_padding=percentage_padding, 
-                                           percentage_smoothing_points=percentage_smoothing_points, 
-                                           smoothing_mode=smoothing_mode, 
-                                           smoothing_cutoff_frequency=smoothing_cutoff_frequency, 
-                                           is_returning_smoothened_training_traj=True
-                                           )
-        cdmp_params["Quaternion"][n_prim] = qdmp.getParamsAsDict()
-        cdmp_params["Quaternion"][n_prim]["critical_states_learn"] = qdmp_critical_states_learn
+        list_learning_kwargs.append({"is_smoothing_training_traj_before_learning": is_smoothing_training_traj_before_learning, 
+                                     "percentage_padding": percentage_padding, 
+                                     "percentage_smoothing_points": percentage_smoothing_points, 
+                                     "smoothing_mode": smoothing_mode, 
+                                     "smoothing_cutoff_frequency": smoothing_cutoff_frequency, 
+                                     "is_returning_smoothened_training_traj": True})
+    N_prims_to_be_learned = len(prims_to_be_learned)
+    [list_learning_results, list_cdmp_params
+     ] = learnDMPsInParallel(list_dmps=([ccdmp] * N_prims_to_be_learned) + ([qdmp] * N_prims_to_be_learned), 
+                             list_set_traj_input=[cdmp_trajs["CartCoord"][n_prim] for n_prim in prims_to_be_learned] + 
+                                                 [cdmp_trajs["Quaternion"][n_prim] for n_prim in prims_to_be_learned], 
+                             robot_task_servo_rate=task_servo_rate, 
+                             list_learning_kwargs=list_learning_kwargs * 2, 
+                             num_processes=num_processes)
+    for cart_type_idx, cart_type in enumerate(["CartCoord", "Quaternion"]):
+        for n_prim_idx, n_prim in enumerate(prims_to_be_learned):
+            job_idx = (cart_type_idx * N_prims_to_be_learned) + n_prim_idx
+            [
+             [critical_states_learn, 
+              _, _, _, 
+              _, _, _, _, _, 
+              _], 
+             cdmp_smoothened_trajs[cart_type][n_prim]
+             ] = list_learning_results[job_idx]
+            cdmp_params[cart_type][n_prim] = list_cdmp_params[job_idx]
+            cdmp_params[cart_type][n_prim]["critical_states_learn"] = critical_states_learn
+    
+    for n_prim in prims_to_be_learned:
+        print("Unrolling (Modified) Open-Loop Primitive # %d/%d" % (n_prim+1, N_primitives))
+        ccdmp.setParamsFromDict(cdmp_params["CartCoord"][n_prim])
+        qdmp.setParamsFromDict(cdmp_params["Quaternion"][n_prim])
         
         cdmp_unroll["CartCoord"][n_prim] = ccdmp.unroll(cdmp_params["CartCoord"][n_prim]["critical_states_learn"], 
                                                         cdmp_params["CartCoord"][n_prim]["mean_tau"], 
@@ -533,13 +536,29 @@ def unrollPI2ParamsSamples(pi2_params_samples, prim_to_be_improved, cart_types_t
             components_to_be_plotted = ["Q", "omega", "omegad"]
         else:
             assert False, "cart_type_tbi == %s is un-defined!"
-        for k in range(K_PI2_samples):
-            print ("   Unrolling PI2 sample # %d/%d ..." % (k+1, K_PI2_samples))
-            cdmp_instance.setParamsFromDict(pi2_params_samples[k]["ole_cdmp_params"][cart_type_tbi][prim_to_be_improved])
-            pi2_unroll_samples[cart_type_tbi][k] = cdmp_instance.unroll(pi2_params_samples[k]["ole_cdmp_params"][cart_type_tbi][prim_to_be_improved]["critical_states_learn"], 
-                                                                        pi2_params_samples[k]["ole_cdmp_params"][cart_type_tbi][prim_to_be_improved]["mean_tau"], 
-                                                                        pi2_params_samples[k]["ole_cdmp_params"][cart_type_tbi][prim_to_be_improved]["mean_tau"], 
-                                                                        dt)
+        cdmp_params_samples = [pi2_params_samples[k]["ole_cdmp_params"][cart_type_tbi][prim_to_be_improved] for k in range(K_PI2_samples)]
+        mean_tau_samples = [cdmp_params_sample["mean_tau"] for cdmp_params_sample in cdmp_params_samples]
+        # PI2 only perturbs the weights, so normally all samples share all other params (incl. the unroll time horizon), 
+        # which are set into cdmp_instance (only W and A_learn are given per sample to unrollBatch()):
+        shared_param_names = [param_name for param_name in cdmp_params_samples[0].keys() 
+                              if param_name not in ["W", "A_learn", "critical_states_learn"]]
+        if (np.all([np.array_equal(cdmp_params_sample[param_name], cdmp_params_samples[0][param_name]) 
+                    for cdmp_params_sample in cdmp_params_samples for param_name in shared_param_names])):
+            print ("   Unrolling all %d PI2 samples in a batch ..." % K_PI2_samples)
+            cdmp_instance.setParamsFromDict(cdmp_params_samples[0])
+            pi2_unroll_batch = cdmp_instance.unrollBatch([cdmp_params_sample["critical_states_learn"] for cdmp_params_sample in cdmp_params_samples], 
+                                                         mean_tau_samples, mean_tau_samples[0], dt, 
+                                                         [cdmp_params_sample["W"] for cdmp_params_sample in cdmp_params_samples], 
+                                                         [cdmp_params_sample["A_learn"] for cdmp_params_sample in cdmp_params_samples])
+            pi2_unroll_samples[cart_type_tbi] = cdmp_instance.convertBatchUnrollIntoDMPTrajectoryList(pi2_unroll_batch)
+        else:
+            for k in range(K_PI2_samples):
+                print ("   Unrolling PI2 sample # %d/%d ..." % (k+1, K_PI2_samples))
+                cdmp_instance.setParamsFromDict(cdmp_params_samples[k])
+                pi2_unroll_samples[cart_type_tbi][k] = cdmp_instance.unroll(cdmp_params_samples[k]["critical_states_learn"], 
+                                                                            cdmp_params_samples[k]["mean_tau"], 
+                                                                            cdmp_params_samples[k]["mean_tau"], 
+                                                                            dt)
         
         if (is_plotting):
             assert (pi2_unroll_mean is not None)
@@ -721,63 +740,54 @@ def computeParamInitStdHeuristic(param_mean, params_mean_extrema_to_init_std_fac
                                                                       np.min(np.fabs(param_mean))))
     return param_init_std
 
-def savePrimsParamsFromDictAtDirPath(prims_params_dirpath, cdmp_params):
+def savePrimsParamsFromDictAtDirPath(prims_params_dirpath, cdmp_params, is_exporting_text=True):
+    # all primitives' params are saved into a single binary file (see DMPParamsIO) at prims_params_dirpath, 
+    # and (if is_exporting_text) also exported as text files, in the directory structure of 
+    # position/prim#/ and orientation/prim#/ (e.g. to be read by the robot); 
+    # the binary file holds exactly the exported params (e.g. NOT the critical states), 
+    # in the types and shapes of the text files' loader, and is written last (see loadPrimsParamsAsDictFromDirPath())
     N_primitives = len(cdmp_params["CartCoord"])
     py_util.createDirIfNotExist(prims_params_dirpath)
+    if (is_exporting_text):
+        savePrimsParamsTextFilesFromDictAtDirPath(prims_params_dirpath, cdmp_params)
+    exported_cdmp_params = {}
+    exported_cdmp_params["CartCoord"] = [ccdmp.getExportedParamsFromDict(cdmp_params["CartCoord"][n_prim]) for n_prim in range(N_primitives)]
+    exported_cdmp_params["Quaternion"] = [qdmp.getExportedParamsFromDict(cdmp_params["Quaternion"][n_prim]) for n_prim in range(N_primitives)]
+    dmp_params_io.saveParamsBinary(prims_params_dirpath+"/"+dmp_params_io.DMP_PARAMS_BINARY_FILE_NAME, exported_cdmp_params)
+    return None
+
+def savePrimsParamsTextFilesFromDictAtDirPath(prims_params_dirpath, cdmp_params):
+    # (the directory layout and file names are in DMPParamsIO, shared with PrimitiveLibrary)
+    N_primitives = len(cdmp_params["CartCoord"])
     for n_prim in range(N_primitives):
-        ccdmp_prim_param_dirpath = prims_params_dirpath+"/position/prim%d/"%(n_prim+1)
+        ccdmp_prim_param_dirpath = prims_params_dirpath+"/"+dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES["CartCoord"]+"/prim%d/"%(n_prim+1)
         py_util.recreateDir(ccdmp_prim_param_dirpath)
         ccdmp.saveParamsFromDict(dir_path=ccdmp_prim_param_dirpath, cart_coord_dmp_params=cdmp_params["CartCoord"][n_prim], 
-                                 file_name_weights="w", 
-                                 file_name_A_learn="A_learn", 
-                                 file_name_mean_start_position="start_global", 
-                                 file_name_mean_goal_position="goal_global", 
-                                 file_name_mean_tau="tau", 
-                                 file_name_canonical_system_order="canonical_sys_order", 
-                                 file_name_mean_start_position_global="start_global", 
-                                 file_name_mean_goal_position_global="goal_global", 
-                                 file_name_mean_start_position_local="start_local", 
-                                 file_name_mean_goal_position_local="goal_local", 
-                                 file_name_ctraj_local_coordinate_frame_selection="ctraj_local_coordinate_frame_selection", 
-                                 file_name_ctraj_hmg_transform_local_to_global_matrix="T_local_to_global_H", 
-                                 file_name_ctraj_hmg_transform_global_to_local_matrix="T_global_to_local_H")
-        qdmp_prim_param_dirpath = prims_params_dirpath+"/orientation/prim%d/"%(n_prim+1)
+                                 **dmp_params_io.PRIMS_PARAMS_FILE_NAMES["CartCoord"])
+        qdmp_prim_param_dirpath = prims_params_dirpath+"/"+dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES["Quaternion"]+"/prim%d/"%(n_prim+1)
         py_util.recreateDir(qdmp_prim_param_dirpath)
         qdmp.saveParamsFromDict(dir_path=qdmp_prim_param_dirpath, dmp_params=cdmp_params["Quaternion"][n_prim], 
-                                file_name_weights="w", 
-                                file_name_A_learn="A_learn", 
-                                file_name_mean_start_position="start", 
-                                file_name_mean_goal_position="goal", 
-                                file_name_mean_tau="tau", 
-                                file_name_canonical_system_order="canonical_sys_order")
+                                **dmp_params_io.PRIMS_PARAMS_FILE_NAMES["Quaternion"])
     return None
 
-def loadPrimsParamsAsDictFromDirPath(prims_params_dirpath, N_primitives):
+def loadPrimsParamsAsDictFromDirPath(prims_params_dirpath, N_primitives, is_loading_binary_if_exist=True):
+    # (loading from the binary file saved by savePrimsParamsFromDictAtDirPath() is much faster, 
+    #  than parsing the text files; it is only loaded if it is up-to-date, see dmp_params_io.isPrimsParamsBinaryFileUpToDate(), 
+    #  and gives the same params as the text files)
+    prims_params_binary_filepath = prims_params_dirpath+"/"+dmp_params_io.DMP_PARAMS_BINARY_FILE_NAME
+    if (is_loading_binary_if_exist and dmp_params_io.isPrimsParamsBinaryFileUpToDate(prims_params_dirpath)):
+        cdmp_params = dmp_params_io.loadParamsBinary(prims_params_binary_filepath)
+        assert (len(cdmp_params["CartCoord"]) == N_primitives)
+        assert (len(cdmp_params["Quaternion"]) == N_primitives)
+        return cdmp_params
     cdmp_params = {}
     cdmp_params["CartCoord"] = [None] * N_primitives
     cdmp_params["Quaternion"] = [None] * N_primitives
     for n_prim in range(N_primitives):
-        cdmp_params["CartCoord"][n_prim] = ccdmp.loadParamsAsDict(prims_params_dirpath+"/position/prim%d/"%(n_prim+1), 
-                                                                  file_name_weights="w", 
-                                                                  file_name_A_learn="A_learn", 
-                                                                  file_name_mean_start_position="start_global", 
-                                                                  file_name_mean_goal_position="goal_global", 
-                                                                  file_name_mean_tau="tau", 
-                                                                  file_name_canonical_system_order="canonical_sys_order", 
-                                                                  file_name_mean_start_position_global="start_global", 
-                                                                  file_name_mean_goal_position_global="goal_global", 
-                                                                  file_name_mean_start_position_local="start_local", 
-                                                                  file_name_mean_goal_position_local="goal_local", 
-                                                                  file_name_ctraj_local_coordinate_frame_selection="ctraj_local_coordinate_frame_selection", 
-                                                                  file_name_ctraj_hmg_transform_local_to_global_matrix="T_local_to_global_H", 
-                                                                  file_name_ctraj_hmg_transform_global_to_local_matrix="T_global_to_local_H")
-        cdmp_params["Quaternion"][n_prim] = qdmp.loadParamsAsDict(prims_params_dirpath+"/orientation/prim%d/"%(n_prim+1), 
-                                                                  file_name_weights="w", 
-                                                                  file_name_A_learn="A_learn", 
-                                                                  file_name_mean_start_position="start", 
-                                                                  file_name_mean_goal_position="goal", 
-                                                                  file_name_mean_tau="tau", 
-                                                                  file_name_canonical_system_order="canonical_sys_order")
+        cdmp_params["CartCoord"][n_prim] = ccdmp.loadParamsAsDict(prims_params_dirpath+"/"+dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES["CartCoord"]+"/prim%d/"%(n_prim+1), 
+                                                                  **dmp_params_io.PRIMS_PARAMS_FILE_NAMES["CartCoord"])
+        cdmp_params["Quaternion"][n_prim] = qdmp.loadParamsAsDict(prims_params_dirpath+"/"+dmp_params_io.PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES["Quaternion"]+"/prim%d/"%(n_prim+1), 
+                                                                  **dmp_params_io.PRIMS_PARAMS_FILE_NAMES["Quaternion"])
     return cdmp_params
 
 def splitDatasetIntoTrainValidTestSubDataset(DeltaS, Ct_target, normalized_phase_kernels, data_point_priority, dataset_suffix, n_prim, 
@@ -9,16 +9,23 @@ import numpy as np
 import os
 import sys
 import copy
+import collections
 sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_param/"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_base/"))
 sys.path.append(
     os.path.join(os.path.dirname(__file__), "../dmp_coupling/base/"))
 from CanonicalSystem import *
 
+MAX_CANONICAL_STATE_TABLE_CACHE_SIZE = 64
+
 
 class CanonicalSystemDiscrete(CanonicalSystem, object):
   "Class for canonical systems of discrete DMPs."
 
+  # LRU cache of the (read-only) closed-form canonical state tables,
+  # shared among all instances, keyed by (order, alpha, beta, tau, dt, length):
+  canonical_state_table_cache = collections.OrderedDict()
+
   def __init__(self,
                tau_system,
                cs_order=2,
@@ -82,9 +89,10 @@ class CanonicalSystemDiscrete(CanonicalSystem, object):
 #        return None
 
   def start(self):
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this CanonicalSystemDiscrete is "
-        "invalid!")
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this CanonicalSystemDiscrete "
+          "is invalid!")
     self.x = 1.0
     self.xd = 0.0
     self.xdd = 0.0
@@ -115,9 +123,10 @@ class CanonicalSystemDiscrete(CanonicalSystem, object):
 
   def updateCanonicalState(self, dt):
     assert (self.is_started), "CanonicalSystemDiscrete is NOT yet started!"
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this CanonicalSystemDiscrete is "
-        "invalid!")
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this CanonicalSystemDiscrete "
+          "is invalid!")
     assert (dt > 0.0), "dt=" + str(dt) + " <= 0.0 (invalid!)"
 
     tau = self.tau_sys.getTauRelative()
@@ -136,3 +145,156 @@ class CanonicalSystemDiscrete(CanonicalSystem, object):
 
     assert (self.x >= 0.0), "self.x=" + str(self.x) + " < 0.0 (invalid!)"
     return None
+
+  def unrollCanonicalState(self, dt, traj_length):
+    """Equivalent to traj_length consecutive calls of updateCanonicalState(dt),
+
+       but returning the canonical position and velocity trajectories
+       (each of size 1 X traj_length), recorded BEFORE each update.
+    """
+    assert (self.is_started), "CanonicalSystemDiscrete is NOT yet started!"
+    assert (self.isValid()), (
+        "Pre-condition(s) checking is failed: this CanonicalSystemDiscrete is "
+        "invalid!")
+    assert (dt > 0.0), "dt=" + str(dt) + " <= 0.0 (invalid!)"
+    assert (traj_length >= 1), "traj_length=" + str(traj_length) + " < 1"
+    assert (all(
+        canonical_coupler is None
+        for canonical_coupler in self.canonical_couplers_list
+    )), "Canonical coupling terms are NOT supported in trajectory unrolling!"
+
+    tau = self.tau_sys.getTauRelative()
+    if ((self.x == 1.0) and (self.v == 0.0) and (self.vd == 0.0)):
+      # at the initial state (right after start()): use the closed-form table
+      [X, V, _] = self.getCanonicalStateTable(dt, traj_length + 1, tau)
+      # (derivatives as set by the last call of updateCanonicalState(dt))
+      x_last = X[0, traj_length - 1]
+      v_last = V[0, traj_length - 1]
+      self.xdd = self.vd * 1.0 / tau
+      if (self.order == 2):
+        if (traj_length >= 2):
+          self.xdd = (self.alpha * ((self.beta * (0 - X[0, traj_length - 2])) -
+                                    V[0, traj_length - 2])) * 1.0 / (tau * tau)
+        self.vd = (self.alpha *
+                   ((self.beta * (0 - x_last)) - v_last)) * 1.0 / tau
+        self.xd = v_last * 1.0 / tau
+      elif (self.order == 1):
+        self.vd = 0.0
+        self.xd = (self.alpha * (0 - x_last)) * 1.0 / tau
+      self.x = X[0, traj_length]
+      self.v = V[0, traj_length]
+
+      assert (self.x >= 0.0), "self.x=" + str(self.x) + " < 0.0 (invalid!)"
+      return X[:, :traj_length].copy(), V[:, :traj_length].copy()
+
+    C_c = self.getCouplingTerm()
+    X = np.zeros((1, traj_length))
+    V = np.zeros((1, traj_length))
+    x = self.x
+    xd = self.xd
+    xdd = self.xdd
+    v = self.v
+    vd = self.vd
+    for i in range(traj_length):
+      X[0, i] = x
+      V[0, i] = v
+      if (self.order == 2):
+        xdd = vd * 1.0 / tau
+        vd = ((self.alpha * ((self.beta * (0 - x)) - v)) + C_c) * 1.0 / tau
+        xd = v * 1.0 / tau
+      elif (self.order == 1):
+        xdd = vd * 1.0 / tau
+        vd = 0.0
+        xd = ((self.alpha * (0 - x)) + C_c) * 1.0 / tau
+      x = x + (xd * dt)
+      v = v + (vd * dt)
+    self.x = x
+    self.xd = xd
+    self.xdd = xdd
+    self.v = v
+    self.vd = vd
+
+    assert (self.x >= 0.0), "self.x=" + str(self.x) + " < 0.0 (invalid!)"
+    return X, V
+
+  def getCanonicalStateClosedForm(self, dt, time_steps, tau=None):
+    """Closed-form solution of the (Euler-discretized) canonical system,
+
+       i.e. the canonical position, velocity, and multiplier after time_steps
+       (a non-negative integer, or an array of them) consecutive calls of
+       updateCanonicalState(dt) right after start(), without coupling term.
+       If tau is None, the current relative tau of the tau system is used.
+       Returns x, v, and multiplier, each of the same shape as time_steps.
+    """
+    assert (dt > 0.0), "dt=" + str(dt) + " <= 0.0 (invalid!)"
+    if (tau is None):
+      tau = self.tau_sys.getTauRelative()
+    K = np.asarray(time_steps)
+    assert ((K >= 0).all()), "time_steps must be non-negative!"
+    K = K.astype(np.float64)
+    h = dt * 1.0 / tau
+
+    if (self.order == 2):
+      # [x; v] at step k is M^k * [1; 0], with
+      # M = [[1, h], [-alpha * beta * h, 1 - alpha * h]] :
+      m10 = -self.alpha * self.beta * h
+      trace_M = 2.0 - (self.alpha * h)
+      det_M = 1.0 - (self.alpha * h) + (self.alpha * self.beta * h * h)
+      discriminant = (self.alpha * h * h) * (self.alpha - (4.0 * self.beta))
+      if (np.fabs(discriminant) <= (1.e-12 * trace_M * trace_M)):
+        # (numerically) repeated eigenvalues, e.g. the default beta=alpha/4:
+        # M^k = lambda^(k-1) * (k * M - (k-1) * lambda * I)
+        lambda_M = trace_M / 2.0
+        lambda_pow_k_minus_1 = np.power(lambda_M, np.maximum(K - 1.0, 0.0))
+        x = (lambda_pow_k_minus_1 * (K - ((K - 1.0) * lambda_M)))
+        x = np.where(K == 0.0, 1.0, x)
+        v = lambda_pow_k_minus_1 * K * m10
+      else:
+        # distinct (possibly complex conjugate) eigenvalues:
+        # M^k = a_k * M - det(M) * a_(k-1) * I,
+        # with a_k = (lambda_1^k - lambda_2^k) / (lambda_1 - lambda_2)
+        sqrt_discriminant = np.sqrt(complex(discriminant))
+        lambda_1 = (trace_M + sqrt_discriminant) / 2.0
+        lambda_2 = (trace_M - sqrt_discriminant) / 2.0
+        a_k = (np.power(lambda_1, K) - np.power(lambda_2, K)) / (lambda_1 -
+                                                                 lambda_2)
+        a_k_minus_1 = (np.power(lambda_1, np.maximum(K - 1.0, 0.0)) - np.power(
+            lambda_2, np.maximum(K - 1.0, 0.0))) / (lambda_1 - lambda_2)
+        x = np.where(K == 0.0, 1.0, np.real(a_k - (det_M * a_k_minus_1)))
+        v = np.real(a_k * m10)
+      multiplier = v
+    elif (self.order == 1):
+      x = np.power(1.0 - (self.alpha * h), K)
+      v = np.zeros(K.shape)
+      multiplier = x
+
+    if (np.ndim(time_steps) == 0):
+      return float(x), float(v), float(multiplier)
+    return x, v, multiplier
+
+  def getCanonicalStateTable(self, dt, traj_length, tau=None):
+    """Returns the canonical position, velocity, and multiplier trajectories
+
+       (each of size 1 X traj_length, READ-ONLY) of an uncoupled unroll
+       right after start(), computed in closed-form.
+       The tables are memoized in an LRU cache shared by all
+       CanonicalSystemDiscrete instances, so that learning and unrolling
+       with the same (order, alpha, beta, tau, dt, traj_length) re-use them.
+    """
+    assert (traj_length >= 1), "traj_length=" + str(traj_length) + " < 1"
+    if (tau is None):
+      tau = self.tau_sys.getTauRelative()
+    key = (self.order, self.alpha, self.beta, tau, dt, traj_length)
+    cache = CanonicalSystemDiscrete.canonical_state_table_cache
+    if (key in cache):
+      canonical_state_table = cache.pop(key)
+    else:
+      canonical_state_table = self.getCanonicalStateClosedForm(
+          dt,
+          np.arange(traj_length).reshape((1, traj_length)), tau)
+      for table in canonical_state_table:
+        table.flags.writeable = False
+      while (len(cache) >= MAX_CANONICAL_STATE_TABLE_CACHE_SIZE):
+        cache.popitem(last=False)
+    cache[key] = canonical_state_table
+    return canonical_state_table
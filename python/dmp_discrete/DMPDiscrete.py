@@ -22,6 +22,10 @@ from TauSystem import *
 from utility_states_trajectories import smoothStartEndNDTrajectoryBasedOnPosition
 import utilities as py_util
 import pyplot_util as pypl_util
+import DMPParamsIO as dmp_params_io
+
+DEFAULT_UNROLL_RING_BUFFER_LENGTH = 256
+DEFAULT_LEARNING_CHUNK_SIZE = 8  # (in number of demos)
 
 
 class DMPDiscrete(DMP, object):
@@ -57,15 +61,17 @@ class DMPDiscrete(DMP, object):
     return True
 
   def start(self, critical_states, tau_init):
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this DMPDiscrete is invalid!"
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid(
+      )), "Pre-condition(s) checking is failed: this DMPDiscrete is invalid!"
 
     traj_size = critical_states.getLength()
     assert (traj_size >= 2)
     start_state_init = critical_states.getDMPStateAtIndex(0)
     goal_state_init = critical_states.getDMPStateAtIndex(traj_size - 1)
-    assert (start_state_init.isValid())
-    assert (goal_state_init.isValid())
+    if (isValidationRequired(self.validation_level, False)):
+      assert (start_state_init.isValid())
+      assert (goal_state_init.isValid())
     assert (start_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
     assert (goal_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
     assert (tau_init >= MIN_TAU)
@@ -74,14 +80,17 @@ class DMPDiscrete(DMP, object):
     self.transform_sys_discrete.start(start_state_init, goal_state_init)
     self.is_started = True
 
-    assert (self.isValid(
-    )), "Post-condition(s) checking is failed: this DMPDiscrete became invalid!"
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this DMPDiscrete became "
+          "invalid!")
     return None
 
   def getNextState(self, dt, update_canonical_state):
     assert (self.is_started == True)
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this DMPDiscrete is invalid!"
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid(
+      )), "Pre-condition(s) checking is failed: this DMPDiscrete is invalid!"
 
     next_state, forcing_term, ct_acc, ct_vel, basis_function_vector = self.transform_sys_discrete.getNextState(
         dt)
@@ -90,9 +99,27 @@ class DMPDiscrete(DMP, object):
       self.canonical_sys_discrete.updateCanonicalState(dt)
     self.transform_sys_discrete.updateCurrentGoalState(dt)
 
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this DMPDiscrete became "
+          "invalid!")
+    return next_state, forcing_term, ct_acc, ct_vel, basis_function_vector
+
+  def getNextStateTraj(self, dt, traj_length):
+    """Vectorized equivalent of traj_length consecutive calls of
+
+       getNextState(dt, True).
+    """
+    assert (self.is_started == True)
+    assert (self.isValid(
+    )), "Pre-condition(s) checking is failed: this DMPDiscrete is invalid!"
+
+    next_state_traj, forcing_term_traj, basis_function_traj = self.transform_sys_discrete.getNextStateTraj(
+        dt, traj_length)
+
     assert (self.isValid(
     )), "Post-condition(s) checking is failed: this DMPDiscrete became invalid!"
-    return next_state, forcing_term, ct_acc, ct_vel, basis_function_vector
+    return next_state_traj, forcing_term_traj, basis_function_traj
 
   def smoothStartEndTrajectoryBasedOnPosition(self, traj, percentage_padding,
                                               percentage_smoothing_points, mode,
@@ -149,12 +176,30 @@ class DMPDiscrete(DMP, object):
   def learnGetDefaultUnrollParams(self, set_traj_input, robot_task_servo_rate):
     W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI = self.learn(
         set_traj_input, robot_task_servo_rate)
+    critical_states_learn = self.getDefaultUnrollCriticalStates()
+    return critical_states_learn, W, mean_A_learn, self.mean_tau, Ft, Fp, G, cX, cV, PSI
+
+  def getDefaultUnrollCriticalStates(self):
+    # (from the mean start and goal positions of the learned demos)
     critical_states_list_learn = [None] * 2
     critical_states_list_learn[0] = DMPState(self.mean_start_position)
     critical_states_list_learn[-1] = DMPState(self.mean_goal_position)
-    critical_states_learn = convertDMPStatesListIntoDMPTrajectory(
-        critical_states_list_learn)
-    return critical_states_learn, W, mean_A_learn, self.mean_tau, Ft, Fp, G, cX, cV, PSI
+    return convertDMPStatesListIntoDMPTrajectory(critical_states_list_learn)
+
+  def smoothSetTrajectories(self, set_traj_input, robot_task_servo_rate,
+                            percentage_padding, percentage_smoothing_points,
+                            smoothing_mode, smoothing_cutoff_frequency):
+    processed_set_traj_input = list()
+    for traj_input in set_traj_input:
+      processed_set_traj_input.append(
+          self.smoothStartEndTrajectoryBasedOnPosition(
+              traj=traj_input,
+              percentage_padding=percentage_padding,
+              percentage_smoothing_points=percentage_smoothing_points,
+              mode=smoothing_mode,
+              dt=(1.0 / robot_task_servo_rate),
+              smoothing_cutoff_frequency=smoothing_cutoff_frequency))
+    return processed_set_traj_input
 
   def learnFromSetTrajectories(self,
                                set_traj_input,
@@ -166,16 +211,10 @@ class DMPDiscrete(DMP, object):
                                smoothing_cutoff_frequency=None,
                                is_returning_smoothened_training_traj=False):
     if (is_smoothing_training_traj_before_learning):
-      processed_set_traj_input = list()
-      for traj_input in set_traj_input:
-        processed_set_traj_input.append(
-            self.smoothStartEndTrajectoryBasedOnPosition(
-                traj=traj_input,
-                percentage_padding=percentage_padding,
-                percentage_smoothing_points=percentage_smoothing_points,
-                mode=smoothing_mode,
-                dt=(1.0 / robot_task_servo_rate),
-                smoothing_cutoff_frequency=smoothing_cutoff_frequency))
+      processed_set_traj_input = self.smoothSetTrajectories(
+          set_traj_input, robot_task_servo_rate, percentage_padding,
+          percentage_smoothing_points, smoothing_mode,
+          smoothing_cutoff_frequency)
     else:
       processed_set_traj_input = set_traj_input
     if (not is_returning_smoothened_training_traj):
@@ -204,6 +243,162 @@ class DMPDiscrete(DMP, object):
         is_smoothing_training_traj_before_learning, percentage_padding,
         percentage_smoothing_points, smoothing_mode, smoothing_cutoff_frequency)
 
+  def learnInChunks(self,
+                    iter_set_traj_input_chunks,
+                    robot_task_servo_rate,
+                    is_smoothing_training_traj_before_learning=False,
+                    percentage_padding=None,
+                    percentage_smoothing_points=None,
+                    smoothing_mode=None,
+                    smoothing_cutoff_frequency=None,
+                    is_returning_fit_trajs=False):
+    """Memory-bounded equivalent of learnFromSetTrajectories(), on an
+
+       iterable of chunks (lists) of demos, e.g. iterSetTrajectoriesInChunks():
+       only one chunk at a time is held (and preprocessed) in memory, see
+       LearningSystemDiscrete.learnApproximatorInChunks(), which also describes
+       is_returning_fit_trajs.
+    """
+    assert (self.isValid(
+    )), "Pre-condition(s) checking is failed: this DMPDiscrete is invalid!"
+    assert (robot_task_servo_rate > 0.0)
+
+    list_start_positions = list()
+    list_goal_positions = list()
+
+    def iterPreprocessedChunks():
+      for set_traj_input in iter_set_traj_input_chunks:
+        if (is_smoothing_training_traj_before_learning):
+          set_traj_input = self.smoothSetTrajectories(
+              set_traj_input, robot_task_servo_rate, percentage_padding,
+              percentage_smoothing_points, smoothing_mode,
+              smoothing_cutoff_frequency)
+        for traj_input in set_traj_input:
+          list_start_positions.append(traj_input.X[:, [0]])
+          list_goal_positions.append(traj_input.X[:, [-1]])
+        yield self.preprocess(set_traj_input)
+
+    W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI = self.learning_sys_discrete.learnApproximatorInChunks(
+        iterPreprocessedChunks(), robot_task_servo_rate, is_returning_fit_trajs)
+    self.mean_tau = mean_tau
+    assert (self.mean_tau >= MIN_TAU)
+    # (the mean start and goal positions over all chunks, i.e. NOT only over
+    #  the last one, as set by preprocess())
+    self.setMeanStartAndGoalPositions(
+        np.hstack(list_start_positions), np.hstack(list_goal_positions))
+    critical_states_learn = self.getDefaultUnrollCriticalStates()
+    assert (self.isValid(
+    )), "Post-condition(s) checking is failed: this DMPDiscrete became invalid!"
+    return critical_states_learn, W, mean_A_learn, self.mean_tau, Ft, Fp, G, cX, cV, PSI
+
+  def iterSetTrajectoriesInChunks(self,
+                                  training_data_dir_or_file_path,
+                                  chunk_size=DEFAULT_LEARNING_CHUNK_SIZE,
+                                  start_column_idx=1,
+                                  time_column_idx=0):
+    """Generator of the chunks (lists of at most chunk_size demos) of the
+
+       trajectory file(s) in training_data_dir_or_file_path, loaded from disk
+       only when the chunk is requested.
+    """
+    assert (chunk_size >= 1)
+    trajectory_files_list = getTrajectoryFilesList(
+        training_data_dir_or_file_path)
+    for chunk_start_idx in range(0, len(trajectory_files_list), chunk_size):
+      set_traj_input = list()
+      for trajectory_file in trajectory_files_list[
+          chunk_start_idx:chunk_start_idx + chunk_size]:
+        set_traj_input.extend(
+            self.extractSetTrajectories(trajectory_file, start_column_idx,
+                                        time_column_idx))
+      yield set_traj_input
+
+  def learnFromPathInChunks(self,
+                            training_data_dir_or_file_path,
+                            robot_task_servo_rate,
+                            chunk_size=DEFAULT_LEARNING_CHUNK_SIZE,
+                            start_column_idx=1,
+                            time_column_idx=0,
+                            is_smoothing_training_traj_before_learning=False,
+                            percentage_padding=None,
+                            percentage_smoothing_points=None,
+                            smoothing_mode=None,
+                            smoothing_cutoff_frequency=None,
+                            is_returning_fit_trajs=False):
+    return self.learnInChunks(
+        self.iterSetTrajectoriesInChunks(training_data_dir_or_file_path,
+                                         chunk_size, start_column_idx,
+                                         time_column_idx),
+        robot_task_servo_rate, is_smoothing_training_traj_before_learning,
+        percentage_padding, percentage_smoothing_points, smoothing_mode,
+        smoothing_cutoff_frequency, is_returning_fit_trajs)
+
+  def addDemo(self, dmptrajectory_demo_global, robot_task_servo_rate):
+    """Incremental learning: learns from one more demo, in O(T) of this demo
+
+       only (i.e. without revisiting the previously added demos), and updates
+       the parameters (W, A_learn, mean tau, and mean start and goal
+       positions) of this DMP. Returns the id of the demo (for removeDemo()).
+    """
+    assert (self.isValid(
+    )), "Pre-condition(s) checking is failed: this DMPDiscrete is invalid!"
+    assert (robot_task_servo_rate > 0.0)
+
+    [dmptrajectory_demo_local] = self.preprocess([dmptrajectory_demo_global])
+    demo_id = self.learning_sys_discrete.addDemoIncrementally(
+        dmptrajectory_demo_local, robot_task_servo_rate,
+        dmptrajectory_demo_global.X[:, [0]],
+        dmptrajectory_demo_global.X[:, [-1]], self.getPreprocessingStats())
+    self.updateFromIncrementalLearning()
+    assert (self.isValid(
+    )), "Post-condition(s) checking is failed: this DMPDiscrete became invalid!"
+    return demo_id
+
+  def removeDemo(self, demo_id):
+    """Incremental learning: un-learns the demo with the given id (as returned
+
+       by addDemo()), and updates the parameters of this DMP (if any demo is
+       left).
+    """
+    self.learning_sys_discrete.removeDemoIncrementally(demo_id)
+    if (len(self.learning_sys_discrete.getIncrementalDemoIds()) > 0):
+      self.updateFromIncrementalLearning()
+    return None
+
+  def updateFromIncrementalLearning(self):
+    [_, _,
+     self.mean_tau] = self.learning_sys_discrete.updateIncrementalApproximator()
+    assert (self.mean_tau >= MIN_TAU)
+    # (as in batch learning, the per-demo quantities of the preprocessing are
+    #  the ones of the last (remaining) demo)
+    self.setPreprocessingStats(self.learning_sys_discrete
+                               .getIncrementalDemoStats()[-1]
+                               ["preprocessing_stats"])
+    [start_positions, goal_positions
+    ] = self.learning_sys_discrete.getIncrementalStartAndGoalPositions()
+    self.setMeanStartAndGoalPositions(start_positions, goal_positions)
+    return None
+
+  def getPreprocessingStats(self):
+    # per-demo quantities of the last preprocess() call that the parameters
+    # depend on, kept by the incremental learning (none in general):
+    return None
+
+  def setPreprocessingStats(self, preprocessing_stats):
+    return None
+
+  def setMeanStartAndGoalPositions(self, start_positions, goal_positions):
+    # (as in preprocess(), from the start and goal positions of the demos,
+    #  column-wise stacked)
+    N_traj = start_positions.shape[1]
+    self.mean_start_position = np.sum(
+        start_positions, axis=1).reshape(self.dmp_num_dimensions,
+                                         1) * 1.0 / N_traj
+    self.mean_goal_position = np.sum(
+        goal_positions, axis=1).reshape(self.dmp_num_dimensions,
+                                        1) * 1.0 / N_traj
+    return None
+
   def getTargetCouplingTermTraj(
       self,
       demo_adapted_traj_global,
@@ -262,17 +457,173 @@ class DMPDiscrete(DMP, object):
     return (self.start(dmp_unroll_init_parameters.critical_states,
                        dmp_unroll_init_parameters.tau))
 
-  def unroll(self, critical_states_unroll, tau_unroll, time_unroll_max, dt):
+  def unroll(self,
+             critical_states_unroll,
+             tau_unroll,
+             time_unroll_max,
+             dt,
+             is_vectorized=False):
     dmp_unroll_init_params = self.getDMPUnrollInitParams(
         critical_states_unroll, tau_unroll)
 
     self.startWithUnrollParams(dmp_unroll_init_params)
 
-    dmpstate_list = list()
-    for i in range(int(np.round(time_unroll_max / dt) + 1)):
+    traj_length = int(np.round(time_unroll_max / dt) + 1)
+    if ((is_vectorized) or
+        (self.transform_sys_discrete.unroll_integrator != EULER_INTEGRATOR)):
+      [unroll_traj, _, _] = self.getNextStateTraj(dt, traj_length)
+      return unroll_traj
+
+    trajectory_builder = self.createTrajectoryBuilder(traj_length)
+    for i in range(traj_length):
       [current_dmpstate, _, _, _, _] = self.getNextState(dt, True)
-      dmpstate_list.append(current_dmpstate)
-    return self.convertDMPStatesListIntoDMPTrajectory(dmpstate_list)
+      trajectory_builder.append(current_dmpstate)
+    return trajectory_builder.finalize()
+
+  def iterUnroll(self,
+                 critical_states_unroll,
+                 tau_unroll,
+                 time_unroll_max,
+                 dt,
+                 ring_buffer_length=DEFAULT_UNROLL_RING_BUFFER_LENGTH):
+    """Streaming version of unroll(): starts this DMP right away, and returns
+
+       a generator yielding the unrolled DMP states one time step at a time.
+       Each yielded DMP state is a view into a preallocated ring buffer
+       (of ring_buffer_length time steps), i.e. it stays valid for
+       ring_buffer_length - 1 further time steps, then it is overwritten;
+       copy it to keep it longer. Until the next time step, the latest yielded
+       DMP state may also be the current state of this DMP itself (see
+       iterUnrollRingBuffer()). The memory usage does NOT grow with
+       the horizon, and time_unroll_max=None unrolls indefinitely.
+       Changes in between the yields, e.g. setNewSteadyStateGoalPosition(),
+       take effect on the next time step.
+    """
+    assert (ring_buffer_length >= 1)
+    dmp_unroll_init_params = self.getDMPUnrollInitParams(
+        critical_states_unroll, tau_unroll)
+
+    self.startWithUnrollParams(dmp_unroll_init_params)
+
+    if (time_unroll_max is None):
+      traj_length = None
+    else:
+      traj_length = int(np.round(time_unroll_max / dt) + 1)
+
+    # ring buffer, with each DMP state being backed by a row of ring_buffer_data:
+    template_dmpstate = self.getCurrentState()
+    ring_buffer_data = np.zeros(
+        (ring_buffer_length, template_dmpstate.buffer.size))
+    ring_buffer = [
+        copy.copy(template_dmpstate) for _ in range(ring_buffer_length)
+    ]
+    for ring_idx in range(ring_buffer_length):
+      ring_buffer[ring_idx].setBuffer(ring_buffer_data[ring_idx])
+
+    return self.iterUnrollRingBuffer(dt, traj_length, ring_buffer)
+
+  def iterUnrollRingBuffer(self, dt, traj_length, ring_buffer):
+    # Each time step is integrated directly into its ring buffer slot:
+    # the current state of the transformation system is moved into the slot
+    # (setBuffer()) right before getNextState() updates it in-place.
+    # If getNextState() returns any other state (e.g. a state converted into
+    # another coordinate system), the states are copied into the slots instead.
+    ring_buffer_length = len(ring_buffer)
+    is_integrating_in_ring_slot = True
+    current_dmpstate = None
+    i = 0
+    try:
+      while ((traj_length is None) or (i < traj_length)):
+        ring_dmpstate = ring_buffer[i % ring_buffer_length]
+        current_dmpstate = self.transform_sys_discrete.current_state
+        if ((is_integrating_in_ring_slot) and
+            (current_dmpstate.field_layout == ring_dmpstate.field_layout)):
+          current_dmpstate.setBuffer(ring_dmpstate.buffer)
+        [next_dmpstate, _, _, _, _] = self.getNextState(dt, True)
+        if (next_dmpstate.buffer is not ring_dmpstate.buffer):
+          if (current_dmpstate.buffer is ring_dmpstate.buffer):
+            current_dmpstate.setBuffer(current_dmpstate.buffer.copy())
+            is_integrating_in_ring_slot = False
+          ring_dmpstate.copyFieldValuesFrom(next_dmpstate)
+        yield ring_dmpstate
+        i += 1
+    finally:
+      # (the current state must NOT keep sharing a ring buffer slot)
+      if ((current_dmpstate is not None) and
+          (current_dmpstate.field_layout is not None)):
+        current_dmpstate.setBuffer(current_dmpstate.buffer.copy())
+
+  def unrollBatch(self, list_critical_states_unroll, list_tau_unroll,
+                  time_unroll_max, dt, list_weights, list_A_learn):
+    """Unrolls K parameter sets (weights, A_learn, tau, and critical states)
+
+       in one pass, and returns the unrolled trajectories as tensors:
+       X, Xd, and Xdd (each of size K X D X T), and time (of size K X 1 X T).
+       The parameters of this DMP are restored afterwards.
+    """
+    K = len(list_weights)
+    assert (K >= 1)
+    assert (len(list_A_learn) == K)
+    assert (len(list_tau_unroll) == K)
+    assert (len(list_critical_states_unroll) == K)
+    traj_length = int(np.round(time_unroll_max / dt) + 1)
+
+    [weights_orig, A_learn_orig] = self.getParams()
+    tau = np.zeros((K, 1))
+    x_init = np.zeros((K, self.dmp_num_dimensions))
+    xd_init = np.zeros((K, self.dmp_num_dimensions))
+    v_init = np.zeros((K, self.dmp_num_dimensions))
+    goal_position_trajectory = np.zeros(
+        (K, self.dmp_num_dimensions, traj_length))
+    scaled_forcing_term_trajectory = np.zeros(
+        (K, self.dmp_num_dimensions, traj_length))
+    time_init = np.zeros((K, 1, 1))
+    list_local_to_global_transform = [None] * K
+    for k in range(K):
+      self.setParams(list_weights[k], list_A_learn[k])
+      self.startWithUnrollParams(
+          self.getDMPUnrollInitParams(list_critical_states_unroll[k],
+                                      list_tau_unroll[k]))
+      list_local_to_global_transform[k] = self.getLocalToGlobalTransform()
+      tau[k, 0] = self.tau_sys.getTauRelative()
+      x_init[k, :] = self.transform_sys_discrete.current_state.X[:, 0]
+      xd_init[k, :] = self.transform_sys_discrete.current_state.Xd[:, 0]
+      v_init[k, :] = self.transform_sys_discrete.current_velocity_state.X[:, 0]
+      time_init[k, :, :] = self.transform_sys_discrete.current_state.time
+      [forcing_term_trajectory,
+       _] = self.transform_sys_discrete.getForcingTermTrajForUnroll(
+           dt, traj_length)
+      goal_position_trajectory[
+          k, :, :] = self.transform_sys_discrete.goal_sys.unrollCurrentGoalState(
+              dt, traj_length)
+      scaled_forcing_term_trajectory[k, :, :] = (
+          forcing_term_trajectory *
+          self.transform_sys_discrete.getScalingAmplitude())
+    self.is_started = False
+    self.setParams(weights_orig, A_learn_orig)
+
+    [X, Xd, Xdd, _, _] = self.transform_sys_discrete.integrateNextStateTrajBatch(
+        dt, tau, x_init, xd_init, v_init, goal_position_trajectory,
+        scaled_forcing_term_trajectory)
+    time = time_init + (
+        dt * np.arange(1, traj_length + 1).reshape(1, 1, traj_length))
+    [X, Xd, Xdd] = self.convertLocalTrajBatchToGlobalTrajBatch(
+        X, Xd, Xdd, list_local_to_global_transform)
+    return X, Xd, Xdd, time
+
+  def convertBatchUnrollIntoDMPTrajectoryList(self, batch_unroll):
+    [X, Xd, Xdd, time] = batch_unroll
+    return [
+        DMPTrajectory(X[k], Xd[k], Xdd[k], time[k]) for k in range(X.shape[0])
+    ]
+
+  def getLocalToGlobalTransform(self):
+    return None  # in general the global coordinate system is also (or equal to) the local coordinate system
+
+  def convertLocalTrajBatchToGlobalTrajBatch(self, X_local, Xd_local,
+                                             Xdd_local,
+                                             list_local_to_global_transform):
+    return X_local, Xd_local, Xdd_local
 
   def plotDemosVsUnroll(self,
                         set_demo_trajs,
@@ -291,6 +642,27 @@ class DMPDiscrete(DMP, object):
   def setScalingUsage(self, is_using_scaling_init):
     return self.transform_sys_discrete.setScalingUsage(is_using_scaling_init)
 
+  def setBasisFunctionCutoff(self, new_basis_function_cutoff):
+    return self.func_approx_discrete.setBasisFunctionCutoff(
+        new_basis_function_cutoff)
+
+  def setFitNMSEPrinting(self, is_printing_fit_nmse):
+    return self.learning_sys_discrete.setFitNMSEPrinting(is_printing_fit_nmse)
+
+  def getFitNMSE(self):
+    return self.learning_sys_discrete.getFitNMSE()
+
+  def setUnrollIntegrator(self, new_unroll_integrator):
+    return self.transform_sys_discrete.setUnrollIntegrator(
+        new_unroll_integrator)
+
+  def getNextStateAtTimeIndex(self, dt, time_index):
+    """Returns the (exactly integrated) state after time_index time steps
+
+       from start(), without unrolling (and without changing) this DMP.
+    """
+    return self.transform_sys_discrete.getNextStateAtTimeIndex(dt, time_index)
+
   def getCurrentState(self):
     return self.transform_sys_discrete.getCurrentState()
 
@@ -390,18 +762,37 @@ class DMPDiscrete(DMP, object):
     canonical_system_order_file_path = dir_path + "/" + file_name_canonical_system_order
     if (os.path.isfile(canonical_system_order_file_path)):
       dmp_params["canonical_order"] = int(
-          round(np.loadtxt(canonical_system_order_file_path)))
+          round(float(np.loadtxt(canonical_system_order_file_path))))
     dmp_params["W"] = np.loadtxt(dir_path + "/" + file_name_weights)
     dmp_params["A_learn"] = np.loadtxt(dir_path + "/" + file_name_A_learn)
     dmp_params["mean_start_position"] = np.loadtxt(
         dir_path + "/" + file_name_mean_start_position)
     dmp_params["mean_goal_position"] = np.loadtxt(dir_path + "/" +
                                                   file_name_mean_goal_position)
-    dmp_params["mean_tau"] = np.loadtxt(dir_path + "/" + file_name_mean_tau)
+    dmp_params["mean_tau"] = float(
+        np.loadtxt(dir_path + "/" + file_name_mean_tau))
     assert (self.isValid(
     )), "Post-condition(s) checking is failed: this DMPDiscrete became invalid!"
     return dmp_params
 
+  def getExportedParamsFromDict(self, dmp_params):
+    """Returns the params of dmp_params which saveParamsFromDict() exports,
+
+       in the types and shapes returned by loadParamsAsDict(), i.e. as if
+       saved into and loaded back from the text files (e.g. without any other
+       entries of dmp_params, such as the critical states).
+    """
+    exported_dmp_params = {}
+    if ("canonical_order" in dmp_params.keys()):
+      exported_dmp_params["canonical_order"] = int(
+          round(float(dmp_params["canonical_order"])))
+    # (np.loadtxt() returns the squeezed 2-D array saved by np.savetxt())
+    for key in ["W", "A_learn", "mean_start_position", "mean_goal_position"]:
+      exported_dmp_params[key] = np.array(
+          dmp_params[key], dtype=float).squeeze()
+    exported_dmp_params["mean_tau"] = float(dmp_params["mean_tau"])
+    return exported_dmp_params
+
   def saveParamsFromDict(
       self,
       dir_path,
@@ -443,6 +834,16 @@ class DMPDiscrete(DMP, object):
     )), "Post-condition(s) checking is failed: this DMPDiscrete became invalid!"
     return None
 
+  def loadParamsFromBinaryFile(self, file_path, is_memory_mapped=True):
+    # (much faster than loadParams(), which parses many text files)
+    return self.setParamsFromDict(
+        dmp_params_io.loadParamsBinary(file_path, is_memory_mapped))
+
+  def saveParamsToBinaryFile(self, file_path):
+    # (saves getParamsAsDict() into a single binary file,
+    #  see DMPParamsIO; saveParams() remains as the text export)
+    return dmp_params_io.saveParamsBinary(file_path, self.getParamsAsDict())
+
   def loadParams(self,
                  dir_path,
                  file_name_weights="f_weights_matrix.txt",
@@ -6,9 +6,11 @@
 """
 
 import numpy as np
+from scipy import sparse
 import os
 import sys
 import copy
+import bisect
 sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_param/"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_base/"))
 from FunctionApproximator import *
@@ -29,6 +31,10 @@ class FuncApproximatorDiscrete(FunctionApproximator, object):
     self.centers = np.zeros((self.model_size, 1))
     self.bandwidths = np.zeros((self.model_size, 1))
     self.psi = np.zeros((self.model_size, 1))
+    # None: all basis functions are evaluated (dense basis function tensor);
+    # otherwise only those within basis_function_cutoff bandwidths
+    # (standard deviations) of their centers (sparse basis function tensor):
+    self.basis_function_cutoff = None
     self.initBasisFunctions()
 
   def initBasisFunctions(self):
@@ -49,9 +55,37 @@ class FuncApproximatorDiscrete(FunctionApproximator, object):
       self.centers = np.exp(-alpha_canonical * t)
     self.bandwidths = np.square(np.diff(self.centers, axis=0) * 0.55)
     self.bandwidths = 1.0 / np.vstack((self.bandwidths, self.bandwidths[-1, 0]))
+    self.initBasisFunctionWindows()
 
     return None
 
+  def initBasisFunctionWindows(self):
+    """Pre-computes the look-up tables for finding the basis functions
+
+       within basis_function_cutoff of a canonical position by bisection
+       (the centers are monotonically decreasing), and the buffers used by
+       the windowed per-time-step evaluation.
+    """
+    self.psi = np.zeros((self.model_size, 1))
+    self.psi_window = [0, 0]
+    if (self.basis_function_cutoff is None):
+      return None
+    centers = self.centers[:, 0]
+    assert ((np.diff(centers) < 0.0).all()), (
+        "Basis function centers must be monotonically decreasing!")
+    cutoff_radius = self.basis_function_cutoff / np.sqrt(self.bandwidths[:, 0])
+    # (non-increasing) envelopes of the lower and upper ends of the support
+    # of each basis function; the basis functions within the cutoff of x
+    # are a subset of {i : lower_envelope[i] <= x <= upper_envelope[i]},
+    # which is a contiguous index range:
+    lower_envelope = np.minimum.accumulate(centers - cutoff_radius)
+    upper_envelope = np.maximum.accumulate((centers + cutoff_radius)[::-1])
+    self.ascending_lower_envelope = lower_envelope[::-1].tolist()
+    self.ascending_upper_envelope = upper_envelope.tolist()
+    self.ascending_centers = centers[::-1].tolist()
+    self.half_square_cutoff = 0.5 * self.basis_function_cutoff**2
+    return None
+
   def isValid(self):
     assert (super(FuncApproximatorDiscrete, self).isValid())
     assert (self.canonical_sys.isValid())
@@ -62,10 +96,39 @@ class FuncApproximatorDiscrete(FunctionApproximator, object):
         (self.model_size, 1))) == False)
     assert (np.array_equal(self.bandwidths, np.zeros(
         (self.model_size, 1))) == False)
+    assert ((self.basis_function_cutoff is None) or
+            (self.basis_function_cutoff > 0.0))
     return True
 
+  def setBasisFunctionCutoff(self, new_basis_function_cutoff):
+    assert ((new_basis_function_cutoff is None) or
+            (new_basis_function_cutoff > 0.0)), (
+                "basis_function_cutoff must be either None or positive!")
+    self.basis_function_cutoff = new_basis_function_cutoff
+    self.initBasisFunctionWindows()
+    return None
+
+  def getNearestBasisFunctionIndex(self, canonical_X):
+    """Index of the largest basis function among the (at most two)
+
+       basis functions whose centers are adjacent to canonical_X
+       (a scalar or a 1-D array), found by bisection.
+    """
+    ascending_centers = self.centers[::-1, 0]
+    x = np.asarray(canonical_X)
+    upper_idx = np.clip(
+        self.model_size - np.searchsorted(ascending_centers, x), 0,
+        self.model_size - 1)
+    lower_idx = np.clip(upper_idx - 1, 0, self.model_size - 1)
+    return np.where(
+        (np.square(x - self.centers[lower_idx, 0]) *
+         self.bandwidths[lower_idx, 0]) <
+        (np.square(x - self.centers[upper_idx, 0]) *
+         self.bandwidths[upper_idx, 0]), lower_idx, upper_idx)
+
   def getBasisFunctionTensor(self, canonical_X):
-    assert (self.isValid())
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid())
 
     if (type(canonical_X) != np.ndarray):
       cX = canonical_X * np.ones((1, 1))
@@ -79,55 +142,207 @@ class FuncApproximatorDiscrete(FunctionApproximator, object):
         np.matmul(self.bandwidths, np.ones(cX.shape)))
     return basis_function_tensor
 
+  def getSparseBasisFunctionTensor(self,
+                                   canonical_X,
+                                   basis_function_cutoff=None):
+    """Truncated (sparse) version of getBasisFunctionTensor(),
+
+       which only evaluates the basis functions within basis_function_cutoff
+       bandwidths (standard deviations) of their centers, i.e. the ones with
+       values >= exp(-0.5 * basis_function_cutoff^2); the rest are zero.
+       Each column keeps at least its nearest basis function (see
+       getNearestBasisFunctionIndex()), so that the normalization by the sum
+       of the basis functions stays well-defined.
+       Returns a scipy.sparse CSR matrix of size model_size X T.
+    """
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid())
+    if (basis_function_cutoff is None):
+      basis_function_cutoff = self.basis_function_cutoff
+    assert (basis_function_cutoff is not None), (
+        "basis_function_cutoff is NOT specified!")
+
+    if (type(canonical_X) != np.ndarray):
+      cX = canonical_X * np.ones((1, 1))
+    else:
+      assert (canonical_X.shape[0] == 1), "canonical_X must be a row vector!"
+      cX = canonical_X
+    x = cX[0, :]
+    traj_length = x.shape[0]
+    centers = self.centers[:, 0]
+    bandwidths = self.bandwidths[:, 0]
+
+    # the canonical positions within the cutoff of each basis function
+    # are contiguous in the sorted canonical positions:
+    sorted_idx = np.argsort(x, kind="mergesort")
+    sorted_x = x[sorted_idx]
+    cutoff_radius = basis_function_cutoff / np.sqrt(bandwidths)
+    start_idx = np.searchsorted(sorted_x, centers - cutoff_radius, side="left")
+    end_idx = np.searchsorted(sorted_x, centers + cutoff_radius, side="right")
+    counts = end_idx - start_idx
+    row_idx = np.repeat(np.arange(self.model_size), counts)
+    sorted_pos = np.arange(np.sum(counts)) - np.repeat(
+        np.cumsum(counts) - counts - start_idx, counts)
+    col_idx = sorted_idx[sorted_pos]
+
+    is_col_covered = np.zeros(traj_length, dtype=bool)
+    is_col_covered[col_idx] = True
+    uncovered_col_idx = np.nonzero(is_col_covered == False)[0]
+    if (uncovered_col_idx.shape[0] > 0):
+      nearest_basis_idx = self.getNearestBasisFunctionIndex(
+          x[uncovered_col_idx])
+      row_idx = np.concatenate([row_idx, nearest_basis_idx])
+      col_idx = np.concatenate([col_idx, uncovered_col_idx])
+
+    basis_function_values = np.exp(-0.5 * np.square(x[col_idx] -
+                                                     centers[row_idx]) *
+                                   bandwidths[row_idx])
+    sparse_basis_function_tensor = sparse.csr_matrix(
+        (basis_function_values, (row_idx, col_idx)),
+        shape=(self.model_size, traj_length))
+    return sparse_basis_function_tensor
+
+  def getWindowedNormalizedBasisFunctionVectorMultipliedPhaseMultiplier(self):
+    """Per-time-step evaluation of only the basis functions within
+
+       basis_function_cutoff of the current canonical position, which are
+       found by bisection, i.e. O(number of active basis functions).
+       self.psi is updated in-place (only within the current window).
+       Returns the index range [start, end) of the window and the normalized
+       basis function values multiplied by the phase multiplier within it.
+    """
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid())
+
+    x = self.canonical_sys.x
+    start = self.model_size - bisect.bisect_right(
+        self.ascending_lower_envelope, x)
+    end = self.model_size - bisect.bisect_left(self.ascending_upper_envelope, x)
+    half_square_dist = 0.5 * np.square(
+        x - self.centers[start:end, 0]) * self.bandwidths[start:end, 0]
+    is_active = (half_square_dist <= self.half_square_cutoff)
+    if (is_active.any() == False):
+      start = int(self.getNearestBasisFunctionIndex(x))
+      end = start + 1
+      half_square_dist = 0.5 * np.square(
+          x - self.centers[start:end, 0]) * self.bandwidths[start:end, 0]
+      is_active = np.ones(1, dtype=bool)
+    psi_window = np.exp(-half_square_dist) * is_active
+
+    self.psi[self.psi_window[0]:self.psi_window[1], 0] = 0.0
+    self.psi[start:end, 0] = psi_window
+    self.psi_window = [start, end]
+    if (isValidationRequired(self.validation_level)):
+      assert (np.isnan(psi_window).any() == False), "self.psi contains NaN!"
+    sum_psi = np.sum(psi_window) + (self.model_size * 1.e-10)
+    normalized_window = psi_window * (
+        self.canonical_sys.getCanonicalMultiplier() * 1.0 / sum_psi)
+    return start, end, normalized_window
+
   def getNormalizedBasisFunctionVectorMultipliedPhaseMultiplier(self):
-    assert (self.isValid())
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid())
+
+    if (self.basis_function_cutoff is not None):
+      [start, end, normalized_window
+      ] = self.getWindowedNormalizedBasisFunctionVectorMultipliedPhaseMultiplier(
+      )
+      normalized_basis_func_vector_mult_phase_multiplier = np.zeros(
+          (self.model_size, 1))
+      normalized_basis_func_vector_mult_phase_multiplier[
+          start:end, 0] = normalized_window
+      return normalized_basis_func_vector_mult_phase_multiplier
 
     self.psi = self.getBasisFunctionTensor(
         self.canonical_sys.getCanonicalPosition())
-    assert (self.psi.shape == (
-        self.model_size,
-        1)), "self.psi must be a column vector of size self.model_size!"
-    assert (np.isnan(self.psi).any() == False), "self.psi contains NaN!"
+    if (isValidationRequired(self.validation_level)):
+      assert (self.psi.shape == (
+          self.model_size,
+          1)), "self.psi must be a column vector of size self.model_size!"
+      assert (np.isnan(self.psi).any() == False), "self.psi contains NaN!"
     sum_psi = np.sum(self.psi + 1.e-10)
     normalized_basis_func_vector_mult_phase_multiplier = self.psi * self.canonical_sys.getCanonicalMultiplier(
     ) * 1.0 / sum_psi
-    assert (np.isnan(
-        normalized_basis_func_vector_mult_phase_multiplier).any() == False
-           ), "normalized_basis_func_vector_mult_phase_multiplier contains NaN!"
+    if (isValidationRequired(self.validation_level)):
+      assert (np.isnan(normalized_basis_func_vector_mult_phase_multiplier).any()
+              == False), (
+                  "normalized_basis_func_vector_mult_phase_multiplier contains "
+                  "NaN!")
 
     return normalized_basis_func_vector_mult_phase_multiplier
 
   def getForcingTerm(self):
-    assert (self.isValid())
+    """Returns the forcing term and the basis function vector at the
 
-    normalized_basis_func_vector_multiplied_phase_multiplier = self.getNormalizedBasisFunctionVectorMultipliedPhaseMultiplier(
-    )
-    forcing_term = np.matmul(
-        self.weights, normalized_basis_func_vector_multiplied_phase_multiplier)
-    assert (np.isnan(forcing_term).any() == False), "forcing_term contains NaN!"
-    basis_function_vector = copy.copy(self.psi)
+       current canonical state. The returned basis function vector is
+       self.psi itself (NOT a copy), which is overwritten (in-place, if
+       basis_function_cutoff is set) by the next call; callers that keep it
+       across time steps must copy it.
+    """
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid())
 
-    return forcing_term, basis_function_vector
+    if (self.basis_function_cutoff is not None):
+      [start, end, normalized_window
+      ] = self.getWindowedNormalizedBasisFunctionVectorMultipliedPhaseMultiplier(
+      )
+      forcing_term = np.dot(self.weights[:, start:end],
+                            normalized_window).reshape(
+                                (self.dmp_num_dimensions, 1))
+    else:
+      normalized_basis_func_vector_multiplied_phase_multiplier = self.getNormalizedBasisFunctionVectorMultipliedPhaseMultiplier(
+      )
+      forcing_term = np.matmul(
+          self.weights, normalized_basis_func_vector_multiplied_phase_multiplier)
+    if (isValidationRequired(self.validation_level)):
+      assert (np.isnan(forcing_term).any() == False), (
+          "forcing_term contains NaN!")
+    return forcing_term, self.psi
 
-  def getForcingTermTraj(self, canonical_position_trajectory,
-                         canonical_velocity_trajectory):
-    assert (self.isValid())
+  def getForcingTermTraj(self,
+                         canonical_position_trajectory,
+                         canonical_velocity_trajectory,
+                         is_regularizing_psi_sum=False,
+                         is_per_step=False):
+    # is_regularizing_psi_sum=True makes the normalization identical to
+    # the one in getNormalizedBasisFunctionVectorMultipliedPhaseMultiplier(),
+    # i.e. as computed per time step during an unroll.
+    # is_per_step=True if called within each step of an unroll (e.g. by the
+    # ODE integrators), such that the validity check follows the per-step
+    # validation level (see isValidationRequired()).
+    # If basis_function_cutoff is set, the returned basis_function_trajectory
+    # is a scipy.sparse matrix (see getSparseBasisFunctionTensor()).
+    if (isValidationRequired(self.validation_level, is_per_step)):
+      assert (self.isValid())
 
     traj_length = canonical_position_trajectory.shape[1]
     X = canonical_position_trajectory
     V = canonical_velocity_trajectory
-    PSI = self.getBasisFunctionTensor(X)
+    if (self.basis_function_cutoff is None):
+      PSI = self.getBasisFunctionTensor(X)
+      assert (np.isnan(PSI).any() == False), "PSI contains NaN!"
+      weighted_PSI = np.matmul(self.weights, PSI)
+      if (is_regularizing_psi_sum):
+        sum_PSI = np.sum(PSI + 1.e-10, axis=0).reshape((1, traj_length))
+      else:
+        sum_PSI = np.sum(PSI, axis=0).reshape((1, traj_length))
+    else:
+      PSI = self.getSparseBasisFunctionTensor(X)
+      assert (np.isnan(PSI.data).any() == False), "PSI contains NaN!"
+      weighted_PSI = PSI.T.dot(self.weights.T).T
+      sum_PSI = np.asarray(PSI.sum(axis=0)).reshape((1, traj_length))
+      if (is_regularizing_psi_sum):
+        sum_PSI = sum_PSI + (self.model_size * 1.e-10)
     assert (PSI.shape[0] == self.model_size)
-    assert (np.isnan(PSI).any() == False), "PSI contains NaN!"
     if (self.canonical_sys.order == 1):
-      forcing_term_trajectory = np.matmul(self.weights, PSI) * np.matmul(
+      forcing_term_trajectory = weighted_PSI * np.matmul(
           np.ones((self.dmp_num_dimensions, 1)),
-          (X * 1.0 / np.sum(PSI, axis=0).reshape((1, traj_length))))
+          (X * 1.0 / sum_PSI))
       #forcing_term_trajectory = np.matmul(self.weights, PSI) * np.matmul(np.ones((self.dmp_num_dimensions, 1)), (X * 1.0 / np.sum(PSI + 1.e-10, axis=0).reshape((1,traj_length))))
     elif (self.canonical_sys.order == 2):
-      forcing_term_trajectory = np.matmul(self.weights, PSI) * np.matmul(
+      forcing_term_trajectory = weighted_PSI * np.matmul(
           np.ones((self.dmp_num_dimensions, 1)),
-          (V * 1.0 / np.sum(PSI, axis=0).reshape((1, traj_length))))
+          (V * 1.0 / sum_PSI))
       #forcing_term_trajectory = np.matmul(self.weights, PSI) * np.matmul(np.ones((self.dmp_num_dimensions, 1)), (V * 1.0 / np.sum(PSI + 1.e-10, axis=0).reshape((1,traj_length))))
     assert (np.isnan(forcing_term_trajectory).any() == False
            ), "forcing_term_trajectory contains NaN!"
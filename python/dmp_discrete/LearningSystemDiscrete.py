@@ -10,6 +10,7 @@ from scipy import signal
 import os
 import sys
 import copy
+import collections
 sys.path.append(os.path.join(os.path.dirname(__file__), '../dmp_param/'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../dmp_base/'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../utilities/'))
@@ -24,7 +25,7 @@ class LearningSystemDiscrete(LearningSystem, object):
 
        Implemented free of (or abstracted away from)
        the type of state (DMPState/QuaternionDMPState/etc.).
-       The function getTargetForcingTermTraj() of transform_sys is the one
+       The function getTargetForcingTermTrajBatch() of transform_sys is the one
        who shall take care of the particular state type being used
        in its implementation underneath.
   """
@@ -32,6 +33,12 @@ class LearningSystemDiscrete(LearningSystem, object):
   def __init__(self, transformation_system_discrete, name=''):
     super(LearningSystemDiscrete, self).__init__(transformation_system_discrete,
                                                  name)
+    self.is_printing_fit_nmse = True
+    # (Ft, Fp, robot_task_servo_rate) of the last learnApproximator() call,
+    # for the (lazily computed) fitting NMSE diagnostic:
+    self.last_fit = None
+    self.last_fit_nmse = None
+    self.resetIncrementalLearning()
 
   def isValid(self):
     assert (super(LearningSystemDiscrete, self).isValid())
@@ -45,67 +52,269 @@ class LearningSystemDiscrete(LearningSystem, object):
     N_traj = len(list_dmptrajectory_demo_local)
     assert (N_traj > 0)
 
-    list_Ft = [None] * N_traj
-    list_cX = [None] * N_traj
-    list_cV = [None] * N_traj
-    list_tau = [None] * N_traj
-    list_A_learn = [None] * N_traj
-    list_G = [None] * N_traj
-    list_PSI = [None] * N_traj
-    for i in range(N_traj):
-      dmptrajectory_demo_local = list_dmptrajectory_demo_local[i]
-      Ft_inst, cX_inst, cV_inst, tau_inst, tau_relative_inst, A_learn_inst, G_inst = self.transform_sys.getTargetForcingTermTraj(
-          dmptrajectory_demo_local, robot_task_servo_rate)
-      list_Ft[i] = Ft_inst
-      list_cX[i] = cX_inst
-      list_cV[i] = cV_inst
-      list_tau[i] = tau_inst
-      list_A_learn[i] = A_learn_inst
-      list_G[i] = G_inst
-      PSI_inst = self.transform_sys.func_approx.getBasisFunctionTensor(cX_inst)
-      list_PSI[i] = PSI_inst
+    # target forcing term, canonical, and goal trajectories of all demos,
+    # stacked (concatenated along the time axis):
+    [Ft, cX, cV, list_tau, _, list_A_learn,
+     G] = self.transform_sys.getTargetForcingTermTrajBatch(
+         list_dmptrajectory_demo_local, robot_task_servo_rate)
+    [sx2, sxtd, PSI, MULT] = self.computeSufficientStatistics(Ft, cX, cV)
     mean_tau = np.mean(list_tau)
     mean_A_learn = np.mean(list_A_learn, axis=0)
-    Ft = np.hstack(list_Ft)
-    cX = np.hstack(list_cX)
-    cV = np.hstack(list_cV)
-    G = np.hstack(list_G)
-    PSI = np.hstack(list_PSI)
 
+    W = (sxtd * 1.0 / (sx2 + 1.e-10)).T
+    assert (np.isnan(W).any() == False), 'Learned W contains NaN!'
+    self.transform_sys.func_approx.weights = W
+    self.transform_sys.A_learn = mean_A_learn
+    Fp = self.computePredictedForcingTermTraj(W, PSI, MULT)
+
+    self.last_fit = (Ft, Fp, robot_task_servo_rate)
+    self.last_fit_nmse = None
+    if (self.is_printing_fit_nmse):
+      print('NMSE of forcing term fitting = ' + str(self.getFitNMSE()))
+
+    return W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI
+
+  def learnApproximatorInChunks(self,
+                                iter_list_dmptrajectory_demo_local,
+                                robot_task_servo_rate,
+                                is_returning_fit_trajs=False):
+    """Memory-bounded equivalent of learnApproximator(), on an iterable of
+
+       chunks (lists) of demos, e.g. streamed from disk: only one chunk at a
+       time is held in memory, and only the sufficient statistics (see
+       computeSufficientStatistics()), tau, and A_learn of the demos are
+       accumulated, i.e. the peak memory is independent of the total number
+       of demo samples.
+       Unless is_returning_fit_trajs is True (which keeps the stacked
+       trajectories of all chunks, as learnApproximator() does), Ft, Fp, G,
+       cX, cV, and PSI are returned as None, and the fitting NMSE is
+       NOT available.
+    """
+    assert (self.isValid())
+    assert (robot_task_servo_rate > 0.0)
+
+    sx2 = None
+    sxtd = None
+    list_tau = list()
+    list_A_learn = list()
+    list_fit_trajs = list()
+    for list_dmptrajectory_demo_local in iter_list_dmptrajectory_demo_local:
+      if (len(list_dmptrajectory_demo_local) == 0):
+        continue
+      [Ft_chunk, cX_chunk, cV_chunk, list_tau_chunk, _, list_A_learn_chunk,
+       G_chunk] = self.transform_sys.getTargetForcingTermTrajBatch(
+           list_dmptrajectory_demo_local, robot_task_servo_rate)
+      [sx2_chunk, sxtd_chunk, _,
+       _] = self.computeSufficientStatistics(Ft_chunk, cX_chunk, cV_chunk)
+      if (sx2 is None):
+        sx2 = sx2_chunk
+        sxtd = sxtd_chunk
+      else:
+        sx2 = sx2 + sx2_chunk
+        sxtd = sxtd + sxtd_chunk
+      list_tau.extend(list_tau_chunk)
+      list_A_learn.extend(list_A_learn_chunk)
+      if (is_returning_fit_trajs):
+        list_fit_trajs.append((Ft_chunk, cX_chunk, cV_chunk, G_chunk))
+    assert (len(list_tau) > 0), 'There is NO demo to learn from!'
+    mean_tau = np.mean(list_tau)
+    mean_A_learn = np.mean(list_A_learn, axis=0)
+
+    W = (sxtd * 1.0 / (sx2 + 1.e-10)).T
+    assert (np.isnan(W).any() == False), 'Learned W contains NaN!'
+    self.transform_sys.func_approx.weights = W
+    self.transform_sys.A_learn = mean_A_learn
+
+    if (is_returning_fit_trajs):
+      [Ft, cX, cV, G] = [
+          np.hstack(list_chunk_traj) for list_chunk_traj in zip(*list_fit_trajs)
+      ]
+      [_, _, PSI, MULT] = self.computeSufficientStatistics(Ft, cX, cV)
+      Fp = self.computePredictedForcingTermTraj(W, PSI, MULT)
+      self.last_fit = (Ft, Fp, robot_task_servo_rate)
+      self.last_fit_nmse = None
+      if (self.is_printing_fit_nmse):
+        print('NMSE of forcing term fitting = ' + str(self.getFitNMSE()))
+    else:
+      [Ft, Fp, G, cX, cV, PSI] = [None] * 6
+      self.last_fit = None
+      self.last_fit_nmse = None
+
+    return W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI
+
+  def computePredictedForcingTermTraj(self, W, PSI, MULT):
+    # predicted forcing term (MULT / sum(PSI) is broadcast over dimensions):
+    return PSI.T.dot(W.T).T * (
+        MULT * 1.0 / np.asarray(PSI.sum(axis=0)).reshape((1, PSI.shape[1])))
+
+  def computeSufficientStatistics(self, Ft, cX, cV):
+    """Returns the per-basis-function sufficient statistics of the (locally
+
+       weighted regression) fit, i.e. sx2 = sum(psi * mult^2) (of size
+       model_size X 1) and sxtd = sum(psi * mult * Ft) (of size model_size X
+       dmp_num_dimensions), summed over the samples, as well as PSI and MULT.
+    """
+    if (self.transform_sys.func_approx.basis_function_cutoff is None):
+      PSI = self.transform_sys.func_approx.getBasisFunctionTensor(cX)
+    else:
+      PSI = self.transform_sys.func_approx.getSparseBasisFunctionTensor(cX)
     if (self.transform_sys.canonical_sys.order == 2):
       MULT = cV
     elif (self.transform_sys.canonical_sys.order == 1):
       MULT = cX
-    sx2 = np.sum(
-        np.matmul(
-            np.ones((self.transform_sys.func_approx.model_size, 1)),
-            np.square(MULT)) * PSI,
-        axis=1)
-    list_w = [None] * self.transform_sys.dmp_num_dimensions
-    for i in range(self.transform_sys.dmp_num_dimensions):
-      sxtd = np.sum(
-          np.matmul(
-              np.ones((self.transform_sys.func_approx.model_size, 1)),
-              (MULT * Ft[[i], :])) * PSI,
-          axis=1)
-      w_dim = sxtd * 1.0 / (sx2 + 1.e-10)
-      list_w[i] = w_dim.T
-    W = np.vstack(list_w)
+    # (one PSI product over all samples and dimensions each, instead of
+    #  the model_size X T copies of MULT per dimension; PSI may either be
+    #  a dense numpy array or the truncated sparse scipy.sparse matrix)
+    sx2 = PSI.dot(np.square(MULT).T)
+    sxtd = PSI.dot((MULT * Ft).T)
+    return sx2, sxtd, PSI, MULT
+
+  def resetIncrementalLearning(self):
+    # per-demo statistics of the incremental learning, keyed by the demo id:
+    self.incremental_demo_stats = collections.OrderedDict()
+    self.incremental_next_demo_id = 0
+    self.incremental_sx2 = None
+    self.incremental_sxtd = None
+    return None
+
+  def addDemoIncrementally(self,
+                           dmptrajectory_demo_local,
+                           robot_task_servo_rate,
+                           start_position=None,
+                           goal_position=None,
+                           preprocessing_stats=None):
+    """Adds a demo to the incremental learning, in O(T) of this demo only:
+
+       its sufficient statistics (see computeSufficientStatistics()),
+       tau, and A_learn, as well as the given (e.g. global) start and goal
+       positions and preprocessing_stats (any other per-demo quantities of
+       the preprocessing, e.g. the local coordinate system of
+       CartesianCoordDMP), are kept, and added to the running sums.
+       Call updateIncrementalApproximator() to update W afterwards.
+       Returns the id of the demo (for removeDemoIncrementally()).
+    """
+    assert (self.isValid())
+    assert (robot_task_servo_rate > 0.0)
+
+    [Ft, cX, cV, list_tau, _, list_A_learn,
+     _] = self.transform_sys.getTargetForcingTermTrajBatch(
+         [dmptrajectory_demo_local], robot_task_servo_rate)
+    [sx2, sxtd, _, _] = self.computeSufficientStatistics(Ft, cX, cV)
+    demo_id = self.incremental_next_demo_id
+    self.incremental_next_demo_id += 1
+    self.incremental_demo_stats[demo_id] = {
+        "sx2": sx2,
+        "sxtd": sxtd,
+        "tau": list_tau[0],
+        "A_learn": list_A_learn[0],
+        "start_position": start_position,
+        "goal_position": goal_position,
+        "preprocessing_stats": preprocessing_stats
+    }
+    if (self.incremental_sx2 is None):
+      self.incremental_sx2 = copy.copy(sx2)
+      self.incremental_sxtd = copy.copy(sxtd)
+    else:
+      self.incremental_sx2 += sx2
+      self.incremental_sxtd += sxtd
+    return demo_id
+
+  def removeDemoIncrementally(self, demo_id):
+    """Removes a demo (by its id, as returned by addDemoIncrementally())
+
+       from the incremental learning, without revisiting any demo data.
+    """
+    assert (demo_id in self.incremental_demo_stats
+           ), "Demo id=" + str(demo_id) + " is NOT in the incremental learning!"
+    del self.incremental_demo_stats[demo_id]
+    # (re-summed from the kept per-demo statistics, i.e. free of the
+    #  round-off error accumulation of subtracting from the running sums)
+    if (len(self.incremental_demo_stats) > 0):
+      self.incremental_sx2 = np.sum([
+          demo_stats["sx2"]
+          for demo_stats in self.incremental_demo_stats.values()
+      ],
+                                    axis=0)
+      self.incremental_sxtd = np.sum([
+          demo_stats["sxtd"]
+          for demo_stats in self.incremental_demo_stats.values()
+      ],
+                                     axis=0)
+    else:
+      self.incremental_sx2 = None
+      self.incremental_sxtd = None
+    return None
+
+  def getIncrementalDemoIds(self):
+    return list(self.incremental_demo_stats.keys())
+
+  def getIncrementalDemoStats(self):
+    # (the per-demo statistics, in the order the demos were added)
+    return list(self.incremental_demo_stats.values())
+
+  def getIncrementalStartAndGoalPositions(self):
+    """Returns the start and goal positions given to addDemoIncrementally()
+
+       of all demos in the incremental learning, column-wise stacked.
+    """
+    assert (len(self.incremental_demo_stats) > 0)
+    start_positions = np.hstack([
+        demo_stats["start_position"]
+        for demo_stats in self.incremental_demo_stats.values()
+    ])
+    goal_positions = np.hstack([
+        demo_stats["goal_position"]
+        for demo_stats in self.incremental_demo_stats.values()
+    ])
+    return start_positions, goal_positions
+
+  def updateIncrementalApproximator(self):
+    """Sets W and A_learn from the running sums of the incremental learning,
+
+       in O(model_size X dmp_num_dimensions), i.e. independent of the amount
+       of demo data. Returns W, mean A_learn, and mean tau.
+    """
+    assert (len(self.incremental_demo_stats) >
+            0), "There is NO demo in the incremental learning!"
+    W = (self.incremental_sxtd * 1.0 / (self.incremental_sx2 + 1.e-10)).T
     assert (np.isnan(W).any() == False), 'Learned W contains NaN!'
+    mean_tau = np.mean([
+        demo_stats["tau"] for demo_stats in self.incremental_demo_stats.values()
+    ])
+    mean_A_learn = np.mean([
+        demo_stats["A_learn"]
+        for demo_stats in self.incremental_demo_stats.values()
+    ],
+                           axis=0)
     self.transform_sys.func_approx.weights = W
     self.transform_sys.A_learn = mean_A_learn
-    Fp = np.matmul(W, PSI) * np.matmul(
-        np.ones((self.transform_sys.dmp_num_dimensions, 1)),
-        (MULT * 1.0 / np.sum(PSI, axis=0).reshape(
-            (1, PSI.shape[1]))))  # predicted forcing term
-
-    N_filter_order = 2  # Butterworth filter order
-    fc = 10.0  # cutoff frequency (in Hz)
-    fs = robot_task_servo_rate  # sampling frequency (in Hz)
-    Wn = fc / (fs / 2)
-    [b, a] = signal.butter(N_filter_order, Wn)
-    Ft_filtered = signal.filtfilt(b, a, Ft, axis=1)
-    nmse_fit = computeNMSE(Fp.T, Ft_filtered.T)
-    print('NMSE of forcing term fitting = ' + str(nmse_fit))
+    return W, mean_A_learn, mean_tau
 
-    return W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI
+  def setFitNMSEPrinting(self, is_printing_fit_nmse):
+    """If False, learnApproximator() does NOT compute (nor print)
+
+       the fitting NMSE diagnostic; it is still available on demand
+       via getFitNMSE().
+    """
+    self.is_printing_fit_nmse = is_printing_fit_nmse
+    return None
+
+  def getFitNMSE(self):
+    """Returns the NMSE of the predicted forcing term of the last
+
+       learnApproximator() call w.r.t. the (Butterworth-filtered)
+       target forcing term, computed on the first request only.
+    """
+    assert (self.last_fit is not None), (
+        "NO fit is available (nothing has been learned yet, or it has been "
+        "learned in chunks without keeping the fit trajectories)!")
+    if (self.last_fit_nmse is None):
+      [Ft, Fp, robot_task_servo_rate] = self.last_fit
+      N_filter_order = 2  # Butterworth filter order
+      fc = 10.0  # cutoff frequency (in Hz)
+      fs = robot_task_servo_rate  # sampling frequency (in Hz)
+      Wn = fc / (fs / 2)
+      [b, a] = signal.butter(N_filter_order, Wn)
+      Ft_filtered = signal.filtfilt(b, a, Ft, axis=1)
+      self.last_fit_nmse = computeNMSE(Fp.T, Ft_filtered.T)
+    return self.last_fit_nmse
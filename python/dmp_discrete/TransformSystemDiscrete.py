@@ -6,9 +6,13 @@
 """
 
 import numpy as np
+from scipy import linalg
+from scipy import signal
+from scipy import integrate
 import os
 import sys
 import copy
+import collections
 sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_base/"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_param/"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "../dmp_state/"))
@@ -17,10 +21,31 @@ from FuncApproximatorDiscrete import *
 from CanonicalSystemDiscrete import *
 from DMPTrajectory import *
 
+# integrators for the (vectorized/batched) trajectory unrolling:
+EULER_INTEGRATOR = 0  # same integration scheme as getNextState()
+ZOH_INTEGRATOR = 1  # exact discretization with zero-order hold (ZOH) inputs
+# integrators of the continuous-time (canonical, goal, and transformation)
+# system dynamics, evaluating the forcing term within each time step:
+SEMI_IMPLICIT_EULER_INTEGRATOR = 2  # velocities first, then positions
+RK4_INTEGRATOR = 3  # classical 4th-order Runge-Kutta
+RK45_INTEGRATOR = 4  # adaptive-step Runge-Kutta (Dormand-Prince),
+# with the dense output resampled every dt
+ODE_INTEGRATORS = [
+    SEMI_IMPLICIT_EULER_INTEGRATOR, RK4_INTEGRATOR, RK45_INTEGRATOR
+]
+
+MAX_ZOH_DISCRETIZATION_CACHE_SIZE = 64
+RK45_RELATIVE_TOLERANCE = 1.e-8
+RK45_ABSOLUTE_TOLERANCE = 1.e-10
+
 
 class TransformSystemDiscrete(TransformationSystem, object):
   "Class for transformation systems of discrete DMPs."
 
+  # LRU cache of the ZOH-discretized system matrices, shared among all
+  # instances, keyed by (alpha, beta, tau, dt):
+  zoh_discretization_cache = collections.OrderedDict()
+
   def __init__(self,
                dmp_num_dimensions_init,
                canonical_system_discrete,
@@ -43,6 +68,7 @@ class TransformSystemDiscrete(TransformationSystem, object):
     self.beta = ts_beta
     self.is_using_scaling = is_using_scaling_init
     self.A_learn = np.zeros((self.dmp_num_dimensions, 1))
+    self.unroll_integrator = EULER_INTEGRATOR
 
   def isValid(self):
     assert (super(TransformSystemDiscrete, self).isValid())
@@ -53,11 +79,12 @@ class TransformSystemDiscrete(TransformationSystem, object):
     return True
 
   def start(self, start_state_init, goal_state_init):
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this TransformSystemDiscrete is "
-        "invalid!")
-    assert (start_state_init.isValid())
-    assert (goal_state_init.isValid())
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this TransformSystemDiscrete "
+          "is invalid!")
+      assert (start_state_init.isValid())
+      assert (goal_state_init.isValid())
     assert (start_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
     assert (goal_state_init.dmp_num_dimensions == self.dmp_num_dimensions)
 
@@ -89,16 +116,18 @@ class TransformSystemDiscrete(TransformationSystem, object):
     self.resetCouplingTerm()
     self.is_started = True
 
-    assert (self.isValid()), (
-        "Post-condition(s) checking is failed: this TransformSystemDiscrete "
-        "became invalid!")
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this TransformSystemDiscrete "
+          "became invalid!")
     return None
 
   def getNextState(self, dt):
     assert (self.is_started)
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this TransformSystemDiscrete is "
-        "invalid!")
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this TransformSystemDiscrete "
+          "is invalid!")
     assert (dt > 0.0)
 
     tau = self.tau_sys.getTauRelative()
@@ -136,7 +165,8 @@ class TransformSystemDiscrete(TransformationSystem, object):
 
     vd = ((self.alpha * ((self.beta * (g - x)) - v)) +
           (forcing_term * A) + ct_acc) * 1.0 / tau
-    assert (np.isnan(vd).any() == False), "vd contains NaN!"
+    if (isValidationRequired(self.validation_level)):
+      assert (np.isnan(vd).any() == False), "vd contains NaN!"
 
     xdd = vd * 1.0 / tau
     xd = (v + ct_vel) * 1.0 / tau
@@ -154,12 +184,492 @@ class TransformSystemDiscrete(TransformationSystem, object):
     self.current_velocity_state.X = v
     self.current_velocity_state.Xd = vd
     self.current_velocity_state.time = time
-    next_state = copy.copy(self.current_state)
+    # (NO copy: the returned next state is the current state itself,
+    #  which is updated in-place by the next time step)
+    next_state = self.current_state
+
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this TransformSystemDiscrete "
+          "became invalid!")
+    return next_state, forcing_term, ct_acc, ct_vel, basis_function_vector
+
+  def getNextStateTraj(self, dt, traj_length):
+    """Vectorized equivalent of traj_length consecutive calls of getNextState(dt),
+
+       each followed by the canonical state and goal state updates.
+       The canonical (phase) trajectory, the goal trajectory, and the forcing
+       term trajectory over the whole horizon are computed up-front, then
+       the spring-damper system is integrated in a single loop over
+       preallocated arrays. Coupling terms are NOT supported here.
+       With any of the ODE_INTEGRATORS, the continuous-time dynamics is
+       integrated instead (see getNextStateTrajODE()).
+    """
+    if (self.unroll_integrator in ODE_INTEGRATORS):
+      return self.getNextStateTrajODE(dt, traj_length)
+    assert (self.is_started)
+    assert (self.isValid()), (
+        "Pre-condition(s) checking is failed: this TransformSystemDiscrete is "
+        "invalid!")
+
+    tau = self.tau_sys.getTauRelative()
+    forcing_term_trajectory, basis_function_trajectory = self.getForcingTermTrajForUnroll(
+        dt, traj_length)
+    goal_position_trajectory = self.goal_sys.unrollCurrentGoalState(
+        dt, traj_length)
+    A = self.getScalingAmplitude()
+
+    [X, Xd, Xdd, V, Vd] = self.integrateNextStateTrajBatch(
+        dt, tau * np.ones((1, 1)), self.current_state.X.T,
+        self.current_state.Xd.T, self.current_velocity_state.X.T,
+        goal_position_trajectory.reshape(
+            (1, self.dmp_num_dimensions, traj_length)),
+        (forcing_term_trajectory * A).reshape(
+            (1, self.dmp_num_dimensions, traj_length)))
+    X = X[0]
+    Xd = Xd[0]
+    Xdd = Xdd[0]
+    time = self.current_state.time + (
+        dt * np.arange(1, traj_length + 1).reshape(1, traj_length))
+
+    self.current_state.X = X[:, [-1]]
+    self.current_state.Xd = Xd[:, [-1]]
+    self.current_state.Xdd = Xdd[:, [-1]]
+    self.current_state.time = time[:, [-1]]
+    self.current_velocity_state.X = V[0][:, [-1]]
+    self.current_velocity_state.Xd = Vd[0][:, [-1]]
+    self.current_velocity_state.time = time[:, [-1]]
+    next_state_trajectory = DMPTrajectory(X, Xd, Xdd, time)
 
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this TransformSystemDiscrete "
         "became invalid!")
-    return next_state, forcing_term, ct_acc, ct_vel, basis_function_vector
+    return next_state_trajectory, forcing_term_trajectory, basis_function_trajectory
+
+  def getForcingTermTrajForUnroll(self, dt, traj_length):
+    """Unrolls the canonical system for traj_length time steps,
+
+       and returns the forcing term and basis function trajectories
+       encountered along the way (WITHOUT the amplitude scaling).
+    """
+    assert (self.is_started)
+    assert (dt > 0.0)
+    assert (traj_length >= 1)
+    assert (all(
+        transform_coupler is None
+        for transform_coupler in self.transform_couplers_list
+    )), "Transform coupling terms are NOT supported in trajectory unrolling!"
+
+    canonical_position_trajectory, canonical_velocity_trajectory = self.canonical_sys.unrollCanonicalState(
+        dt, traj_length)
+    forcing_term_trajectory, basis_function_trajectory = self.func_approx.getForcingTermTraj(
+        canonical_position_trajectory,
+        canonical_velocity_trajectory,
+        is_regularizing_psi_sum=True)
+    return forcing_term_trajectory, basis_function_trajectory
+
+  def getScalingAmplitude(self):
+    A = self.goal_sys.G - self.start_state.X
+
+    for d in range(self.dmp_num_dimensions):
+      if (self.is_using_scaling[d]):
+        if (np.fabs(self.A_learn[d, 0]) < MIN_FABS_AMPLITUDE):
+          A[d, 0] = 1.0
+        else:
+          A[d, 0] = A[d, 0] * 1.0 / self.A_learn[d, 0]
+      else:
+        A[d, 0] = 1.0
+    return A
+
+  def setUnrollIntegrator(self, new_unroll_integrator):
+    assert ((new_unroll_integrator == EULER_INTEGRATOR) or
+            (new_unroll_integrator == ZOH_INTEGRATOR) or
+            (new_unroll_integrator in ODE_INTEGRATORS)), (
+                "Unroll integrator=" + str(new_unroll_integrator) +
+                " is not supported!")
+    self.unroll_integrator = new_unroll_integrator
+    return None
+
+  def integrateNextStateTrajBatch(self, dt, tau, x_init, xd_init, v_init,
+                                  goal_position_trajectory,
+                                  scaled_forcing_term_trajectory):
+    """Integrates a batch of K (un-coupled) transformation systems
+
+       over traj_length time steps, all at once, with self.unroll_integrator.
+       tau is of size K X 1; x_init, xd_init, and v_init are of size K X D;
+       goal_position_trajectory and scaled_forcing_term_trajectory are
+       of size K X D X traj_length.
+       Returns X, Xd, Xdd, V, and Vd, each of size K X D X traj_length.
+    """
+    assert (self.unroll_integrator not in ODE_INTEGRATORS), (
+        "Batch integration does NOT support the ODE_INTEGRATORS!")
+    if (self.unroll_integrator == ZOH_INTEGRATOR):
+      return self.integrateNextStateTrajBatchZOH(dt, tau, x_init, v_init,
+                                                 goal_position_trajectory,
+                                                 scaled_forcing_term_trajectory)
+    assert (dt > 0.0)
+    assert (len(goal_position_trajectory.shape) == 3)
+    [K, D, traj_length] = goal_position_trajectory.shape
+    assert (D == self.dmp_num_dimensions)
+    assert (scaled_forcing_term_trajectory.shape == (K, D, traj_length))
+    assert (tau.shape == (K, 1))
+    assert (x_init.shape == (K, D))
+    assert (xd_init.shape == (K, D))
+    assert (v_init.shape == (K, D))
+
+    # time-major (contiguous per time step) copies for the integration loop:
+    goal_traj = np.ascontiguousarray(np.moveaxis(goal_position_trajectory, 2, 0))
+    forcing_traj = np.ascontiguousarray(
+        np.moveaxis(scaled_forcing_term_trajectory, 2, 0))
+    X = np.zeros((traj_length, K, D))
+    V = np.zeros((traj_length, K, D))
+    Vd = np.zeros((traj_length, K, D))
+    x = x_init
+    xd = xd_init
+    v = v_init
+    for i in range(traj_length):
+      x = x + (xd * dt)
+      vd = ((self.alpha * ((self.beta * (goal_traj[i] - x)) - v)) +
+            forcing_traj[i]) * 1.0 / tau
+      xd = v * 1.0 / tau
+      v = v + (vd * dt)
+      X[i] = x
+      V[i] = v
+      Vd[i] = vd
+    assert (np.isnan(Vd).any() == False), "vd contains NaN!"
+
+    # velocity at step i is computed from v BEFORE the update at step i:
+    Xd = np.concatenate([v_init.reshape(1, K, D), V[:-1]], axis=0) * 1.0 / tau
+    Xdd = Vd * 1.0 / tau
+    return [np.moveaxis(X, 0, 2), np.moveaxis(Xd, 0, 2),
+            np.moveaxis(Xdd, 0, 2), np.moveaxis(V, 0, 2),
+            np.moveaxis(Vd, 0, 2)]
+
+  def getContinuousTimeSystemMatrices(self, tau):
+    """Continuous-time (un-coupled) transformation system, per dimension:
+
+       d/dt [x; v] = Ac * [x; v] + Bc * [g; f * A].
+    """
+    Ac = np.array([[0.0, 1.0 / tau],
+                   [-self.alpha * self.beta / tau, -self.alpha / tau]])
+    Bc = np.array([[0.0, 0.0], [self.alpha * self.beta / tau, 1.0 / tau]])
+    return Ac, Bc
+
+  def getZOHDiscretization(self, tau, dt):
+    """Exact discretization of the (un-coupled) transformation system,
+
+       holding the goal position and the scaled forcing term constant over
+       each time step (zero-order hold):
+       [x; v]_(k+1) = Ad * [x; v]_k + Bd * [g_k; f_k * A_k].
+       Ad and Bd are computed with a single matrix exponential, and memoized
+       (together with their transfer functions, see
+       getZOHTransferFunctions()) in an LRU cache keyed by
+       (alpha, beta, tau, dt).
+    """
+    [Ad, Bd, _, _] = self.getZOHDiscretizationCacheEntry(tau, dt)
+    return Ad, Bd
+
+  def getZOHTransferFunctions(self, tau, dt):
+    """Transfer functions of the ZOH-discretized transformation system,
+
+       from each input (goal position and scaled forcing term) to the states,
+       i.e. nums[input_idx][state_idx] and the (common) denominator den,
+       such that the states are scipy.signal.lfilter() outputs.
+    """
+    [_, _, nums, den] = self.getZOHDiscretizationCacheEntry(tau, dt)
+    return nums, den
+
+  def getZOHDiscretizationCacheEntry(self, tau, dt):
+    key = (self.alpha, self.beta, tau, dt)
+    cache = TransformSystemDiscrete.zoh_discretization_cache
+    if (key in cache):
+      zoh_discretization = cache.pop(key)
+    else:
+      [Ac, Bc] = self.getContinuousTimeSystemMatrices(tau)
+      augmented_system_matrix = np.zeros((4, 4))
+      augmented_system_matrix[:2, :2] = Ac
+      augmented_system_matrix[:2, 2:] = Bc
+      augmented_exp = linalg.expm(augmented_system_matrix * dt)
+      Ad = augmented_exp[:2, :2]
+      Bd = augmented_exp[:2, 2:]
+      nums = [None] * 2
+      for input_idx in range(2):
+        [nums[input_idx], den] = signal.ss2tf(Ad, Bd, np.eye(2),
+                                              np.zeros((2, 2)),
+                                              input=input_idx)
+      zoh_discretization = (Ad, Bd, nums, den)
+      while (len(cache) >= MAX_ZOH_DISCRETIZATION_CACHE_SIZE):
+        cache.popitem(last=False)
+    cache[key] = zoh_discretization
+    return zoh_discretization
+
+  def getZOHTransitionMatrixPowers(self, tau, dt, max_power):
+    """Returns Ad^n for n = 0, ..., max_power (of size (max_power+1) X 2 X 2),
+
+       where Ad is the ZOH-discretized system matrix, WITHOUT any further
+       matrix exponential: by the Cayley-Hamilton theorem,
+       Ad^n = a_n * Ad - det(Ad) * a_(n-1) * I, with a_0 = 0, a_1 = 1, and
+       a_(n+1) = trace(Ad) * a_n - det(Ad) * a_(n-1), i.e. (a_n) is the
+       (delayed) impulse response of 1/den (computed with lfilter()).
+    """
+    [Ad, _] = self.getZOHDiscretization(tau, dt)
+    [_, den] = self.getZOHTransferFunctions(tau, dt)
+    impulse = np.zeros(max_power + 1)
+    if (max_power >= 1):
+      impulse[1] = 1.0
+    a = signal.lfilter([1.0], den, impulse)  # a_0, ..., a_max_power
+    b = np.zeros(max_power + 1)
+    b[0] = 1.0
+    b[1:] = -den[2] * a[:-1]  # den = [1, -trace(Ad), det(Ad)]
+    return (a.reshape(max_power + 1, 1, 1) * Ad +
+            b.reshape(max_power + 1, 1, 1) * np.eye(2))
+
+  def getZOHStateTrajDerivatives(self, tau, X, V, goal_position_trajectory,
+                                 scaled_forcing_term_trajectory):
+    # (with the inputs held from the beginning of each time step)
+    Vd = ((self.alpha * ((self.beta * (goal_position_trajectory - X)) - V)) +
+          scaled_forcing_term_trajectory) * 1.0 / tau
+    Xd = V * 1.0 / tau
+    Xdd = Vd * 1.0 / tau
+    return Xd, Xdd, Vd
+
+  def integrateNextStateTrajBatchZOH(self, dt, tau, x_init, v_init,
+                                     goal_position_trajectory,
+                                     scaled_forcing_term_trajectory):
+    """ZOH_INTEGRATOR version of integrateNextStateTrajBatch():
+
+       the states after each time step are the response of the exactly
+       discretized linear time-invariant system, computed for all dimensions
+       at once with scipy.signal.lfilter() (forced response), plus
+       the free response of the initial state.
+    """
+    assert (dt > 0.0)
+    assert (len(goal_position_trajectory.shape) == 3)
+    [K, D, traj_length] = goal_position_trajectory.shape
+    assert (D == self.dmp_num_dimensions)
+    assert (scaled_forcing_term_trajectory.shape == (K, D, traj_length))
+    assert (tau.shape == (K, 1))
+    assert (x_init.shape == (K, D))
+    assert (v_init.shape == (K, D))
+
+    X = np.zeros((K, D, traj_length))
+    V = np.zeros((K, D, traj_length))
+    # (one extra zero input sample, such that the lfilter() output
+    #  covers the state after the last time step)
+    inputs = [
+        np.concatenate([goal_position_trajectory,
+                        np.zeros((K, D, 1))], axis=2),
+        np.concatenate([scaled_forcing_term_trajectory,
+                        np.zeros((K, D, 1))], axis=2)
+    ]
+    for k in range(K):
+      [nums, den] = self.getZOHTransferFunctions(tau[k, 0], dt)
+      for input_idx in range(2):
+        X[k] += signal.lfilter(nums[input_idx][0], den, inputs[input_idx][k],
+                               axis=1)[:, 1:]
+        V[k] += signal.lfilter(nums[input_idx][1], den, inputs[input_idx][k],
+                               axis=1)[:, 1:]
+      free_response_transition = self.getZOHTransitionMatrixPowers(
+          tau[k, 0], dt, traj_length)[1:]
+      X[k] += (np.outer(x_init[k, :], free_response_transition[:, 0, 0]) +
+               np.outer(v_init[k, :], free_response_transition[:, 0, 1]))
+      V[k] += (np.outer(x_init[k, :], free_response_transition[:, 1, 0]) +
+               np.outer(v_init[k, :], free_response_transition[:, 1, 1]))
+
+    [Xd, Xdd, Vd] = self.getZOHStateTrajDerivatives(
+        tau.reshape(K, 1, 1), X, V, goal_position_trajectory,
+        scaled_forcing_term_trajectory)
+    assert (np.isnan(Vd).any() == False), "vd contains NaN!"
+    return [X, Xd, Xdd, V, Vd]
+
+  def getNextStateAtTimeIndex(self, dt, time_index):
+    """Returns the state (DMPState) after time_index calls of getNextState(dt)
+
+       right after start(), integrated exactly (as with ZOH_INTEGRATOR),
+       without stepping through the previous time steps and WITHOUT changing
+       the state of this transformation system.
+    """
+    assert (self.is_started)
+    assert (time_index >= 1)
+    assert ((self.canonical_sys.x == 1.0) and (self.canonical_sys.v == 0.0)), (
+        "Canonical system has to be at its initial state (right after start())!"
+    )
+    assert (all(
+        transform_coupler is None
+        for transform_coupler in self.transform_couplers_list
+    )), "Transform coupling terms are NOT supported here!"
+
+    tau = self.tau_sys.getTauRelative()
+    [X, V, _] = self.canonical_sys.getCanonicalStateTable(dt, time_index, tau)
+    [forcing_term_trajectory, _] = self.func_approx.getForcingTermTraj(
+        X, V, is_regularizing_psi_sum=True)
+    scaled_forcing_term_trajectory = (forcing_term_trajectory *
+                                      self.getScalingAmplitude())
+    goal_position_trajectory = self.goal_sys.getGoalPositionTrajectoryClosedForm(
+        dt, time_index)
+
+    # [x; v]_n = Ad^n * [x; v]_0 + sum_j Ad^(n-1-j) * Bd * u_j :
+    [_, Bd] = self.getZOHDiscretization(tau, dt)
+    transition = self.getZOHTransitionMatrixPowers(tau, dt, time_index)[::-1]
+    input_response = np.matmul(transition[1:], Bd)  # time_index X 2 X 2
+    x = (transition[0, 0, 0] * self.current_state.X +
+         transition[0, 0, 1] * self.current_velocity_state.X + np.matmul(
+             goal_position_trajectory, input_response[:, [0], 0]) +
+         np.matmul(scaled_forcing_term_trajectory, input_response[:, [0], 1]))
+    v = (transition[0, 1, 0] * self.current_state.X +
+         transition[0, 1, 1] * self.current_velocity_state.X + np.matmul(
+             goal_position_trajectory, input_response[:, [1], 0]) +
+         np.matmul(scaled_forcing_term_trajectory, input_response[:, [1], 1]))
+    [xd, xdd, _] = self.getZOHStateTrajDerivatives(
+        tau, x, v, goal_position_trajectory[:, [-1]],
+        scaled_forcing_term_trajectory[:, [-1]])
+    return DMPState(x, xd, xdd,
+                    self.current_state.time + (dt * time_index))
+
+  def getUnrollStateDerivative(self, tau, A, unroll_states):
+    """Time derivative of the (un-coupled) continuous-time DMP dynamics
+
+       at N unroll states (each column of unroll_states) at once.
+       An unroll state stacks the canonical position and velocity,
+       the goal position, and the transformation system's position and
+       velocity, i.e. it is of size (2 + 3 * dmp_num_dimensions) X N.
+    """
+    D = self.dmp_num_dimensions
+    cx = unroll_states[[0], :]
+    cv = unroll_states[[1], :]
+    g = unroll_states[2:2 + D, :]
+    x = unroll_states[2 + D:2 + (2 * D), :]
+    v = unroll_states[2 + (2 * D):, :]
+
+    if (self.canonical_sys.order == 2):
+      cxd = cv * 1.0 / tau
+      cvd = (self.canonical_sys.alpha *
+             ((self.canonical_sys.beta * (0 - cx)) - cv)) * 1.0 / tau
+    elif (self.canonical_sys.order == 1):
+      cxd = (self.canonical_sys.alpha * (0 - cx)) * 1.0 / tau
+      cvd = np.zeros(cv.shape)
+    gd = (self.goal_sys.alpha * 1.0 / tau) * (self.goal_sys.G - g)
+    [forcing_term, _] = self.func_approx.getForcingTermTraj(
+        cx, cv, is_regularizing_psi_sum=True, is_per_step=True)
+    vd = ((self.alpha * ((self.beta * (g - x)) - v)) +
+          (forcing_term * A)) * 1.0 / tau
+    xd = v * 1.0 / tau
+    return np.vstack([cxd, cvd, gd, xd, vd])
+
+  def getNextStateTrajODE(self, dt, traj_length):
+    """ODE_INTEGRATORS version of getNextStateTraj():
+
+       the canonical system, the goal system, and the transformation system
+       are integrated together as one continuous-time system (such that
+       the forcing term is also evaluated within each time step),
+       and the states are returned every dt.
+       With SEMI_IMPLICIT_EULER_INTEGRATOR and RK4_INTEGRATOR dt is also
+       the integration step size, while RK45_INTEGRATOR adapts its step size
+       to the error tolerances, independent of dt.
+    """
+    assert (self.is_started)
+    assert (self.isValid()), (
+        "Pre-condition(s) checking is failed: this TransformSystemDiscrete is "
+        "invalid!")
+    assert (dt > 0.0)
+    assert (traj_length >= 1)
+    assert (all(
+        transform_coupler is None
+        for transform_coupler in self.transform_couplers_list
+    )), "Transform coupling terms are NOT supported in trajectory unrolling!"
+    assert (all(
+        canonical_coupler is None
+        for canonical_coupler in self.canonical_sys.canonical_couplers_list
+    )), "Canonical coupling terms are NOT supported in trajectory unrolling!"
+
+    D = self.dmp_num_dimensions
+    tau = self.tau_sys.getTauRelative()
+    A = self.getScalingAmplitude()
+    initial_unroll_state = np.vstack([
+        self.canonical_sys.x * np.ones((1, 1)),
+        self.canonical_sys.v * np.ones((1, 1)),
+        self.goal_sys.current_goal_state.getX(), self.current_state.X,
+        self.current_velocity_state.X
+    ])
+
+    if (self.unroll_integrator == RK45_INTEGRATOR):
+      ode_solution = integrate.solve_ivp(
+          lambda t, z: self.getUnrollStateDerivative(tau, A, z),
+          (0.0, dt * traj_length),
+          initial_unroll_state[:, 0],
+          method='RK45',
+          t_eval=dt * np.arange(1, traj_length + 1),
+          rtol=RK45_RELATIVE_TOLERANCE,
+          atol=RK45_ABSOLUTE_TOLERANCE,
+          vectorized=True)
+      assert (ode_solution.success), ode_solution.message
+      unroll_state_trajectory = ode_solution.y
+    else:
+      unroll_state_trajectory = np.zeros(
+          (initial_unroll_state.shape[0], traj_length))
+      z = initial_unroll_state
+      for i in range(traj_length):
+        if (self.unroll_integrator == SEMI_IMPLICIT_EULER_INTEGRATOR):
+          z_next = z + (self.getUnrollStateDerivative(tau, A, z) * dt)
+          # positions are updated with the (already updated) velocities:
+          if (self.canonical_sys.order == 2):
+            z_next[[0], :] = z[[0], :] + (z_next[[1], :] * 1.0 / tau * dt)
+          z_next[2 + D:2 + (2 * D), :] = (
+              z[2 + D:2 + (2 * D), :] +
+              (z_next[2 + (2 * D):, :] * 1.0 / tau * dt))
+          z = z_next
+        elif (self.unroll_integrator == RK4_INTEGRATOR):
+          k1 = self.getUnrollStateDerivative(tau, A, z)
+          k2 = self.getUnrollStateDerivative(tau, A, z + (0.5 * dt * k1))
+          k3 = self.getUnrollStateDerivative(tau, A, z + (0.5 * dt * k2))
+          k4 = self.getUnrollStateDerivative(tau, A, z + (dt * k3))
+          z = z + ((dt / 6.0) * (k1 + (2.0 * k2) + (2.0 * k3) + k4))
+        unroll_state_trajectory[:, [i]] = z
+    unroll_state_derivative_trajectory = self.getUnrollStateDerivative(
+        tau, A, unroll_state_trajectory)
+
+    X = unroll_state_trajectory[2 + D:2 + (2 * D), :]
+    V = unroll_state_trajectory[2 + (2 * D):, :]
+    Xd = V * 1.0 / tau
+    Vd = unroll_state_derivative_trajectory[2 + (2 * D):, :]
+    assert (np.isnan(Vd).any() == False), "vd contains NaN!"
+    Xdd = Vd * 1.0 / tau
+    time = self.current_state.time + (
+        dt * np.arange(1, traj_length + 1).reshape(1, traj_length))
+
+    # forcing term and basis function trajectories,
+    # at the canonical states BEFORE each time step (as in getNextStateTraj()):
+    canonical_state_trajectory = np.hstack(
+        [initial_unroll_state[:2, :], unroll_state_trajectory[:2, :-1]])
+    forcing_term_trajectory, basis_function_trajectory = self.func_approx.getForcingTermTraj(
+        canonical_state_trajectory[[0], :],
+        canonical_state_trajectory[[1], :],
+        is_regularizing_psi_sum=True)
+
+    self.canonical_sys.x = unroll_state_trajectory[0, -1]
+    self.canonical_sys.v = unroll_state_trajectory[1, -1]
+    self.canonical_sys.xd = unroll_state_derivative_trajectory[0, -1]
+    self.canonical_sys.vd = unroll_state_derivative_trajectory[1, -1]
+    self.canonical_sys.xdd = self.canonical_sys.vd * 1.0 / tau
+    self.goal_sys.current_goal_state.setX(unroll_state_trajectory[2:2 + D,
+                                                                  [-1]])
+    self.goal_sys.current_goal_state.setXd(
+        unroll_state_derivative_trajectory[2:2 + D, [-1]])
+    self.goal_sys.current_goal_state.setTime(
+        self.goal_sys.current_goal_state.getTime() + (traj_length * dt))
+    self.current_state.X = X[:, [-1]]
+    self.current_state.Xd = Xd[:, [-1]]
+    self.current_state.Xdd = Xdd[:, [-1]]
+    self.current_state.time = time[:, [-1]]
+    self.current_velocity_state.X = V[:, [-1]]
+    self.current_velocity_state.Xd = Vd[:, [-1]]
+    self.current_velocity_state.time = time[:, [-1]]
+    next_state_trajectory = DMPTrajectory(X, Xd, Xdd, time)
+
+    assert (self.isValid()), (
+        "Post-condition(s) checking is failed: this TransformSystemDiscrete "
+        "became invalid!")
+    return next_state_trajectory, forcing_term_trajectory, basis_function_trajectory
 
   def getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemo(
       self,
@@ -197,22 +707,29 @@ class TransformSystemDiscrete(TransformationSystem, object):
     self.canonical_sys.start()
     self.start(start_dmpstate_demo_local, goal_steady_dmpstate_demo_local)
     tau_relative = self.tau_sys.getTauRelative()
-    X_list = [None] * traj_length
-    V_list = [None] * traj_length
-    G_list = [None] * traj_length
-    for i in range(traj_length):
-      x = self.canonical_sys.getCanonicalPosition()
-      v = self.canonical_sys.getCanonicalVelocity()
-      g = self.goal_sys.getCurrentGoalState().getX()
-      X_list[i] = x
-      V_list[i] = v
-      G_list[i] = g
-
-      self.canonical_sys.updateCanonicalState(dt)
-      self.updateCurrentGoalState(dt)
-    X = np.hstack(X_list).reshape((1, traj_length))
-    V = np.hstack(V_list).reshape((1, traj_length))
-    G = np.hstack(G_list)
+    # without canonical coupling, the canonical trajectory is taken from
+    # the (cached) closed-form phase table:
+    is_canonical_traj_closed_form = all(
+        canonical_coupler is None
+        for canonical_coupler in self.canonical_sys.canonical_couplers_list)
+    if (is_canonical_traj_closed_form):
+      [X, V] = self.canonical_sys.unrollCanonicalState(dt, traj_length)
+      # (the goal evolution is linear, i.e. also computed in closed-form)
+      G = self.goal_sys.unrollCurrentGoalState(dt, traj_length)
+    else:
+      X_list = [None] * traj_length
+      V_list = [None] * traj_length
+      G_list = [None] * traj_length
+      for i in range(traj_length):
+        X_list[i] = self.canonical_sys.getCanonicalPosition()
+        V_list[i] = self.canonical_sys.getCanonicalVelocity()
+        self.canonical_sys.updateCanonicalState(dt)
+        G_list[i] = self.goal_sys.getCurrentGoalState().getX()
+
+        self.updateCurrentGoalState(dt)
+      X = np.hstack(X_list).reshape((1, traj_length))
+      V = np.hstack(V_list).reshape((1, traj_length))
+      G = np.hstack(G_list)
     self.is_started = False
     self.canonical_sys.is_started = False
     self.goal_sys.is_started = False
@@ -225,6 +742,184 @@ class TransformSystemDiscrete(TransformationSystem, object):
         "became invalid!")
     return goal_position_trajectory, canonical_position_trajectory, canonical_velocity_trajectory, tau, tau_relative, A_learn
 
+  def getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemoBatch(
+      self,
+      list_dmptrajectory_demo_local,
+      robot_task_servo_rate,
+      steady_state_goal_position_local=None):
+    """Batched version of getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemo()
+
+       on a list of demos (sharing steady_state_goal_position_local, if any).
+       Without canonical coupling, the goal and canonical trajectories are
+       computed in closed-form, one batch per group of demos with the same
+       length, tau, and dt. Returns lists (in the order of the demos) of
+       the goal position, canonical position, and canonical velocity
+       trajectories, tau, tau_relative, and A_learn.
+    """
+    assert (self.isValid()), (
+        "Pre-condition(s) checking is failed: this TransformSystemDiscrete is "
+        "invalid!")
+    assert (robot_task_servo_rate > 0.0)
+
+    N_demo = len(list_dmptrajectory_demo_local)
+    is_canonical_traj_closed_form = all(
+        canonical_coupler is None
+        for canonical_coupler in self.canonical_sys.canonical_couplers_list)
+    if (not is_canonical_traj_closed_form):
+      list_outputs = [
+          self.getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemo(
+              dmptrajectory_demo_local, robot_task_servo_rate,
+              steady_state_goal_position_local)
+          for dmptrajectory_demo_local in list_dmptrajectory_demo_local
+      ]
+      return [list(outputs) for outputs in zip(*list_outputs)]
+
+    # group the demos by (traj_length, tau, dt):
+    demo_groups = collections.OrderedDict()
+    for n in range(N_demo):
+      dmptrajectory_demo_local = list_dmptrajectory_demo_local[n]
+      assert (dmptrajectory_demo_local.isValid())
+      assert (dmptrajectory_demo_local.dmp_num_dimensions ==
+              self.dmp_num_dimensions)
+      traj_length = dmptrajectory_demo_local.getLength()
+      start_time = dmptrajectory_demo_local.time[0, 0]
+      if (steady_state_goal_position_local is None):
+        goal_time = dmptrajectory_demo_local.time[0, traj_length - 1]
+      else:  # (time of the DMPState(steady_state_goal_position_local))
+        goal_time = 0.0
+      dt = (goal_time - start_time) / (traj_length - 1.0)
+      if (dt <= 0.0):
+        dt = 1.0 / robot_task_servo_rate
+      tau = goal_time - start_time
+      if (tau < MIN_TAU):
+        tau = (1.0 * (traj_length - 1)) / robot_task_servo_rate
+      demo_groups.setdefault((traj_length, tau, dt), []).append(n)
+
+    list_G = [None] * N_demo
+    list_X = [None] * N_demo
+    list_V = [None] * N_demo
+    list_tau = [None] * N_demo
+    list_tau_relative = [None] * N_demo
+    list_A_learn = [None] * N_demo
+    for [traj_length, tau, dt], demo_indices in demo_groups.items():
+      self.tau_sys.setTauBase(tau)
+      tau_relative = self.tau_sys.getTauRelative()
+      [X, V, _] = self.canonical_sys.getCanonicalStateTable(
+          dt, traj_length, tau_relative)
+
+      # start (X0, Xd0, Xdd0) and steady-state goal (G) positions,
+      # each of size dmp_num_dimensions X K (K = number of demos in the group):
+      X0 = np.hstack([
+          list_dmptrajectory_demo_local[n].X[:, [0]] for n in demo_indices
+      ])
+      if (steady_state_goal_position_local is None):
+        G = np.hstack([
+            list_dmptrajectory_demo_local[n].X[:, [traj_length - 1]]
+            for n in demo_indices
+        ])
+      else:
+        G = np.tile(
+            steady_state_goal_position_local.reshape(self.dmp_num_dimensions,
+                                                     1),
+            (1, len(demo_indices)))
+      # initial goal positions, as in start():
+      if (self.canonical_sys.order == 2):
+        Xd0 = np.hstack([
+            list_dmptrajectory_demo_local[n].Xd[:, [0]] for n in demo_indices
+        ])
+        Xdd0 = np.hstack([
+            list_dmptrajectory_demo_local[n].Xdd[:, [0]] for n in demo_indices
+        ])
+        g0 = ((((tau_relative * tau_relative * Xdd0) * 1.0 / self.alpha) +
+               (tau_relative * Xd0)) * 1.0 / self.beta) + X0
+      elif (self.canonical_sys.order == 1):
+        g0 = G
+      # goal position trajectories (of size K X dmp_num_dimensions X
+      # traj_length), as in GoalSystem.getGoalPositionTrajectoryClosedForm():
+      decay = np.power(1.0 - ((self.goal_sys.alpha * 1.0 / tau_relative) * dt),
+                       np.arange(traj_length)).reshape(1, 1, traj_length)
+      goal_position_trajectories = G.T[:, :, np.newaxis] + (
+          (g0 - G).T[:, :, np.newaxis] * decay)
+
+      for k, n in enumerate(demo_indices):
+        list_G[n] = goal_position_trajectories[k]
+        list_X[n] = X.copy()
+        list_V[n] = V.copy()
+        list_tau[n] = tau
+        list_tau_relative[n] = tau_relative
+        list_A_learn[n] = G[:, [k]] - X0[:, [k]]
+    self.tau_sys.setTauBase(list_tau[-1])  # (as after the last demo)
+
+    return list_G, list_X, list_V, list_tau, list_tau_relative, list_A_learn
+
+  def getTargetForcingTermTrajBatch(self, list_dmptrajectory_demo_local,
+                                    robot_task_servo_rate):
+    """Batched version of getTargetForcingTermTraj() on a list of demos.
+
+       Returns the target forcing term, canonical position, canonical
+       velocity, and goal position trajectories of all demos, stacked
+       (concatenated along the time axis, in the order of the demos),
+       as well as the lists of tau, tau_relative, and A_learn (per demo).
+    """
+    [list_G, list_cX, list_cV, list_tau, list_tau_relative, list_A_learn
+    ] = self.getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemoBatch(
+        list_dmptrajectory_demo_local, robot_task_servo_rate)
+    [F_target, G] = self.getStackedTargetTermTrajs(
+        list_dmptrajectory_demo_local, list_G, list_tau_relative)
+    cX = np.hstack(list_cX)
+    cV = np.hstack(list_cV)
+
+    return F_target, cX, cV, list_tau, list_tau_relative, list_A_learn, G
+
+  def getTargetCouplingTermTrajBatch(self, list_dmptrajectory_demo_local,
+                                     robot_task_servo_rate,
+                                     steady_state_goal_position_local):
+    """Batched version of getTargetCouplingTermTraj() on a list of demos.
+
+       Returns the target coupling term, forcing term, basis function,
+       canonical position, canonical velocity, and goal position
+       trajectories of all demos, stacked (concatenated along the time
+       axis, in the order of the demos), as well as the lists of tau and
+       tau_relative (per demo).
+    """
+    [list_G, list_cX, list_cV, list_tau, list_tau_relative,
+     _] = self.getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemoBatch(
+         list_dmptrajectory_demo_local, robot_task_servo_rate,
+         steady_state_goal_position_local)
+    [F_target, G] = self.getStackedTargetTermTrajs(
+        list_dmptrajectory_demo_local, list_G, list_tau_relative)
+    cX = np.hstack(list_cX)
+    cV = np.hstack(list_cV)
+    F, PSI = self.func_approx.getForcingTermTraj(cX, cV)
+    C_target = F_target - F
+
+    return C_target, F, PSI, cX, cV, list_tau, list_tau_relative, G
+
+  def getStackedTargetTermTrajs(self, list_dmptrajectory_demo_local, list_G,
+                                list_tau_relative):
+    # target (forcing) term trajectories of all demos, stacked, i.e.
+    # tau_relative^2 * Tdd - alpha * (beta * (G - T) - tau_relative * Td):
+    T = np.hstack([
+        dmptrajectory_demo_local.X
+        for dmptrajectory_demo_local in list_dmptrajectory_demo_local
+    ])
+    Td = np.hstack([
+        dmptrajectory_demo_local.Xd
+        for dmptrajectory_demo_local in list_dmptrajectory_demo_local
+    ])
+    Tdd = np.hstack([
+        dmptrajectory_demo_local.Xdd
+        for dmptrajectory_demo_local in list_dmptrajectory_demo_local
+    ])
+    G = np.hstack(list_G)
+    tau_relative = np.hstack([
+        np.full((1, list_G[n].shape[1]), list_tau_relative[n])
+        for n in range(len(list_G))
+    ])
+    F_target = ((np.square(tau_relative) * Tdd) -
+                (self.alpha * ((self.beta * (G - T)) - (tau_relative * Td))))
+    return F_target, G
+
   def getTargetForcingTermTraj(self, dmptrajectory_demo_local,
                                robot_task_servo_rate):
     G, cX, cV, tau, tau_relative, A_learn = self.getGoalTrajAndCanonicalTrajAndTauAndALearnFromDemo(
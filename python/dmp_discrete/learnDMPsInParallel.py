@@ -0,0 +1,91 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 14:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import copy
+import multiprocessing
+from DMPDiscrete import *
+
+
+def learnDMPJob(dmp_learning_job):
+  # runs in a worker process, on the worker's own (unpickled) copy of the DMP:
+  [dmp, set_traj_input, robot_task_servo_rate, learning_kwargs,
+   is_computing_fit_nmse] = dmp_learning_job
+  dmp.setFitNMSEPrinting(False)
+  learning_results = dmp.learnFromSetTrajectories(set_traj_input,
+                                                  robot_task_servo_rate,
+                                                  **learning_kwargs)
+  if (is_computing_fit_nmse):
+    fit_nmse = dmp.getFitNMSE()
+  else:
+    fit_nmse = None
+  return learning_results, dmp.getParamsAsDict(), fit_nmse
+
+
+def learnDMPsInParallel(list_dmps,
+                        list_set_traj_input,
+                        robot_task_servo_rate,
+                        list_learning_kwargs=None,
+                        num_processes=1):
+  """Learns list_dmps[j] from list_set_traj_input[j] (via
+
+     learnFromSetTrajectories(), with the keyword arguments
+     list_learning_kwargs[j], e.g. the smoothing settings), as one job per
+     DMP, e.g. per primitive and per type (CartCoord/Quaternion),
+     serially (num_processes=1, the default) or on a pool of num_processes
+     worker processes (None means one per CPU).
+     The same DMP object may appear in several jobs, as each job works on
+     its own copy (of the DMP and of the trajectories); list_dmps and
+     list_set_traj_input are NOT modified.
+     Returns the lists (in the order of the jobs, regardless of
+     the completion order) of the outputs of learnFromSetTrajectories()
+     and of the learned parameters (getParamsAsDict()), which can be set
+     into a DMP via setParamsFromDict().
+     The fitting NMSE of each job is printed in the order of the jobs.
+  """
+  N_jobs = len(list_dmps)
+  assert (N_jobs >= 1)
+  assert (len(list_set_traj_input) == N_jobs)
+  assert (robot_task_servo_rate > 0.0)
+  if (list_learning_kwargs is None):
+    list_learning_kwargs = [{}] * N_jobs
+  assert (len(list_learning_kwargs) == N_jobs)
+  if (num_processes is None):
+    num_processes = multiprocessing.cpu_count()
+  num_processes = min(num_processes, N_jobs)
+  assert (num_processes >= 1)
+
+  dmp_learning_jobs = [
+      (list_dmps[j], list_set_traj_input[j], robot_task_servo_rate,
+       list_learning_kwargs[j],
+       list_dmps[j].learning_sys_discrete.is_printing_fit_nmse)
+      for j in range(N_jobs)
+  ]
+  if (num_processes == 1):  # (serially, in this process, on copies as well)
+    dmp_learning_outputs = [
+        learnDMPJob(copy.deepcopy(dmp_learning_job))
+        for dmp_learning_job in dmp_learning_jobs
+    ]
+  else:
+    pool = multiprocessing.Pool(processes=num_processes)
+    try:
+      # (map() returns the outputs in the order of the jobs)
+      dmp_learning_outputs = pool.map(learnDMPJob, dmp_learning_jobs, 1)
+    finally:
+      pool.close()
+      pool.join()
+
+  list_learning_results = [None] * N_jobs
+  list_dmp_params = [None] * N_jobs
+  for j in range(N_jobs):
+    [list_learning_results[j], list_dmp_params[j],
+     fit_nmse] = dmp_learning_outputs[j]
+    if (fit_nmse is not None):
+      print('NMSE of forcing term fitting = ' + str(fit_nmse))
+  return list_learning_results, list_dmp_params
@@ -39,6 +39,7 @@ class GoalSystem:
     self.alpha = alpha_init
     self.G = np.zeros((self.goal_num_dimensions, 1))
     self.is_started = False
+    self.validation_level = None
 
   def isValid(self):
     assert (self.dmp_num_dimensions > 0), "self.dmp_num_dimensions=" + str(
@@ -61,14 +62,22 @@ class GoalSystem:
             0.0), "self.alpha=" + str(self.alpha) + " <= 0 (invalid!)"
     return True
 
+  def setValidationLevel(self, new_validation_level):
+    assertValidValidationLevel(new_validation_level)
+    self.validation_level = new_validation_level
+    return None
+
   def start(self, current_goal_state_init, G_init):
-    assert (self.isValid()
-           ), "Pre-condition(s) checking is failed: this GoalSystem is invalid!"
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this GoalSystem is invalid!")
     self.setCurrentGoalState(current_goal_state_init)
     self.setSteadyStateGoalPosition(G_init)
     self.is_started = True
-    assert (self.isValid(
-    )), "Post-condition(s) checking is failed: this GoalSystem became invalid!"
+    if (isValidationRequired(self.validation_level, False)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this GoalSystem became "
+          "invalid!")
     return None
 
   def getSteadyStateGoalPosition(self):
@@ -85,8 +94,12 @@ class GoalSystem:
     )), "Post-condition(s) checking is failed: this GoalSystem became invalid!"
     return None
 
-  def getCurrentGoalState(self):
-    return copy.copy(self.current_goal_state)
+  def getCurrentGoalState(self, is_snapshot=True):
+    # is_snapshot=False returns the current goal state itself (NO copy),
+    # which is updated in-place by updateCurrentGoalState():
+    if (is_snapshot):
+      return copy.copy(self.current_goal_state)
+    return self.current_goal_state
 
   def setCurrentGoalState(self, new_current_goal_state):
     assert (self.isValid()
@@ -110,19 +123,63 @@ class GoalSystem:
     return None
 
   def updateCurrentGoalState(self, dt):
+    assert (self.is_started), "GoalSystem is NOT yet started!"
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this GoalSystem is invalid!")
+    assert (dt > 0.0), "dt=" + str(dt) + " <= 0.0 (invalid!)"
+
+    tau = self.tau_sys.getTauRelative()
+    g = self.current_goal_state.X
+    gd = (self.alpha * 1.0 / tau) * (self.G - g)
+    # (in-place updates of the current goal state)
+    self.current_goal_state.X = g + (gd * dt)
+    self.current_goal_state.Xd = gd
+    self.current_goal_state.time = self.current_goal_state.time + dt
+
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this GoalSystem became "
+          "invalid!")
+    return None
+
+  def getGoalPositionTrajectoryClosedForm(self, dt, traj_length):
+    """Goal position trajectory (of size goal_num_dimensions X traj_length)
+
+       over traj_length consecutive calls of updateCurrentGoalState(dt),
+       recorded BEFORE each update, WITHOUT changing the current goal state.
+       The (Euler-discretized) goal evolution is linear, so the whole
+       trajectory is computed in closed-form.
+    """
+    assert (dt > 0.0), "dt=" + str(dt) + " <= 0.0 (invalid!)"
+    assert (traj_length >= 1), "traj_length=" + str(traj_length) + " < 1"
+
+    tau = self.tau_sys.getTauRelative()
+    g0 = self.current_goal_state.getX()
+    decay = np.power(1.0 - ((self.alpha * 1.0 / tau) * dt),
+                     np.arange(traj_length)).reshape(1, traj_length)
+    return self.G + np.matmul((g0 - self.G), decay)
+
+  def unrollCurrentGoalState(self, dt, traj_length):
+    """Equivalent to traj_length consecutive calls of updateCurrentGoalState(dt),
+
+       but returning the goal position trajectory
+       (of size goal_num_dimensions X traj_length), recorded BEFORE each update.
+    """
     assert (self.is_started), "GoalSystem is NOT yet started!"
     assert (self.isValid()
            ), "Pre-condition(s) checking is failed: this GoalSystem is invalid!"
-    assert (dt > 0.0), "dt=" + str(dt) + " <= 0.0 (invalid!)"
 
     tau = self.tau_sys.getTauRelative()
-    g = self.current_goal_state.getX()
+    goal_position_trajectory = self.getGoalPositionTrajectoryClosedForm(
+        dt, traj_length + 1)
+    g = goal_position_trajectory[:, [traj_length - 1]]
     gd = (self.alpha * 1.0 / tau) * (self.G - g)
-    g = g + (gd * dt)
-    self.current_goal_state.setX(g)
+    self.current_goal_state.setX(goal_position_trajectory[:, [traj_length]])
     self.current_goal_state.setXd(gd)
-    self.current_goal_state.setTime(self.current_goal_state.getTime() + dt)
+    self.current_goal_state.setTime(self.current_goal_state.getTime() +
+                                    (traj_length * dt))
 
     assert (self.isValid(
     )), "Post-condition(s) checking is failed: this GoalSystem became invalid!"
-    return None
+    return goal_position_trajectory[:, :traj_length]
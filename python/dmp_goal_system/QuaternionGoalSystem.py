@@ -35,9 +35,10 @@ class QuaternionGoalSystem(GoalSystem, object):
 
   def updateCurrentGoalState(self, dt):
     assert (self.is_started), "QuaternionGoalSystem is NOT yet started!"
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionGoalSystem is "
-        "invalid!")
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionGoalSystem is "
+          "invalid!")
     assert (dt > 0.0), "dt=" + str(dt) + " <= 0.0 (invalid!)"
 
     tau = self.tau_sys.getTauRelative()
@@ -56,7 +57,8 @@ class QuaternionGoalSystem(GoalSystem, object):
     self.current_goal_state.computeQdAndQdd()
     self.current_goal_state.setTime(self.current_goal_state.getTime() + dt)
 
-    assert (self.isValid()), (
-        "Post-condition(s) checking is failed: this QuaternionGoalSystem became"
-        " invalid!")
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), (
+          "Post-condition(s) checking is failed: this QuaternionGoalSystem "
+          "became invalid!")
     return None
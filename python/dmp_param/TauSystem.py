@@ -31,6 +31,7 @@ class TauSystem:
     self.tau_base = tau_base_init
     self.tau_reference = tau_ref
     self.tau_couplers_list = tau_couplers_list
+    self.validation_level = None
 
   def isValid(self):
     assert (self.dt > 0.0), "TauSystem.dt=" + str(self.dt) + " <= 0.0"
@@ -40,17 +41,24 @@ class TauSystem:
         self.tau_reference) + " < MIN_TAU"
     return True
 
+  def setValidationLevel(self, new_validation_level):
+    assertValidValidationLevel(new_validation_level)
+    self.validation_level = new_validation_level
+    return None
+
   def setTauBase(self, tau_base_new):
     assert (tau_base_new >= MIN_TAU), "tau_base_new have to be >= MIN_TAU"
     self.tau_base = tau_base_new
     return None
 
   def getTauRelative(self):
-    assert (self.isValid()), "TauSystem is invalid!"
+    if (isValidationRequired(self.validation_level)):
+      assert (self.isValid()), "TauSystem is invalid!"
     C_tau = self.getCouplingTerm()
     tau_relative = (1.0 + C_tau) * (self.tau_base * 1.0 / self.tau_reference)
-    assert (tau_relative * self.tau_reference >=
-            MIN_TAU), "tau_relative is too small!"
+    if (isValidationRequired(self.validation_level)):
+      assert (tau_relative * self.tau_reference >=
+              MIN_TAU), "tau_relative is too small!"
     return tau_relative
 
   def getdtPerTauRelative(self):
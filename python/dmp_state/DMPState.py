@@ -9,11 +9,34 @@ import numpy as np
 import os
 import sys
 import copy
+import operator
 
 
-class DMPState:
+def createStateFieldProperty(field_name):
+  # property of a per-time-step field (e.g. X) of a state, which is a view into
+  # the state's buffer (kept in the slot 'view_' + field_name); assigning
+  # a value of the same shape updates it in-place (otherwise the buffer is
+  # re-allocated):
+  return property(
+      operator.attrgetter('view_' + field_name),
+      lambda self, new_value: self.setFieldValue(field_name, new_value))
+
+
+class DMPState(object):
   "Base class for DMP states."
 
+  # The per-time-step fields (X, Xd, Xdd, and time) are all views into
+  # a single contiguous float64 buffer; copy.copy() makes a snapshot,
+  # i.e. a state with its own copy of the buffer.
+  __slots__ = ('name', 'dmp_num_dimensions', 'buffer', 'field_layout',
+               'view_X', 'view_Xd', 'view_Xdd', 'view_time')
+  field_names = ('X', 'Xd', 'Xdd', 'time')
+
+  X = createStateFieldProperty('X')
+  Xd = createStateFieldProperty('Xd')
+  Xdd = createStateFieldProperty('Xdd')
+  time = createStateFieldProperty('time')
+
   def __init__(self,
                X_init=None,
                Xd_init=None,
@@ -21,20 +44,21 @@ class DMPState:
                time_init=np.zeros((1, 1)),
                name=""):
     self.name = name
-    self.time = time_init
+    time = np.asarray(time_init)
     if ((X_init is None) and (Xd_init is None) and (Xdd_init is None)):
       self.dmp_num_dimensions = 0
-      self.X = np.empty((0, 0))
-      self.Xd = np.empty((0, 0))
-      self.Xdd = np.empty((0, 0))
+      X = np.empty((0, 0))
+      Xd = np.empty((0, 0))
+      Xdd = np.empty((0, 0))
+      self.allocateBuffer({'X': X, 'Xd': Xd, 'Xdd': Xdd, 'time': time})
     else:
       if (X_init is not None):
         self.dmp_num_dimensions = X_init.shape[0]
-        self.X = X_init
+        X = X_init
       else:
         assert (False), "X_init CANNOT be empty!"
-      if (len(self.X.shape) == 1):
-        self.X = self.X.reshape(self.dmp_num_dimensions, 1)
+      if (len(X.shape) == 1):
+        X = X.reshape(self.dmp_num_dimensions, 1)
 
       if (Xd_init is not None):
         assert (self.dmp_num_dimensions == Xd_init.shape[0]
@@ -42,11 +66,11 @@ class DMPState:
                    Xd_init.shape[0]
                ) + " is mis-matched with self.dmp_num_dimensions=" + str(
                    self.dmp_num_dimensions) + "!"
-        self.Xd = Xd_init
+        Xd = Xd_init
       else:
-        self.Xd = np.zeros((self.dmp_num_dimensions, self.X.shape[1]))
-      if (len(self.Xd.shape) == 1):
-        self.Xd = self.Xd.reshape(self.dmp_num_dimensions, 1)
+        Xd = np.zeros((self.dmp_num_dimensions, X.shape[1]))
+      if (len(Xd.shape) == 1):
+        Xd = Xd.reshape(self.dmp_num_dimensions, 1)
 
       if (Xdd_init is not None):
         assert (self.dmp_num_dimensions == Xdd_init.shape[0]
@@ -54,16 +78,135 @@ class DMPState:
                    Xdd_init.shape[0]
                ) + " is mis-matched with self.dmp_num_dimensions=" + str(
                    self.dmp_num_dimensions) + "!"
-        self.Xdd = Xdd_init
+        Xdd = Xdd_init
       else:
-        self.Xdd = np.zeros((self.dmp_num_dimensions, self.X.shape[1]))
-      if (len(self.Xdd.shape) == 1):
-        self.Xdd = self.Xdd.reshape(self.dmp_num_dimensions, 1)
+        Xdd = np.zeros((self.dmp_num_dimensions, X.shape[1]))
+      if (len(Xdd.shape) == 1):
+        Xdd = Xdd.reshape(self.dmp_num_dimensions, 1)
 
-      if (len(self.time.shape) == 1):
-        self.time = self.time.reshape((1, 1))
+      if (len(time.shape) == 1):
+        time = time.reshape((1, 1))
+      self.allocateBuffer({'X': X, 'Xd': Xd, 'Xdd': Xdd, 'time': time})
       assert (self.isValid())
 
+  def allocateBuffer(self, field_values):
+    """(Re-)allocates the buffer holding all fields (in field_names order),
+
+       and copies the given field values (or else the current ones) into it.
+    """
+    field_values = [
+        np.asarray(field_values[field_name]) if field_name in field_values else
+        getattr(self, 'view_' + field_name) for field_name in self.field_names
+    ]
+    buffer_size = 0
+    field_layout = []
+    for field_name, field_value in zip(self.field_names, field_values):
+      field_layout.append(('view_' + field_name, buffer_size,
+                           buffer_size + field_value.size, field_value.shape))
+      buffer_size += field_value.size
+    self.field_layout = tuple(field_layout)
+    self.buffer = np.empty(buffer_size)
+    self.createFieldViews()
+    for field_name, field_value in zip(self.field_names, field_values):
+      getattr(self, 'view_' + field_name)[...] = field_value
+    return None
+
+  def createFieldViews(self):
+    for [view_name, start_idx, end_idx, shape] in self.field_layout:
+      setattr(self, view_name, self.buffer[start_idx:end_idx].reshape(shape))
+    return None
+
+  def setBuffer(self, new_buffer):
+    """Moves this state (all its fields) into new_buffer,
+
+       a (preallocated) contiguous float64 array of the same size as
+       the current buffer, e.g. a row of a larger array.
+    """
+    assert (self.field_layout is not None), "Column views have NO own buffer!"
+    assert (new_buffer.shape == self.buffer.shape)
+    assert (new_buffer.dtype == self.buffer.dtype)
+    assert (new_buffer.flags['C_CONTIGUOUS'])
+    new_buffer[...] = self.buffer
+    self.buffer = new_buffer
+    self.createFieldViews()
+    return None
+
+  def setFieldValue(self, field_name, new_value):
+    field_view = getattr(self, 'view_' + field_name)
+    if ((isinstance(new_value, np.ndarray)) and
+        (new_value.shape == field_view.shape)):
+      field_view[...] = new_value
+    else:
+      self.allocateBuffer({field_name: new_value})
+    return None
+
+  def copyFieldValuesFrom(self, source_state):
+    """Copies all fields of source_state (of the same class) into this state,
+
+       in-place wherever the field shapes match (i.e. without re-allocating
+       the buffer).
+    """
+    assert (source_state.field_names == self.field_names)
+    self.name = source_state.name
+    self.dmp_num_dimensions = source_state.dmp_num_dimensions
+    for field_name in self.field_names:
+      self.setFieldValue(field_name, getattr(source_state, field_name))
+    return None
+
+  def getColumnView(self, view_class, column_slice):
+    """Returns a view_class object whose fields are (zero-copy) views into
+
+       the columns column_slice (a slice object) of this state's fields,
+       i.e. in-place updates on either one are visible on the other.
+       No validation is performed here.
+    """
+    view = view_class.__new__(view_class)
+    view.name = self.name
+    view.dmp_num_dimensions = self.dmp_num_dimensions
+    view.buffer = self.buffer
+    view.field_layout = None  # (fields are NOT contiguous in the buffer)
+    for field_name in self.field_names:
+      view_name = 'view_' + field_name
+      setattr(view, view_name, getattr(self, view_name)[:, column_slice])
+    return view
+
+  def __copy__(self):
+    new_state = self.__class__.__new__(self.__class__)
+    new_state.name = self.name
+    new_state.dmp_num_dimensions = self.dmp_num_dimensions
+    if (self.field_layout is None):  # (a column view)
+      new_state.allocateBuffer({
+          field_name: getattr(self, 'view_' + field_name)
+          for field_name in self.field_names
+      })
+    else:
+      new_state.buffer = self.buffer.copy()
+      new_state.field_layout = self.field_layout
+      new_state.createFieldViews()
+    return new_state
+
+  def __deepcopy__(self, memo):
+    return self.__copy__()
+
+  def __getstate__(self):
+    if (self.field_layout is None):  # (a column view)
+      return self.__copy__().__getstate__()
+    return (self.name, self.dmp_num_dimensions, self.buffer, self.field_layout)
+
+  def __setstate__(self, state):
+    if (isinstance(state, dict)):
+      # legacy pickles (from before the fields were backed by the buffer)
+      # hold the instance __dict__, with each field as a separate array:
+      self.name = state.get('name', "")
+      self.dmp_num_dimensions = state['dmp_num_dimensions']
+      self.allocateBuffer({
+          field_name: state[field_name] for field_name in self.field_names
+      })
+      return None
+    [self.name, self.dmp_num_dimensions, self.buffer, self.field_layout] = state
+    self.createFieldViews()
+    return None
+
   def isValid(self):
     assert (len(self.X.shape) == 2), "self.X.shape =" + str(self.X.shape)
     assert (len(self.Xd.shape) == 2), "self.Xd.shape =" + str(self.Xd.shape)
@@ -113,7 +256,7 @@ class DMPState:
     ), "self.dmp_num_dimensions=" + str(
         self.dmp_num_dimensions) + " is mis-matched with new_X.shape[0]=" + str(
             new_X.shape[0]) + "!"
-    self.X = copy.copy(new_X)
+    self.X = new_X
     assert (self.isValid(
     )), "Post-condition(s) checking is failed: this DMPState became invalid!"
     return None
@@ -126,7 +269,7 @@ class DMPState:
     ), "self.dmp_num_dimensions=" + str(
         self.dmp_num_dimensions
     ) + " is mis-matched with new_Xd.shape[0]=" + str(new_Xd.shape[0]) + "!"
-    self.Xd = copy.copy(new_Xd)
+    self.Xd = new_Xd
     assert (self.isValid(
     )), "Post-condition(s) checking is failed: this DMPState became invalid!"
     return None
@@ -139,7 +282,7 @@ class DMPState:
     ), "self.dmp_num_dimensions=" + str(
         self.dmp_num_dimensions
     ) + " is mis-matched with new_Xdd.shape[0]=" + str(new_Xdd.shape[0]) + "!"
-    self.Xdd = copy.copy(new_Xdd)
+    self.Xdd = new_Xdd
     assert (self.isValid(
     )), "Post-condition(s) checking is failed: this DMPState became invalid!"
     return None
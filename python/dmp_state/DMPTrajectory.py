@@ -9,27 +9,57 @@ import numpy as np
 import os
 import sys
 import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../utilities/"))
 from DMPState import *
+from definitions_base import *
 
 
 class DMPTrajectory(DMPState, object):
   "Class for DMP trajectories."
 
+  __slots__ = ()
+
   def isValid(self):
     assert (super(DMPTrajectory, self).isValid())
     assert (self.X.shape[1] == self.time.shape[1])
     return True
 
+  def __len__(self):
+    return self.view_time.shape[1]
+
+  def __getitem__(self, key):
+    """traj[i] is a (zero-copy) DMPState view of the i-th state,
+
+       and traj[a:b] is a (zero-copy) DMPTrajectory view of the states a to b-1.
+    """
+    if (isinstance(key, slice)):
+      return self.getColumnView(DMPTrajectory, key)
+    else:
+      return self.getDMPStateViewAtIndex(key)
+
+  def __iter__(self):
+    # fast iteration over (zero-copy) DMPState views, WITHOUT validation:
+    for i in range(self.view_time.shape[1]):
+      yield self.getColumnView(DMPState, slice(i, i + 1))
+
+  def getDMPStateViewAtIndex(self, i):
+    traj_length = self.view_time.shape[1]
+    assert ((i >= -traj_length) and (i < traj_length)
+           ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
+               traj_length) + ")!"
+    if (i < 0):
+      i += traj_length
+    return self.getColumnView(DMPState, slice(i, i + 1))
+
   def getDMPStateAtIndex(self, i):
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!"
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
-    return DMPState(self.X[:, i].reshape(self.dmp_num_dimensions, 1),
-                    self.Xd[:, i].reshape(self.dmp_num_dimensions, 1),
-                    self.Xdd[:, i].reshape(self.dmp_num_dimensions,
-                                           1), self.time[:, i].reshape(1, 1))
+    # (a snapshot, i.e. a copy)
+    return copy.copy(self.getDMPStateViewAtIndex(i))
 
   def setDMPStateAtIndex(self, i, dmpstate):
     assert (self.isValid(
@@ -51,8 +81,9 @@ class DMPTrajectory(DMPState, object):
 
   def accessDMPPositionAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!"
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -60,8 +91,9 @@ class DMPTrajectory(DMPState, object):
 
   def accessDMPVelocityAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!"
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -69,8 +101,9 @@ class DMPTrajectory(DMPState, object):
 
   def accessDMPAccelerationAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!"
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -78,8 +111,9 @@ class DMPTrajectory(DMPState, object):
 
   def accessDMPTimeAtIndex(self,
                            i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid(
-    )), "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!"
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this DMPTrajectory is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -0,0 +1,243 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 20:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import copy
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), "../utilities/"))
+from DMPTrajectory import *
+from QuaternionDMPTrajectory import *
+from definitions_base import *
+
+DEMO_DATASET_STORE_FORMAT_VERSION = 1
+DEMO_DATASET_STORE_TRAJECTORY_CLASSES = {
+    'DMPTrajectory': DMPTrajectory,
+    'QuaternionDMPTrajectory': QuaternionDMPTrajectory
+}
+
+# On-disk layout of a demo dataset store (a directory), holding the demos
+# (trajectories) of N_settings settings, e.g. obstacle settings:
+# - metadata.json: format version, trajectory class, dmp_num_dimensions,
+#   the names of the per-setting arrays, and user (JSON-able) metadata;
+# - traj_<field>.npy (for each field of the trajectory class): the field of
+#   all demos, concatenated time-major, i.e. of size total_length X field_size;
+# - demo_offsets.npy: the start row of each demo (and the total length) in
+#   traj_<field>.npy, of size N_demos+1;
+# - setting_offsets.npy: the index of the first demo of each setting (and
+#   N_demos), of size N_settings+1, i.e. demo j of setting i is demo
+#   setting_offsets[i]+j;
+# - setting_<name>.npy and setting_<name>_offsets.npy: a per-setting array
+#   (e.g. the obstacle markers), concatenated along axis 0, and the start row
+#   of each setting (and the total number of rows).
+# All of these are memory-mapped on opening, i.e. NOTHING is deserialized,
+# and any demo is accessed in O(1), as (zero-copy) views. By default
+# (mmap_mode='r') these views are read-only, i.e. consumers which modify
+# a trajectory in-place (e.g. smoothStartEndNDTrajectoryBasedOnPosition())
+# fail with "assignment destination is read-only"; either copy.copy()
+# the trajectory first, or open the store with mmap_mode='c' (copy-on-write),
+# where in-place modifications stay in memory (per store instance) and
+# are NEVER written back to the store's files.
+
+
+def saveDemoDatasetStore(store_dir_path,
+                         list_set_traj,
+                         setting_arrays=None,
+                         metadata=None):
+  """Saves list_set_traj (a list, over the settings, of lists of trajectories,
+
+     all of the same class and dmp_num_dimensions), and setting_arrays
+     (a dictionary of per-setting lists of numpy arrays, each of the length
+     N_settings), into a demo dataset store at store_dir_path.
+  """
+  N_settings = len(list_set_traj)
+  assert (N_settings >= 1)
+  if (setting_arrays is None):
+    setting_arrays = {}
+  if (metadata is None):
+    metadata = {}
+  list_traj = [traj for set_traj in list_set_traj for traj in set_traj]
+  assert (len(list_traj) >= 1), "There is NO demo to save!"
+  trajectory_class = list_traj[0].__class__
+  assert (trajectory_class.__name__ in DEMO_DATASET_STORE_TRAJECTORY_CLASSES
+         ), "Trajectory class " + trajectory_class.__name__ + " is NOT supported!"
+  dmp_num_dimensions = list_traj[0].dmp_num_dimensions
+  for traj in list_traj:
+    assert (traj.__class__ == trajectory_class)
+    assert (traj.dmp_num_dimensions == dmp_num_dimensions)
+    if (isValidationRequired()):
+      assert (traj.isValid())
+
+  if (not os.path.isdir(store_dir_path)):
+    os.makedirs(store_dir_path)
+  demo_offsets = np.cumsum([0] + [traj.getLength() for traj in list_traj])
+  setting_offsets = np.cumsum([0] + [len(set_traj) for set_traj in list_set_traj])
+  for field_name in trajectory_class.field_names:
+    np.save(
+        os.path.join(store_dir_path, 'traj_' + field_name + '.npy'),
+        np.hstack([getattr(traj, 'view_' + field_name) for traj in list_traj
+                  ]).T)
+  np.save(os.path.join(store_dir_path, 'demo_offsets.npy'), demo_offsets)
+  np.save(os.path.join(store_dir_path, 'setting_offsets.npy'), setting_offsets)
+  for [setting_array_name, list_setting_array] in setting_arrays.items():
+    assert (len(list_setting_array) == N_settings)
+    list_setting_array = [
+        np.atleast_1d(setting_array) for setting_array in list_setting_array
+    ]
+    np.save(
+        os.path.join(store_dir_path, 'setting_' + setting_array_name + '.npy'),
+        np.concatenate(list_setting_array, axis=0))
+    np.save(
+        os.path.join(store_dir_path,
+                     'setting_' + setting_array_name + '_offsets.npy'),
+        np.cumsum([0] + [
+            setting_array.shape[0] for setting_array in list_setting_array
+        ]))
+  with open(os.path.join(store_dir_path, 'metadata.json'), 'w') as f:
+    json.dump(
+        {
+            'format_version': DEMO_DATASET_STORE_FORMAT_VERSION,
+            'trajectory_class': trajectory_class.__name__,
+            'dmp_num_dimensions': dmp_num_dimensions,
+            'setting_array_names': sorted(setting_arrays.keys()),
+            'user_metadata': metadata
+        },
+        f,
+        indent=2,
+        sort_keys=True)
+  return None
+
+
+class DemoDatasetStore(object):
+  """Class for (read-only) access to a demo dataset store,
+
+       see saveDemoDatasetStore(); store[i][j] (or getDemo(i, j)) is demo j
+       of setting i, as a trajectory whose fields are (zero-copy) views into
+       the memory-mapped store, which are read-only if mmap_mode='r', or
+       copy-on-write if mmap_mode='c' (copy.copy() a demo for one with its own
+       buffer).
+  """
+
+  def __init__(self, store_dir_path, mmap_mode='r'):
+    assert (os.path.isdir(store_dir_path)
+           ), "Demo dataset store " + store_dir_path + " does NOT exist!"
+    assert (mmap_mode in ['r', 'c']
+           ), "mmap_mode=" + str(mmap_mode) + " is NOT supported!"
+    with open(os.path.join(store_dir_path, 'metadata.json'), 'r') as f:
+      store_metadata = json.load(f)
+    assert (store_metadata['format_version'] <=
+            DEMO_DATASET_STORE_FORMAT_VERSION), (
+                "Demo dataset store format version " +
+                str(store_metadata['format_version']) + " is NOT supported!")
+    self.store_dir_path = store_dir_path
+    self.mmap_mode = mmap_mode
+    self.trajectory_class = DEMO_DATASET_STORE_TRAJECTORY_CLASSES[
+        store_metadata['trajectory_class']]
+    self.dmp_num_dimensions = store_metadata['dmp_num_dimensions']
+    self.metadata = store_metadata['user_metadata']
+    self.demo_offsets = self.loadArray('demo_offsets.npy')
+    self.setting_offsets = self.loadArray('setting_offsets.npy')
+    self.traj_fields = [
+        ('view_' + field_name,
+         self.loadArray('traj_' + field_name + '.npy', mmap_mode=mmap_mode))
+        for field_name in self.trajectory_class.field_names
+    ]
+    self.setting_arrays = {}
+    for setting_array_name in store_metadata['setting_array_names']:
+      self.setting_arrays[setting_array_name] = (
+          self.loadArray('setting_' + setting_array_name + '.npy',
+                         mmap_mode=mmap_mode),
+          self.loadArray('setting_' + setting_array_name + '_offsets.npy'))
+
+  def loadArray(self, file_name, mmap_mode=None):
+    try:
+      return np.load(
+          os.path.join(self.store_dir_path, file_name), mmap_mode=mmap_mode)
+    except ValueError:  # (e.g. an empty array, which can NOT be mmap-ed)
+      return np.load(os.path.join(self.store_dir_path, file_name))
+
+  def getNumSettings(self):
+    return self.setting_offsets.shape[0] - 1
+
+  def getNumDemos(self, setting_idx=None):
+    # setting_idx=None means the total number of demos (of all settings).
+    if (setting_idx is None):
+      return self.demo_offsets.shape[0] - 1
+    return (self.setting_offsets[setting_idx + 1] -
+            self.setting_offsets[setting_idx])
+
+  def getDemo(self, setting_idx, demo_idx):
+    assert ((setting_idx >= 0) and (setting_idx < self.getNumSettings())
+           ), "Setting index=" + str(setting_idx) + " is out-of-range!"
+    assert ((demo_idx >= 0) and (demo_idx < self.getNumDemos(setting_idx))
+           ), "Demo index=" + str(demo_idx) + " is out-of-range!"
+    global_demo_idx = self.setting_offsets[setting_idx] + demo_idx
+    start_row_idx = self.demo_offsets[global_demo_idx]
+    end_row_idx = self.demo_offsets[global_demo_idx + 1]
+    trajectory = self.trajectory_class.__new__(self.trajectory_class)
+    trajectory.name = ""
+    trajectory.dmp_num_dimensions = self.dmp_num_dimensions
+    trajectory.buffer = None  # (NO own buffer)
+    trajectory.field_layout = None  # (fields are NOT contiguous in a buffer)
+    for [view_name, traj_field] in self.traj_fields:
+      setattr(trajectory, view_name, traj_field[start_row_idx:end_row_idx].T)
+    return trajectory
+
+  def getSettingDemos(self, setting_idx):
+    return [
+        self.getDemo(setting_idx, demo_idx)
+        for demo_idx in range(self.getNumDemos(setting_idx))
+    ]
+
+  def getSettingArray(self, setting_array_name, setting_idx):
+    [setting_array,
+     setting_array_offsets] = self.setting_arrays[setting_array_name]
+    return setting_array[setting_array_offsets[setting_idx]:
+                         setting_array_offsets[setting_idx + 1]]
+
+  def __len__(self):
+    return self.getNumSettings()
+
+  def __getitem__(self, setting_idx):
+    # (a lazy, indexable view of the demos of a setting)
+    if (setting_idx < 0):
+      setting_idx += self.getNumSettings()
+    if ((setting_idx < 0) or (setting_idx >= self.getNumSettings())):
+      raise IndexError("setting_idx is out of range!")
+    return DemoDatasetStoreSetting(self, setting_idx)
+
+  def __iter__(self):
+    for setting_idx in range(len(self)):
+      yield DemoDatasetStoreSetting(self, setting_idx)
+
+
+class DemoDatasetStoreSetting(object):
+  "Class for (lazy) access to the demos of a setting of a DemoDatasetStore."
+
+  def __init__(self, demo_dataset_store, setting_idx):
+    self.demo_dataset_store = demo_dataset_store
+    self.setting_idx = setting_idx
+
+  def __len__(self):
+    return self.demo_dataset_store.getNumDemos(self.setting_idx)
+
+  def __getitem__(self, demo_idx):
+    if (isinstance(demo_idx, slice)):
+      return [
+          self.demo_dataset_store.getDemo(self.setting_idx, i)
+          for i in range(*demo_idx.indices(len(self)))
+      ]
+    if (demo_idx < 0):
+      demo_idx += len(self)
+    if ((demo_idx < 0) or (demo_idx >= len(self))):
+      raise IndexError("demo_idx is out of range!")
+    return self.demo_dataset_store.getDemo(self.setting_idx, demo_idx)
+
+  def __iter__(self):
+    for demo_idx in range(len(self)):
+      yield self.demo_dataset_store.getDemo(self.setting_idx, demo_idx)
@@ -20,6 +20,12 @@ import utility_quaternion as util_quat
 class QuaternionDMPState(DMPState, object):
   "Class for Quaternion DMP states."
 
+  __slots__ = ('view_omega', 'view_omegad')
+  field_names = ('X', 'Xd', 'Xdd', 'omega', 'omegad', 'time')
+
+  omega = createStateFieldProperty('omega')
+  omegad = createStateFieldProperty('omegad')
+
   def __init__(self,
                Q_init=None,
                Qd_init=None,
@@ -29,42 +35,50 @@ class QuaternionDMPState(DMPState, object):
                time_init=np.zeros((1, 1)),
                name=""):
     self.name = name
-    self.time = time_init
+    time = np.asarray(time_init)
     self.dmp_num_dimensions = 3
     if ((Q_init is None) and (Qd_init is None) and (Qdd_init is None) and
         (omega_init is None) and (omegad_init is None)):
-      self.X = np.empty((4, 0))
-      self.Xd = np.empty((4, 0))
-      self.Xdd = np.empty((4, 0))
-      self.omega = np.empty((self.dmp_num_dimensions, 0))
-      self.omegad = np.empty((self.dmp_num_dimensions, 0))
+      X = np.empty((4, 0))
+      Xd = np.empty((4, 0))
+      Xdd = np.empty((4, 0))
+      omega = np.empty((self.dmp_num_dimensions, 0))
+      omegad = np.empty((self.dmp_num_dimensions, 0))
+      self.allocateBuffer({
+          'X': X,
+          'Xd': Xd,
+          'Xdd': Xdd,
+          'omega': omega,
+          'omegad': omegad,
+          'time': time
+      })
     else:
       if (Q_init is not None):
         assert (Q_init.shape[0] == 4), "Dimension Q_init.shape[0]=" + str(
             Q_init.shape[0]) + " is NOT 4 (invalid Quaternion)!"
-        self.X = Q_init
+        X = Q_init
       else:
         assert (False), "Q_init CANNOT be empty!"
-      if (len(self.X.shape) == 1):
-        self.X = self.X.reshape(4, 1)
+      if (len(X.shape) == 1):
+        X = X.reshape(4, 1)
 
       if (Qd_init is not None):
         assert (Qd_init.shape[0] == 4), "Dimension Qd_init.shape[0]=" + str(
             Qd_init.shape[0]) + " is NOT 4!"
-        self.Xd = Qd_init
+        Xd = Qd_init
       else:
-        self.Xd = np.zeros((4, self.X.shape[1]))
-      if (len(self.Xd.shape) == 1):
-        self.Xd = self.Xd.reshape(4, 1)
+        Xd = np.zeros((4, X.shape[1]))
+      if (len(Xd.shape) == 1):
+        Xd = Xd.reshape(4, 1)
 
       if (Qdd_init is not None):
         assert (Qdd_init.shape[0] == 4), "Dimension Qdd_init.shape[0]=" + str(
             Qdd_init.shape[0]) + " is NOT 4!"
-        self.Xdd = Qdd_init
+        Xdd = Qdd_init
       else:
-        self.Xdd = np.zeros((4, self.X.shape[1]))
-      if (len(self.Xdd.shape) == 1):
-        self.Xdd = self.Xdd.reshape(4, 1)
+        Xdd = np.zeros((4, X.shape[1]))
+      if (len(Xdd.shape) == 1):
+        Xdd = Xdd.reshape(4, 1)
 
       if (omega_init is not None):
         assert (omega_init.shape[0] == self.dmp_num_dimensions
@@ -72,11 +86,11 @@ class QuaternionDMPState(DMPState, object):
                    omega_init.shape[0]
                ) + " is mis-matched with self.dmp_num_dimensions=" + str(
                    self.dmp_num_dimensions) + "!"
-        self.omega = omega_init
+        omega = omega_init
       else:
-        self.omega = np.zeros((self.dmp_num_dimensions, self.X.shape[1]))
-      if (len(self.omega.shape) == 1):
-        self.omega = self.omega.reshape(self.dmp_num_dimensions, 1)
+        omega = np.zeros((self.dmp_num_dimensions, X.shape[1]))
+      if (len(omega.shape) == 1):
+        omega = omega.reshape(self.dmp_num_dimensions, 1)
 
       if (omegad_init is not None):
         assert (omegad_init.shape[0] == self.dmp_num_dimensions
@@ -84,14 +98,22 @@ class QuaternionDMPState(DMPState, object):
                    omegad_init.shape[0]
                ) + " is mis-matched with self.dmp_num_dimensions=" + str(
                    self.dmp_num_dimensions) + "!"
-        self.omegad = omegad_init
+        omegad = omegad_init
       else:
-        self.omegad = np.zeros((self.dmp_num_dimensions, self.X.shape[1]))
-      if (len(self.omegad.shape) == 1):
-        self.omegad = self.omegad.reshape(self.dmp_num_dimensions, 1)
+        omegad = np.zeros((self.dmp_num_dimensions, X.shape[1]))
+      if (len(omegad.shape) == 1):
+        omegad = omegad.reshape(self.dmp_num_dimensions, 1)
 
-      if (len(self.time.shape) == 1):
-        self.time = self.time.reshape((1, 1))
+      if (len(time.shape) == 1):
+        time = time.reshape((1, 1))
+      self.allocateBuffer({
+          'X': X,
+          'Xd': Xd,
+          'Xdd': Xdd,
+          'omega': omega,
+          'omegad': omegad,
+          'time': time
+      })
       assert (self.isValid())
 
   def isValid(self):
@@ -156,7 +178,7 @@ class QuaternionDMPState(DMPState, object):
         "invalid!")
     assert (new_Q.shape[0] == 4), "new_Q.shape[0]=" + str(
         new_Q.shape[0]) + " is NOT 4 (invalid Quaternion)!"
-    self.X = copy.copy(new_Q)
+    self.X = new_Q
     self.normalizeQuaternion()
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this QuaternionDMPState became "
@@ -169,7 +191,7 @@ class QuaternionDMPState(DMPState, object):
         "invalid!")
     assert (new_Qd.shape[0] == 4), "new_Qd.shape[0]=" + str(
         new_Qd.shape[0]) + " is NOT 4!"
-    self.Xd = copy.copy(new_Qd)
+    self.Xd = new_Qd
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this QuaternionDMPState became "
         "invalid!")
@@ -181,7 +203,7 @@ class QuaternionDMPState(DMPState, object):
         "invalid!")
     assert (new_Qdd.shape[0] == 4), "new_Qdd.shape[0]=" + str(
         new_Qdd.shape[0]) + " is NOT 4!"
-    self.Xdd = copy.copy(new_Qdd)
+    self.Xdd = new_Qdd
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this QuaternionDMPState became "
         "invalid!")
@@ -196,7 +218,7 @@ class QuaternionDMPState(DMPState, object):
                new_omega.shape[0]
            ) + " is mis-matched with self.dmp_num_dimensions=" + str(
                self.dmp_num_dimensions) + "!"
-    self.omega = copy.copy(new_omega)
+    self.omega = new_omega
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this QuaternionDMPState became "
         "invalid!")
@@ -211,7 +233,7 @@ class QuaternionDMPState(DMPState, object):
                new_omegad.shape[0]
            ) + " is mis-matched with self.dmp_num_dimensions=" + str(
                self.dmp_num_dimensions) + "!"
-    self.omegad = copy.copy(new_omegad)
+    self.omegad = new_omegad
     assert (self.isValid()), (
         "Post-condition(s) checking is failed: this QuaternionDMPState became "
         "invalid!")
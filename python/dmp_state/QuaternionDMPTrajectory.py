@@ -9,33 +9,63 @@ import numpy as np
 import os
 import sys
 import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../utilities/"))
 from QuaternionDMPState import *
+from definitions_base import *
 
 
 class QuaternionDMPTrajectory(QuaternionDMPState, object):
   "Class for QuaternionDMP trajectories."
 
+  __slots__ = ()
+
   def isValid(self):
     assert (super(QuaternionDMPTrajectory, self).isValid())
     assert (self.X.shape[1] == self.time.shape[1])
     return True
 
+  def __len__(self):
+    return self.view_time.shape[1]
+
+  def __getitem__(self, key):
+    """qtraj[i] is a (zero-copy) QuaternionDMPState view of the i-th state,
+
+       and qtraj[a:b] is a (zero-copy) QuaternionDMPTrajectory view of
+       the states a to b-1.
+    """
+    if (isinstance(key, slice)):
+      return self.getColumnView(QuaternionDMPTrajectory, key)
+    else:
+      return self.getQuaternionDMPStateViewAtIndex(key)
+
+  def __iter__(self):
+    # fast iteration over (zero-copy) QuaternionDMPState views,
+    # WITHOUT validation:
+    for i in range(self.view_time.shape[1]):
+      yield self.getColumnView(QuaternionDMPState, slice(i, i + 1))
+
+  def getQuaternionDMPStateViewAtIndex(self, i):
+    traj_length = self.view_time.shape[1]
+    assert ((i >= -traj_length) and (i < traj_length)
+           ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
+               traj_length) + ")!"
+    if (i < 0):
+      i += traj_length
+    return self.getColumnView(QuaternionDMPState, slice(i, i + 1))
+
   def getDMPStateAtIndex(self, i):
     return self.getQuaternionDMPStateAtIndex(i)
 
   def getQuaternionDMPStateAtIndex(self, i):
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory is "
-        "invalid!")
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory "
+          "is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
-    return QuaternionDMPState(
-        self.X[:, i].reshape(4, 1), self.Xd[:, i].reshape(4, 1),
-        self.Xdd[:, i].reshape(4, 1),
-        self.omega[:, i].reshape(self.dmp_num_dimensions, 1),
-        self.omegad[:, i].reshape(self.dmp_num_dimensions,
-                                  1), self.time[:, i].reshape(1, 1))
+    # (a snapshot, i.e. a copy)
+    return copy.copy(self.getQuaternionDMPStateViewAtIndex(i))
 
   def setDMPStateAtIndex(self, i, quatdmpstate):
     return self.setQuaternionDMPStateAtIndex(i, quatdmpstate)
@@ -65,9 +95,10 @@ class QuaternionDMPTrajectory(QuaternionDMPState, object):
 
   def accessQuaternionDMPQAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory is "
-        "invalid!")
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory "
+          "is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -75,9 +106,10 @@ class QuaternionDMPTrajectory(QuaternionDMPState, object):
 
   def accessQuaternionDMPQdAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory is "
-        "invalid!")
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory "
+          "is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -85,9 +117,10 @@ class QuaternionDMPTrajectory(QuaternionDMPState, object):
 
   def accessQuaternionDMPQddAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory is "
-        "invalid!")
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory "
+          "is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -95,9 +128,10 @@ class QuaternionDMPTrajectory(QuaternionDMPState, object):
 
   def accessQuaternionDMPOmegaAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory is "
-        "invalid!")
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory "
+          "is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -105,9 +139,10 @@ class QuaternionDMPTrajectory(QuaternionDMPState, object):
 
   def accessQuaternionDMPOmegadAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory is "
-        "invalid!")
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory "
+          "is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
@@ -115,9 +150,10 @@ class QuaternionDMPTrajectory(QuaternionDMPState, object):
 
   def accessQuaternionDMPTimeAtIndex(
       self, i):  # for quick (pointer-like) access, NO copying
-    assert (self.isValid()), (
-        "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory is "
-        "invalid!")
+    if (isValidationRequired()):
+      assert (self.isValid()), (
+          "Pre-condition(s) checking is failed: this QuaternionDMPTrajectory "
+          "is invalid!")
     assert ((i >= 0) and (i < self.time.shape[1])
            ), "Index i=" + str(i) + " is out-of-range (TrajectoryLength=" + str(
                self.time.shape[1]) + ")!"
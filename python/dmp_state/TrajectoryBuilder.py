@@ -0,0 +1,113 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 10:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../utilities/"))
+from DMPState import *
+from DMPTrajectory import *
+from definitions_base import *
+
+DEFAULT_TRAJECTORY_BUILDER_INITIAL_CAPACITY = 256
+
+
+class TrajectoryBuilder(object):
+  "Class for building a (DMP) trajectory by appending states in-place."
+
+  # The states are stored time-major, i.e. the i-th appended state occupies
+  # the i-th row of self.data (with the same layout as a single-time-step
+  # state's buffer, so appending is a single row copy), and the fields of
+  # the finalized trajectory are (zero-copy) transposed views into self.data.
+
+  def __init__(self,
+               trajectory_class=DMPTrajectory,
+               traj_length=None,
+               initial_capacity=DEFAULT_TRAJECTORY_BUILDER_INITIAL_CAPACITY):
+    """traj_length is the (expected) trajectory length, to preallocate
+
+       exactly; if it is None (unknown), the storage starts at
+       initial_capacity time steps and grows geometrically.
+    """
+    assert ((traj_length is None) or (traj_length >= 1))
+    assert (initial_capacity >= 1)
+    self.trajectory_class = trajectory_class
+    if (traj_length is not None):
+      self.capacity = traj_length
+    else:
+      self.capacity = initial_capacity
+    self.length = 0
+    self.data = None
+    self.state_field_layout = None
+    self.field_row_ranges = None
+    self.dmp_num_dimensions = None
+
+  def initializeStorage(self, dmpstate):
+    assert (tuple(dmpstate.field_names) == tuple(
+        self.trajectory_class.field_names)), (
+            "State fields " + str(dmpstate.field_names) +
+            " are mis-matched with the trajectory fields " +
+            str(self.trajectory_class.field_names) + "!")
+    field_row_ranges = []
+    row_size = 0
+    for field_name in dmpstate.field_names:
+      field_value = getattr(dmpstate, 'view_' + field_name)
+      assert (field_value.shape[1] == 1
+             ), "Only single-time-step states can be appended!"
+      field_row_ranges.append(('view_' + field_name, row_size,
+                               row_size + field_value.shape[0]))
+      row_size += field_value.shape[0]
+    self.field_row_ranges = tuple(field_row_ranges)
+    self.state_field_layout = tuple(
+        (view_name, start_idx, end_idx, (end_idx - start_idx, 1))
+        for [view_name, start_idx, end_idx] in self.field_row_ranges)
+    self.dmp_num_dimensions = dmpstate.dmp_num_dimensions
+    self.data = np.empty((self.capacity, row_size))
+    return None
+
+  def append(self, dmpstate):
+    if (self.data is None):
+      self.initializeStorage(dmpstate)
+    if (self.length == self.capacity):  # grow geometrically
+      self.capacity *= 2
+      new_data = np.empty((self.capacity, self.data.shape[1]))
+      new_data[:self.length] = self.data[:self.length]
+      self.data = new_data
+    if (dmpstate.field_layout == self.state_field_layout):
+      self.data[self.length] = dmpstate.buffer
+    else:  # e.g. a column view, with NO own contiguous buffer
+      for [view_name, start_idx, end_idx] in self.field_row_ranges:
+        self.data[self.length, start_idx:end_idx] = getattr(
+            dmpstate, view_name)[:, 0]
+    self.length += 1
+    return None
+
+  def getLength(self):
+    return self.length
+
+  def finalize(self):
+    """Returns the built trajectory (of self.trajectory_class), whose fields
+
+       are (zero-copy) views into this builder's storage; states appended
+       afterwards go into a new storage, i.e. do NOT affect it.
+    """
+    assert (self.length >= 1), "NO state has been appended yet!"
+    trajectory = self.trajectory_class.__new__(self.trajectory_class)
+    trajectory.name = ""
+    trajectory.dmp_num_dimensions = self.dmp_num_dimensions
+    trajectory.buffer = self.data
+    trajectory.field_layout = None  # (fields are NOT contiguous in the buffer)
+    for [view_name, start_idx, end_idx] in self.field_row_ranges:
+      setattr(trajectory, view_name,
+              self.data[:self.length, start_idx:end_idx].T)
+    self.capacity = self.length  # (any further append() re-allocates)
+    if (isValidationRequired()):
+      assert (trajectory.isValid()), (
+          "Post-condition(s) checking is failed: the built trajectory is "
+          "invalid!")
+    return trajectory
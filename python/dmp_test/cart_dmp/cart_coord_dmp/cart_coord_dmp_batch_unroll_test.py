@@ -0,0 +1,111 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 14:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../dmp_param/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../dmp_base/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../../dmp_discrete/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../../cart_dmp/cart_coord_dmp"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../utilities/"))
+from TauSystem import *
+from CanonicalSystemDiscrete import *
+from CartesianCoordTransformer import *
+from CartesianCoordDMP import *
+from utilities import *
+
+
+def cart_coord_dmp_batch_unroll_test(dmp_home_dir_path="../../../../",
+                                     canonical_order=2,
+                                     unroll_ctraj_save_dir_path="",
+                                     sequential_unroll_ctraj_save_filename="",
+                                     batch_unroll_ctraj_save_filename="",
+                                     K=4,
+                                     random_seed=40):
+  """Unrolls K parameter sets (randomly perturbed weights, A_learn, tau,
+
+     and start and goal positions, i.e. different local coordinate systems)
+     of a CartesianCoordDMP sequentially (setParams() and unroll() per
+     parameter set) and at once (unrollBatch()), and saves both unrolled
+     trajectories (time, X, Xd, and Xdd of the K parameter sets, stacked).
+  """
+  task_servo_rate = 1000.0
+  dt = 1.0 / task_servo_rate
+  model_size = 25
+  tau = 0.5
+  time_unroll_max = 0.5
+  rng = np.random.RandomState(random_seed)
+
+  tau_sys = TauSystem(dt, tau)
+  canonical_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+  cart_dmp = CartesianCoordDMP(model_size, canonical_sys_discr,
+                               GSUTANTO_LOCAL_COORD_FRAME)
+  set_ctraj_input = cart_dmp.extractSetTrajectories(
+      dmp_home_dir_path +
+      "/data/cart_dmp/cart_coord_dmp/multi_traj_training/dataset1/",
+      start_column_idx=1,
+      time_column_idx=0)
+  [critical_states_learn, W, mean_A_learn, mean_tau, _, _, _, _, _,
+   _] = cart_dmp.learnFromSetTrajectories(set_ctraj_input, task_servo_rate)
+
+  list_weights = [None] * K
+  list_A_learn = [None] * K
+  list_tau_unroll = [None] * K
+  list_critical_states_unroll = [None] * K
+  for k in range(K):
+    list_weights[k] = W * (1.0 + (0.1 * rng.randn(*W.shape)))
+    list_A_learn[k] = mean_A_learn * (1.0 + (0.1 * rng.randn(
+        *mean_A_learn.shape)))
+    list_tau_unroll[k] = mean_tau * (1.0 + (0.2 * rng.rand()))
+    list_critical_states_unroll[k] = copy.copy(critical_states_learn)
+    list_critical_states_unroll[k].X = (
+        critical_states_learn.X + (0.05 * rng.randn(3, 1)) +
+        (0.05 * rng.randn(*critical_states_learn.X.shape)))
+
+  sequential_unroll_ctraj = [None] * K
+  for k in range(K):
+    cart_dmp.setParams(list_weights[k], list_A_learn[k])
+    ccdmp_unroll = cart_dmp.unroll(list_critical_states_unroll[k],
+                                   list_tau_unroll[k], time_unroll_max, dt)
+    sequential_unroll_ctraj[k] = np.hstack([
+        ccdmp_unroll.time.T, ccdmp_unroll.X.T, ccdmp_unroll.Xd.T,
+        ccdmp_unroll.Xdd.T
+    ])
+  sequential_unroll_ctraj = np.vstack(sequential_unroll_ctraj)
+  cart_dmp.setParams(W, mean_A_learn)
+
+  [X, Xd, Xdd, time] = cart_dmp.unrollBatch(list_critical_states_unroll,
+                                             list_tau_unroll, time_unroll_max,
+                                             dt, list_weights, list_A_learn)
+  batch_unroll_ctraj = np.vstack([
+      np.hstack([time[k].T, X[k].T, Xd[k].T, Xdd[k].T]) for k in range(K)
+  ])
+  # (the parameters of cart_dmp are restored by unrollBatch())
+  [W_after_batch_unroll, A_learn_after_batch_unroll] = cart_dmp.getParams()
+  assert (np.array_equal(W_after_batch_unroll, W))
+  assert (np.array_equal(A_learn_after_batch_unroll, mean_A_learn))
+
+  if (os.path.isdir(unroll_ctraj_save_dir_path)):
+    np.savetxt(
+        unroll_ctraj_save_dir_path + "/" +
+        sequential_unroll_ctraj_save_filename, sequential_unroll_ctraj)
+    np.savetxt(
+        unroll_ctraj_save_dir_path + "/" + batch_unroll_ctraj_save_filename,
+        batch_unroll_ctraj)
+
+  return sequential_unroll_ctraj, batch_unroll_ctraj
+
+
+if __name__ == "__main__":
+  [sequential_unroll_ctraj,
+   batch_unroll_ctraj] = cart_coord_dmp_batch_unroll_test()
+  print("max abs. diff. = " +
+        str(np.max(np.abs(sequential_unroll_ctraj - batch_unroll_ctraj))))
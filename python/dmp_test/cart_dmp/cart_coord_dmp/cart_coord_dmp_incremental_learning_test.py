@@ -0,0 +1,139 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 16:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../dmp_param/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../dmp_base/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../../dmp_discrete/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../../cart_dmp/cart_coord_dmp"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../utilities/"))
+from TauSystem import *
+from DMPUnrollInitParams import *
+from CanonicalSystemDiscrete import *
+from CartesianCoordTransformer import *
+from CartesianCoordDMP import *
+from utilities import *
+
+
+def getCartCoordDMPLearnedParamsMatrix(cart_dmp):
+  model_size = cart_dmp.model_size
+  [W, A_learn] = cart_dmp.getParams()
+  learned_params = np.zeros((model_size + 1 + 4 + 4 + 4, 4))
+  learned_params[0:model_size, 0:3] = W.T
+  learned_params[model_size:model_size + 1, 0:3] = A_learn.T
+  learned_params[model_size, 3] = cart_dmp.mean_tau
+  learned_params[model_size + 1:model_size + 2,
+                 0:3] = cart_dmp.mean_start_global_position.T
+  learned_params[model_size + 2:model_size + 3,
+                 0:3] = cart_dmp.mean_goal_global_position.T
+  learned_params[model_size + 3:model_size + 4,
+                 0:3] = cart_dmp.mean_start_local_position.T
+  learned_params[model_size + 4:model_size + 5,
+                 0:3] = cart_dmp.mean_goal_local_position.T
+  learned_params[
+      model_size + 5:model_size +
+      9, :] = cart_dmp.ctraj_hmg_transform_local_to_global_matrix
+  learned_params[
+      model_size + 9:model_size +
+      13, :] = cart_dmp.ctraj_hmg_transform_global_to_local_matrix
+  return learned_params
+
+
+def cart_coord_dmp_incremental_learning_test(
+    dmp_home_dir_path="../../../../",
+    canonical_order=2,
+    unroll_ctraj_save_dir_path="",
+    batch_learning_save_filename="",
+    incremental_learning_save_filename=""):
+  """Learns a CartesianCoordDMP from the demos of each multi-trajectory
+
+     training dataset (a) in batch and (b) incrementally (via addDemo(), and
+     removeDemo() of the first or of the last demo, compared against
+     the batch learning on the remaining demos), and saves the learned parameters and the unrolled
+     trajectories of both, which are supposed to be (numerically) equal.
+  """
+  task_servo_rate = 1000.0
+  dt = 1.0 / task_servo_rate
+  model_size = 25
+  tau = 0.5
+
+  assert ((canonical_order >= 1) and (canonical_order <= 2))
+
+  list_cart_dmp = list()
+  for learning_mode in range(2):
+    tau_sys = TauSystem(dt, tau)
+    canonical_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+    cart_dmp = CartesianCoordDMP(model_size, canonical_sys_discr,
+                                 GSUTANTO_LOCAL_COORD_FRAME)
+    cart_dmp.setFitNMSEPrinting(False)
+    list_cart_dmp.append(cart_dmp)
+  [batch_cart_dmp, incremental_cart_dmp] = list_cart_dmp
+
+  batch_learning_log = list()
+  incremental_learning_log = list()
+
+  for k in range(2):
+    if (k == 0):
+      sub_cart_coord_dmp_training_path = "/data/cart_dmp/cart_coord_dmp/multi_traj_training/dataset1/"
+    elif (k == 1):
+      sub_cart_coord_dmp_training_path = "/data/cart_dmp/cart_coord_dmp/multi_traj_training/dataset2/"
+
+    set_ctraj_input = batch_cart_dmp.extractSetTrajectories(
+        dmp_home_dir_path + sub_cart_coord_dmp_training_path,
+        start_column_idx=1,
+        time_column_idx=0)
+
+    # (all demos, then all but the first demo, then all but the last demo,
+    #  whose local coordinate system is the one of the batch learning)
+    N_demos = len(set_ctraj_input)
+    for [set_batch_ctraj_input,
+         removed_demo_idx] in [[set_ctraj_input, None],
+                               [set_ctraj_input[1:], 0],
+                               [set_ctraj_input[:-1], N_demos - 1]]:
+      [critical_states_learn, _, _, _, _, _, _, _, _,
+       _] = batch_cart_dmp.learnFromSetTrajectories(
+           copy.deepcopy(set_batch_ctraj_input), task_servo_rate)
+      batch_learning_log.append(
+          getCartCoordDMPLearnedParamsMatrix(batch_cart_dmp))
+      ccdmp_unroll = batch_cart_dmp.unroll(critical_states_learn, tau, tau, dt)
+      batch_learning_log.append(
+          np.hstack([ccdmp_unroll.time.T - dt, ccdmp_unroll.X.T]))
+
+      incremental_cart_dmp.learning_sys_discrete.resetIncrementalLearning()
+      list_demo_ids = [
+          incremental_cart_dmp.addDemo(
+              copy.deepcopy(ctraj_input), task_servo_rate)
+          for ctraj_input in set_ctraj_input
+      ]
+      if (removed_demo_idx is not None):
+        incremental_cart_dmp.removeDemo(list_demo_ids[removed_demo_idx])
+      incremental_learning_log.append(
+          getCartCoordDMPLearnedParamsMatrix(incremental_cart_dmp))
+      ccdmp_unroll = incremental_cart_dmp.unroll(critical_states_learn, tau,
+                                                 tau, dt)
+      incremental_learning_log.append(
+          np.hstack([ccdmp_unroll.time.T - dt, ccdmp_unroll.X.T]))
+
+  if (os.path.isdir(unroll_ctraj_save_dir_path)):
+    np.savetxt(unroll_ctraj_save_dir_path + "/" + batch_learning_save_filename,
+               np.vstack(batch_learning_log))
+    np.savetxt(
+        unroll_ctraj_save_dir_path + "/" + incremental_learning_save_filename,
+        np.vstack(incremental_learning_log))
+
+  return np.vstack(batch_learning_log), np.vstack(incremental_learning_log)
+
+
+if __name__ == "__main__":
+  batch_learning_result, incremental_learning_result = cart_coord_dmp_incremental_learning_test(
+  )
+  compareTwoMatrices(batch_learning_result, incremental_learning_result)
@@ -37,7 +37,9 @@ def cart_coord_dmp_multi_traj_training_test(
     percentage_smoothing_points=None,
     smoothing_mode=None,
     smoothing_cutoff_frequency=None,
-    is_plotting=False):
+    is_plotting=False,
+    learning_chunk_size=None,
+    params_binary_file_path=None):
   task_servo_rate = 1000.0
   dt = 1.0 / task_servo_rate
   model_size = 25
@@ -54,6 +56,14 @@ def cart_coord_dmp_multi_traj_training_test(
   canonical_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
   cart_dmp = CartesianCoordDMP(model_size, canonical_sys_discr,
                                GSUTANTO_LOCAL_COORD_FRAME)
+  unroll_cart_dmp = cart_dmp
+  if (params_binary_file_path is not None):
+    # (unrolling another CartesianCoordDMP, whose params are loaded from
+    #  the binary file saved by the learning CartesianCoordDMP)
+    unroll_cart_dmp = CartesianCoordDMP(
+        model_size, CanonicalSystemDiscrete(TauSystem(dt, tau),
+                                            canonical_order),
+        GSUTANTO_LOCAL_COORD_FRAME)
   tau = tau_reproduce
 
   unroll_ctraj_list = list()
@@ -70,19 +80,39 @@ def cart_coord_dmp_multi_traj_training_test(
         start_column_idx=1,
         time_column_idx=0)
 
-    [critical_states_learn, W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI
-    ] = cart_dmp.learnFromSetTrajectories(
-        set_ctraj_input,
-        task_servo_rate,
-        is_smoothing_training_traj_before_learning=is_smoothing_training_traj_before_learning,
-        percentage_padding=percentage_padding,
-        percentage_smoothing_points=percentage_smoothing_points,
-        smoothing_mode=smoothing_mode,
-        smoothing_cutoff_frequency=smoothing_cutoff_frequency)
+    if (learning_chunk_size is None):
+      [critical_states_learn, W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI
+      ] = cart_dmp.learnFromSetTrajectories(
+          set_ctraj_input,
+          task_servo_rate,
+          is_smoothing_training_traj_before_learning=is_smoothing_training_traj_before_learning,
+          percentage_padding=percentage_padding,
+          percentage_smoothing_points=percentage_smoothing_points,
+          smoothing_mode=smoothing_mode,
+          smoothing_cutoff_frequency=smoothing_cutoff_frequency)
+    else:  # (streamed from disk, learning_chunk_size demos at a time)
+      [critical_states_learn, W, mean_A_learn, mean_tau, Ft, Fp, G, cX, cV, PSI
+      ] = cart_dmp.learnFromPathInChunks(
+          dmp_home_dir_path + sub_cart_coord_dmp_training_path,
+          task_servo_rate,
+          chunk_size=learning_chunk_size,
+          start_column_idx=1,
+          time_column_idx=0,
+          is_smoothing_training_traj_before_learning=is_smoothing_training_traj_before_learning,
+          percentage_padding=percentage_padding,
+          percentage_smoothing_points=percentage_smoothing_points,
+          smoothing_mode=smoothing_mode,
+          smoothing_cutoff_frequency=smoothing_cutoff_frequency)
+
+    if (params_binary_file_path is not None):
+      cart_dmp.saveParamsToBinaryFile(params_binary_file_path)
+      unroll_cart_dmp.loadParamsFromBinaryFile(params_binary_file_path)
+      [W, mean_A_learn] = unroll_cart_dmp.getParams()
+      mean_tau = unroll_cart_dmp.mean_tau
 
     ## Reproduce
-    ccdmp_unroll = cart_dmp.unroll(critical_states_learn, tau,
-                                   time_reproduce_max, dt)
+    ccdmp_unroll = unroll_cart_dmp.unroll(critical_states_learn, tau,
+                                          time_reproduce_max, dt)
     unroll_ctraj_time = ccdmp_unroll.time.T - dt
     unroll_ctraj_X = ccdmp_unroll.X.T
     unroll_ctraj = np.hstack([unroll_ctraj_time, unroll_ctraj_X])
@@ -94,19 +124,19 @@ def cart_coord_dmp_multi_traj_training_test(
     unroll_learned_params[model_size:model_size + 1, 0:3] = mean_A_learn.T
     unroll_learned_params[model_size, 3] = mean_tau
     unroll_learned_params[model_size + 1:model_size + 2,
-                          0:3] = cart_dmp.mean_start_global_position.T
+                          0:3] = unroll_cart_dmp.mean_start_global_position.T
     unroll_learned_params[model_size + 2:model_size + 3,
-                          0:3] = cart_dmp.mean_goal_global_position.T
+                          0:3] = unroll_cart_dmp.mean_goal_global_position.T
     unroll_learned_params[model_size + 3:model_size + 4,
-                          0:3] = cart_dmp.mean_start_local_position.T
+                          0:3] = unroll_cart_dmp.mean_start_local_position.T
     unroll_learned_params[model_size + 4:model_size + 5,
-                          0:3] = cart_dmp.mean_goal_local_position.T
+                          0:3] = unroll_cart_dmp.mean_goal_local_position.T
     unroll_learned_params[
         model_size + 5:model_size +
-        9, :] = cart_dmp.ctraj_hmg_transform_local_to_global_matrix
+        9, :] = unroll_cart_dmp.ctraj_hmg_transform_local_to_global_matrix
     unroll_learned_params[
         model_size + 9:model_size +
-        13, :] = cart_dmp.ctraj_hmg_transform_global_to_local_matrix
+        13, :] = unroll_cart_dmp.ctraj_hmg_transform_global_to_local_matrix
     unroll_log.append(copy.deepcopy(unroll_learned_params))
 
   unroll_ctraj_concatenated = np.vstack(unroll_ctraj_list)
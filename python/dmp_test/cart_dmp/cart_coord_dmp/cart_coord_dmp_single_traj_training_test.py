@@ -38,7 +38,8 @@ def cart_coord_dmp_single_traj_training_test(
     percentage_smoothing_points=None,
     smoothing_mode=None,
     smoothing_cutoff_frequency=None,
-    is_plotting=False):
+    is_plotting=False,
+    is_unrolling_vectorized=False):
   task_servo_rate = 420.0
   dt = 1.0 / task_servo_rate
   model_size = 50
@@ -82,30 +83,38 @@ def cart_coord_dmp_single_traj_training_test(
 
   steady_state_goal_position = np.array([[0.5, 1.0, 0.0]]).T
 
-  cart_dmp.startWithUnrollParams(dmp_unroll_init_parameters)
-
   unroll_ctraj = np.zeros(
       (int(np.round(time_reproduce_max * task_servo_rate) + 1), 4))
-  for i in range(int(np.round(time_reproduce_max * task_servo_rate) + 1)):
-    time = 1.0 * (i * dt)
-
-    [
-        current_state, transform_sys_forcing_term,
-        transform_sys_coupling_term_acc, transform_sys_coupling_term_vel,
-        func_approx_basis_function_vector
-    ] = cart_dmp.getNextState(dt, True)
-
-    # testing goal change:
-    epsilon = sys.float_info.epsilon
-    if (np.abs(time - time_goal_change) < (5 * epsilon)):
-      steady_state_goal_position = np.array([[0.5, 0.5, 0.0]]).T
-      cart_dmp.setNewSteadyStateGoalPosition(steady_state_goal_position)
-
-    current_position = current_state.getX()
-    unroll_ctraj[i, 0] = time
-    unroll_ctraj[i, 1] = current_position[0, 0]
-    unroll_ctraj[i, 2] = current_position[1, 0]
-    unroll_ctraj[i, 3] = current_position[2, 0]
+  if (is_unrolling_vectorized):
+    # the goal change (if any) must NOT happen in the middle of the unroll:
+    assert (time_goal_change >= time_reproduce_max)
+    ccdmp_unroll = cart_dmp.unroll(
+        critical_states_learn, tau, time_reproduce_max, dt, is_vectorized=True)
+    unroll_ctraj[:, 0] = dt * np.arange(unroll_ctraj.shape[0])
+    unroll_ctraj[:, 1:4] = ccdmp_unroll.X.T
+  else:
+    cart_dmp.startWithUnrollParams(dmp_unroll_init_parameters)
+
+    for i in range(int(np.round(time_reproduce_max * task_servo_rate) + 1)):
+      time = 1.0 * (i * dt)
+
+      [
+          current_state, transform_sys_forcing_term,
+          transform_sys_coupling_term_acc, transform_sys_coupling_term_vel,
+          func_approx_basis_function_vector
+      ] = cart_dmp.getNextState(dt, True)
+
+      # testing goal change:
+      epsilon = sys.float_info.epsilon
+      if (np.abs(time - time_goal_change) < (5 * epsilon)):
+        steady_state_goal_position = np.array([[0.5, 0.5, 0.0]]).T
+        cart_dmp.setNewSteadyStateGoalPosition(steady_state_goal_position)
+
+      current_position = current_state.getX()
+      unroll_ctraj[i, 0] = time
+      unroll_ctraj[i, 1] = current_position[0, 0]
+      unroll_ctraj[i, 2] = current_position[1, 0]
+      unroll_ctraj[i, 3] = current_position[2, 0]
 
   if (os.path.isdir(unroll_ctraj_save_dir_path)):
     np.savetxt(unroll_ctraj_save_dir_path + '/' + unroll_ctraj_save_filename,
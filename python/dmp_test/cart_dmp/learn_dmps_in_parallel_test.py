@@ -0,0 +1,105 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 09:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../dmp_param/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../dmp_base/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../dmp_discrete/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../cart_dmp/cart_coord_dmp"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../cart_dmp/quat_dmp"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../utilities/"))
+from TauSystem import *
+from CanonicalSystemDiscrete import *
+from CartesianCoordDMP import *
+from QuaternionDMP import *
+from learnDMPsInParallel import *
+from utilities import *
+
+
+def flattenDMPParams(list_dmp_params):
+  # all numeric parameters of all jobs, in a fixed (sorted key) order,
+  # as rows of [job index, parameter value]:
+  return np.vstack([
+      np.hstack([
+          j * np.ones((np.size(dmp_params[key]), 1)),
+          np.asarray(dmp_params[key], dtype=float).reshape(-1, 1)
+      ])
+      for j, dmp_params in enumerate(list_dmp_params)
+      for key in sorted(dmp_params.keys())
+  ])
+
+
+def learn_dmps_in_parallel_test(dmp_home_dir_path="../../../",
+                                num_processes=2,
+                                learned_params_save_dir_path="",
+                                serial_learned_params_save_filename="",
+                                parallel_learned_params_save_filename=""):
+  """Learns two CartesianCoordDMPs (one of them with the training
+
+     trajectories smoothened) and a QuaternionDMP via learnDMPsInParallel(),
+     once serially (num_processes=1) and once on a pool of num_processes
+     worker processes, and returns both sets of learned parameters
+     (flattened, see flattenDMPParams()), which must be equal.
+  """
+  task_servo_rate = 300.0
+  dt = 1.0 / task_servo_rate
+  model_size = 25
+
+  cart_dmp = CartesianCoordDMP(
+      model_size, CanonicalSystemDiscrete(TauSystem(dt, MIN_TAU), 2),
+      GSUTANTO_LOCAL_COORD_FRAME)
+  quat_dmp = QuaternionDMP(model_size,
+                           CanonicalSystemDiscrete(TauSystem(dt, MIN_TAU), 2))
+  list_dmps = [cart_dmp, cart_dmp, quat_dmp]
+  list_set_traj_input = [
+      cart_dmp.extractSetTrajectories(
+          dmp_home_dir_path +
+          "/data/cart_dmp/cart_coord_dmp/multi_traj_training/dataset" +
+          str(k) + "/",
+          start_column_idx=1,
+          time_column_idx=0) for k in [1, 2]
+  ] + [
+      quat_dmp.extractSetTrajectories(
+          dmp_home_dir_path + "/data/cart_dmp/quat_dmp/multi_traj_training/",
+          start_column_idx=10,
+          time_column_idx=0)
+  ]
+  list_learning_kwargs = [{}, {
+      "is_smoothing_training_traj_before_learning": True,
+      "percentage_padding": 1.5,
+      "percentage_smoothing_points": 3.0,
+      "smoothing_mode": 3,
+      "smoothing_cutoff_frequency": 1.5
+  }, {}]
+
+  list_learned_params = [None] * 2
+  for [i, n_processes] in enumerate([1, num_processes]):
+    [_, list_dmp_params] = learnDMPsInParallel(
+        list_dmps,
+        list_set_traj_input,
+        task_servo_rate,
+        list_learning_kwargs,
+        num_processes=n_processes)
+    list_learned_params[i] = flattenDMPParams(list_dmp_params)
+
+  if (os.path.isdir(learned_params_save_dir_path)):
+    np.savetxt(
+        learned_params_save_dir_path + "/" +
+        serial_learned_params_save_filename, list_learned_params[0])
+    np.savetxt(
+        learned_params_save_dir_path + "/" +
+        parallel_learned_params_save_filename, list_learned_params[1])
+
+  return list_learned_params[0], list_learned_params[1]
+
+
+if __name__ == "__main__":
+  learn_dmps_in_parallel_test()
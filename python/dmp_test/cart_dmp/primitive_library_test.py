@@ -0,0 +1,144 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 00:30:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import time
+import shutil
+import tempfile
+import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../cart_dmp/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../utilities/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__),
+                 "../../dmp_coupling/learn_tactile_feedback/"
+                 "reinforcement_learning/"))
+from PrimitiveLibrary import *
+from utilities import *
+import rl_tactile_fb_utils as rl_util
+
+# (tasks of the data directory with both position and orientation
+#  primitives, i.e. which rl_tactile_fb_utils can load)
+RL_TACTILE_FB_TASKS = [
+    "learn_tactile_feedback/scraping", "learn_tactile_feedback/scraping_w_tool",
+    "learn_tactile_feedback/scraping_wo_tool"
+]
+
+
+def setLoadedParamsToDMP(dmp, dmp_type, params):
+  # (loadPrimsParamsAsDictFromDirPath() returns 1-D arrays, but
+  #  setParamsFromDict() expects the shapes of getParamsAsDict())
+  dmp_params = dict(params)
+  dmp_params["A_learn"] = dmp_params["A_learn"].reshape(3, 1)
+  if (dmp_type == "CartCoord"):
+    dmp_params["mean_start_position"] = dmp_params[
+        "mean_start_position"].reshape(3, 1)
+    dmp_params["mean_goal_position"] = dmp_params["mean_goal_position"].reshape(
+        3, 1)
+  dmp.setParamsFromDict(dmp_params)
+  return dmp
+
+
+def primitive_library_test(dmp_home_dir_path="../../../",
+                           max_num_cached_dmps=4):
+  """Indexes the learned primitives under the data directory (copied into
+
+     a temporary directory, where one task's prims params directory also gets
+     an up-to-date binary file, and another one a stale binary file), warms up
+     a PrimitiveLibrary (i.e. loads all primitives' params), removes
+     the copied data directory, and then switches among all primitives
+     (via getDMP()), which must NOT need the disk anymore, and unrolls each,
+     which must be equal to the unroll of the params loaded via
+     loadPrimsParamsAsDictFromDirPath() (see rl_tactile_fb_utils).
+     Returns the cold (first access) and warm (LRU-cached DMP) switching time
+     per primitive.
+  """
+  dt = 1.0 / 300.0
+  library_dir_path = tempfile.mkdtemp()
+  shutil.rmtree(library_dir_path)
+  shutil.copytree(
+      dmp_home_dir_path + "/data/dmp_coupling/", library_dir_path, symlinks=True)
+  try:
+    reference_prims_params = {}
+    for task in RL_TACTILE_FB_TASKS:
+      prims_params_dirpath = os.path.join(library_dir_path, task,
+                                          PRIMS_PARAMS_DIR_NAME)
+      N_primitives = len(
+          os.listdir(os.path.join(prims_params_dirpath, "position")))
+      reference_prims_params[task] = rl_util.loadPrimsParamsAsDictFromDirPath(
+          prims_params_dirpath, N_primitives, is_loading_binary_if_exist=False)
+      if (task == RL_TACTILE_FB_TASKS[1]):
+        rl_util.savePrimsParamsFromDictAtDirPath(
+            prims_params_dirpath,
+            reference_prims_params[task],
+            is_exporting_text=False)
+      elif (task == RL_TACTILE_FB_TASKS[2]):
+        # (a binary file holding wrong params, which is older than
+        #  the text files, i.e. must NOT be used)
+        stale_prims_params = copy.deepcopy(reference_prims_params[task])
+        stale_prims_params["CartCoord"][0]["mean_tau"] *= 2.0
+        rl_util.savePrimsParamsFromDictAtDirPath(
+            prims_params_dirpath, stale_prims_params, is_exporting_text=False)
+        binary_file_mtime = os.path.getmtime(
+            os.path.join(prims_params_dirpath,
+                         dmp_params_io.DMP_PARAMS_BINARY_FILE_NAME))
+        os.utime(
+            os.path.join(prims_params_dirpath, "position", "prim1", "tau"),
+            (binary_file_mtime + 1.0, binary_file_mtime + 1.0))
+
+    prim_library = PrimitiveLibrary(dt, max_num_cached_dmps, library_dir_path)
+    prim_keys = prim_library.findPrims()
+    for prim_key in prim_library.findPrims(task=RL_TACTILE_FB_TASKS[1]):
+      assert (prim_library.prims_params_sources[prim_key][0] == "binary")
+    for prim_key in prim_library.findPrims(task=RL_TACTILE_FB_TASKS[2]):
+      assert (prim_library.prims_params_sources[prim_key][0] == "text")
+    assert (len(prim_keys) == len(prim_library))
+    assert (len(prim_keys) > max_num_cached_dmps)
+    t0 = time.time()
+    for prim_key in prim_keys:
+      prim_library.getDMP(*prim_key)
+    cold_switching_time = (time.time() - t0) / len(prim_keys)
+  finally:
+    shutil.rmtree(library_dir_path)
+  assert (len(prim_library.cached_dmps) == max_num_cached_dmps)
+
+  for prim_key in prim_keys:
+    dmp = prim_library.getDMP(*prim_key)
+    assert (list(prim_library.cached_dmps.keys())[-1] == prim_key)
+    assert (len(prim_library.cached_dmps) <= max_num_cached_dmps)
+    critical_states = dmp.getDefaultUnrollCriticalStates()
+    dmp_unroll = dmp.unroll(critical_states, dmp.mean_tau, dmp.mean_tau, dt)
+    assert (np.all(np.isfinite(dmp_unroll.X)))
+    [task, prim_id, dmp_type, _] = prim_key
+    if (task in reference_prims_params):
+      reference_dmp = setLoadedParamsToDMP(
+          rl_util.ccdmp if (dmp_type == "CartCoord") else rl_util.qdmp,
+          dmp_type, reference_prims_params[task][dmp_type][prim_id - 1])
+      reference_dmp_unroll = reference_dmp.unroll(critical_states,
+                                                  reference_dmp.mean_tau,
+                                                  reference_dmp.mean_tau, dt)
+      assert (np.array_equal(dmp_unroll.X, reference_dmp_unroll.X))
+
+  # (switching among a working set of primitives which fits in the LRU cache)
+  min_warm_switching_time = np.inf
+  for _ in range(10):
+    for prim_key in prim_keys[-max_num_cached_dmps:]:
+      t0 = time.time()
+      dmp = prim_library.getDMP(*prim_key)
+      min_warm_switching_time = min(min_warm_switching_time, time.time() - t0)
+  assert (list(prim_library.cached_dmps.keys()) ==
+          prim_keys[-max_num_cached_dmps:])
+  print("PrimitiveLibrary switching time: cold = " +
+        str(cold_switching_time * 1.e3) + " ms, warm = " +
+        str(min_warm_switching_time * 1.e6) + " us")
+
+  return cold_switching_time, min_warm_switching_time
+
+
+if __name__ == "__main__":
+  primitive_library_test()
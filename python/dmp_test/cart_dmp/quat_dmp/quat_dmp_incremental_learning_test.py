@@ -0,0 +1,119 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 10:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../dmp_param/"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../dmp_base/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../../dmp_discrete/"))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "../../../cart_dmp/quat_dmp"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../../utilities/"))
+from TauSystem import *
+from QuaternionDMPUnrollInitParams import *
+from CanonicalSystemDiscrete import *
+from QuaternionDMP import *
+from utilities import *
+
+
+def getQuatDMPLearnedParamsMatrix(quat_dmp):
+  model_size = quat_dmp.model_size
+  [W, A_learn] = quat_dmp.getParams()
+  learned_params = np.zeros((model_size + 1 + 2, 4))
+  learned_params[0:model_size, 0:3] = W.T
+  learned_params[model_size:model_size + 1, 0:3] = A_learn.T
+  learned_params[model_size, 3] = quat_dmp.mean_tau
+  learned_params[model_size + 1:model_size + 2,
+                 0:4] = quat_dmp.mean_start_position.T
+  learned_params[model_size + 2:model_size + 3,
+                 0:4] = quat_dmp.mean_goal_position.T
+  return learned_params
+
+
+def quat_dmp_incremental_learning_test(dmp_home_dir_path="../../../../",
+                                       canonical_order=2,
+                                       unroll_qtraj_save_dir_path="",
+                                       batch_learning_save_filename="",
+                                       incremental_learning_save_filename=""):
+  """Learns a QuaternionDMP from the demos of the multi-trajectory
+
+     training dataset (a) in batch and (b) incrementally (via addDemo(), and
+     removeDemo() of the first or of the last demo, compared against
+     the batch learning on the remaining demos), and saves the learned
+     parameters and the unrolled trajectories of both, which are supposed to
+     be (numerically) equal.
+  """
+  task_servo_rate = 300.0
+  dt = 1.0 / task_servo_rate
+  model_size = 25
+  tau = 2.0
+
+  assert ((canonical_order >= 1) and (canonical_order <= 2))
+
+  list_quat_dmp = list()
+  for learning_mode in range(2):
+    tau_sys = TauSystem(dt, MIN_TAU)
+    canonical_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+    quat_dmp = QuaternionDMP(model_size, canonical_sys_discr)
+    quat_dmp.setFitNMSEPrinting(False)
+    list_quat_dmp.append(quat_dmp)
+  [batch_quat_dmp, incremental_quat_dmp] = list_quat_dmp
+
+  batch_learning_log = list()
+  incremental_learning_log = list()
+
+  set_qtraj_input = batch_quat_dmp.extractSetTrajectories(
+      dmp_home_dir_path + "/data/cart_dmp/quat_dmp/multi_traj_training/",
+      start_column_idx=10,
+      time_column_idx=0)
+
+  # (all demos, then all but the first demo, then all but the last demo)
+  N_demos = len(set_qtraj_input)
+  for [set_batch_qtraj_input,
+       removed_demo_idx] in [[set_qtraj_input, None],
+                             [set_qtraj_input[1:], 0],
+                             [set_qtraj_input[:-1], N_demos - 1]]:
+    [critical_states_learn, _, _, _, _, _, _, _, _,
+     _] = batch_quat_dmp.learnFromSetTrajectories(
+         copy.deepcopy(set_batch_qtraj_input), task_servo_rate)
+    batch_learning_log.append(getQuatDMPLearnedParamsMatrix(batch_quat_dmp))
+    qdmp_unroll = batch_quat_dmp.unroll(critical_states_learn, tau, tau, dt)
+    batch_learning_log.append(
+        np.hstack([qdmp_unroll.time.T - dt, qdmp_unroll.X[:3, :].T]))
+
+    incremental_quat_dmp.learning_sys_discrete.resetIncrementalLearning()
+    list_demo_ids = [
+        incremental_quat_dmp.addDemo(
+            copy.deepcopy(qtraj_input), task_servo_rate)
+        for qtraj_input in set_qtraj_input
+    ]
+    if (removed_demo_idx is not None):
+      incremental_quat_dmp.removeDemo(list_demo_ids[removed_demo_idx])
+    incremental_learning_log.append(
+        getQuatDMPLearnedParamsMatrix(incremental_quat_dmp))
+    qdmp_unroll = incremental_quat_dmp.unroll(critical_states_learn, tau,
+                                              tau, dt)
+    incremental_learning_log.append(
+        np.hstack([qdmp_unroll.time.T - dt, qdmp_unroll.X[:3, :].T]))
+
+  if (os.path.isdir(unroll_qtraj_save_dir_path)):
+    np.savetxt(unroll_qtraj_save_dir_path + "/" + batch_learning_save_filename,
+               np.vstack(batch_learning_log))
+    np.savetxt(
+        unroll_qtraj_save_dir_path + "/" + incremental_learning_save_filename,
+        np.vstack(incremental_learning_log))
+
+  return np.vstack(batch_learning_log), np.vstack(incremental_learning_log)
+
+
+if __name__ == "__main__":
+  batch_learning_result, incremental_learning_result = quat_dmp_incremental_learning_test(
+  )
+  compareTwoMatrices(batch_learning_result, incremental_learning_result)
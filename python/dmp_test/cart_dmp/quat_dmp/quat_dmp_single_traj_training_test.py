@@ -38,7 +38,8 @@ def quat_dmp_single_traj_training_test(
     percentage_smoothing_points=None,
     smoothing_mode=None,
     smoothing_cutoff_frequency=None,
-    is_plotting=False):
+    is_plotting=False,
+    is_unrolling_batched=False):
   task_servo_rate = 300.0
   dt = 1.0 / task_servo_rate
   model_size = 50
@@ -80,8 +81,13 @@ def quat_dmp_single_traj_training_test(
   if (tau_reproduce <= 0.0):
     tau_reproduce = mean_tau
   tau = tau_reproduce
-  qdmp_unroll = quat_dmp.unroll(critical_states_learn, tau, time_reproduce_max,
-                                dt)
+  if (is_unrolling_batched):
+    qdmp_unroll = quat_dmp.convertBatchUnrollIntoDMPTrajectoryList(
+        quat_dmp.unrollBatch([critical_states_learn], [tau],
+                             time_reproduce_max, dt, [W], [mean_A_learn]))[0]
+  else:
+    qdmp_unroll = quat_dmp.unroll(critical_states_learn, tau,
+                                  time_reproduce_max, dt)
   unroll_qtraj_time = qdmp_unroll.time.T - dt
   unroll_qtraj_Q = qdmp_unroll.X.T
   unroll_qtraj = np.hstack([unroll_qtraj_time, unroll_qtraj_Q])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 14:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_param/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_base/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_discrete/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_1D/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from TauSystem import *
+from CanonicalSystemDiscrete import *
+from TransformSystemDiscrete import *
+from DMPDiscrete1D import *
+from utilities import *
+
+
+def dmp_1D_integrator_benchmark(dmp_home_dir_path='../../../',
+                                canonical_order=2,
+                                unroll_step_multipliers=[1, 5, 10]):
+  """Measures the accuracy and the computation time of DMPDiscrete1D unrolling
+
+     with each unroll integrator, at time steps of multiples of 1 ms.
+     The accuracy is measured against a (tight-tolerance) RK45_INTEGRATOR
+     unroll, sampled at 1 ms.
+  """
+  task_servo_rate = 1000.0
+  model_size = 25
+  dt = 1.0 / task_servo_rate
+
+  tau_sys = TauSystem(dt, MIN_TAU)
+  can_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+  dmp_discrete_1D = DMPDiscrete1D(model_size, can_sys_discr)
+
+  set_1Dtraj_input = dmp_discrete_1D.extractSetTrajectories(
+      dmp_home_dir_path + '/data/dmp_1D/sample_traj_1.txt')
+  [critical_states_learn, _, _, mean_tau, _, _, _, _, _,
+   _] = dmp_discrete_1D.learnFromSetTrajectories(set_1Dtraj_input,
+                                                 task_servo_rate)
+
+  dmp_discrete_1D.setUnrollIntegrator(RK45_INTEGRATOR)
+  reference_unroll = dmp_discrete_1D.unroll(critical_states_learn, mean_tau,
+                                            mean_tau, dt)
+
+  unroll_integrator_names = {
+      EULER_INTEGRATOR: 'EULER_INTEGRATOR',
+      ZOH_INTEGRATOR: 'ZOH_INTEGRATOR',
+      SEMI_IMPLICIT_EULER_INTEGRATOR: 'SEMI_IMPLICIT_EULER_INTEGRATOR',
+      RK4_INTEGRATOR: 'RK4_INTEGRATOR'
+  }
+  max_position_error = {}
+  for unroll_integrator in [
+      EULER_INTEGRATOR, ZOH_INTEGRATOR, SEMI_IMPLICIT_EULER_INTEGRATOR,
+      RK4_INTEGRATOR
+  ]:
+    dmp_discrete_1D.setUnrollIntegrator(unroll_integrator)
+    for unroll_step_multiplier in unroll_step_multipliers:
+      t0 = time.time()
+      unroll = dmp_discrete_1D.unroll(critical_states_learn, mean_tau,
+                                      mean_tau, dt * unroll_step_multiplier)
+      elapsed_time = time.time() - t0
+      # (the i-th unrolled state is at time (i+1) * dt * unroll_step_multiplier)
+      reference_indices = (np.arange(1, unroll.X.shape[1] + 1) *
+                           unroll_step_multiplier) - 1
+      is_in_reference = (reference_indices < reference_unroll.X.shape[1])
+      max_position_error[(unroll_integrator, unroll_step_multiplier)] = np.max(
+          np.abs(unroll.X[:, is_in_reference] -
+                 reference_unroll.X[:, reference_indices[is_in_reference]]))
+      print(unroll_integrator_names[unroll_integrator] + ' at dt=' +
+            str(unroll_step_multiplier) + ' ms: max position error = ' +
+            str(max_position_error[(unroll_integrator,
+                                    unroll_step_multiplier)]) + ', ' +
+            str(elapsed_time * 1.e3) + ' ms')
+  dmp_discrete_1D.setUnrollIntegrator(EULER_INTEGRATOR)
+
+  return max_position_error
+
+
+if __name__ == '__main__':
+  dmp_1D_integrator_benchmark()
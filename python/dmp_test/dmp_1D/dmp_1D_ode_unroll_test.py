@@ -0,0 +1,64 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 14:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_param/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_base/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_discrete/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_1D/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from TauSystem import *
+from DMPUnrollInitParams import *
+from CanonicalSystemDiscrete import *
+from TransformSystemDiscrete import *
+from DMPDiscrete1D import *
+from utilities import *
+
+
+def dmp_1D_ode_unroll_test(dmp_home_dir_path='../../../',
+                           canonical_order=2,
+                           unroll_integrator=RK4_INTEGRATOR,
+                           unroll_dt=0.005,
+                           unroll_traj_save_dir_path='',
+                           unroll_traj_save_filename=''):
+  """Learns DMPDiscrete1D (at 1000 Hz), then unrolls it with unroll_integrator
+
+     at a (coarser) time step unroll_dt.
+  """
+  task_servo_rate = 1000.0
+  model_size = 25
+  dt = 1.0 / task_servo_rate
+
+  tau_sys = TauSystem(dt, MIN_TAU)
+  can_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+  dmp_discrete_1D = DMPDiscrete1D(model_size, can_sys_discr)
+
+  set_1Dtraj_input = dmp_discrete_1D.extractSetTrajectories(
+      dmp_home_dir_path + '/data/dmp_1D/sample_traj_1.txt')
+  [critical_states_learn, _, _, mean_tau, _, _, _, _, _,
+   _] = dmp_discrete_1D.learnFromSetTrajectories(set_1Dtraj_input,
+                                                 task_servo_rate)
+
+  dmp_discrete_1D.setUnrollIntegrator(unroll_integrator)
+  dmptrajectory = dmp_discrete_1D.unroll(critical_states_learn, mean_tau,
+                                         mean_tau, unroll_dt)
+  unroll_traj = np.hstack([
+      dmptrajectory.time.T, dmptrajectory.X.T, dmptrajectory.Xd.T,
+      dmptrajectory.Xdd.T
+  ])
+
+  if (os.path.isdir(unroll_traj_save_dir_path)):
+    np.savetxt(unroll_traj_save_dir_path + '/' + unroll_traj_save_filename,
+               unroll_traj)
+
+  return unroll_traj
+
+
+if __name__ == '__main__':
+  dmp_1D_ode_unroll_test()
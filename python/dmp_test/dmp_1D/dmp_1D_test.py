@@ -36,7 +36,10 @@ def dmp_1D_test(dmp_home_dir_path='../../../',
                 percentage_smoothing_points=None,
                 smoothing_mode=None,
                 smoothing_cutoff_frequency=None,
-                is_plotting=False):
+                is_plotting=False,
+                validation_level=None,
+                basis_function_cutoff=None,
+                is_using_iter_unroll=False):
   task_servo_rate = 1000.0
   model_size = 25
   tau = MIN_TAU
@@ -53,6 +56,7 @@ def dmp_1D_test(dmp_home_dir_path='../../../',
   tau_sys = TauSystem(dt, MIN_TAU)
   can_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
   dmp_discrete_1D = DMPDiscrete1D(model_size, can_sys_discr)
+  dmp_discrete_1D.setBasisFunctionCutoff(basis_function_cutoff)
 
   set_1Dtraj_input = dmp_discrete_1D.extractSetTrajectories(
       dmp_home_dir_path + '/data/dmp_1D/sample_traj_1.txt')
@@ -76,18 +80,26 @@ def dmp_1D_test(dmp_home_dir_path='../../../',
     tau_reproduce = mean_tau
   tau = tau_reproduce
   dmp_unroll_init_parameters = DMPUnrollInitParams(critical_states_learn, tau)
-  dmp_discrete_1D.startWithUnrollParams(dmp_unroll_init_parameters)
+  dmp_discrete_1D.setValidationLevel(validation_level)
 
   unroll_traj_length = int(np.round(time_reproduce_max * task_servo_rate) + 1)
   unroll_traj = np.zeros((unroll_traj_length, 4))
   time_idx_goal_change = int(np.round(time_goal_change * task_servo_rate) + 1)
+  if (is_using_iter_unroll):
+    dmpstate_iterator = dmp_discrete_1D.iterUnroll(
+        critical_states_learn, tau, time_reproduce_max, dt, ring_buffer_length=1)
+  else:
+    dmp_discrete_1D.startWithUnrollParams(dmp_unroll_init_parameters)
   #t0 = time.time()
   for i in range(unroll_traj_length):
     # testing goal change:
     if (i == time_idx_goal_change):
       dmp_discrete_1D.setNewSteadyStateGoalPosition(new_goal)
 
-    [dmpstate, _, _, _, _] = dmp_discrete_1D.getNextState(dt, True)
+    if (is_using_iter_unroll):
+      dmpstate = next(dmpstate_iterator)
+    else:
+      [dmpstate, _, _, _, _] = dmp_discrete_1D.getNextState(dt, True)
     unroll_traj[i, 0] = dmpstate.time[0, 0]
     unroll_traj[i, 1] = dmpstate.X[0, 0]
     unroll_traj[i, 2] = dmpstate.Xd[0, 0]
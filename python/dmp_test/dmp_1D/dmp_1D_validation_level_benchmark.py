@@ -0,0 +1,74 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sat Oct 17 10:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_param/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_base/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_discrete/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_1D/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from TauSystem import *
+from DMPUnrollInitParams import *
+from CanonicalSystemDiscrete import *
+from DMPDiscrete1D import *
+from utilities import *
+
+
+def dmp_1D_validation_level_benchmark(dmp_home_dir_path='../../../',
+                                      canonical_order=2,
+                                      num_trials=5):
+  """Measures the per-time-step computation time of DMPDiscrete1D unrolling
+
+     (via getNextState()) on each validation level.
+  """
+  task_servo_rate = 1000.0
+  model_size = 25
+  dt = 1.0 / task_servo_rate
+
+  tau_sys = TauSystem(dt, MIN_TAU)
+  can_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+  dmp_discrete_1D = DMPDiscrete1D(model_size, can_sys_discr)
+
+  set_1Dtraj_input = dmp_discrete_1D.extractSetTrajectories(
+      dmp_home_dir_path + '/data/dmp_1D/sample_traj_1.txt')
+  [critical_states_learn, _, _, mean_tau, _, _, _, _, _,
+   _] = dmp_discrete_1D.learnFromSetTrajectories(set_1Dtraj_input,
+                                                 task_servo_rate)
+  dmp_unroll_init_parameters = DMPUnrollInitParams(critical_states_learn,
+                                                   mean_tau)
+  unroll_traj_length = int(np.round(mean_tau * task_servo_rate) + 1)
+
+  validation_level_names = {
+      VALIDATION_FULL: 'VALIDATION_FULL',
+      VALIDATION_ON_START_ONLY: 'VALIDATION_ON_START_ONLY',
+      VALIDATION_OFF: 'VALIDATION_OFF'
+  }
+  per_step_time = {}
+  for validation_level in [
+      VALIDATION_FULL, VALIDATION_ON_START_ONLY, VALIDATION_OFF
+  ]:
+    dmp_discrete_1D.setValidationLevel(validation_level)
+    min_elapsed_time = np.inf
+    for _ in range(num_trials):
+      dmp_discrete_1D.startWithUnrollParams(dmp_unroll_init_parameters)
+      t0 = time.time()
+      for i in range(unroll_traj_length):
+        dmp_discrete_1D.getNextState(dt, True)
+      min_elapsed_time = min(min_elapsed_time, time.time() - t0)
+    per_step_time[validation_level] = min_elapsed_time / unroll_traj_length
+    print(validation_level_names[validation_level] + ': ' +
+          str(per_step_time[validation_level] * 1.e6) + ' us/step')
+  dmp_discrete_1D.setValidationLevel(None)
+
+  return per_step_time
+
+
+if __name__ == '__main__':
+  dmp_1D_validation_level_benchmark()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 10:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_param/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_base/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_discrete/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_1D/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from TauSystem import *
+from DMPUnrollInitParams import *
+from CanonicalSystemDiscrete import *
+from TransformSystemDiscrete import *
+from DMPDiscrete1D import *
+from utilities import *
+
+
+def dmp_1D_zoh_unroll_test(dmp_home_dir_path='../../../',
+                           canonical_order=2,
+                           unroll_traj_save_dir_path='',
+                           unroll_traj_save_filename='',
+                           random_access_save_filename='',
+                           time_index_stride=50):
+  """Unrolls DMPDiscrete1D with the exact (ZOH) integrator,
+
+     and evaluates the same states via random access (getNextStateAtTimeIndex()),
+     every time_index_stride time steps.
+  """
+  task_servo_rate = 1000.0
+  model_size = 25
+  dt = 1.0 / task_servo_rate
+
+  tau_sys = TauSystem(dt, MIN_TAU)
+  can_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+  dmp_discrete_1D = DMPDiscrete1D(model_size, can_sys_discr)
+  dmp_discrete_1D.setUnrollIntegrator(ZOH_INTEGRATOR)
+
+  set_1Dtraj_input = dmp_discrete_1D.extractSetTrajectories(
+      dmp_home_dir_path + '/data/dmp_1D/sample_traj_1.txt')
+  [critical_states_learn, _, _, mean_tau, _, _, _, _, _,
+   _] = dmp_discrete_1D.learnFromSetTrajectories(set_1Dtraj_input,
+                                                 task_servo_rate)
+  dmp_unroll_init_parameters = DMPUnrollInitParams(critical_states_learn,
+                                                   mean_tau)
+  unroll_traj_length = int(np.round(mean_tau * task_servo_rate) + 1)
+  time_indices = np.arange(1, unroll_traj_length + 1, time_index_stride)
+
+  dmp_discrete_1D.startWithUnrollParams(dmp_unroll_init_parameters)
+  [dmptrajectory, _, _] = dmp_discrete_1D.getNextStateTraj(
+      dt, unroll_traj_length)
+  unroll_traj = np.hstack([
+      dmptrajectory.time.T, dmptrajectory.X.T, dmptrajectory.Xd.T,
+      dmptrajectory.Xdd.T
+  ])[time_indices - 1, :]
+
+  dmp_discrete_1D.startWithUnrollParams(dmp_unroll_init_parameters)
+  random_access_traj = np.zeros((len(time_indices), 4))
+  for i in range(len(time_indices)):
+    dmpstate = dmp_discrete_1D.getNextStateAtTimeIndex(dt, time_indices[i])
+    random_access_traj[i, 0] = dmpstate.time[0, 0]
+    random_access_traj[i, 1] = dmpstate.X[0, 0]
+    random_access_traj[i, 2] = dmpstate.Xd[0, 0]
+    random_access_traj[i, 3] = dmpstate.Xdd[0, 0]
+
+  if (os.path.isdir(unroll_traj_save_dir_path)):
+    np.savetxt(unroll_traj_save_dir_path + '/' + unroll_traj_save_filename,
+               unroll_traj)
+    np.savetxt(unroll_traj_save_dir_path + '/' + random_access_save_filename,
+               random_access_traj)
+
+  return unroll_traj, random_access_traj
+
+
+def dmp_1D_zoh_vs_euler_unroll_test(dmp_home_dir_path='../../../',
+                                    canonical_order=2,
+                                    unroll_traj_save_dir_path='',
+                                    zoh_unroll_save_filename='',
+                                    euler_unroll_save_filename='',
+                                    task_servo_rate=100000.0,
+                                    time_index_stride=1000):
+  """Unrolls DMPDiscrete1D (learned at 1000 Hz) with the exact (ZOH) and
+
+     the Euler integrators at a small dt (= 1/task_servo_rate), where both
+     converge to the continuous-time solution (with O(dt) errors),
+     and samples both unrolls every time_index_stride time steps.
+  """
+  learning_task_servo_rate = 1000.0
+  model_size = 25
+  dt = 1.0 / task_servo_rate
+
+  unroll_trajs = [None] * 2
+  for [i, unroll_integrator] in enumerate([ZOH_INTEGRATOR, EULER_INTEGRATOR]):
+    tau_sys = TauSystem(dt, MIN_TAU)
+    can_sys_discr = CanonicalSystemDiscrete(tau_sys, canonical_order)
+    dmp_discrete_1D = DMPDiscrete1D(model_size, can_sys_discr)
+    dmp_discrete_1D.setUnrollIntegrator(unroll_integrator)
+
+    set_1Dtraj_input = dmp_discrete_1D.extractSetTrajectories(
+        dmp_home_dir_path + '/data/dmp_1D/sample_traj_1.txt')
+    [critical_states_learn, _, _, mean_tau, _, _, _, _, _,
+     _] = dmp_discrete_1D.learnFromSetTrajectories(set_1Dtraj_input,
+                                                   learning_task_servo_rate)
+    dmp_unroll_init_parameters = DMPUnrollInitParams(critical_states_learn,
+                                                     mean_tau)
+    unroll_traj_length = int(np.round(mean_tau * task_servo_rate) + 1)
+
+    dmp_discrete_1D.startWithUnrollParams(dmp_unroll_init_parameters)
+    [dmptrajectory, _, _] = dmp_discrete_1D.getNextStateTraj(
+        dt, unroll_traj_length)
+    unroll_trajs[i] = np.hstack(
+        [dmptrajectory.time.T, dmptrajectory.X.T,
+         dmptrajectory.Xd.T])[::time_index_stride, :]
+
+  if (os.path.isdir(unroll_traj_save_dir_path)):
+    np.savetxt(unroll_traj_save_dir_path + '/' + zoh_unroll_save_filename,
+               unroll_trajs[0])
+    np.savetxt(unroll_traj_save_dir_path + '/' + euler_unroll_save_filename,
+               unroll_trajs[1])
+
+  return unroll_trajs[0], unroll_trajs[1]
+
+
+if __name__ == '__main__':
+  dmp_1D_zoh_unroll_test()
@@ -48,6 +48,7 @@ def ct_loa_so_sb_multi_demo_vicon_PMNN_unrolling_test(dmp_home_dir_path="../../.
     pmnn_model_parent_dir_path = loa_data_dir_path + "static_obs/neural_nets/pmnn/cpp_models/"
     pmnn_model_path = loa_data_dir_path + "static_obs/neural_nets/pmnn/cpp_models/prim1/"
     data_global_coord_filepath = dmp_home_dir_path + "python/dmp_coupling/learn_obs_avoid/learn_obs_avoid_pmnn_vicon_data/data_multi_demo_vicon_static_global_coord.pkl"
+    data_global_coord_store_dir_path = dmp_home_dir_path + "python/dmp_coupling/learn_obs_avoid/learn_obs_avoid_pmnn_vicon_data/data_multi_demo_vicon_static_global_coord_store/"
     pmnn_name = 'my_PMNN_obs_avoid_fb'
     ctraj_local_coordinate_frame_selection = GSUTANTO_LOCAL_COORD_FRAME
     is_using_scaling = [False] * PMNN_output_size # NOT using scaling on CartCoordDMP for now...
@@ -86,7 +87,9 @@ def ct_loa_so_sb_multi_demo_vicon_PMNN_unrolling_test(dmp_home_dir_path="../../.
                               file_name_ctraj_hmg_transform_global_to_local_matrix="T_global_to_local_H")
     ccdmp_baseline_params = cart_coord_dmp.getParamsAsDict()
     
-    if (os.path.isfile(data_global_coord_filepath)):
+    if (os.path.isdir(data_global_coord_store_dir_path)):
+        data_global_coord = loadDemoDatasetLOAViconStore(data_global_coord_store_dir_path)
+    elif (os.path.isfile(data_global_coord_filepath)):
         data_global_coord = loadObj(data_global_coord_filepath)
     else:
         data_global_coord = prepareDemoDatasetLOAVicon(task_servo_rate, dmp_home_dir_path)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 11:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import copy
+import shutil
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../dmp_state/'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from DMPTrajectory import *
+from QuaternionDMPTrajectory import *
+from DemoDatasetStore import *
+from utility_states_trajectories import smoothStartEndNDTrajectoryBasedOnPosition
+
+
+def generateRandomDMPTrajectory(traj_length, dmp_num_dimensions, rng, dt):
+  return DMPTrajectory(
+      rng.randn(dmp_num_dimensions, traj_length),
+      rng.randn(dmp_num_dimensions, traj_length),
+      rng.randn(dmp_num_dimensions, traj_length),
+      dt * np.arange(traj_length).reshape(1, traj_length))
+
+
+def generateRandomQuaternionDMPTrajectory(traj_length, rng, dt):
+  Q = rng.randn(4, traj_length)
+  return QuaternionDMPTrajectory(
+      Q / np.linalg.norm(Q, axis=0), rng.randn(4, traj_length),
+      rng.randn(4, traj_length), rng.randn(3, traj_length),
+      rng.randn(3, traj_length),
+      dt * np.arange(traj_length).reshape(1, traj_length))
+
+
+def assertDemoDatasetStoreEquals(store, list_set_traj, setting_arrays, metadata):
+  assert (store.getNumSettings() == len(list_set_traj))
+  assert (len(store) == len(list_set_traj))
+  assert (store.getNumDemos() == sum(
+      [len(set_traj) for set_traj in list_set_traj]))
+  assert (store.metadata == metadata)
+  assert (len(list(store)) == len(list_set_traj))
+  for [i, set_traj] in enumerate(list_set_traj):
+    assert (store.getNumDemos(i) == len(set_traj))
+    assert (len(store[i]) == len(set_traj))
+    for [j, traj] in enumerate(set_traj):
+      for demo in [
+          store.getDemo(i, j), store[i][j], store[i - len(list_set_traj)][j],
+          store[i][j - len(set_traj)], store[i][j:j + 1][0],
+          list(store[i])[j],
+          list(store)[i][j]
+      ]:
+        assert (demo.__class__ == traj.__class__)
+        assert (demo.dmp_num_dimensions == traj.dmp_num_dimensions)
+        assert (demo.isValid())
+        for field_name in traj.field_names:
+          assert (np.array_equal(
+              getattr(demo, field_name), getattr(traj, field_name)))
+    for demo_idx in [len(set_traj), -len(set_traj) - 1]:
+      try:
+        store[i][demo_idx]
+        assert (False), "Out-of-range demo_idx does NOT raise IndexError!"
+      except IndexError:
+        pass
+    for [setting_array_name, list_setting_array] in setting_arrays.items():
+      assert (np.array_equal(
+          store.getSettingArray(setting_array_name, i),
+          np.atleast_1d(list_setting_array[i])))
+  for setting_idx in [len(list_set_traj), -len(list_set_traj) - 1]:
+    try:
+      store[setting_idx]
+      assert (False), "Out-of-range setting_idx does NOT raise IndexError!"
+    except IndexError:
+      pass
+  return None
+
+
+def demo_dataset_store_test(random_seed=38):
+  """Saves synthetic (random) DMPTrajectory and QuaternionDMPTrajectory demos
+
+     (of different lengths, over several settings, with per-setting arrays
+     and user metadata) into demo dataset stores, opens them, and checks
+     that every demo (accessed via getDemo(), indexing, slicing and
+     iteration), every per-setting array and the metadata are equal to
+     the saved ones, and that out-of-range indexing raises IndexError (so
+     that iterating over a store terminates). Also checks that the demos are read-only with
+     mmap_mode='r', and that in-place modifications (smoothing) with
+     mmap_mode='c' are NOT written back to the store.
+  """
+  rng = np.random.RandomState(random_seed)
+  dt = 0.01
+  store_root_dir_path = tempfile.mkdtemp()
+  try:
+    list_set_ctraj = [[
+        generateRandomDMPTrajectory(rng.randint(20, 60), 3, rng, dt)
+        for _ in range(N_demos)
+    ]
+                      for N_demos in [3, 1, 4]]
+    setting_arrays = {
+        "obs_markers": [rng.randn(rng.randint(1, 5), 3) for _ in range(3)],
+        "dominant_axis": [rng.randint(0, 3) for _ in range(3)],
+        "is_consistent": [True, False, True]
+    }
+    metadata = {"dt": dt, "description": "synthetic"}
+    ctraj_store_dir_path = os.path.join(store_root_dir_path, "ctraj")
+    saveDemoDatasetStore(ctraj_store_dir_path, list_set_ctraj, setting_arrays,
+                         metadata)
+    for mmap_mode in ['r', 'c']:
+      assertDemoDatasetStoreEquals(
+          DemoDatasetStore(ctraj_store_dir_path, mmap_mode), list_set_ctraj,
+          setting_arrays, metadata)
+
+    list_set_qtraj = [[
+        generateRandomQuaternionDMPTrajectory(rng.randint(20, 60), rng, dt)
+        for _ in range(N_demos)
+    ]
+                      for N_demos in [2, 3]]
+    qtraj_store_dir_path = os.path.join(store_root_dir_path, "qtraj")
+    saveDemoDatasetStore(qtraj_store_dir_path, list_set_qtraj)
+    assertDemoDatasetStoreEquals(
+        DemoDatasetStore(qtraj_store_dir_path), list_set_qtraj, {}, {})
+
+    # in-place consumers fail on the (default) read-only demos ...
+    try:
+      smoothStartEndNDTrajectoryBasedOnPosition(
+          DemoDatasetStore(ctraj_store_dir_path)[0][0], 1.5, 3.0, 3, dt)
+      assert (False), "Read-only demo is modified in-place!"
+    except ValueError:
+      pass
+    # ... but work on the copy-on-write ones (and on copies), as on
+    # the original demos, without modifying the store:
+    smoothed_ctraj = smoothStartEndNDTrajectoryBasedOnPosition(
+        copy.copy(list_set_ctraj[0][0]), 1.5, 3.0, 3, dt)
+    for demo in [
+        DemoDatasetStore(ctraj_store_dir_path, 'c')[0][0],
+        copy.copy(DemoDatasetStore(ctraj_store_dir_path)[0][0])
+    ]:
+      smoothed_demo = smoothStartEndNDTrajectoryBasedOnPosition(
+          demo, 1.5, 3.0, 3, dt)
+      for field_name in smoothed_ctraj.field_names:
+        assert (np.array_equal(
+            getattr(smoothed_demo, field_name),
+            getattr(smoothed_ctraj, field_name)))
+    assertDemoDatasetStoreEquals(
+        DemoDatasetStore(ctraj_store_dir_path), list_set_ctraj, setting_arrays,
+        metadata)
+  finally:
+    shutil.rmtree(store_root_dir_path)
+  return None
+
+
+if __name__ == '__main__':
+  demo_dataset_store_test()
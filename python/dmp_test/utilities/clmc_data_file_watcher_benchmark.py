@@ -0,0 +1,112 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 22:30:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import time
+import shutil
+import tempfile
+import multiprocessing
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from utilities import *
+from CLMCDataFileWatcher import *
+
+
+def writeFakeCLMCDataFiles(directory_path, num_files, inter_file_period,
+                           num_rows, num_chunks, completion_time_queue):
+  # (imitating SL: each data file is written in num_chunks chunks,
+  #  i.e. it is incomplete in-between; the (wall-clock) time when each data
+  #  file is fully written is put into completion_time_queue)
+  cols = 4
+  header = (('%d %d %d %f\n' % (cols * num_rows, cols, num_rows, 1000.0)) +
+            ' '.join(['var%d m' % c for c in range(cols)]) + '\n').encode()
+  payload = np.arange(num_rows * cols, dtype='>f4').tobytes()
+  chunk_size = int(np.ceil(len(payload) / float(num_chunks)))
+  for i in range(num_files):
+    time.sleep(inter_file_period)
+    with open(directory_path + '/d%05d' % i, 'wb') as dfile:
+      dfile.write(header)
+      for j in range(num_chunks):
+        if (j > 0):
+          time.sleep(0.001)
+        dfile.write(payload[j * chunk_size:(j + 1) * chunk_size])
+        dfile.flush()
+      completion_time_queue.put(('d%05d' % i, time.time()))
+  return None
+
+
+def waitBusy(directory_path, num_files):
+  # (the original approach: busy-waiting on the number of files,
+  #  plus waiting until the last file is complete)
+  dfilepaths = getAllCLMCDataFilePathsInDirectory(directory_path)
+  while ((len(dfilepaths) < num_files) or
+         (not all([isCLMCDataFileComplete(f) for f in dfilepaths]))):
+    dfilepaths = getAllCLMCDataFilePathsInDirectory(directory_path)
+  return dfilepaths
+
+
+def clmc_data_file_watcher_benchmark(num_files=10,
+                                     inter_file_period=0.1,
+                                     num_rows=2000,
+                                     num_chunks=4):
+  """Measures the CPU time consumed while waiting for num_files SL data files
+
+     (written by another process, each after inter_file_period seconds),
+     and the detection latency of each data file (i.e. from when the writer
+     has fully written it until it is returned), via busy-waiting, polling
+     with exponential back-off, and inotify (if available).
+  """
+  waiter_names = ['busy-waiting', 'back-off polling', 'inotify']
+  cpu_time = {}
+  mean_latency = {}
+  for waiter_name in waiter_names:
+    directory_path = tempfile.mkdtemp()
+    try:
+      watcher = None
+      if (waiter_name != 'busy-waiting'):
+        watcher = CLMCDataFileWatcher(
+            directory_path, is_using_inotify=(waiter_name == 'inotify'))
+        if ((waiter_name == 'inotify') and (not watcher.isEventDriven())):
+          print('inotify: NOT available')
+          watcher.close()
+          continue
+      completion_time_queue = multiprocessing.Queue()
+      writer = multiprocessing.Process(
+          target=writeFakeCLMCDataFiles,
+          args=(directory_path, num_files, inter_file_period, num_rows,
+                num_chunks, completion_time_queue))
+      cpu_t0 = sum(os.times()[0:2])
+      writer.start()
+      detection_time = {}
+      for i in range(num_files):
+        if (watcher is None):
+          dfilepath = sorted(waitBusy(directory_path, i + 1))[-1]
+        else:
+          dfilepath = watcher.waitForNewFiles(1)[0]
+        detection_time[os.path.basename(dfilepath)] = time.time()
+      cpu_time[waiter_name] = sum(os.times()[0:2]) - cpu_t0
+      completion_time = dict(
+          [completion_time_queue.get() for i in range(num_files)])
+      mean_latency[waiter_name] = np.mean([
+          detection_time[dfilename] - completion_time[dfilename]
+          for dfilename in detection_time.keys()
+      ])
+      writer.join()
+      if (watcher is not None):
+        watcher.close()
+    finally:
+      shutil.rmtree(directory_path)
+    print(waiter_name + ': CPU time = ' + str(cpu_time[waiter_name]) +
+          ' s, mean detection latency = ' +
+          str(mean_latency[waiter_name] * 1.e3) + ' ms')
+
+  return cpu_time, mean_latency
+
+
+if __name__ == '__main__':
+  clmc_data_file_watcher_benchmark()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 15:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import struct
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), '../../utilities/clmcplot/'))
+from clmcplot_utils import ClmcFile
+
+
+def loadClmcFileReference(filename):
+  # (the original parsing of ClmcFile, i.e. via struct.unpack(), of ALL data)
+  with open(filename, 'rb') as my_file:
+    temp = my_file.readline().split()
+    cols = int(temp[1])
+    rows = int(temp[2])
+    freq = float(temp[3])
+    names = {}
+    units = []
+    temp = my_file.readline().split()
+    for i in range(0, cols):
+      names[(temp[2 * i]).decode()] = i
+      units.append(temp[2 * i + 1].decode())
+    data = np.array(
+        struct.unpack('>' + 'f' * cols * rows,
+                      my_file.read(4 * cols * rows))).reshape(rows,
+                                                              cols).transpose()
+  return cols, rows, freq, names, units, data
+
+
+def clmcplot_utils_test(
+    dmp_home_dir_path='../../../',
+    clmc_file_paths=(
+        '/data/cart_dmp/cart_dmp_wiggling/d02209',
+        '/data/cart_dmp/cart_dmp_wiggling/other_data_samples/d02208',
+        '/data/cart_dmp/cart_dmp_wiggling/other_data_samples/d02210')):
+  """Loads SL (clmc) data files via ClmcFile, both read into memory
+
+     and memory-mapped, and checks that the header (cols, rows, freq, names,
+     and units), the variables (get_variables(), of a single name and of
+     a list of names, in any order) and all the data are exactly equal
+     (including the dtype) to the ones parsed via struct.unpack().
+  """
+  for clmc_file_path in clmc_file_paths:
+    [cols, rows, freq, names, units,
+     data] = loadClmcFileReference(dmp_home_dir_path + clmc_file_path)
+    sorted_names = sorted(names.keys(), key=lambda name: names[name])
+    for is_memory_mapped in [False, True]:
+      # (variables first, i.e. before ALL columns are converted via data)
+      clmc_file = ClmcFile(dmp_home_dir_path + clmc_file_path,
+                           is_memory_mapped)
+      assert (clmc_file.cols == cols)
+      assert (clmc_file.rows == rows)
+      assert (clmc_file.freq == freq)
+      assert (clmc_file.names == names)
+      assert (clmc_file.units == units)
+      for name in [sorted_names[-1], sorted_names[0]]:
+        variable = clmc_file.get_variables(name)
+        assert (variable.dtype == data.dtype)
+        assert (np.array_equal(variable, data[names[name]]))
+      variables = clmc_file.get_variables(sorted_names[::-1])
+      assert (len(variables) == cols)
+      for [name, variable] in zip(sorted_names[::-1], variables):
+        assert (variable.dtype == data.dtype)
+        assert (np.array_equal(variable, data[names[name]]))
+      assert (clmc_file.data.dtype == data.dtype)
+      assert (clmc_file.data.shape == data.shape)
+      assert (np.array_equal(clmc_file.data, data))
+
+      # (ALL data first)
+      clmc_file = ClmcFile(dmp_home_dir_path + clmc_file_path,
+                           is_memory_mapped)
+      assert (np.array_equal(clmc_file.data, data))
+      assert (np.array_equal(
+          np.array(clmc_file.get_variables(sorted_names)), data))
+  return None
+
+
+if __name__ == '__main__':
+  clmcplot_utils_test()
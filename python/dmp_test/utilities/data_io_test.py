@@ -0,0 +1,161 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 13:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import shutil
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__),
+                 '../../dmp_coupling/learn_obs_avoid/vicon/'))
+from DataIO import *
+from vicon_obs_avoid_utils import prepareDemoDatasetLOAVicon
+
+
+def saveRandomTrajectoryFile(trajectory_file_path,
+                             N_columns,
+                             rng,
+                             dt,
+                             is_quaternion=False):
+  traj_length = rng.randint(20, 60)
+  trajectory_file_content = np.hstack([
+      dt * np.arange(traj_length).reshape(traj_length, 1),
+      rng.randn(traj_length, N_columns)
+  ])
+  if (is_quaternion):  # (unit Quaternions in the first 4 columns)
+    trajectory_file_content[:, 1:5] /= np.linalg.norm(
+        trajectory_file_content[:, 1:5], axis=1).reshape(traj_length, 1)
+  np.savetxt(trajectory_file_path, trajectory_file_content)
+  return None
+
+
+def assertExtractedEqual(extracted_A, extracted_B):
+  # (equal structure, classes and values)
+  if (isinstance(extracted_A, dict)):
+    assert (sorted(extracted_A.keys()) == sorted(extracted_B.keys()))
+    for key in extracted_A.keys():
+      assertExtractedEqual(extracted_A[key], extracted_B[key])
+  elif (isinstance(extracted_A, list)):
+    assert (len(extracted_A) == len(extracted_B))
+    for [item_A, item_B] in zip(extracted_A, extracted_B):
+      assertExtractedEqual(item_A, item_B)
+  elif (isinstance(extracted_A, DMPState)):
+    assert (extracted_A.__class__ == extracted_B.__class__)
+    for field_name in extracted_A.field_names:
+      assert (np.array_equal(
+          getattr(extracted_A, field_name), getattr(extracted_B, field_name)))
+  else:
+    assert (np.array_equal(extracted_A, extracted_B))
+  return None
+
+
+def data_io_test(random_seed=39, num_threads=4):
+  """Extracts the trajectories of a synthetic (random) data directory tree
+
+     (N-dimensional, with N=-1 as well, Cartesian coordinate and Quaternion
+     trajectories, and a small static obstacle avoidance Vicon dataset
+     for prepareDemoDatasetLOAVicon()), serially (num_threads=1) and
+     concurrently (by num_threads threads), and checks that both are
+     exactly equal (including the order of the trajectories and the grouping
+     of the files into settings), and equal to the text files' contents.
+  """
+  rng = np.random.RandomState(random_seed)
+  dt = 0.01
+  dmp_home_dir_path = tempfile.mkdtemp()
+  try:
+    # (more files than num_threads, and named such that the natural sort
+    #  order differs from the lexicographic one)
+    nd_dir_path = dmp_home_dir_path + '/nd_trajs/'
+    quat_dir_path = dmp_home_dir_path + '/quat_trajs/'
+    os.makedirs(nd_dir_path)
+    os.makedirs(quat_dir_path)
+    for i in range(11):
+      saveRandomTrajectoryFile(nd_dir_path + str(i + 1) + '.txt', 3 * 3, rng,
+                               dt)
+      saveRandomTrajectoryFile(quat_dir_path + str(i + 1) + '.txt', 4 + 3 + 3,
+                               rng, dt, True)
+
+    dir_path = (dmp_home_dir_path + '/data/dmp_coupling/learn_obs_avoid/'
+                'static_obs/data_multi_demo_vicon_static/')
+    os.makedirs(dir_path + '/baseline/endeff_trajs/')
+    for j in range(5):
+      saveRandomTrajectoryFile(
+          dir_path + '/baseline/endeff_trajs/' + str(j + 1) + '.txt', 3 * 3,
+          rng, dt)
+    N_settings = 4
+    N_demos_per_setting = [3, 1, 6, 2]
+    for i in range(N_settings):
+      setting_dir_path = dir_path + '/' + str(i + 1) + '/'
+      os.makedirs(setting_dir_path + '/endeff_trajs/')
+      np.savetxt(setting_dir_path + '/obs_markers_global_coord.txt',
+                 rng.randn(rng.randint(2, 5), 3))
+      for j in range(N_demos_per_setting[i]):
+        saveRandomTrajectoryFile(
+            setting_dir_path + '/endeff_trajs/' + str(j + 1) + '.txt', 3 * 3,
+            rng, dt)
+    np.savetxt(
+        dir_path + '/data_annotation_obs_avoid_dominant_axis.txt',
+        rng.randint(0, 3, N_settings),
+        fmt='%d')
+    np.savetxt(dir_path + '/data_annotation_obs_avoid_consistency.txt',
+               [1, 3])
+
+    list_extracted = [None] * 2
+    for [k, N_threads] in enumerate([1, num_threads]):
+      list_extracted[k] = {
+          "nd": extractSetNDTrajectories(
+              nd_dir_path, num_threads=N_threads),
+          "nd_2": extractSetNDTrajectories(
+              nd_dir_path, 2, num_threads=N_threads),
+          "cart_coord": extractSetCartCoordTrajectories(
+              nd_dir_path, num_threads=N_threads),
+          "quat": extractSetQuaternionTrajectories(
+              quat_dir_path, num_threads=N_threads),
+          "loa_vicon": prepareDemoDatasetLOAVicon(
+              dmp_home_dir_path=dmp_home_dir_path + '/',
+              num_threads=N_threads)
+      }
+    assertExtractedEqual(list_extracted[0], list_extracted[1])
+
+    # equal to the text files' contents, in the natural sort order:
+    for i in range(11):
+      trajectory_file_content = np.loadtxt(nd_dir_path + str(i + 1) + '.txt')
+      for [key, N] in [["nd", 3], ["nd_2", 2], ["cart_coord", 3]]:
+        trajectory = list_extracted[1][key][i]
+        assert (trajectory.dmp_num_dimensions == N)
+        assert (np.array_equal(trajectory.time,
+                               trajectory_file_content[:, [0]].T))
+        assert (np.array_equal(trajectory.X,
+                               trajectory_file_content[:, 1:1 + N].T))
+      # (Q is re-normalized on extraction, but omega is NOT)
+      assert (np.array_equal(
+          list_extracted[1]["quat"][i].omega,
+          np.loadtxt(quat_dir_path + str(i + 1) + '.txt')[:, 5:8].T))
+    data_global_coord = list_extracted[1]["loa_vicon"]
+    assert (len(data_global_coord["baseline"]) == 5)
+    for i in range(N_settings):
+      setting_dir_path = dir_path + '/' + str(i + 1) + '/'
+      assert (np.array_equal(
+          data_global_coord["obs_avoid"][0][i],
+          np.loadtxt(setting_dir_path + '/obs_markers_global_coord.txt')))
+      assert (len(data_global_coord["obs_avoid"][1][i]) ==
+              N_demos_per_setting[i])
+      for j in range(N_demos_per_setting[i]):
+        assert (np.array_equal(
+            data_global_coord["obs_avoid"][1][i][j].X,
+            np.loadtxt(setting_dir_path + '/endeff_trajs/' + str(j + 1) +
+                       '.txt')[:, 1:4].T))
+      assert (data_global_coord["obs_avoid"][3][i] == (i + 1 in [1, 3]))
+  finally:
+    shutil.rmtree(dmp_home_dir_path)
+  return None
+
+
+if __name__ == '__main__':
+  data_io_test()
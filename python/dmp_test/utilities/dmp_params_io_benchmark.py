@@ -0,0 +1,79 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 23:30:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import time
+import shutil
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__),
+                 '../../dmp_coupling/learn_tactile_feedback/'
+                 'reinforcement_learning/'))
+from utilities import *
+import DMPParamsIO as dmp_params_io
+import rl_tactile_fb_utils as rl_util
+
+
+def compareParams(params_A, params_B):
+  if (isinstance(params_A, dict)):
+    assert (sorted(params_A.keys()) == sorted(params_B.keys()))
+    for key in params_A.keys():
+      compareParams(params_A[key], params_B[key])
+  elif (isinstance(params_A, list)):
+    assert (len(params_A) == len(params_B))
+    for [item_A, item_B] in zip(params_A, params_B):
+      compareParams(item_A, item_B)
+  else:
+    assert (np.array_equal(params_A, params_B))
+  return None
+
+
+def dmp_params_io_benchmark(
+    dmp_home_dir_path='../../../',
+    prims_params_dirpath='/data/dmp_coupling/learn_tactile_feedback/'
+    'scraping_w_tool/learned_prims_params/',
+    N_primitives=3,
+    num_trials=20):
+  """Measures the loading time of the (3-primitive) params of a primitive library
+
+     from the text files and from the single binary file (see DMPParamsIO),
+     and checks that both are exactly equal.
+  """
+  text_prims_params_dirpath = dmp_home_dir_path + prims_params_dirpath
+  binary_prims_params_dirpath = tempfile.mkdtemp()
+  loading_time = {}
+  try:
+    text_cdmp_params = rl_util.loadPrimsParamsAsDictFromDirPath(
+        text_prims_params_dirpath, N_primitives,
+        is_loading_binary_if_exist=False)
+    rl_util.savePrimsParamsFromDictAtDirPath(
+        binary_prims_params_dirpath, text_cdmp_params, is_exporting_text=False)
+    for [format_name, prims_params_dirpath] in [[
+        'text', text_prims_params_dirpath
+    ], ['binary', binary_prims_params_dirpath]]:
+      min_elapsed_time = np.inf
+      for _ in range(num_trials):
+        t0 = time.time()
+        cdmp_params = rl_util.loadPrimsParamsAsDictFromDirPath(
+            prims_params_dirpath, N_primitives,
+            is_loading_binary_if_exist=(format_name == 'binary'))
+        min_elapsed_time = min(min_elapsed_time, time.time() - t0)
+      compareParams(text_cdmp_params, cdmp_params)
+      loading_time[format_name] = min_elapsed_time
+      print(format_name + ': ' + str(loading_time[format_name] * 1.e3) +
+            ' ms per ' + str(N_primitives) + '-primitive library')
+  finally:
+    shutil.rmtree(binary_prims_params_dirpath)
+
+  return loading_time
+
+
+if __name__ == '__main__':
+  dmp_params_io_benchmark()
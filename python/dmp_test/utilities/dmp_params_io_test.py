@@ -0,0 +1,115 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 12:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import time
+import shutil
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+sys.path.append(
+    os.path.join(os.path.dirname(__file__),
+                 '../../dmp_coupling/learn_tactile_feedback/'
+                 'reinforcement_learning/'))
+from utilities import *
+import DMPParamsIO as dmp_params_io
+import rl_tactile_fb_utils as rl_util
+
+
+def assertParamsStrictlyEqual(params_A, params_B):
+  # (equal structure, types, shapes and values)
+  if (isinstance(params_A, dict)):
+    assert (sorted(params_A.keys()) == sorted(params_B.keys()))
+    for key in params_A.keys():
+      assertParamsStrictlyEqual(params_A[key], params_B[key])
+  elif (isinstance(params_A, list)):
+    assert (len(params_A) == len(params_B))
+    for [item_A, item_B] in zip(params_A, params_B):
+      assertParamsStrictlyEqual(item_A, item_B)
+  else:
+    assert (isinstance(params_A, np.ndarray) == isinstance(
+        params_B, np.ndarray)), str(type(params_A)) + " vs " + str(
+            type(params_B))
+    assert (type(params_A) == type(params_B) or
+            isinstance(params_A, np.ndarray)), str(type(params_A)) + " vs " + str(
+                type(params_B))
+    assert (np.shape(params_A) == np.shape(params_B)), str(
+        np.shape(params_A)) + " vs " + str(np.shape(params_B))
+    assert (np.array_equal(params_A, params_B))
+  return None
+
+
+def dmp_params_io_test(
+    dmp_home_dir_path='../../../',
+    prims_params_dirpath='/data/dmp_coupling/learn_tactile_feedback/'
+    'scraping_w_tool/learned_prims_params/',
+    N_primitives=3):
+  """Saves the params of a (3-primitive) primitive library, as returned by
+
+     getParamsAsDict() and with the critical states (as in the RL loop),
+     via savePrimsParamsFromDictAtDirPath(), and checks that loading them
+     from the binary file gives exactly the same (types, shapes and values)
+     params as loading them from the text files. Also checks that a binary
+     file which is older than the text files is NOT loaded.
+  """
+  text_cdmp_params = rl_util.loadPrimsParamsAsDictFromDirPath(
+      dmp_home_dir_path + prims_params_dirpath,
+      N_primitives,
+      is_loading_binary_if_exist=False)
+  cdmp_params = {}
+  for [cart_type, cdmp] in [["CartCoord", rl_util.ccdmp],
+                            ["Quaternion", rl_util.qdmp]]:
+    cdmp_params[cart_type] = [None] * N_primitives
+    for n_prim in range(N_primitives):
+      # (the text files' loader returns 1-D arrays, instead of the column
+      #  vectors of getParamsAsDict())
+      dmp_params = dict(text_cdmp_params[cart_type][n_prim])
+      dmp_params["A_learn"] = dmp_params["A_learn"].reshape(3, 1)
+      if (cart_type == "CartCoord"):
+        for key in ["mean_start_position", "mean_goal_position"]:
+          dmp_params[key] = dmp_params[key].reshape(3, 1)
+      cdmp.setParamsFromDict(dmp_params)
+      cdmp_params[cart_type][n_prim] = cdmp.getParamsAsDict()
+      assert (cdmp_params[cart_type][n_prim]["A_learn"].shape == (3, 1))
+      cdmp_params[cart_type][n_prim]["critical_states_learn"] = (
+          rl_util.dmp_traj.DMPTrajectory(
+              np.zeros((3, 2)), np.zeros((3, 2)), np.zeros((3, 2)),
+              np.array([[0.0, 1.0]])))
+
+  saved_prims_params_dirpath = tempfile.mkdtemp()
+  try:
+    rl_util.savePrimsParamsFromDictAtDirPath(saved_prims_params_dirpath,
+                                             cdmp_params)
+    assert (dmp_params_io.isPrimsParamsBinaryFileUpToDate(
+        saved_prims_params_dirpath))
+    loaded_text_cdmp_params = rl_util.loadPrimsParamsAsDictFromDirPath(
+        saved_prims_params_dirpath,
+        N_primitives,
+        is_loading_binary_if_exist=False)
+    loaded_binary_cdmp_params = rl_util.loadPrimsParamsAsDictFromDirPath(
+        saved_prims_params_dirpath, N_primitives)
+    assertParamsStrictlyEqual(text_cdmp_params, loaded_text_cdmp_params)
+    assertParamsStrictlyEqual(loaded_text_cdmp_params,
+                              loaded_binary_cdmp_params)
+
+    # a text file modified after the binary file was saved is loaded
+    # (instead of the stale binary file):
+    time.sleep(0.01)
+    np.savetxt(saved_prims_params_dirpath + "/position/prim1/tau", [2.5])
+    assert (not dmp_params_io.isPrimsParamsBinaryFileUpToDate(
+        saved_prims_params_dirpath))
+    assert (rl_util.loadPrimsParamsAsDictFromDirPath(
+        saved_prims_params_dirpath, N_primitives)["CartCoord"][0]["mean_tau"]
+            == 2.5)
+  finally:
+    shutil.rmtree(saved_prims_params_dirpath)
+  return None
+
+
+if __name__ == '__main__':
+  dmp_params_io_test()
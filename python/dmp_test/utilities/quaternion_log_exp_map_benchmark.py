@@ -0,0 +1,58 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 01:30:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from utility_quaternion import *
+from quaternion_log_exp_map_test import *
+
+
+def quaternion_log_exp_map_benchmark(list_N=[1, 100000], num_trials=5):
+  """Measures the computation time of (the vectorized) computeQuaternionLogMap()
+
+     and computeQuaternionExpMap(), and of their references, on batches of
+     N Quaternions (N=1 being e.g. a QuaternionDMP time-step).
+  """
+  rng = np.random.RandomState(38)
+  computation_time = {}
+  for N in list_N:
+    Q = generateRandomQuaternions(N, rng)
+    log_Q = generateRandomLogQuaternions(N, rng, 2.0 * np.pi)
+    if (N == 1):
+      [Q, log_Q] = [Q[0, :], log_Q[0, :]]
+    num_repetitions = max(1, 1000 // N)
+    for [func_name, func, func_input] in [
+        ['computeQuaternionLogMap', computeQuaternionLogMap, Q],
+        ['computeQuaternionLogMapReference', computeQuaternionLogMapReference, Q],
+        ['computeQuaternionExpMap', computeQuaternionExpMap, log_Q],
+        ['computeQuaternionExpMapReference', computeQuaternionExpMapReference,
+         log_Q]
+    ]:
+      min_elapsed_time = np.inf
+      for _ in range(num_trials):
+        t0 = time.time()
+        for _ in range(num_repetitions):
+          func(func_input)
+        min_elapsed_time = min(min_elapsed_time,
+                               (time.time() - t0) / num_repetitions)
+      computation_time[(func_name, N)] = min_elapsed_time
+      print(func_name + ' (N=' + str(N) + '): ' +
+            str(min_elapsed_time * 1.e6) + ' us')
+    for map_name in ['LogMap', 'ExpMap']:
+      print('computeQuaternion' + map_name + ' speed-up (N=' + str(N) + '): ' +
+            str(computation_time[('computeQuaternion' + map_name +
+                                  'Reference', N)] /
+                computation_time[('computeQuaternion' + map_name, N)]) + 'x')
+
+  return computation_time
+
+
+if __name__ == '__main__':
+  quaternion_log_exp_map_benchmark()
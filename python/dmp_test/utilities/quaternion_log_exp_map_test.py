@@ -0,0 +1,292 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Mon Oct 19 01:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import numpy.linalg as npla
+import numpy.matlib as npma
+import os
+import sys
+import copy
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../utilities/'))
+from utility_quaternion import *
+
+# The previous (index-set-based) implementations of the Quaternion log and exp
+# maps, as the references of the (vectorized) computeQuaternionLogMap() and
+# computeQuaternionExpMap():
+
+
+def computeQuaternionLogMapReference(Q_input, div_epsilon=division_epsilon):
+  assert (
+      (len(Q_input.shape) >= 1) and
+      (len(Q_input.shape) <= 2)), "Q_input has invalid number of dimensions!"
+  if (len(Q_input.shape) == 1):
+    Q_input = Q_input.reshape(1, 4)
+  assert (
+      Q_input.shape[1] == 4), "Each row of Q_input has to be 4-dimensional!!!"
+  assert (np.iscomplex(Q_input).any() == False)
+
+  tensor_length = Q_input.shape[0]
+
+  # normalize the input Quaternion first:
+  Q_prep = normalizeQuaternion(np.real(Q_input)).reshape(tensor_length, 4)
+
+  u = Q_prep[:, 0].reshape(tensor_length, 1)
+  q = Q_prep[:, 1:4]
+
+  arccos_u = np.arccos(u)
+  sin_arccos_u = np.sin(arccos_u)
+
+  #    arccos_u_div_sin_arccos_u = (arccos_u + div_epsilon)/(sin_arccos_u + div_epsilon)
+  #
+  #    log_Q_output = npma.repmat(arccos_u_div_sin_arccos_u, 1, 3) * q
+
+  multiplier_sign = np.ones((tensor_length, 1))
+  log_multiplier = np.log(np.zeros((tensor_length, 1)) + division_epsilon)
+
+  Q_idx_w_positive_sin_arccos_u = np.where(sin_arccos_u[:, 0] > 0)[0]
+  Q_idx_w_negative_sin_arccos_u = np.where(sin_arccos_u[:, 0] < 0)[0]
+  Q_idx_w_nonzero_sin_arccos_u = np.union1d(Q_idx_w_positive_sin_arccos_u,
+                                            Q_idx_w_negative_sin_arccos_u)
+
+  log_Q_output = copy.deepcopy(q)
+  if (Q_idx_w_nonzero_sin_arccos_u.size > 0):
+    log_Q_output[Q_idx_w_nonzero_sin_arccos_u, :] = np.zeros(
+        (len(Q_idx_w_nonzero_sin_arccos_u), 3))
+    log_multiplier[Q_idx_w_nonzero_sin_arccos_u,
+                   0] = np.log(arccos_u[Q_idx_w_nonzero_sin_arccos_u, 0])
+
+  if (Q_idx_w_positive_sin_arccos_u.size > 0):
+    log_multiplier[
+        Q_idx_w_positive_sin_arccos_u,
+        0] = log_multiplier[Q_idx_w_positive_sin_arccos_u, 0] - np.log(
+            sin_arccos_u[Q_idx_w_positive_sin_arccos_u, 0])
+
+  if (Q_idx_w_negative_sin_arccos_u.size > 0):
+    multiplier_sign[Q_idx_w_negative_sin_arccos_u,
+                    0] = -multiplier_sign[Q_idx_w_negative_sin_arccos_u, 0]
+    log_multiplier[Q_idx_w_negative_sin_arccos_u, 0] = log_multiplier[
+        Q_idx_w_negative_sin_arccos_u,
+        0] - np.log(-sin_arccos_u[Q_idx_w_negative_sin_arccos_u, 0])
+
+  for i in range(3):
+    q_ith_col_idx_gt_zero = np.where(q[:, i] > 0)[0]
+    q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u = np.intersect1d(
+        q_ith_col_idx_gt_zero, Q_idx_w_nonzero_sin_arccos_u)
+    if (q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u.size > 0):
+      log_Q_output[
+          q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u, i] = (
+              multiplier_sign[
+                  q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
+                  0] *
+              np.exp(log_multiplier[
+                  q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
+                  0] + np.log(q[
+                      q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
+                      i])))
+
+    q_ith_col_idx_lt_zero = np.where(q[:, i] < 0)[0]
+    q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u = np.intersect1d(
+        q_ith_col_idx_lt_zero, Q_idx_w_nonzero_sin_arccos_u)
+    if (q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u.size > 0):
+      log_Q_output[
+          q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
+          i] = (-multiplier_sign[
+              q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
+              0] * np.exp(log_multiplier[
+                  q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
+                  0] + np.log(-q[
+                      q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
+                      i])))
+
+  assert (np.isnan(log_Q_output).any() == False), "log_Q_output contains NaN!"
+  if (tensor_length == 1):
+    log_Q_output = log_Q_output[0, :]
+  assert (np.iscomplex(log_Q_output).any() == False)
+  return (2.0 * np.real(log_Q_output))
+
+
+def computeQuaternionExpMapReference(log_Q_input, div_epsilon=division_epsilon):
+  assert ((len(log_Q_input.shape) >= 1) and (len(log_Q_input.shape) <= 2)
+         ), "log_Q_input has invalid number of dimensions!"
+  if (len(log_Q_input.shape) == 1):
+    log_Q_input = log_Q_input.reshape(1, 3)
+  assert (log_Q_input.shape[1] == 3
+         ), "Each row of log_Q_input has to be 3-dimensional!!!"
+  assert (np.iscomplex(log_Q_input).any() == False)
+
+  tensor_length = log_Q_input.shape[0]
+
+  r = np.real(log_Q_input) / 2.0
+  norm_r = npla.norm(r, ord=2, axis=1).reshape(tensor_length, 1)
+  cos_norm_r = np.cos(norm_r)
+  sin_norm_r = np.sin(norm_r)
+
+  #    sin_norm_r_div_norm_r = (sin_norm_r + div_epsilon)/(norm_r + div_epsilon)
+  #
+  #    Q_output = np.hstack([cos_norm_r, (npma.repmat(sin_norm_r_div_norm_r, 1, 3) * r)])
+
+  Q_output = np.zeros((tensor_length, 4))
+  Q_output[:, 0] = np.ones(tensor_length)
+
+  log_Q_input_idx_nonzero_norm_r = np.where(norm_r[:, 0] != 0)[0]
+
+  log_Q_input_idx_sin_norm_r_gt_zero = np.where(sin_norm_r[:, 0] > 0)[0]
+  log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r = np.intersect1d(
+      log_Q_input_idx_sin_norm_r_gt_zero, log_Q_input_idx_nonzero_norm_r)
+  if (log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r
+      .size > 0):
+    Q_output[
+        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+        0] = cos_norm_r[
+            log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+            0]
+    Q_output[
+        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+        1:4] = (
+            npma.repmat(
+                np.exp(
+                    np.log(sin_norm_r[
+                        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+                        0]) -
+                    np.log(norm_r[
+                        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+                        0]))
+                .reshape(
+                    log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r
+                    .shape[0], 1), 1, 3) *
+            r[log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r, :]
+        )
+
+  log_Q_input_idx_sin_norm_r_lt_zero = np.where(sin_norm_r[:, 0] < 0)[0]
+  log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r = np.intersect1d(
+      log_Q_input_idx_sin_norm_r_lt_zero, log_Q_input_idx_nonzero_norm_r)
+  if (log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r
+      .size > 0):
+    Q_output[
+        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+        0] = cos_norm_r[
+            log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+            0]
+    Q_output[
+        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+        1:4] = (
+            npma.repmat(
+                np.exp(
+                    np.log(-sin_norm_r[
+                        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+                        0]) -
+                    np.log(norm_r[
+                        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
+                        0]))
+                .reshape(
+                    log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r
+                    .shape[0], 1), 1, 3) *
+            (-r[log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r, :]
+            ))
+
+  assert (np.isnan(Q_output).any() == False), "Q_output contains NaN!"
+  # don't forget to normalize the resulting Quaternion:
+  Q_output = normalizeQuaternion(Q_output)
+  assert (np.iscomplex(Q_output).any() == False)
+  return np.real(Q_output)
+
+
+def generateRandomQuaternions(N, rng, max_norm_deviation=0.0):
+  Q = rng.randn(N, 4)
+  Q = Q / npla.norm(Q, ord=2, axis=1).reshape(N, 1)
+  return Q * (1.0 + rng.uniform(-max_norm_deviation, max_norm_deviation,
+                                (N, 1)))
+
+
+def generateRandomLogQuaternions(N, rng, max_norm):
+  log_Q_direction = rng.randn(N, 3)
+  log_Q_direction = log_Q_direction / npla.norm(
+      log_Q_direction, ord=2, axis=1).reshape(N, 1)
+  return log_Q_direction * rng.uniform(0.0, max_norm, (N, 1))
+
+
+def quaternion_log_exp_map_test(N=10000, random_seed=38):
+  """Compares computeQuaternionLogMap() and computeQuaternionExpMap() against
+
+     their references, on random (batches of) Quaternions and log
+     Quaternions, and on edge cases (identity, tiny and (near-)pi rotations),
+     where the (atan2-based) log map is expected to be more accurate than its
+     (arccos-based) reference, i.e. it is checked via the exp map round-trip.
+     Returns the maximum absolute differences to the references.
+  """
+  rng = np.random.RandomState(random_seed)
+  max_abs_diff = {}
+
+  # random (slightly un-normalized) Quaternions and log Quaternions (with norms
+  # up to 4*pi, i.e. including negative sin(norm(log_Q)/2)):
+  Q = generateRandomQuaternions(N, rng, 0.01)
+  log_Q = generateRandomLogQuaternions(N, rng, 4.0 * np.pi)
+
+  # edge cases: identity, tiny rotations (down to the Taylor expansions' region)
+  tiny_rotation_angles = np.hstack([0.0, np.logspace(-12, -2, 21)])
+  log_Q_tiny = generateRandomLogQuaternions(len(tiny_rotation_angles), rng, 1.0)
+  log_Q_tiny = (log_Q_tiny / npla.norm(log_Q_tiny, ord=2, axis=1).reshape(
+      -1, 1)) * tiny_rotation_angles.reshape(-1, 1)
+  Q_tiny = computeQuaternionExpMapReference(log_Q_tiny)
+  Q_edge = np.vstack([
+      Q_tiny,
+      np.array([[1.0, 0.0, 0.0, 0.0], [-1.0, 0.0, 0.0, 0.0]])
+  ])
+
+  for [test_name, log_Q_new, log_Q_ref] in [
+      ["log map (random)",
+       computeQuaternionLogMap(Q),
+       computeQuaternionLogMapReference(Q)],
+      ["log map (edge cases)",
+       computeQuaternionLogMap(Q_edge),
+       computeQuaternionLogMapReference(Q_edge)],
+      ["log map (single)",
+       computeQuaternionLogMap(Q[0, :]),
+       computeQuaternionLogMapReference(Q[0, :])],
+      ["exp map (random)",
+       computeQuaternionExpMap(log_Q),
+       computeQuaternionExpMapReference(log_Q)],
+      ["exp map (edge cases)",
+       computeQuaternionExpMap(log_Q_tiny),
+       computeQuaternionExpMapReference(log_Q_tiny)],
+      ["exp map (single)",
+       computeQuaternionExpMap(log_Q[0, :]),
+       computeQuaternionExpMapReference(log_Q[0, :])]
+  ]:
+    assert (log_Q_new.shape == log_Q_ref.shape)
+    max_abs_diff[test_name] = np.max(np.fabs(log_Q_new - log_Q_ref))
+    print(test_name + ": max abs diff to the reference = " +
+          str(max_abs_diff[test_name]))
+    assert (max_abs_diff[test_name] < 1.0e-12)
+
+  # u close to -1 (i.e. -Q_tiny) and near-pi rotations (i.e. u close to 0 in
+  # the log map's half angle), where arccos(u) and sin(arccos(u)) lose
+  # precision, i.e. the reference is (much) less accurate: checked via
+  # the exp map round-trip instead
+  near_pi_rotation_angles = np.pi - np.logspace(-9, -3, 13)
+  log_Q_near_pi = generateRandomLogQuaternions(
+      len(near_pi_rotation_angles), rng, 1.0)
+  log_Q_near_pi = (log_Q_near_pi / npla.norm(
+      log_Q_near_pi, ord=2, axis=1).reshape(-1, 1)
+                  ) * near_pi_rotation_angles.reshape(-1, 1)
+  Q_near_pi = np.vstack(
+      [-Q_tiny[1:, :], computeQuaternionExpMap(log_Q_near_pi)])
+  for [test_name, computeLogMap] in [
+      ["log map (near-pi) round-trip", computeQuaternionLogMap],
+      ["log map reference (near-pi) round-trip",
+       computeQuaternionLogMapReference]
+  ]:
+    max_abs_diff[test_name] = np.max(
+        np.fabs(computeQuaternionExpMap(computeLogMap(Q_near_pi)) - Q_near_pi))
+    print(test_name + ": max abs error = " + str(max_abs_diff[test_name]))
+  assert (max_abs_diff["log map (near-pi) round-trip"] < 1.0e-12)
+
+  return max_abs_diff
+
+
+if __name__ == '__main__':
+  quaternion_log_exp_map_test()
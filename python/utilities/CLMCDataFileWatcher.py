@@ -0,0 +1,175 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 22:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import re
+import time
+import select
+import ctypes
+import ctypes.util
+
+CLMC_DATA_FILE_NAME_REGEX = r"d+\d{5,5}$"  # (the pattern of SL data file names)
+
+DEFAULT_CLMC_DATA_FILE_WATCHER_MIN_POLL_PERIOD = 0.001  # (in seconds)
+DEFAULT_CLMC_DATA_FILE_WATCHER_MAX_POLL_PERIOD = 0.1  # (in seconds)
+
+# (from <sys/inotify.h>)
+INOTIFY_IN_CLOSE_WRITE = 0x00000008
+INOTIFY_IN_MOVED_TO = 0x00000080
+INOTIFY_IN_CREATE = 0x00000100
+
+
+def isCLMCDataFileComplete(dfilepath):
+  """Returns True if the SL data file at dfilepath is fully written, i.e.
+
+     its header is complete and its size is (at least) the header size plus
+     the (binary float32) payload size of cols X rows declared by the header.
+  """
+  try:
+    with open(dfilepath, 'rb') as dfile:
+      header_line_1 = dfile.readline()
+      header_line_2 = dfile.readline()
+      if ((not header_line_1.endswith(b'\n')) or
+          (not header_line_2.endswith(b'\n'))):
+        return False
+      header = header_line_1.split()
+      cols = int(header[1])
+      rows = int(header[2])
+      return (os.fstat(dfile.fileno()).st_size >= (dfile.tell() +
+                                                   (4 * cols * rows)))
+  except (IOError, OSError, IndexError, ValueError):
+    # (e.g. removed in-between, or the header is only partially written)
+    return False
+
+
+class CLMCDataFileWatcher(object):
+  """Class for (efficiently) blocking until new SL data files (d#####) are
+
+       fully written into a directory: event-driven (via Linux inotify, if
+       available), or else polling with exponential back-off (from
+       min_poll_period up to max_poll_period, reset whenever a file
+       arrives), instead of busy-waiting.
+       The files already in the directory on construction (or returned by
+       waitForNewFiles() already) are NOT considered new.
+  """
+
+  def __init__(self,
+               directory_path,
+               min_poll_period=DEFAULT_CLMC_DATA_FILE_WATCHER_MIN_POLL_PERIOD,
+               max_poll_period=DEFAULT_CLMC_DATA_FILE_WATCHER_MAX_POLL_PERIOD,
+               is_using_inotify=True):
+    assert (os.path.isdir(directory_path)
+           ), "Directory " + directory_path + " does NOT exist!"
+    assert ((min_poll_period > 0.0) and (max_poll_period >= min_poll_period))
+    self.directory_path = directory_path
+    self.min_poll_period = min_poll_period
+    self.max_poll_period = max_poll_period
+    self.inotify_fd = None
+    if (is_using_inotify):
+      self.inotify_fd = self.initInotify()
+    self.known_dfilepaths = set(self.getAllCLMCDataFilePaths())
+
+  def initInotify(self):
+    # returns the inotify file descriptor watching self.directory_path,
+    # or None if inotify is NOT available (then polling is used):
+    if (not sys.platform.startswith('linux')):
+      return None
+    try:
+      libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+      inotify_fd = libc.inotify_init()
+      if (inotify_fd < 0):
+        return None
+      if (libc.inotify_add_watch(
+          inotify_fd, os.path.abspath(self.directory_path).encode('utf-8'),
+          INOTIFY_IN_CLOSE_WRITE | INOTIFY_IN_MOVED_TO | INOTIFY_IN_CREATE) <
+          0):
+        os.close(inotify_fd)
+        return None
+      return inotify_fd
+    except (OSError, AttributeError):  # (e.g. NO inotify in libc)
+      return None
+
+  def isEventDriven(self):
+    return (self.inotify_fd is not None)
+
+  def getAllCLMCDataFilePaths(self):
+    return [
+        self.directory_path + "/" + f
+        for f in os.listdir(self.directory_path)
+        if re.match(CLMC_DATA_FILE_NAME_REGEX, f)
+    ]
+
+  def getNewCompleteFiles(self):
+    new_complete_dfilepaths = [
+        dfilepath for dfilepath in self.getAllCLMCDataFilePaths()
+        if ((dfilepath not in self.known_dfilepaths) and
+            (isCLMCDataFileComplete(dfilepath)))
+    ]
+    self.known_dfilepaths.update(new_complete_dfilepaths)
+    return sorted(new_complete_dfilepaths)
+
+  def waitForEvent(self, timeout):
+    # blocks until an inotify event (on the directory) or timeout (in seconds),
+    # and consumes the pending events (they only trigger a re-scan):
+    [ready_fds, _, _] = select.select([self.inotify_fd], [], [], timeout)
+    if (len(ready_fds) > 0):
+      os.read(self.inotify_fd, 65536)
+    return None
+
+  def waitForNewFiles(self, min_num_new_files=1, timeout=None):
+    """Blocks until (at least) min_num_new_files new SL data files are fully
+
+       written, or timeout (in seconds; None means forever) has passed, and
+       returns the (sorted) paths of the new files (possibly fewer than
+       min_num_new_files, on timeout).
+    """
+    assert (min_num_new_files >= 1)
+    t_end = None
+    if (timeout is not None):
+      t_end = time.time() + timeout
+    new_dfilepaths = self.getNewCompleteFiles()
+    poll_period = self.min_poll_period
+    while (len(new_dfilepaths) < min_num_new_files):
+      wait_time = self.max_poll_period if self.isEventDriven() else poll_period
+      if (t_end is not None):
+        wait_time = min(wait_time, t_end - time.time())
+        if (wait_time <= 0.0):
+          break
+      if (self.isEventDriven()):
+        # (the max_poll_period time-out is only a safety net, e.g. for files
+        #  being completed without a close-after-write event)
+        self.waitForEvent(wait_time)
+      else:
+        time.sleep(wait_time)
+      num_new_dfilepaths = len(new_dfilepaths)
+      new_dfilepaths.extend(self.getNewCompleteFiles())
+      if (len(new_dfilepaths) > num_new_dfilepaths):
+        poll_period = self.min_poll_period
+      else:
+        poll_period = min(2.0 * poll_period, self.max_poll_period)
+    return sorted(new_dfilepaths)
+
+  def forgetFile(self, dfilepath):
+    # e.g. after removing an (invalid) data file, so that a new file with
+    # the same name is considered new again:
+    self.known_dfilepaths.discard(dfilepath)
+    return None
+
+  def close(self):
+    if (self.inotify_fd is not None):
+      os.close(self.inotify_fd)
+      self.inotify_fd = None
+    return None
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+    return False
@@ -0,0 +1,237 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 23:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import json
+import struct
+import tempfile
+
+# Single-file binary format of DMP parameters (e.g. the dictionary returned by
+# DMPDiscrete.getParamsAsDict(), or a (nested) dictionary/list of those,
+# for many primitives):
+# - magic (8 bytes) and format version (uint32, little-endian);
+# - header length (uint32, little-endian) and the (JSON) header, describing
+#   the (nested) structure of the parameters, where each numpy array leaf is
+#   {"dtype", "shape", "offset"} (offset into the data buffer), and each
+#   Python scalar (int/float/string/None) leaf and each numpy scalar leaf
+#   (e.g. a np.float64 mean_tau, as {"dtype", "value"}, i.e. it is loaded back
+#   as a numpy scalar of the same dtype, NOT as a 0-d array) is stored in
+#   the header itself;
+# - the data buffer (starting at a multiple of DMP_PARAMS_BINARY_ALIGNMENT),
+#   holding all numpy arrays (C-order, each aligned to
+#   DMP_PARAMS_BINARY_ALIGNMENT).
+# On loading, the data buffer is memory-mapped (copy-on-write, i.e. the arrays
+# are writable, without modifying the file), and the arrays are views into it.
+DMP_PARAMS_BINARY_MAGIC = b'DMPPARAM'
+DMP_PARAMS_BINARY_FORMAT_VERSION = 2
+DMP_PARAMS_BINARY_ALIGNMENT = 64  # (in bytes)
+DMP_PARAMS_BINARY_FILE_NAME = 'dmp_params.bin'
+
+# The directory layout of the (text files of the) primitives' params, as saved
+# by savePrimsParamsFromDictAtDirPath() (see rl_tactile_fb_utils), i.e.
+# <prims_params_dirpath>/position/prim#/ and
+# <prims_params_dirpath>/orientation/prim#/ (# is the 1-based primitive ID),
+# with the file names (as keyword arguments of loadParamsAsDict() and
+# saveParamsFromDict()) of each DMP type, and the binary file
+# <prims_params_dirpath>/DMP_PARAMS_BINARY_FILE_NAME of all primitives:
+PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES = {
+    "CartCoord": "position",
+    "Quaternion": "orientation"
+}
+PRIMS_PARAMS_FILE_NAMES = {
+    "CartCoord": {
+        "file_name_weights": "w",
+        "file_name_A_learn": "A_learn",
+        "file_name_mean_start_position": "start_global",
+        "file_name_mean_goal_position": "goal_global",
+        "file_name_mean_tau": "tau",
+        "file_name_canonical_system_order": "canonical_sys_order",
+        "file_name_mean_start_position_global": "start_global",
+        "file_name_mean_goal_position_global": "goal_global",
+        "file_name_mean_start_position_local": "start_local",
+        "file_name_mean_goal_position_local": "goal_local",
+        "file_name_ctraj_local_coordinate_frame_selection":
+            "ctraj_local_coordinate_frame_selection",
+        "file_name_ctraj_hmg_transform_local_to_global_matrix":
+            "T_local_to_global_H",
+        "file_name_ctraj_hmg_transform_global_to_local_matrix":
+            "T_global_to_local_H"
+    },
+    "Quaternion": {
+        "file_name_weights": "w",
+        "file_name_A_learn": "A_learn",
+        "file_name_mean_start_position": "start",
+        "file_name_mean_goal_position": "goal",
+        "file_name_mean_tau": "tau",
+        "file_name_canonical_system_order": "canonical_sys_order"
+    }
+}
+
+
+def getAlignedOffset(offset):
+  return (((offset + DMP_PARAMS_BINARY_ALIGNMENT - 1) //
+           DMP_PARAMS_BINARY_ALIGNMENT) * DMP_PARAMS_BINARY_ALIGNMENT)
+
+
+def encodeParamsTree(params, list_arrays, data_buffer_length):
+  # returns the (JSON-able) header tree of params, and the data buffer length,
+  # after appending the numpy arrays (leaves) of params into list_arrays:
+  if (isinstance(params, dict)):
+    tree = {}
+    for key in params.keys():
+      assert (isinstance(key, str)
+             ), "Only (dictionary) keys of type str are supported!"
+      [tree[key], data_buffer_length] = encodeParamsTree(
+          params[key], list_arrays, data_buffer_length)
+    return {'dict': tree}, data_buffer_length
+  elif (isinstance(params, (list, tuple))):
+    tree = []
+    for item in params:
+      [item_tree, data_buffer_length] = encodeParamsTree(
+          item, list_arrays, data_buffer_length)
+      tree.append(item_tree)
+    return {'list': tree}, data_buffer_length
+  elif (isinstance(params, np.generic)):
+    assert (params.dtype.kind in 'biuf'
+           ), "Scalar dtype " + str(params.dtype) + " is NOT supported!"
+    # (the JSON (repr) of a Python float round-trips exactly)
+    return {
+        'numpy_scalar': {
+            'dtype': params.dtype.str,
+            'value': params.item()
+        }
+    }, data_buffer_length
+  elif (isinstance(params, np.ndarray)):
+    # (NOT np.ascontiguousarray(), which turns 0-d arrays into 1-d arrays)
+    array = np.array(params, order='C')
+    assert (array.dtype.kind in 'biuf'
+           ), "Array dtype " + str(array.dtype) + " is NOT supported!"
+    offset = getAlignedOffset(data_buffer_length)
+    list_arrays.append((offset, array))
+    return {
+        'array': {
+            'dtype': array.dtype.str,
+            'shape': list(array.shape),
+            'offset': offset
+        }
+    }, offset + array.nbytes
+  else:
+    assert ((params is None) or
+            isinstance(params, (bool, int, float, str))), (
+                "Parameter type " + str(type(params)) + " is NOT supported!")
+    return {'scalar': params}, data_buffer_length
+
+
+def decodeParamsTree(tree, data_buffer):
+  if ('dict' in tree):
+    return dict([(key, decodeParamsTree(tree['dict'][key], data_buffer))
+                 for key in tree['dict'].keys()])
+  elif ('list' in tree):
+    return [decodeParamsTree(item_tree, data_buffer) for item_tree in tree['list']]
+  elif ('array' in tree):
+    return np.ndarray(
+        tuple(tree['array']['shape']),
+        dtype=tree['array']['dtype'],
+        buffer=data_buffer,
+        offset=tree['array']['offset'])
+  elif ('numpy_scalar' in tree):
+    return np.dtype(tree['numpy_scalar']['dtype']).type(
+        tree['numpy_scalar']['value'])
+  else:
+    return tree['scalar']
+
+
+def saveParamsBinary(file_path, params):
+  """Saves params (a (nested) dictionary/list of numpy arrays and Python scalars,
+
+     e.g. of DMP parameters, for one or many primitives) into a single binary
+     file at file_path (atomically, i.e. via a temporary file, then renamed).
+  """
+  list_arrays = []
+  [tree, data_buffer_length] = encodeParamsTree(params, list_arrays, 0)
+  header = json.dumps(
+      {
+          'params': tree,
+          'data_buffer_length': data_buffer_length
+      },
+      sort_keys=True).encode('utf-8')
+  data_buffer_offset = getAlignedOffset(
+      len(DMP_PARAMS_BINARY_MAGIC) + 8 + len(header))
+  file_dir_path = os.path.dirname(os.path.abspath(file_path))
+  [temp_file_descriptor, temp_file_path] = tempfile.mkstemp(
+      suffix='.tmp', dir=file_dir_path)
+  try:
+    with os.fdopen(temp_file_descriptor, 'wb') as temp_file:
+      temp_file.write(DMP_PARAMS_BINARY_MAGIC)
+      temp_file.write(
+          struct.pack('<II', DMP_PARAMS_BINARY_FORMAT_VERSION, len(header)))
+      temp_file.write(header)
+      for [offset, array] in list_arrays:
+        temp_file.seek(data_buffer_offset + offset)
+        temp_file.write(array.tobytes())
+      temp_file.truncate(data_buffer_offset + data_buffer_length)
+    os.rename(temp_file_path, file_path)
+  except:
+    if (os.path.isfile(temp_file_path)):
+      os.remove(temp_file_path)
+    raise
+  return None
+
+
+def loadParamsBinary(file_path, is_memory_mapped=True):
+  """Loads the params saved by saveParamsBinary() at file_path,
+
+     with its numpy arrays as (writable, copy-on-write) views into the
+     memory-mapped data buffer, or (if is_memory_mapped=False) into
+     the data buffer read into memory at once.
+  """
+  with open(file_path, 'rb') as f:
+    magic = f.read(len(DMP_PARAMS_BINARY_MAGIC))
+    assert (magic == DMP_PARAMS_BINARY_MAGIC
+           ), file_path + " is NOT a DMP params binary file!"
+    [format_version, header_length] = struct.unpack('<II', f.read(8))
+    assert (format_version <= DMP_PARAMS_BINARY_FORMAT_VERSION), (
+        "DMP params binary format version " + str(format_version) +
+        " is NOT supported!")
+    header = json.loads(f.read(header_length).decode('utf-8'))
+    data_buffer_offset = getAlignedOffset(f.tell())
+    data_buffer_length = header['data_buffer_length']
+    if (data_buffer_length == 0):  # (NO array, which can NOT be mmap-ed)
+      data_buffer = np.zeros(0, dtype=np.uint8)
+    elif (is_memory_mapped):
+      data_buffer = np.memmap(
+          f,
+          dtype=np.uint8,
+          mode='c',
+          offset=data_buffer_offset,
+          shape=(data_buffer_length,)).view(np.ndarray)
+    else:
+      f.seek(data_buffer_offset)
+      data_buffer = np.frombuffer(
+          bytearray(f.read(data_buffer_length)), dtype=np.uint8)
+  return decodeParamsTree(header['params'], data_buffer)
+
+
+def isPrimsParamsBinaryFileUpToDate(prims_params_dirpath):
+  # the binary file of the primitives' params at prims_params_dirpath is
+  # up-to-date if it exists, and it is NOT older than any of the text files
+  # (e.g. NOT if these were modified or re-exported afterwards):
+  binary_file_path = os.path.join(prims_params_dirpath,
+                                  DMP_PARAMS_BINARY_FILE_NAME)
+  if (not os.path.isfile(binary_file_path)):
+    return False
+  binary_file_mtime = os.path.getmtime(binary_file_path)
+  for dmp_type_subdir_name in PRIMS_PARAMS_DMP_TYPE_SUBDIR_NAMES.values():
+    for [dir_path, _, file_names] in os.walk(
+        os.path.join(prims_params_dirpath, dmp_type_subdir_name)):
+      for file_name in file_names:
+        if (os.path.getmtime(os.path.join(dir_path, file_name)) >
+            binary_file_mtime):
+          return False
+  return True
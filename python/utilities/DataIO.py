@@ -10,95 +10,171 @@ import os
 import sys
 import copy
 import glob
+import time
+import multiprocessing.pool
 sys.path.append(os.path.join(os.path.dirname(__file__), '../dmp_state/'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../utilities/'))
 from DMPTrajectory import *
 from QuaternionDMPTrajectory import *
 from utilities import *
+from DataIOCache import *
 
 
-def extractSetNDTrajectories(dir_or_file_path,
-                             N=-1,
-                             start_column_idx=1,
-                             time_column_idx=0):
+def getTrajectoryFilesList(dir_or_file_path):
+  # (naturally-sorted) list of the trajectory file(s) in a directory,
+  # or the trajectory file itself:
   if (os.path.isdir(dir_or_file_path)):
     trajectory_files_list = naturalSort(glob.glob(dir_or_file_path + '/*.txt'))
   else:
     assert (
         dir_or_file_path.endswith('.txt')), 'Only *.txt files are supported.'
     trajectory_files_list = [dir_or_file_path]
-  trajectories_list_size = len(trajectory_files_list)
-  trajectories_list = [None] * trajectories_list_size
-  for i in range(trajectories_list_size):
-    trajectory_file = trajectory_files_list[i]
-    trajectory_file_content = np.loadtxt(trajectory_file)
-    if (N == -1):
-      N = (trajectory_file_content.shape[1] - 1) / 3
-    if (time_column_idx >= 0):
-      timeT = np.transpose(trajectory_file_content[:, [time_column_idx]])
-    else:
-      timeT = np.zeros((trajectory_file_content.shape[0], 1))
-    XT = np.transpose(
-        trajectory_file_content[:, start_column_idx:start_column_idx + N])
-    XdT = np.transpose(trajectory_file_content[:, start_column_idx +
-                                               N:start_column_idx + (2 * N)])
-    XddT = np.transpose(
-        trajectory_file_content[:, start_column_idx + (2 * N):start_column_idx +
-                                (3 * N)])
-    trajectory = DMPTrajectory(XT, XdT, XddT, timeT)
-    trajectories_list[i] = trajectory
+  return trajectory_files_list
+
+
+def extractTrajectoriesFromFiles(trajectory_files_list,
+                                 extract_trajectory_function,
+                                 num_threads=1,
+                                 is_printing_parse_time=False):
+  """Returns [extract_trajectory_function(trajectory_file) for each
+
+     trajectory_file in trajectory_files_list], in the same order, extracted
+     concurrently by a pool of num_threads threads (which overlap the file
+     I/O and the parsing of different files) if num_threads > 1.
+     If is_printing_parse_time is True, the parse time of each file is
+     printed (in the order of trajectory_files_list).
+  """
+  assert (num_threads >= 1)
+
+  def extractTimedTrajectory(trajectory_file):
+    t_start = time.time()
+    trajectory = extract_trajectory_function(trajectory_file)
+    return trajectory, time.time() - t_start
+
+  num_threads = min(num_threads, len(trajectory_files_list))
+  if (num_threads <= 1):
+    timed_trajectories_list = [
+        extractTimedTrajectory(trajectory_file)
+        for trajectory_file in trajectory_files_list
+    ]
+  else:
+    pool = multiprocessing.pool.ThreadPool(processes=num_threads)
+    try:
+      # (map() returns the outputs in the order of the inputs)
+      timed_trajectories_list = pool.map(extractTimedTrajectory,
+                                         trajectory_files_list, 1)
+    finally:
+      pool.close()
+      pool.join()
+
+  trajectories_list = [None] * len(trajectory_files_list)
+  for i in range(len(trajectory_files_list)):
+    [trajectories_list[i], parse_time] = timed_trajectories_list[i]
+    if (is_printing_parse_time):
+      print('Parsed ' + trajectory_files_list[i] + ' in ' + str(parse_time) +
+            ' s')
   return trajectories_list
 
 
+def extractNDTrajectory(trajectory_file,
+                        N=-1,
+                        start_column_idx=1,
+                        time_column_idx=0):
+  trajectory_file_content = loadTextFileCached(trajectory_file)
+  if (N == -1):
+    N = (trajectory_file_content.shape[1] - 1) // 3
+  if (time_column_idx >= 0):
+    timeT = np.transpose(trajectory_file_content[:, [time_column_idx]])
+  else:
+    timeT = np.zeros((trajectory_file_content.shape[0], 1))
+  XT = np.transpose(
+      trajectory_file_content[:, start_column_idx:start_column_idx + N])
+  XdT = np.transpose(trajectory_file_content[:, start_column_idx +
+                                             N:start_column_idx + (2 * N)])
+  XddT = np.transpose(
+      trajectory_file_content[:, start_column_idx + (2 * N):start_column_idx +
+                              (3 * N)])
+  return DMPTrajectory(XT, XdT, XddT, timeT)
+
+
+def extractSetNDTrajectories(dir_or_file_path,
+                             N=-1,
+                             start_column_idx=1,
+                             time_column_idx=0,
+                             num_threads=1,
+                             is_printing_parse_time=False):
+  trajectory_files_list = getTrajectoryFilesList(dir_or_file_path)
+  first_trajectories_list = []
+  if ((N == -1) and (len(trajectory_files_list) > 0)):
+    # (N of the first file is used for all files, i.e. the first file is
+    #  extracted (once) before the others, and its N is used for the others)
+    first_trajectories_list = extractTrajectoriesFromFiles(
+        trajectory_files_list[:1],
+        lambda trajectory_file: extractNDTrajectory(
+            trajectory_file, N, start_column_idx, time_column_idx), 1,
+        is_printing_parse_time)
+    N = first_trajectories_list[0].dmp_num_dimensions
+  return first_trajectories_list + extractTrajectoriesFromFiles(
+      trajectory_files_list[len(first_trajectories_list):],
+      lambda trajectory_file: extractNDTrajectory(
+          trajectory_file, N, start_column_idx, time_column_idx), num_threads,
+      is_printing_parse_time)
+
+
 def extractSetCartCoordTrajectories(dir_or_file_path,
                                     start_column_idx=1,
-                                    time_column_idx=0):
+                                    time_column_idx=0,
+                                    num_threads=1,
+                                    is_printing_parse_time=False):
   return extractSetNDTrajectories(dir_or_file_path, 3, start_column_idx,
-                                  time_column_idx)
+                                  time_column_idx, num_threads,
+                                  is_printing_parse_time)
+
+
+def extractQuaternionTrajectory(trajectory_file,
+                                start_column_idx=1,
+                                time_column_idx=0,
+                                is_omega_and_omegad_provided=True):
+  trajectory_file_content = loadTextFileCached(trajectory_file)
+  N_Q = 4
+  N_omega = 3
+  if (time_column_idx >= 0):
+    timeT = np.transpose(trajectory_file_content[:, [time_column_idx]])
+  else:
+    timeT = np.zeros((trajectory_file_content.shape[0], 1))
+  QT = np.transpose(
+      trajectory_file_content[:, start_column_idx:start_column_idx + N_Q])
+  if (is_omega_and_omegad_provided):
+    omegaT = np.transpose(
+        trajectory_file_content[:, start_column_idx + N_Q:start_column_idx +
+                                (N_Q + N_omega)])
+    omegadT = np.transpose(
+        trajectory_file_content[:, start_column_idx +
+                                (N_Q + N_omega):start_column_idx +
+                                (N_Q + (2 * N_omega))])
+    trajectory = QuaternionDMPTrajectory(
+        Q_init=QT, omega_init=omegaT, omegad_init=omegadT, time_init=timeT)
+    trajectory.computeQdAndQdd()
+  else:
+    QdT = np.transpose(
+        trajectory_file_content[:, start_column_idx + N_Q:start_column_idx +
+                                (2 * N_Q)])
+    QddT = np.transpose(
+        trajectory_file_content[:, start_column_idx +
+                                (2 * N_Q):start_column_idx + (3 * N_Q)])
+    trajectory = QuaternionDMPTrajectory(
+        Q_init=QT, Qd_init=QdT, Qdd_init=QddT, time_init=timeT)
+  return trajectory
 
 
 def extractSetQuaternionTrajectories(dir_or_file_path,
                                      start_column_idx=1,
                                      time_column_idx=0,
-                                     is_omega_and_omegad_provided=True):
-  if (os.path.isdir(dir_or_file_path)):
-    trajectory_files_list = naturalSort(glob.glob(dir_or_file_path + '/*.txt'))
-  else:
-    assert (
-        dir_or_file_path.endswith('.txt')), 'Only *.txt files are supported.'
-    trajectory_files_list = [dir_or_file_path]
-  trajectories_list_size = len(trajectory_files_list)
-  trajectories_list = [None] * trajectories_list_size
-  for i in range(trajectories_list_size):
-    trajectory_file = trajectory_files_list[i]
-    trajectory_file_content = np.loadtxt(trajectory_file)
-    N_Q = 4
-    N_omega = 3
-    if (time_column_idx >= 0):
-      timeT = np.transpose(trajectory_file_content[:, [time_column_idx]])
-    else:
-      timeT = np.zeros((trajectory_file_content.shape[0], 1))
-    QT = np.transpose(
-        trajectory_file_content[:, start_column_idx:start_column_idx + N_Q])
-    if (is_omega_and_omegad_provided):
-      omegaT = np.transpose(
-          trajectory_file_content[:, start_column_idx + N_Q:start_column_idx +
-                                  (N_Q + N_omega)])
-      omegadT = np.transpose(
-          trajectory_file_content[:, start_column_idx +
-                                  (N_Q + N_omega):start_column_idx +
-                                  (N_Q + (2 * N_omega))])
-      trajectory = QuaternionDMPTrajectory(
-          Q_init=QT, omega_init=omegaT, omegad_init=omegadT, time_init=timeT)
-      trajectory.computeQdAndQdd()
-    else:
-      QdT = np.transpose(
-          trajectory_file_content[:, start_column_idx + N_Q:start_column_idx +
-                                  (2 * N_Q)])
-      QddT = np.transpose(
-          trajectory_file_content[:, start_column_idx +
-                                  (2 * N_Q):start_column_idx + (3 * N_Q)])
-      trajectory = QuaternionDMPTrajectory(
-          Q_init=QT, Qd_init=QdT, Qdd_init=QddT, time_init=timeT)
-    trajectories_list[i] = trajectory
-  return trajectories_list
+                                     is_omega_and_omegad_provided=True,
+                                     num_threads=1,
+                                     is_printing_parse_time=False):
+  return extractTrajectoriesFromFiles(
+      getTrajectoryFilesList(dir_or_file_path),
+      lambda trajectory_file: extractQuaternionTrajectory(
+          trajectory_file, start_column_idx, time_column_idx,
+          is_omega_and_omegad_provided), num_threads, is_printing_parse_time)
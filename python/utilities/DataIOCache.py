@@ -0,0 +1,155 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""Created on Sun Oct 18 18:00:00 2026
+
+@author: gsutanto
+"""
+
+import numpy as np
+import os
+import sys
+import glob
+import hashlib
+import tempfile
+import argparse
+
+# Binary (*.npy) cache of the numeric text files loaded by DataIO:
+# each text file is parsed (via np.loadtxt()) once, and saved as
+# <cache_dir>/<sha1 of its absolute path>_<its size>_<its mtime>.npy,
+# which is memory-mapped on later loads, i.e. a modified text file
+# (different size and/or mtime) is re-parsed (and its stale cache file removed).
+# By default, the cache directory is data_io_cache/ at the root of this
+# repository (git-ignored, next to data/), i.e. removing the repository
+# removes its cache too; it may be set via the DMP_DATA_IO_CACHE_DIR
+# environment variable (an empty string disables the cache), or via
+# setDataIOCacheDir().
+DEFAULT_DATA_IO_CACHE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '../../data_io_cache/'))
+
+_data_io_cache_dir = os.environ.get('DMP_DATA_IO_CACHE_DIR',
+                                    DEFAULT_DATA_IO_CACHE_DIR)
+if (_data_io_cache_dir == ''):
+  _data_io_cache_dir = None
+
+
+def setDataIOCacheDir(new_data_io_cache_dir):
+  # new_data_io_cache_dir=None disables the cache.
+  global _data_io_cache_dir
+  _data_io_cache_dir = new_data_io_cache_dir
+  return None
+
+
+def getDataIOCacheDir():
+  return _data_io_cache_dir
+
+
+def getCacheFilePathPrefix(text_file_path, cache_dir):
+  return os.path.join(
+      cache_dir,
+      hashlib.sha1(os.path.abspath(text_file_path).encode(
+          'utf-8')).hexdigest())
+
+
+def getCacheFilePath(text_file_path, cache_dir):
+  text_file_stat = os.stat(text_file_path)
+  text_file_mtime_ns = getattr(text_file_stat, 'st_mtime_ns',
+                               int(text_file_stat.st_mtime * 1.e9))
+  return (getCacheFilePathPrefix(text_file_path, cache_dir) + '_' +
+          str(text_file_stat.st_size) + '_' + str(text_file_mtime_ns) + '.npy')
+
+
+def loadTextFileCached(text_file_path, cache_dir=None):
+  """Returns np.loadtxt(text_file_path), bit-identically, but from
+
+     the (read-only, memory-mapped) cache file, if it is up-to-date;
+     otherwise parses the text file, and (re-)builds its cache file.
+     cache_dir=None means following the cache directory set via
+     setDataIOCacheDir() (if it is None too, the cache is NOT used).
+  """
+  if (cache_dir is None):
+    cache_dir = _data_io_cache_dir
+  if (cache_dir is None):
+    return np.loadtxt(text_file_path)
+  cache_file_path = getCacheFilePath(text_file_path, cache_dir)
+  if (os.path.isfile(cache_file_path)):
+    try:
+      return np.load(cache_file_path, mmap_mode='r')
+    except ValueError:  # (e.g. an empty array, which can NOT be mmap-ed)
+      return np.load(cache_file_path)
+  text_file_content = np.loadtxt(text_file_path)
+  try:
+    saveCacheFile(text_file_content, text_file_path, cache_file_path,
+                  cache_dir)
+  except (IOError, OSError):  # (e.g. a read-only cache directory)
+    pass
+  return text_file_content
+
+
+def saveCacheFile(text_file_content, text_file_path, cache_file_path,
+                  cache_dir):
+  if (not os.path.isdir(cache_dir)):
+    try:
+      os.makedirs(cache_dir)
+    except OSError:  # (e.g. created concurrently by another process)
+      assert (os.path.isdir(cache_dir))
+  # (written to a temporary file first, and then renamed, which is atomic,
+  #  i.e. concurrent loaders never see a partially-written cache file)
+  [temp_file_descriptor, temp_file_path] = tempfile.mkstemp(
+      suffix='.npy.tmp', dir=cache_dir)
+  try:
+    with os.fdopen(temp_file_descriptor, 'wb') as temp_file:
+      np.save(temp_file, text_file_content)
+    os.rename(temp_file_path, cache_file_path)
+  except:
+    if (os.path.isfile(temp_file_path)):
+      os.remove(temp_file_path)
+    raise
+  for stale_cache_file_path in glob.glob(
+      getCacheFilePathPrefix(text_file_path, cache_dir) + '_*.npy'):
+    if (stale_cache_file_path != cache_file_path):
+      try:
+        os.remove(stale_cache_file_path)
+      except OSError:  # (e.g. removed concurrently by another process)
+        pass
+  return None
+
+
+def prebuildDataIOCache(data_dir_path, cache_dir=None):
+  """Builds the (up-to-date) cache files of all numeric *.txt files
+
+     (recursively) under data_dir_path; non-numeric *.txt files are skipped.
+     Returns the numbers of cached and skipped files.
+  """
+  if (cache_dir is None):
+    cache_dir = _data_io_cache_dir
+  assert (cache_dir is not None), "The cache is disabled!"
+  assert (os.path.isdir(data_dir_path)
+         ), "Directory " + data_dir_path + " does NOT exist!"
+  num_cached_files = 0
+  num_skipped_files = 0
+  for [dir_path, _, file_names] in os.walk(data_dir_path):
+    for file_name in sorted(file_names):
+      if (not file_name.endswith('.txt')):
+        continue
+      try:
+        loadTextFileCached(os.path.join(dir_path, file_name), cache_dir)
+        num_cached_files += 1
+      except ValueError:  # (NOT a numeric text file)
+        num_skipped_files += 1
+  return num_cached_files, num_skipped_files
+
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(
+      description='Prebuilds the binary cache of the numeric *.txt files '
+      '(recursively) under a data directory.')
+  parser.add_argument('data_dir_path')
+  parser.add_argument(
+      '--cache_dir',
+      default=None,
+      help='cache directory (default: ' + str(_data_io_cache_dir) + ')')
+  args = parser.parse_args()
+  [num_cached_files, num_skipped_files] = prebuildDataIOCache(
+      args.data_dir_path, args.cache_dir)
+  print('Cached ' + str(num_cached_files) + ' file(s), skipped ' +
+        str(num_skipped_files) + ' non-numeric file(s).')
@@ -3,37 +3,60 @@
 @author: righetti
 """
 
+from __future__ import print_function
 import os
 import numpy
-import struct
 
 
-class ClmcFile:
+class ClmcFile(object):
   #defines cols, rows, freq, names and units
-  def __init__(self, filename=''):
+  #the data is only parsed (column by column) when it is requested via get_variables(),
+  #either from the payload read into memory at once (default), or memory-mapped (is_memory_mapped=True)
+  def __init__(self, filename='', is_memory_mapped=False):
     if os.path.exists(filename) == False:
-      print 'Error the file - ', filename, ' - does not exist'
+      print('Error the file - ', filename, ' - does not exist')
       return
 
     #read the file
     with open(filename, 'rb') as my_file:
       #get the header right
       temp = my_file.readline().split()
-      cols = int(temp[1])
-      rows = int(temp[2])
+      self.cols = int(temp[1])
+      self.rows = int(temp[2])
       self.freq = float(temp[3])
 
       #get the names and units
       self.names = {}
       self.units = []
       temp = my_file.readline().split()
-      for i in range(0, cols):
-        self.names[(temp[2 * i])] = i
-        self.units.append(temp[2 * i + 1])
-      #get all of the data
-      self.data = numpy.array(
-          struct.unpack('>' + 'f' * cols * rows, my_file.read(
-              4 * cols * rows))).reshape(rows, cols).transpose()
+      for i in range(0, self.cols):
+        self.names[(temp[2 * i]).decode()] = i
+        self.units.append(temp[2 * i + 1].decode())
+      #the (big-endian float32, row-major, i.e. rows X cols) payload, NOT converted yet
+      if (is_memory_mapped):
+        self.payload = numpy.memmap(
+            filename,
+            dtype='>f4',
+            mode='r',
+            offset=my_file.tell(),
+            shape=(self.rows, self.cols))
+      else:
+        self.payload = numpy.frombuffer(
+            my_file.read(4 * self.cols * self.rows),
+            dtype='>f4').reshape(self.rows, self.cols)
+    #the columns converted so far (to native float64, as numpy.array(struct.unpack(...)) used to be)
+    self.columns = {}
+
+  def get_column(self, i):
+    if i not in self.columns:
+      self.columns[i] = numpy.array(self.payload[:, i], dtype=numpy.float64)
+    return self.columns[i]
+
+  @property
+  def data(self):
+    #all of the data (cols X rows), i.e. converting ALL columns
+    return numpy.array([self.get_column(i) for i in range(0, self.cols)
+                       ]).reshape(self.cols, self.rows)
 
   def get_variables(self, names):
     #call this function with a list of names and it will return a list of numpy arrays
@@ -43,15 +66,15 @@ class ClmcFile:
     #check if it asks only for one name - names is a string
     if (isinstance(names, str)):
       if names in self.names:
-        return self.data[self.names[names]]
+        return self.get_column(self.names[names])
       else:
-        print 'ERROR ', names, ' is not a valid name'
+        print('ERROR ', names, ' is not a valid name')
     else:
       result = []
       for item in names:
         if item in self.names:
-          result.append(self.data[self.names[item]])
+          result.append(self.get_column(self.names[item]))
         else:
-          print 'ERROR ', item, ' is not a valid name'
+          print('ERROR ', item, ' is not a valid name')
           break
       return result
@@ -1 +1,41 @@
 MIN_TAU = 0.01
+
+# Validation levels, i.e. how much of the isValid() pre-/post-condition
+# checking is performed:
+VALIDATION_OFF = 0  # no checking at all
+VALIDATION_ON_START_ONLY = 1  # checking on start(), but NOT on every time step
+VALIDATION_FULL = 2  # checking everywhere (default)
+
+_global_validation_level = VALIDATION_FULL
+
+
+def assertValidValidationLevel(validation_level, is_none_allowed=True):
+  # (validation_level=None, if allowed, means following the global
+  #  validation level, e.g. in the components' setValidationLevel())
+  assert ((is_none_allowed and (validation_level is None)) or
+          (validation_level in [
+              VALIDATION_OFF, VALIDATION_ON_START_ONLY, VALIDATION_FULL
+          ])), ("Validation level=" + str(validation_level) +
+                " is not supported!")
+  return None
+
+
+def setGlobalValidationLevel(new_validation_level):
+  global _global_validation_level
+  assertValidValidationLevel(new_validation_level, is_none_allowed=False)
+  _global_validation_level = new_validation_level
+  return None
+
+
+def getGlobalValidationLevel():
+  return _global_validation_level
+
+
+def isValidationRequired(validation_level=None, is_per_step=True):
+  # validation_level=None means following the global validation level.
+  if (validation_level is None):
+    validation_level = _global_validation_level
+  if (is_per_step):
+    return (validation_level >= VALIDATION_FULL)
+  else:
+    return (validation_level >= VALIDATION_ON_START_ONLY)
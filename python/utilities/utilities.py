@@ -13,6 +13,7 @@ import copy
 import glob
 import pickle
 import shutil
+import time
 from scipy import signal
 from scipy.interpolate import interp1d
 import pyplot_util as pypl_util
@@ -237,9 +238,17 @@ def getAllCLMCDataFilePathsInDirectory(directory_path):
 
 
 def waitUntilTotalCLMCDataFilesReaches(directory_path,
-                                       desired_total_clmc_data_files):
+                                       desired_total_clmc_data_files,
+                                       min_poll_period=0.001,
+                                       max_poll_period=0.1):
+  # (polling with exponential back-off, instead of busy-waiting;
+  #  see also CLMCDataFileWatcher, which is event-driven, and also waits
+  #  until the files are fully written)
   dfilepaths = getAllCLMCDataFilePathsInDirectory(directory_path)
+  poll_period = min_poll_period
   while (len(dfilepaths) < desired_total_clmc_data_files):
+    time.sleep(poll_period)
+    poll_period = min(2.0 * poll_period, max_poll_period)
     dfilepaths = getAllCLMCDataFilePathsInDirectory(directory_path)
   return dfilepaths
 
@@ -17,6 +17,10 @@ import pyplot_util
 from utilities import *
 
 division_epsilon = 1.0e-100
+# (below which the Taylor expansions of theta/sin(theta) and sin(theta)/theta
+#  are used in the Quaternion log and exp maps; their truncation errors are
+#  below 1.0e-20 there)
+QUATERNION_LOG_EXP_MAP_TAYLOR_THRESHOLD = 1.0e-4
 
 
 def normalizeQuaternion(Q_input, warning_threshold=0.98):
@@ -33,7 +37,7 @@ def normalizeQuaternion(Q_input, warning_threshold=0.98):
     wa.warn("(Q_input_norm < %f).any() == True ; Q_input_norm=\n" %
             warning_threshold + str(Q_input_norm))
   # Normalize (make sure that norm(Quaternion) == 1)
-  Q_output = Q_input / npma.repmat(Q_input_norm, 1, 4)
+  Q_output = Q_input / Q_input_norm
   if (tensor_length == 1):
     Q_output = Q_output[0, :]
   return Q_output
@@ -62,6 +66,10 @@ def standardizeNormalizeQuaternion(Q_input):
 
 
 def computeQuaternionLogMap(Q_input, div_epsilon=division_epsilon):
+  # (vectorized over the rows of Q_input: log(Q) = 2 * theta/sin(theta) * q,
+  #  where theta = atan2(norm(q), u) (more accurate than arccos(u) near
+  #  u = +/-1), with a Taylor expansion of theta/sin(theta) near theta = 0;
+  #  div_epsilon is NOT used anymore, kept for backward compatibility)
   assert (
       (len(Q_input.shape) >= 1) and
       (len(Q_input.shape) <= 2)), "Q_input has invalid number of dimensions!"
@@ -69,172 +77,64 @@ def computeQuaternionLogMap(Q_input, div_epsilon=division_epsilon):
     Q_input = Q_input.reshape(1, 4)
   assert (
       Q_input.shape[1] == 4), "Each row of Q_input has to be 4-dimensional!!!"
-  assert (np.iscomplex(Q_input).any() == False)
+  assert ((not np.iscomplexobj(Q_input)) or
+          (np.iscomplex(Q_input).any() == False))
 
   tensor_length = Q_input.shape[0]
 
   # normalize the input Quaternion first:
   Q_prep = normalizeQuaternion(np.real(Q_input)).reshape(tensor_length, 4)
 
-  u = Q_prep[:, 0].reshape(tensor_length, 1)
+  u = Q_prep[:, 0:1]
   q = Q_prep[:, 1:4]
 
-  arccos_u = np.arccos(u)
-  sin_arccos_u = np.sin(arccos_u)
-
-  #    arccos_u_div_sin_arccos_u = (arccos_u + div_epsilon)/(sin_arccos_u + div_epsilon)
-  #
-  #    log_Q_output = npma.repmat(arccos_u_div_sin_arccos_u, 1, 3) * q
-
-  multiplier_sign = np.ones((tensor_length, 1))
-  log_multiplier = np.log(np.zeros((tensor_length, 1)) + division_epsilon)
-
-  Q_idx_w_positive_sin_arccos_u = np.where(sin_arccos_u[:, 0] > 0)[0]
-  Q_idx_w_negative_sin_arccos_u = np.where(sin_arccos_u[:, 0] < 0)[0]
-  Q_idx_w_nonzero_sin_arccos_u = np.union1d(Q_idx_w_positive_sin_arccos_u,
-                                            Q_idx_w_negative_sin_arccos_u)
-
-  log_Q_output = copy.deepcopy(q)
-  if (Q_idx_w_nonzero_sin_arccos_u.size > 0):
-    log_Q_output[Q_idx_w_nonzero_sin_arccos_u, :] = np.zeros(
-        (len(Q_idx_w_nonzero_sin_arccos_u), 3))
-    log_multiplier[Q_idx_w_nonzero_sin_arccos_u,
-                   0] = np.log(arccos_u[Q_idx_w_nonzero_sin_arccos_u, 0])
-
-  if (Q_idx_w_positive_sin_arccos_u.size > 0):
-    log_multiplier[
-        Q_idx_w_positive_sin_arccos_u,
-        0] = log_multiplier[Q_idx_w_positive_sin_arccos_u, 0] - np.log(
-            sin_arccos_u[Q_idx_w_positive_sin_arccos_u, 0])
-
-  if (Q_idx_w_negative_sin_arccos_u.size > 0):
-    multiplier_sign[Q_idx_w_negative_sin_arccos_u,
-                    0] = -multiplier_sign[Q_idx_w_negative_sin_arccos_u, 0]
-    log_multiplier[Q_idx_w_negative_sin_arccos_u, 0] = log_multiplier[
-        Q_idx_w_negative_sin_arccos_u,
-        0] - np.log(-sin_arccos_u[Q_idx_w_negative_sin_arccos_u, 0])
-
-  for i in range(3):
-    q_ith_col_idx_gt_zero = np.where(q[:, i] > 0)[0]
-    q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u = np.intersect1d(
-        q_ith_col_idx_gt_zero, Q_idx_w_nonzero_sin_arccos_u)
-    if (q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u.size > 0):
-      log_Q_output[
-          q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u, i] = (
-              multiplier_sign[
-                  q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
-                  0] *
-              np.exp(log_multiplier[
-                  q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
-                  0] + np.log(q[
-                      q_ith_col_idx_gt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
-                      i])))
-
-    q_ith_col_idx_lt_zero = np.where(q[:, i] < 0)[0]
-    q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u = np.intersect1d(
-        q_ith_col_idx_lt_zero, Q_idx_w_nonzero_sin_arccos_u)
-    if (q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u.size > 0):
-      log_Q_output[
-          q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
-          i] = (-multiplier_sign[
-              q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
-              0] * np.exp(log_multiplier[
-                  q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
-                  0] + np.log(-q[
-                      q_ith_col_idx_lt_zero_intersect_Q_idx_w_nonzero_sin_arccos_u,
-                      i])))
+  norm_q = np.sqrt(np.einsum('ij,ij->i', q, q)).reshape(tensor_length, 1)
+  theta = np.arctan2(norm_q, u)
+  theta_sq = theta * theta
+  # (norm_q == 0 and theta > 0 only if u == -1, where q == 0 anyway)
+  theta_div_sin_theta = np.where(
+      theta < QUATERNION_LOG_EXP_MAP_TAYLOR_THRESHOLD,
+      1.0 + (theta_sq / 6.0) + ((7.0 / 360.0) * theta_sq * theta_sq),
+      theta / np.where(norm_q > 0.0, norm_q, 1.0))
+  log_Q_output = theta_div_sin_theta * q
 
   assert (np.isnan(log_Q_output).any() == False), "log_Q_output contains NaN!"
   if (tensor_length == 1):
     log_Q_output = log_Q_output[0, :]
-  assert (np.iscomplex(log_Q_output).any() == False)
-  return (2.0 * np.real(log_Q_output))
+  return (2.0 * log_Q_output)
 
 
 def computeQuaternionExpMap(log_Q_input, div_epsilon=division_epsilon):
+  # (vectorized over the rows of log_Q_input: exp(log_Q) = [cos(norm(r)),
+  #  sin(norm(r))/norm(r) * r], where r = log_Q/2, with a Taylor expansion of
+  #  sin(norm(r))/norm(r) near norm(r) = 0;
+  #  div_epsilon is NOT used anymore, kept for backward compatibility)
   assert ((len(log_Q_input.shape) >= 1) and (len(log_Q_input.shape) <= 2)
          ), "log_Q_input has invalid number of dimensions!"
   if (len(log_Q_input.shape) == 1):
     log_Q_input = log_Q_input.reshape(1, 3)
   assert (log_Q_input.shape[1] == 3
          ), "Each row of log_Q_input has to be 3-dimensional!!!"
-  assert (np.iscomplex(log_Q_input).any() == False)
+  assert ((not np.iscomplexobj(log_Q_input)) or
+          (np.iscomplex(log_Q_input).any() == False))
 
   tensor_length = log_Q_input.shape[0]
 
   r = np.real(log_Q_input) / 2.0
-  norm_r = npla.norm(r, ord=2, axis=1).reshape(tensor_length, 1)
-  cos_norm_r = np.cos(norm_r)
-  sin_norm_r = np.sin(norm_r)
-
-  #    sin_norm_r_div_norm_r = (sin_norm_r + div_epsilon)/(norm_r + div_epsilon)
-  #
-  #    Q_output = np.hstack([cos_norm_r, (npma.repmat(sin_norm_r_div_norm_r, 1, 3) * r)])
-
-  Q_output = np.zeros((tensor_length, 4))
-  Q_output[:, 0] = np.ones(tensor_length)
-
-  log_Q_input_idx_nonzero_norm_r = np.where(norm_r[:, 0] != 0)[0]
-
-  log_Q_input_idx_sin_norm_r_gt_zero = np.where(sin_norm_r[:, 0] > 0)[0]
-  log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r = np.intersect1d(
-      log_Q_input_idx_sin_norm_r_gt_zero, log_Q_input_idx_nonzero_norm_r)
-  if (log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r
-      .size > 0):
-    Q_output[
-        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-        0] = cos_norm_r[
-            log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-            0]
-    Q_output[
-        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-        1:4] = (
-            npma.repmat(
-                np.exp(
-                    np.log(sin_norm_r[
-                        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-                        0]) -
-                    np.log(norm_r[
-                        log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-                        0]))
-                .reshape(
-                    log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r
-                    .shape[0], 1), 1, 3) *
-            r[log_Q_input_idx_sin_norm_r_gt_zero_intersect_log_Q_input_idx_nonzero_norm_r, :]
-        )
-
-  log_Q_input_idx_sin_norm_r_lt_zero = np.where(sin_norm_r[:, 0] < 0)[0]
-  log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r = np.intersect1d(
-      log_Q_input_idx_sin_norm_r_lt_zero, log_Q_input_idx_nonzero_norm_r)
-  if (log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r
-      .size > 0):
-    Q_output[
-        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-        0] = cos_norm_r[
-            log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-            0]
-    Q_output[
-        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-        1:4] = (
-            npma.repmat(
-                np.exp(
-                    np.log(-sin_norm_r[
-                        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-                        0]) -
-                    np.log(norm_r[
-                        log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r,
-                        0]))
-                .reshape(
-                    log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r
-                    .shape[0], 1), 1, 3) *
-            (-r[log_Q_input_idx_sin_norm_r_lt_zero_intersect_log_Q_input_idx_nonzero_norm_r, :]
-            ))
+  norm_r = np.sqrt(np.einsum('ij,ij->i', r, r)).reshape(tensor_length, 1)
+  norm_r_sq = norm_r * norm_r
+  sin_norm_r_div_norm_r = np.where(
+      norm_r < QUATERNION_LOG_EXP_MAP_TAYLOR_THRESHOLD,
+      1.0 - (norm_r_sq / 6.0) + (norm_r_sq * norm_r_sq / 120.0),
+      np.sin(norm_r) / np.where(norm_r > 0.0, norm_r, 1.0))
+
+  Q_output = np.empty((tensor_length, 4))
+  Q_output[:, 0:1] = np.cos(norm_r)
+  Q_output[:, 1:4] = sin_norm_r_div_norm_r * r
 
   assert (np.isnan(Q_output).any() == False), "Q_output contains NaN!"
   # don't forget to normalize the resulting Quaternion:
-  Q_output = normalizeQuaternion(Q_output)
-  assert (np.iscomplex(Q_output).any() == False)
-  return np.real(Q_output)
+  return normalizeQuaternion(Q_output)
 
 
 def computeQuatConjugate(Q_input):
@@ -446,7 +346,8 @@ def computeAverageQuaternions(Qs):
   Qs = normalizeQuaternion(Qs).reshape(tensor_length, 4)
 
   QsTQs = np.matmul(Qs.T, Qs)
-  [d, V] = npla.eig(QsTQs)
+  # (QsTQs is symmetric, i.e. its eigenvalues and eigenvectors are real)
+  [d, V] = npla.eigh(QsTQs)
   max_eig_val_idx = np.argmax(d)
   if (isQuatArrayHasMajorityNegativeRealParts(Qs)):
     mean_Q = -standardizeNormalizeQuaternion(V[:, max_eig_val_idx])
@@ -5,21 +5,42 @@ import numpy as np
 import os
 import sys
 import copy
+import shutil
+import tempfile
 dmp_home_dir_abs_path = os.path.dirname(__file__) + "/../"
 dmp_software_test_dir_abs_path = dmp_home_dir_abs_path + '/software_test/'
+# (all tests use a temporary binary trajectory cache of DataIO, instead of
+#  the default one; set before importing DataIO, i.e. also for subprocesses)
+data_io_cache_root_dir_path = tempfile.mkdtemp()
+os.environ['DMP_DATA_IO_CACHE_DIR'] = data_io_cache_root_dir_path + '/default/'
 assert (os.path.isdir(dmp_home_dir_abs_path + '/python/dmp_test/dmp_1D/'))
 assert (os.path.isdir(dmp_home_dir_abs_path + '/python/dmp_test/cart_dmp/cart_coord_dmp/'))
 assert (os.path.isdir(dmp_home_dir_abs_path + '/python/dmp_test/dmp_coupling/learn_obs_avoid/static_obs/single_baseline/'))
 sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/dmp_test/dmp_1D/'))
 sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/dmp_test/cart_dmp/cart_coord_dmp/'))
 sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/dmp_test/cart_dmp/quat_dmp/'))
+sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/dmp_test/cart_dmp/'))
+sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/dmp_test/utilities/'))
+sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/dmp_test/dmp_state/'))
 sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/dmp_test/dmp_coupling/learn_obs_avoid/static_obs/single_baseline/'))
 sys.path.append(os.path.join(dmp_home_dir_abs_path + '/python/utilities/'))
 from dmp_1D_test import *
+from dmp_1D_zoh_unroll_test import *
+from dmp_1D_ode_unroll_test import *
 from cart_coord_dmp_single_traj_training_test import *
 from cart_coord_dmp_multi_traj_training_test import *
+from cart_coord_dmp_incremental_learning_test import *
+from cart_coord_dmp_batch_unroll_test import *
 from quat_dmp_single_traj_training_test import *
 from quat_dmp_multi_traj_training_test import *
+from quat_dmp_incremental_learning_test import *
+from primitive_library_test import *
+from learn_dmps_in_parallel_test import *
+from quaternion_log_exp_map_test import *
+from demo_dataset_store_test import *
+from dmp_params_io_test import *
+from data_io_test import *
+from clmcplot_utils_test import *
 # from ct_loa_so_sb_multi_demo_vicon_PMNN_unrolling_test import *
 from utilities import *
 
@@ -33,6 +54,52 @@ compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_dmp_1D_test_0_1_0
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0.txt', 
                         dmp_software_test_dir_abs_path+'/test_python_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0.txt')
 
+print("Testing DMPDiscrete1D Unrolling with Validation Turned Off...")
+dmp_1D_test(dmp_home_dir_abs_path, 2, 6.0, 1.0, 10.0, 4.0, dmp_software_test_dir_abs_path, "test_python_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0_validation_off.txt", validation_level=VALIDATION_OFF)
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0_validation_off.txt')
+
+print("Testing DMPDiscrete1D Streaming Unroll (iterUnroll) with Goal Change...")
+dmp_1D_test(dmp_home_dir_abs_path, 2, 6.0, 1.0, 10.0, 4.0, dmp_software_test_dir_abs_path, "test_python_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0_iter_unroll.txt", is_using_iter_unroll=True)
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_test_0_2_0_6.0_1.0_10.0_4.0_iter_unroll.txt')
+
+print("Testing DMPDiscrete1D with Truncated (Sparse) Basis Functions...")
+dmp_1D_test(dmp_home_dir_abs_path, 2, 0.0, 0.0, 0.0, 0.0, dmp_software_test_dir_abs_path, "test_python_dmp_1D_test_0_2_0_sparse_basis.txt", basis_function_cutoff=6.0)
+dmp_1D_test(dmp_home_dir_abs_path, 1, 0.0, 0.0, 0.0, 0.0, dmp_software_test_dir_abs_path, "test_python_dmp_1D_test_0_1_0_sparse_basis.txt", basis_function_cutoff=6.0)
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_dmp_1D_test_0_2_0.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_test_0_2_0_sparse_basis.txt')
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_dmp_1D_test_0_1_0.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_test_0_1_0_sparse_basis.txt')
+
+print("Testing DMPDiscrete1D Exact (ZOH) Unrolling vs Random Access...")
+dmp_1D_zoh_unroll_test(dmp_home_dir_abs_path, 2, dmp_software_test_dir_abs_path, "test_python_dmp_1D_zoh_unroll_test_0_2.txt", "test_python_dmp_1D_zoh_random_access_test_0_2.txt")
+dmp_1D_zoh_unroll_test(dmp_home_dir_abs_path, 1, dmp_software_test_dir_abs_path, "test_python_dmp_1D_zoh_unroll_test_0_1.txt", "test_python_dmp_1D_zoh_random_access_test_0_1.txt")
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_dmp_1D_zoh_unroll_test_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_zoh_random_access_test_0_2.txt')
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_dmp_1D_zoh_unroll_test_0_1.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_zoh_random_access_test_0_1.txt')
+
+print("Testing DMPDiscrete1D Exact (ZOH) vs Euler Unrolling at 0.01 ms Time Step...")
+dmp_1D_zoh_vs_euler_unroll_test(dmp_home_dir_abs_path, 2, dmp_software_test_dir_abs_path, "test_python_dmp_1D_zoh_small_dt_unroll_test_0_2.txt", "test_python_dmp_1D_euler_small_dt_unroll_test_0_2.txt")
+dmp_1D_zoh_vs_euler_unroll_test(dmp_home_dir_abs_path, 1, dmp_software_test_dir_abs_path, "test_python_dmp_1D_zoh_small_dt_unroll_test_0_1.txt", "test_python_dmp_1D_euler_small_dt_unroll_test_0_1.txt")
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_dmp_1D_zoh_small_dt_unroll_test_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_euler_small_dt_unroll_test_0_2.txt', 
+                        scalar_max_abs_diff_threshold=1.0e-3)
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_dmp_1D_zoh_small_dt_unroll_test_0_1.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_euler_small_dt_unroll_test_0_1.txt', 
+                        scalar_max_abs_diff_threshold=1.0e-3)
+
+print("Testing DMPDiscrete1D RK4 vs Adaptive RK45 Unrolling at 5 ms Time Step...")
+dmp_1D_ode_unroll_test(dmp_home_dir_abs_path, 2, RK4_INTEGRATOR, 0.005, dmp_software_test_dir_abs_path, "test_python_dmp_1D_rk4_unroll_test_0_2.txt")
+dmp_1D_ode_unroll_test(dmp_home_dir_abs_path, 2, RK45_INTEGRATOR, 0.005, dmp_software_test_dir_abs_path, "test_python_dmp_1D_rk45_unroll_test_0_2.txt")
+dmp_1D_ode_unroll_test(dmp_home_dir_abs_path, 1, RK4_INTEGRATOR, 0.005, dmp_software_test_dir_abs_path, "test_python_dmp_1D_rk4_unroll_test_0_1.txt")
+dmp_1D_ode_unroll_test(dmp_home_dir_abs_path, 1, RK45_INTEGRATOR, 0.005, dmp_software_test_dir_abs_path, "test_python_dmp_1D_rk45_unroll_test_0_1.txt")
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_dmp_1D_rk45_unroll_test_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_rk4_unroll_test_0_2.txt')
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_dmp_1D_rk45_unroll_test_0_1.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_dmp_1D_rk4_unroll_test_0_1.txt')
+
 cart_coord_dmp_single_traj_training_test(dmp_home_dir_abs_path, 2, 0.0, 0.0, 0.0, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_single_traj_training_test_0_2.txt")
 cart_coord_dmp_single_traj_training_test(dmp_home_dir_abs_path, 1, 0.0, 0.0, 0.0, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_single_traj_training_test_0_1.txt")
 cart_coord_dmp_single_traj_training_test(dmp_home_dir_abs_path, 2, 6.0, 1.0, 6.0, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_single_traj_training_test_0_2_6.0_1.0_6.0.txt")
@@ -46,10 +113,63 @@ compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_si
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_single_traj_training_test_0_2_6.0_2.0_6.0.txt', 
                         dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_single_traj_training_test_0_2_6.0_2.0_6.0.txt')
 
+print("Testing Vectorized Unrolling of CartesianCoordDMP...")
+cart_coord_dmp_single_traj_training_test(dmp_home_dir_abs_path, 2, 0.0, 0.0, 0.0, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_single_traj_training_test_0_2_vectorized.txt", is_unrolling_vectorized=True)
+cart_coord_dmp_single_traj_training_test(dmp_home_dir_abs_path, 1, 0.0, 0.0, 0.0, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_single_traj_training_test_0_1_vectorized.txt", is_unrolling_vectorized=True)
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_single_traj_training_test_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_single_traj_training_test_0_2_vectorized.txt')
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_single_traj_training_test_0_1.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_single_traj_training_test_0_1_vectorized.txt')
+
+print("Testing Batched vs Sequential Unrolling of CartesianCoordDMP...")
+for canonical_order in [1, 2]:
+  cart_coord_dmp_batch_unroll_test(dmp_home_dir_abs_path, canonical_order, dmp_software_test_dir_abs_path, 
+                                   "test_python_cart_coord_dmp_sequential_unroll_test_0_"+str(canonical_order)+".txt", 
+                                   "test_python_cart_coord_dmp_batch_unroll_test_0_"+str(canonical_order)+".txt")
+  compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_sequential_unroll_test_0_'+str(canonical_order)+'.txt', 
+                          dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_batch_unroll_test_0_'+str(canonical_order)+'.txt', 
+                          scalar_max_abs_diff_threshold=1.0e-10)
+
 cart_coord_dmp_multi_traj_training_test(dmp_home_dir_abs_path, 2, 0.5, 0.5, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_multi_traj_training_test_0_2.txt")
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_multi_traj_training_test_0_2.txt', 
                         dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_multi_traj_training_test_0_2.txt')
 
+print("Testing CartesianCoordDMP Training on the Binary Trajectory Cache of DataIO...")
+default_data_io_cache_dir = getDataIOCacheDir()
+setDataIOCacheDir(data_io_cache_root_dir_path + '/cold_warm/')
+for data_io_cache_state in ["cold", "warm"]:
+  cart_coord_dmp_multi_traj_training_test(dmp_home_dir_abs_path, 2, 0.5, 0.5, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_multi_traj_training_test_0_2_"+data_io_cache_state+"_cache.txt")
+  compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_multi_traj_training_test_0_2.txt', 
+                          dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_multi_traj_training_test_0_2_'+data_io_cache_state+'_cache.txt')
+shutil.rmtree(getDataIOCacheDir())
+setDataIOCacheDir(default_data_io_cache_dir)
+
+print("Testing Serial vs Multi-Threaded Trajectory Extraction of DataIO...")
+data_io_test()
+
+print("Testing (Memory-Mapped) Loading of SL Data Files via ClmcFile...")
+clmcplot_utils_test(dmp_home_dir_abs_path)
+
+print("Testing Chunked (Out-of-Core) Learning of CartesianCoordDMP...")
+cart_coord_dmp_multi_traj_training_test(dmp_home_dir_abs_path, 2, 0.5, 0.5, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_multi_traj_training_test_0_2_chunked.txt", learning_chunk_size=2)
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_multi_traj_training_test_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_multi_traj_training_test_0_2_chunked.txt')
+
+print("Testing CartesianCoordDMP Params Saving and Loading via a Binary File...")
+params_binary_dir_path = tempfile.mkdtemp()
+cart_coord_dmp_multi_traj_training_test(dmp_home_dir_abs_path, 2, 0.5, 0.5, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_multi_traj_training_test_0_2_params_binary.txt", params_binary_file_path=params_binary_dir_path+"/dmp_params.bin")
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_cart_coord_dmp_multi_traj_training_test_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_multi_traj_training_test_0_2_params_binary.txt')
+shutil.rmtree(params_binary_dir_path)
+
+print("Testing Primitive Library Params Saving and Loading via a Binary File vs Text Files...")
+dmp_params_io_test(dmp_home_dir_abs_path)
+
+print("Testing Incremental Learning of CartesianCoordDMP...")
+cart_coord_dmp_incremental_learning_test(dmp_home_dir_abs_path, 2, dmp_software_test_dir_abs_path, "test_python_cart_coord_dmp_incremental_learning_test_batch_0_2.txt", "test_python_cart_coord_dmp_incremental_learning_test_incremental_0_2.txt")
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_incremental_learning_test_batch_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_cart_coord_dmp_incremental_learning_test_incremental_0_2.txt')
+
 quat_dmp_single_traj_training_test(dmp_home_dir_abs_path, 1, 1.9976, 1.9976, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_single_traj_training_test_0_1.txt')
 quat_dmp_single_traj_training_test(dmp_home_dir_abs_path, 2, 1.9976, 1.9976, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_single_traj_training_test_0_2.txt')
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_single_traj_training_test_0_1.txt', 
@@ -57,6 +177,20 @@ compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_single_t
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_single_traj_training_test_0_2.txt', 
                         dmp_software_test_dir_abs_path+'/test_python_quat_dmp_single_traj_training_test_0_2.txt', 2.301e-5)
 
+print("Testing Demo Dataset Store Saving and (Memory-Mapped) Loading...")
+demo_dataset_store_test()
+
+print("Testing Vectorized Quaternion Log and Exp Maps against their References...")
+quaternion_log_exp_map_test()
+
+print("Testing Batched Unrolling of QuaternionDMP...")
+quat_dmp_single_traj_training_test(dmp_home_dir_abs_path, 1, 1.9976, 1.9976, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_single_traj_training_test_0_1_batched.txt', is_unrolling_batched=True)
+quat_dmp_single_traj_training_test(dmp_home_dir_abs_path, 2, 1.9976, 1.9976, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_single_traj_training_test_0_2_batched.txt', is_unrolling_batched=True)
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_single_traj_training_test_0_1.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_quat_dmp_single_traj_training_test_0_1_batched.txt')
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_single_traj_training_test_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_quat_dmp_single_traj_training_test_0_2_batched.txt', 2.301e-5)
+
 quat_dmp_multi_traj_training_test(dmp_home_dir_abs_path, 2, 1.9976, 1.9976, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_multi_traj_training_test_0_2.txt', 
                                   False, None, None, None, None, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_multi_traj_training_test_0_2_learned_params.txt')
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_multi_traj_training_test_0_2.txt', 
@@ -64,6 +198,11 @@ compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_multi_tr
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_multi_traj_training_test_0_2_learned_params.txt', 
                         dmp_software_test_dir_abs_path+'/test_python_quat_dmp_multi_traj_training_test_0_2_learned_params.txt', 7.501e-5, 1.5e-3, True)
 
+print("Testing Incremental Learning of QuaternionDMP...")
+quat_dmp_incremental_learning_test(dmp_home_dir_abs_path, 2, dmp_software_test_dir_abs_path, "test_python_quat_dmp_incremental_learning_test_batch_0_2.txt", "test_python_quat_dmp_incremental_learning_test_incremental_0_2.txt")
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_quat_dmp_incremental_learning_test_batch_0_2.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_quat_dmp_incremental_learning_test_incremental_0_2.txt')
+
 print("Testing Learning QuaternionDMP from Smoothed Quaternion Trajectory...")
 quat_dmp_multi_traj_training_test(dmp_home_dir_abs_path, 2, 1.9976, 1.9976, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_multi_smoothed_traj_training_test_0_2.txt', 
                                   True, 1.5, 3.0, 3, 5.0, dmp_software_test_dir_abs_path, 'test_python_quat_dmp_multi_smoothed_traj_training_test_0_2_learned_params.txt')
@@ -72,9 +211,20 @@ compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_multi_sm
 compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_quat_dmp_multi_smoothed_traj_training_test_0_2_learned_params.txt', 
                         dmp_software_test_dir_abs_path+'/test_python_quat_dmp_multi_smoothed_traj_training_test_0_2_learned_params.txt', 1.001e-5, 7.5e-4, True)
 
+print("Testing PrimitiveLibrary Lazy Loading and LRU Cache of DMPs...")
+primitive_library_test(dmp_home_dir_abs_path)
+
+print("Testing Parallel (Process Pool) vs Serial Learning of DMPs...")
+learn_dmps_in_parallel_test(dmp_home_dir_abs_path, 2, dmp_software_test_dir_abs_path, "test_python_learn_dmps_serially_test.txt", "test_python_learn_dmps_in_parallel_test.txt")
+compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/test_python_learn_dmps_serially_test.txt', 
+                        dmp_software_test_dir_abs_path+'/test_python_learn_dmps_in_parallel_test.txt', 
+                        scalar_max_abs_diff_threshold=0.0)
+
 # ct_loa_so_sb_multi_demo_vicon_PMNN_unrolling_test(dmp_home_dir_abs_path, 2, dmp_software_test_dir_abs_path, "test_python_ct_loa_so_sb_multi_demo_vicon_PMNN_unrolling_test.txt")
 # compareTwoNumericFiles(dmp_software_test_dir_abs_path+'/result_ct_loa_so_sb_multi_demo_vicon_PMNN_unrolling_test.txt', 
 #                         dmp_software_test_dir_abs_path+'/test_python_ct_loa_so_sb_multi_demo_vicon_PMNN_unrolling_test.txt',
 #                         scalar_max_abs_diff_threshold=1.6e-5)
 
+shutil.rmtree(data_io_cache_root_dir_path)
+
 print("execute_python_tests_and_compare_execution_results.py script execution done!")